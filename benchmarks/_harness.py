@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Shared helpers for the benchmark suites.
+
+Every suite produces a list of result records (plain dicts) that
+:func:`emit` writes as JSON together with a description of the
+environment, so runs from different releases can be diffed by a script.
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import grpc  # type: ignore
+import pkg_resources
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service.transports import (
+    ReservationServiceGrpcTransport,
+)
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationServer,
+    FakeReservationService,
+    in_process_channel,
+)
+
+SCHEMA_VERSION = 1
+
+IN_PROCESS = "in-process"
+LOCALHOST = "localhost"
+
+
+class Clock:
+    """A settable wall clock, used to age capacity commitments."""
+
+    def __init__(self) -> None:
+        self.offset = 0.0
+
+    def __call__(self) -> float:
+        return time.time() + self.offset
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options common to every suite."""
+    parser.add_argument(
+        "--output",
+        default="-",
+        help="File to write the JSON results to; '-' for standard output.",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=(IN_PROCESS, LOCALHOST),
+        default=IN_PROCESS,
+        help="Reach the fake service through an in-process channel or a "
+        "localhost gRPC server.",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Use small workloads, e.g. to smoke-test the suite.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+
+
+@contextlib.contextmanager
+def connect(
+    transport: str, servicer: FakeReservationService
+) -> Iterator[ReservationServiceClient]:
+    """Yield a client connected to ``servicer`` over ``transport``."""
+    if transport == LOCALHOST:
+        with FakeReservationServer(servicer) as server:
+            yield server.client()
+    else:
+        yield ReservationServiceClient(
+            transport=ReservationServiceGrpcTransport(
+                channel=in_process_channel(servicer)
+            )
+        )
+
+
+def measure(
+    prepare: Callable[[int], Callable[[], object]], number: int, repeat: int
+) -> Dict[str, float]:
+    """Time ``number`` calls, keeping the fastest of ``repeat`` rounds.
+
+    Args:
+        prepare: Called before each round with ``number``; returns the
+            operation to time. Setup done here is not measured.
+        number: Operations per round.
+        repeat: Rounds to run.
+
+    Returns:
+        The wall-clock and process CPU time of the fastest round, with
+        per-operation figures derived from them.
+    """
+    best = None  # type: Tuple[float, float]
+    for _ in range(repeat):
+        operation = prepare(number)
+        wall, cpu = time.perf_counter(), time.process_time()
+        for _ in range(number):
+            operation()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if best is None or wall < best[0]:
+            best = (wall, cpu)
+
+    wall, cpu = best
+    return {
+        "iterations": number,
+        "repeat": repeat,
+        "wall_s": wall,
+        "cpu_s": cpu,
+        "wall_us_per_op": wall / number * 1e6,
+        "cpu_us_per_op": cpu / number * 1e6,
+        "ops_per_s": number / wall if wall else float("inf"),
+    }
+
+
+def result(suite: str, name: str, stats: Dict[str, float], **params) -> Dict:
+    """Build one result record."""
+    return {"suite": suite, "name": name, "params": params, "stats": stats}
+
+
+def environment() -> Dict[str, str]:
+    """Describe the interpreter and library versions of this run."""
+
+    def version(distribution):
+        try:
+            return pkg_resources.get_distribution(distribution).version
+        except pkg_resources.DistributionNotFound:
+            return None
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "google-cloud-bigquery-reservation": version(
+            "google-cloud-bigquery-reservation"
+        ),
+        "google-api-core": version("google-api-core"),
+        "grpcio": grpc.__version__,
+        "protobuf": version("protobuf"),
+        "proto-plus": version("proto-plus"),
+    }
+
+
+def emit(results: List[Dict], output: str) -> None:
+    """Write ``results`` as a JSON document to ``output``."""
+    document = {
+        "schema_version": SCHEMA_VERSION,
+        "environment": environment(),
+        "results": results,
+    }
+    if output == "-":
+        json.dump(document, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(output, "w") as fh:
+            json.dump(document, fh, indent=2)
+            fh.write("\n")
+
+
+def check_budgets(results: List[Dict]) -> int:
+    """Report results over their budget on stderr.
+
+    Returns:
+        The exit status: 1 if any result is over its budget, else 0.
+    """
+    over = [r for r in results if r["stats"].get("within_budget") is False]
+    for r in over:
+        sys.stderr.write(
+            "%s/%s took %.1f ms, over its budget of %.1f ms\n"
+            % (
+                r["suite"],
+                r["name"],
+                r["stats"]["wall_s"] * 1e3,
+                r["params"]["budget_ms"],
+            )
+        )
+    return 1 if over else 0
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Per-call latency and CPU of every ``ReservationServiceClient`` method.
+
+Each method is called against the fake service, so the figures cover
+the client, the transport, and (de)serialization on both ends, plus the
+network stack with ``--transport localhost``. CPU time is for the whole
+process, which includes the fake server's threads.
+
+Usage::
+
+    python benchmarks/client_calls.py [--transport localhost] [--number N]
+"""
+
+import argparse
+import itertools
+
+import _harness
+from google.cloud.bigquery.reservation_v1.testing import FakeReservationService
+from google.cloud.bigquery.reservation_v1.types import reservation
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+
+SUITE = "client_calls"
+
+PARENT = "projects/bench/locations/US"
+FLEX = reservation.CapacityCommitment.CommitmentPlan.FLEX
+QUERY = reservation.Assignment.JobType.QUERY
+
+
+class Fixture:
+    """Creates the resources a timed call operates on."""
+
+    def __init__(self, client, clock):
+        self.client = client
+        self.clock = clock
+        self._ids = itertools.count()
+
+    def reservation(self, parent=PARENT):
+        return self.client.create_reservation(
+            parent=parent,
+            reservation_id="r%d" % next(self._ids),
+            reservation=reservation.Reservation(),
+        ).name
+
+    def commitment(self, parent=PARENT, slot_count=100):
+        return self.client.create_capacity_commitment(
+            parent=parent,
+            capacity_commitment=reservation.CapacityCommitment(
+                slot_count=slot_count, plan=FLEX
+            ),
+        ).name
+
+    def assignment(self, parent):
+        return self.client.create_assignment(
+            parent=parent,
+            assignment=reservation.Assignment(
+                assignee="projects/a%d" % next(self._ids), job_type=QUERY
+            ),
+        ).name
+
+    def expire_commitments(self):
+        # FLEX commitments can be deleted one minute after they start.
+        self.clock.offset += 120
+
+
+def bench_create_reservation(fx, number):
+    return lambda: fx.reservation()
+
+
+def bench_list_reservations(fx, number):
+    parent = "projects/list/locations/US"
+    while len(list(fx.client.list_reservations(parent=parent))) < 10:
+        fx.reservation(parent=parent)
+    return lambda: list(fx.client.list_reservations(parent=parent))
+
+
+def bench_get_reservation(fx, number):
+    name = fx.reservation()
+    return lambda: fx.client.get_reservation(name=name)
+
+
+def bench_delete_reservation(fx, number):
+    names = iter([fx.reservation() for _ in range(number)])
+    return lambda: fx.client.delete_reservation(name=next(names))
+
+
+def bench_update_reservation(fx, number):
+    name = fx.reservation()
+    request = reservation.UpdateReservationRequest(
+        reservation=reservation.Reservation(name=name, slot_capacity=0),
+        update_mask=field_mask.FieldMask(paths=["slot_capacity"]),
+    )
+    return lambda: fx.client.update_reservation(request=request)
+
+
+def bench_create_capacity_commitment(fx, number):
+    commitment = reservation.CapacityCommitment(slot_count=100, plan=FLEX)
+    return lambda: fx.client.create_capacity_commitment(
+        parent=PARENT, capacity_commitment=commitment
+    )
+
+
+def bench_list_capacity_commitments(fx, number):
+    parent = "projects/list/locations/EU"
+    while len(list(fx.client.list_capacity_commitments(parent=parent))) < 10:
+        fx.commitment(parent=parent)
+    return lambda: list(fx.client.list_capacity_commitments(parent=parent))
+
+
+def bench_get_capacity_commitment(fx, number):
+    name = fx.commitment()
+    return lambda: fx.client.get_capacity_commitment(name=name)
+
+
+def bench_delete_capacity_commitment(fx, number):
+    names = [fx.commitment() for _ in range(number)]
+    fx.expire_commitments()
+    names = iter(names)
+    return lambda: fx.client.delete_capacity_commitment(name=next(names))
+
+
+def bench_update_capacity_commitment(fx, number):
+    name = fx.commitment()
+    request = reservation.UpdateCapacityCommitmentRequest(
+        capacity_commitment=reservation.CapacityCommitment(
+            name=name, renewal_plan=FLEX
+        ),
+        update_mask=field_mask.FieldMask(paths=["renewal_plan"]),
+    )
+    return lambda: fx.client.update_capacity_commitment(request=request)
+
+
+def bench_split_capacity_commitment(fx, number):
+    name = fx.commitment(slot_count=number + 2)
+    return lambda: fx.client.split_capacity_commitment(name=name, slot_count=1)
+
+
+def bench_merge_capacity_commitments(fx, number):
+    pairs = iter(
+        [
+            [fx.commitment().rsplit("/", 1)[-1], fx.commitment().rsplit("/", 1)[-1]]
+            for _ in range(number)
+        ]
+    )
+    return lambda: fx.client.merge_capacity_commitments(
+        parent=PARENT, capacity_commitment_ids=next(pairs)
+    )
+
+
+def bench_create_assignment(fx, number):
+    parent = fx.reservation()
+    return lambda: fx.assignment(parent)
+
+
+def bench_list_assignments(fx, number):
+    parent = fx.reservation()
+    for _ in range(10):
+        fx.assignment(parent)
+    return lambda: list(fx.client.list_assignments(parent=parent))
+
+
+def bench_delete_assignment(fx, number):
+    parent = fx.reservation()
+    names = iter([fx.assignment(parent) for _ in range(number)])
+    return lambda: fx.client.delete_assignment(name=next(names))
+
+
+def bench_search_assignments(fx, number):
+    parent = "projects/search/locations/US"
+    query = "assignee=projects/child"
+    if not list(fx.client.search_assignments(parent=parent, query=query)):
+        fx.client.create_assignment(
+            parent=fx.reservation(parent=parent),
+            assignment=reservation.Assignment(
+                assignee="organizations/1", job_type=QUERY
+            ),
+        )
+    return lambda: list(fx.client.search_assignments(parent=parent, query=query))
+
+
+def bench_move_assignment(fx, number):
+    reservations = itertools.cycle([fx.reservation(), fx.reservation()])
+    state = {"name": fx.assignment(next(reservations))}
+
+    def move():
+        state["name"] = fx.client.move_assignment(
+            name=state["name"], destination_id=next(reservations)
+        ).name
+
+    return move
+
+
+def bench_get_bi_reservation(fx, number):
+    name = PARENT + "/bireservation"
+    return lambda: fx.client.get_bi_reservation(name=name)
+
+
+def bench_update_bi_reservation(fx, number):
+    bi_reservation = reservation.BiReservation(
+        name=PARENT + "/bireservation", size=1 << 30
+    )
+    update_mask = field_mask.FieldMask(paths=["size"])
+    return lambda: fx.client.update_bi_reservation(
+        bi_reservation=bi_reservation, update_mask=update_mask
+    )
+
+
+BENCHMARKS = {
+    name[len("bench_") :]: fn
+    for name, fn in sorted(globals().items())
+    if name.startswith("bench_")
+}
+
+
+def run(args):
+    clock = _harness.Clock()
+    servicer = FakeReservationService(
+        hierarchy={"projects/child": "folders/1", "folders/1": "organizations/1"},
+        clock=clock,
+    )
+    results = []
+    with _harness.connect(args.transport, servicer) as client:
+        fixture = Fixture(client, clock)
+        for method, bench in BENCHMARKS.items():
+            if args.methods and method not in args.methods:
+                continue
+            stats = _harness.measure(
+                lambda number: bench(fixture, number), args.number, args.repeat
+            )
+            results.append(
+                _harness.result(SUITE, method, stats, transport=args.transport)
+            )
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument("--number", type=int, default=None)
+    parser.add_argument(
+        "--methods", nargs="*", choices=sorted(BENCHMARKS), metavar="METHOD"
+    )
+
+
+def configure(args):
+    if args.number is None:
+        args.number = 50 if args.quick else 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _harness.add_arguments(parser)
+    add_arguments(parser)
+    args = parser.parse_args()
+    configure(args)
+    _harness.emit(run(args), args.output)
+
+
+if __name__ == "__main__":
+    main()
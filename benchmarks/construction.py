@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Client construction time.
+
+Measures building a ``ReservationServiceClient`` with anonymous
+credentials, which creates a gRPC channel and wraps every method, and
+with a transport around an existing channel, which only wraps methods.
+
+Usage::
+
+    python benchmarks/construction.py [--number N]
+"""
+
+import argparse
+
+import grpc  # type: ignore
+
+import _harness
+from google.auth import credentials  # type: ignore
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service.transports import (
+    ReservationServiceGrpcTransport,
+)
+
+SUITE = "construction"
+
+
+def run(args):
+    anonymous = credentials.AnonymousCredentials()
+    channel = grpc.insecure_channel("localhost:0")
+    constructors = {
+        "client": lambda: ReservationServiceClient(credentials=anonymous),
+        "client_with_channel": lambda: ReservationServiceClient(
+            transport=ReservationServiceGrpcTransport(channel=channel)
+        ),
+    }
+    results = []
+    for name, construct in constructors.items():
+        stats = _harness.measure(lambda number: construct, args.number, args.repeat)
+        results.append(_harness.result(SUITE, name, stats))
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument("--number", type=int, default=None)
+
+
+def configure(args):
+    if args.number is None:
+        args.number = 20 if args.quick else 200
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _harness.add_arguments(parser)
+    add_arguments(parser)
+    args = parser.parse_args()
+    configure(args)
+    _harness.emit(run(args), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Import time of the package and of its exports, with budgets.
+
+Each import runs in a fresh interpreter, so nothing is cached in
+``sys.modules``; the fastest of ``--number`` runs is kept. Importing the
+package and the path helpers must stay within their budgets, since
+command-line tools and serverless functions that need nothing else pay
+for it on every start. The types and client imports are reported for
+reference.
+
+Exits with status 1 if an import exceeds its budget.
+
+Usage::
+
+    python benchmarks/imports.py [--number N] [--budget-scale X]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+import _harness
+
+SUITE = "imports"
+
+# Name -> (statement, budget in milliseconds or None).
+IMPORTS = {
+    "package": ("import google.cloud.bigquery.reservation", 50.0),
+    "paths": ("from google.cloud.bigquery.reservation import ReservationName", 50.0),
+    "types": ("from google.cloud.bigquery.reservation import Reservation", None),
+    "client": (
+        "from google.cloud.bigquery.reservation import ReservationServiceClient",
+        None,
+    ),
+}
+
+_TIMER = """
+import json, time
+wall, cpu = time.perf_counter(), time.process_time()
+{statement}
+print(json.dumps([time.perf_counter() - wall, time.process_time() - cpu]))
+"""
+
+
+def time_import(statement):
+    """Return the wall and CPU seconds ``statement`` takes in a fresh
+    interpreter."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", _TIMER.format(statement=statement)]
+    )
+    return json.loads(output.decode("utf-8"))
+
+
+def run(args):
+    results = []
+    for name, (statement, budget_ms) in IMPORTS.items():
+        wall, cpu = min(time_import(statement) for _ in range(args.number))
+        stats = {
+            "iterations": 1,
+            "repeat": args.number,
+            "wall_s": wall,
+            "cpu_s": cpu,
+            "wall_us_per_op": wall * 1e6,
+            "cpu_us_per_op": cpu * 1e6,
+            "ops_per_s": 1 / wall if wall else float("inf"),
+        }
+        params = {"statement": statement}
+        if budget_ms is not None:
+            budget_ms *= args.budget_scale
+            params["budget_ms"] = budget_ms
+            stats["within_budget"] = wall * 1e3 <= budget_ms
+        results.append(_harness.result(SUITE, name, stats, **params))
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument("--number", type=int, default=None)
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget, e.g. on slow CI machines.",
+    )
+
+
+def configure(args):
+    if args.number is None:
+        args.number = 3 if args.quick else 10
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _harness.add_arguments(parser)
+    add_arguments(parser)
+    args = parser.parse_args()
+    configure(args)
+    results = run(args)
+    _harness.emit(results, args.output)
+    sys.exit(_harness.check_budgets(results))
+
+
+if __name__ == "__main__":
+    main()
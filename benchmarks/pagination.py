@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Pager throughput at different ``page_size`` values.
+
+Lists a fixed number of reservations through ``list_reservations`` and
+reports how many items per second the pager yields for each page size.
+
+Usage::
+
+    python benchmarks/pagination.py [--items N] [--page-sizes 10 100 1000]
+"""
+
+import argparse
+
+import _harness
+from google.cloud.bigquery.reservation_v1.testing import FakeReservationService
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+SUITE = "pagination"
+
+PARENT = "projects/bench/locations/US"
+
+
+def run(args):
+    servicer = FakeReservationService()
+    results = []
+    with _harness.connect(args.transport, servicer) as client:
+        for i in range(args.items):
+            client.create_reservation(
+                parent=PARENT,
+                reservation_id="r%d" % i,
+                reservation=reservation.Reservation(slot_capacity=i),
+            )
+
+        for page_size in args.page_sizes:
+            request = reservation.ListReservationsRequest(
+                parent=PARENT, page_size=page_size
+            )
+
+            def drain():
+                count = sum(1 for _ in client.list_reservations(request=request))
+                assert count == args.items, count
+
+            stats = _harness.measure(lambda number: drain, 1, args.repeat)
+            stats["items"] = args.items
+            stats["pages"] = -(-args.items // page_size)
+            stats["items_per_s"] = args.items / stats["wall_s"]
+            results.append(
+                _harness.result(
+                    SUITE,
+                    "list_reservations",
+                    stats,
+                    transport=args.transport,
+                    page_size=page_size,
+                )
+            )
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument("--items", type=int, default=None)
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[10, 100, 1000])
+
+
+def configure(args):
+    if args.items is None:
+        args.items = 1000 if args.quick else 10000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _harness.add_arguments(parser)
+    add_arguments(parser)
+    args = parser.parse_args()
+    configure(args)
+    _harness.emit(run(args), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Resource-name parsing and formatting rates.
+
+Times single-name parsing through the client's static methods and the
+``AssignmentName`` type, columnar batch parsing, and path formatting, on
+a list of distinct assignment names.
+
+Usage::
+
+    python benchmarks/paths.py [--names N]
+"""
+
+import argparse
+
+import _harness
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    AssignmentName,
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import paths
+
+SUITE = "paths"
+
+
+def run(args):
+    names = [
+        ReservationServiceClient.assignment_path(
+            "project%d" % (i % 500), "US", "reservation%d" % (i % 50), str(i)
+        )
+        for i in range(args.names)
+    ]
+    components = [AssignmentName.from_path(name) for name in names]
+
+    def each(fn, items):
+        def prepare(number):
+            it = iter(items)
+            return lambda: fn(next(it))
+
+        return prepare
+
+    operations = {
+        "parse_assignment_path": each(
+            ReservationServiceClient.parse_assignment_path, names
+        ),
+        "AssignmentName.from_path": each(AssignmentName.from_path, names),
+        "assignment_path": each(
+            lambda c: ReservationServiceClient.assignment_path(*c), components
+        ),
+    }
+    results = []
+    for name, prepare in operations.items():
+        stats = _harness.measure(prepare, len(names), args.repeat)
+        results.append(_harness.result(SUITE, name, stats, names=len(names)))
+
+    stats = _harness.measure(
+        lambda number: lambda: paths.parse_assignment_paths(names), 1, args.repeat
+    )
+    stats["names_per_s"] = len(names) / stats["wall_s"]
+    results.append(
+        _harness.result(SUITE, "parse_assignment_paths", stats, names=len(names))
+    )
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument("--names", type=int, default=None)
+
+
+def configure(args):
+    if args.names is None:
+        args.names = 10000 if args.quick else 1000000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _harness.add_arguments(parser)
+    add_arguments(parser)
+    args = parser.parse_args()
+    configure(args)
+    _harness.emit(run(args), args.output)
+
+
+if __name__ == "__main__":
+    main()
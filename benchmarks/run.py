@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Run the benchmark suites and write one JSON report.
+
+Every suite runs against the in-memory fake service from
+``google.cloud.bigquery.reservation_v1.testing``, so no credentials or
+network access are needed. Suites can also be run on their own, with
+suite-specific options, e.g. ``python benchmarks/pagination.py --help``.
+
+Usage::
+
+    python benchmarks/run.py [--quick] [--output results.json]
+        [--transport {in-process,localhost}] [--suites NAME ...]
+"""
+
+import argparse
+import copy
+import sys
+
+import _harness
+import client_calls
+import construction
+import imports
+import pagination
+import paths
+import serialization
+
+SUITES = {
+    "client_calls": client_calls,
+    "construction": construction,
+    "imports": imports,
+    "pagination": pagination,
+    "paths": paths,
+    "serialization": serialization,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _harness.add_arguments(parser)
+    parser.add_argument(
+        "--suites", nargs="+", choices=sorted(SUITES), default=sorted(SUITES)
+    )
+    args = parser.parse_args()
+
+    results = []
+    for name in args.suites:
+        suite = SUITES[name]
+        # Fill in the suite's own options with their defaults.
+        suite_parser = argparse.ArgumentParser()
+        suite.add_arguments(suite_parser)
+        suite_args = suite_parser.parse_args([], namespace=copy.copy(args))
+        suite.configure(suite_args)
+        results.extend(suite.run(suite_args))
+
+    _harness.emit(results, args.output)
+    sys.exit(_harness.check_budgets(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Serialize and deserialize rates of ``Reservation`` and ``Assignment``.
+
+Each workload is a list response holding N messages, which is the shape
+the client decodes when paging. Three operations are timed per size:
+
+* ``serialize``: encode the response to bytes.
+* ``deserialize``: decode the bytes into a proto-plus response.
+* ``iterate``: decode and then read one field of every item, which also
+  pays for wrapping each item as a proto-plus message.
+
+Usage::
+
+    python benchmarks/serialization.py [--sizes 1000 100000 1000000]
+"""
+
+import argparse
+
+import _harness
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+SUITE = "serialization"
+
+
+def _reservations(size):
+    pb = reservation.ListReservationsResponse.pb()()
+    for i in range(size):
+        pb.reservations.add(
+            name="projects/p/locations/US/reservations/r%d" % i,
+            slot_capacity=i,
+            ignore_idle_slots=bool(i % 2),
+        )
+    return (
+        reservation.ListReservationsResponse.wrap(pb),
+        "reservations",
+        "slot_capacity",
+    )
+
+
+def _assignments(size):
+    pb = reservation.ListAssignmentsResponse.pb()()
+    for i in range(size):
+        pb.assignments.add(
+            name="projects/p/locations/US/reservations/r/assignments/%d" % i,
+            assignee="projects/a%d" % i,
+            job_type=reservation.Assignment.JobType.QUERY,
+            state=reservation.Assignment.State.ACTIVE,
+        )
+    return reservation.ListAssignmentsResponse.wrap(pb), "assignments", "assignee"
+
+
+WORKLOADS = {"Reservation": _reservations, "Assignment": _assignments}
+
+
+def run(args):
+    results = []
+    for message, build in WORKLOADS.items():
+        for size in args.sizes:
+            response, field, attribute = build(size)
+            response_type = type(response)
+            data = response_type.serialize(response)
+
+            def iterate():
+                decoded = response_type.deserialize(data)
+                for item in getattr(decoded, field):
+                    getattr(item, attribute)
+
+            operations = {
+                "serialize": lambda: response_type.serialize(response),
+                "deserialize": lambda: response_type.deserialize(data),
+                "iterate": iterate,
+            }
+            for operation, fn in operations.items():
+                stats = _harness.measure(lambda number: fn, 1, args.repeat)
+                stats["items"] = size
+                stats["bytes"] = len(data)
+                stats["items_per_s"] = size / stats["wall_s"]
+                stats["mb_per_s"] = len(data) / stats["wall_s"] / 1e6
+                results.append(
+                    _harness.result(SUITE, operation, stats, message=message, size=size)
+                )
+    return results
+
+
+def add_arguments(parser):
+    parser.add_argument("--sizes", type=int, nargs="+", default=None)
+
+
+def configure(args):
+    if args.sizes is None:
+        args.sizes = [1000, 10000] if args.quick else [1000, 100000, 1000000]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    _harness.add_arguments(parser)
+    add_arguments(parser)
+    args = parser.parse_args()
+    configure(args)
+    _harness.emit(run(args), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Per-call overhead of wrapping transport methods.
+
+Compares wrapping the transport callable on every call (the previous
+client behaviour) with looking up the callable precomputed by the
+transport. The stub is patched out, so only client-side CPU is measured.
+
+Usage::
+
+    python benchmarks/wrapped_methods.py [--number N]
+"""
+
+import argparse
+import timeit
+from unittest import mock
+
+import grpc  # type: ignore
+
+from google.api_core import gapic_v1  # type: ignore
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import transports
+from google.cloud.bigquery.reservation_v1.services.reservation_service.transports import (
+    base,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    transport = transports.ReservationServiceGrpcTransport(
+        channel=grpc.insecure_channel("localhost:0")
+    )
+    client = ReservationServiceClient(transport=transport)
+    request = reservation.GetReservationRequest(name="projects/p/locations/US")
+    metadata = (gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),)
+
+    def wrap_per_call():
+        rpc = gapic_v1.method.wrap_method(
+            transport.get_reservation,
+            default_timeout=None,
+            client_info=base._client_info,
+        )
+        rpc(request, metadata=metadata)
+
+    def precomputed():
+        rpc = transport._wrapped_methods[transport.get_reservation]
+        rpc(request, metadata=metadata)
+
+    def client_call():
+        client.get_reservation(request)
+
+    with mock.patch.object(
+        type(transport.get_reservation),
+        "__call__",
+        return_value=reservation.Reservation(),
+    ):
+        for label, fn in (
+            ("wrap per call", wrap_per_call),
+            ("precomputed", precomputed),
+            ("client.get_reservation", client_call),
+        ):
+            seconds = min(timeit.repeat(fn, number=args.number, repeat=3))
+            print("{:<24} {:8.2f} us/call".format(label, seconds / args.number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
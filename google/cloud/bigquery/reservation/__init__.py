@@ -16,95 +16,89 @@
 #
 
 
-from google.cloud.bigquery.reservation_v1.services.reservation_service.client import (
-    ReservationServiceClient,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import Assignment
-from google.cloud.bigquery.reservation_v1.types.reservation import BiReservation
-from google.cloud.bigquery.reservation_v1.types.reservation import CapacityCommitment
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    CreateAssignmentRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    CreateCapacityCommitmentRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    CreateReservationRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    DeleteAssignmentRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    DeleteCapacityCommitmentRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    DeleteReservationRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    GetBiReservationRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    GetCapacityCommitmentRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import GetReservationRequest
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    ListAssignmentsRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    ListAssignmentsResponse,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    ListCapacityCommitmentsRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    ListCapacityCommitmentsResponse,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    ListReservationsRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    ListReservationsResponse,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    MergeCapacityCommitmentsRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import MoveAssignmentRequest
-from google.cloud.bigquery.reservation_v1.types.reservation import Reservation
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    SearchAssignmentsRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    SearchAssignmentsResponse,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    SplitCapacityCommitmentRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    SplitCapacityCommitmentResponse,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    UpdateBiReservationRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    UpdateCapacityCommitmentRequest,
-)
-from google.cloud.bigquery.reservation_v1.types.reservation import (
-    UpdateReservationRequest,
-)
+from google.cloud.bigquery.reservation_v1 import _lazy
+
+# Exported names and the modules defining them. The modules are imported
+# on first access; see ``reservation_v1._lazy``.
+_EXPORTS = {
+    "Assignment": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "AssignmentIndex": "google.cloud.bigquery.reservation_v1.services.reservation_service.assignment_index",
+    "AssignmentName": "google.cloud.bigquery.reservation_v1.services.reservation_service.paths",
+    "BatchResult": "google.cloud.bigquery.reservation_v1.services.reservation_service.batch",
+    "BiReservation": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "BiReservationName": "google.cloud.bigquery.reservation_v1.services.reservation_service.paths",
+    "CapacityCommitment": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "CapacityCommitmentName": "google.cloud.bigquery.reservation_v1.services.reservation_service.paths",
+    "CapacityModel": "google.cloud.bigquery.reservation_v1.services.reservation_service.capacity",
+    "ChangeEvent": "google.cloud.bigquery.reservation_v1.services.reservation_service.watch",
+    "ChannelOptions": "google.cloud.bigquery.reservation_v1.services.reservation_service",
+    "CreateAssignmentRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "CreateCapacityCommitmentRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "CreateReservationRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "DeleteAssignmentRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "DeleteCapacityCommitmentRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "DeleteReservationRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "DesiredAssignment": "google.cloud.bigquery.reservation_v1.services.reservation_service.reconcile",
+    "FieldDiff": "google.cloud.bigquery.reservation_v1.services.reservation_service.masks",
+    "GetBiReservationRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "GetCapacityCommitmentRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "GetReservationRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "HedgePolicy": "google.cloud.bigquery.reservation_v1.services.reservation_service.transports.policy",
+    "ListAssignmentsRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "ListAssignmentsResponse": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "ListCapacityCommitmentsRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "ListCapacityCommitmentsResponse": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "ListReservationsRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "ListReservationsResponse": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "MergeCapacityCommitmentsRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "MethodPolicy": "google.cloud.bigquery.reservation_v1.services.reservation_service.transports.policy",
+    "MoveAssignmentRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "PagerCursor": "google.cloud.bigquery.reservation_v1.services.reservation_service.pagers",
+    "PortfolioPlan": "google.cloud.bigquery.reservation_v1.services.reservation_service.portfolio",
+    "RateLimiter": "google.cloud.bigquery.reservation_v1.services.reservation_service.transports.ratelimit",
+    "ReconcileStep": "google.cloud.bigquery.reservation_v1.services.reservation_service.reconcile",
+    "Reservation": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "ReservationName": "google.cloud.bigquery.reservation_v1.services.reservation_service.paths",
+    "ReservationServiceAsyncClient": "google.cloud.bigquery.reservation_v1.services.reservation_service.async_client",
+    "ReservationServiceClient": "google.cloud.bigquery.reservation_v1.services.reservation_service.client",
+    "ResourceCache": "google.cloud.bigquery.reservation_v1.services.reservation_service.cache",
+    "RetryPolicy": "google.cloud.bigquery.reservation_v1.services.reservation_service.transports.policy",
+    "SearchAssignmentsRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "SearchAssignmentsResponse": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "SplitCapacityCommitmentRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "SplitCapacityCommitmentResponse": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "UpdateBiReservationRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "UpdateCapacityCommitmentRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "UpdateReservationRequest": "google.cloud.bigquery.reservation_v1.types.reservation",
+    "WarmupReport": "google.cloud.bigquery.reservation_v1.services.reservation_service",
+    "Watcher": "google.cloud.bigquery.reservation_v1.services.reservation_service.watch",
+    "default_policies": "google.cloud.bigquery.reservation_v1.services.reservation_service.transports.policy",
+}
 
 __all__ = (
     "Assignment",
+    "AssignmentIndex",
+    "AssignmentName",
+    "BatchResult",
     "BiReservation",
+    "BiReservationName",
     "CapacityCommitment",
+    "CapacityCommitmentName",
+    "CapacityModel",
+    "ChangeEvent",
+    "ChannelOptions",
     "CreateAssignmentRequest",
     "CreateCapacityCommitmentRequest",
     "CreateReservationRequest",
     "DeleteAssignmentRequest",
     "DeleteCapacityCommitmentRequest",
     "DeleteReservationRequest",
+    "DesiredAssignment",
+    "FieldDiff",
     "GetBiReservationRequest",
     "GetCapacityCommitmentRequest",
     "GetReservationRequest",
+    "HedgePolicy",
     "ListAssignmentsRequest",
     "ListAssignmentsResponse",
     "ListCapacityCommitmentsRequest",
@@ -112,9 +106,18 @@ __all__ = (
     "ListReservationsRequest",
     "ListReservationsResponse",
     "MergeCapacityCommitmentsRequest",
+    "MethodPolicy",
     "MoveAssignmentRequest",
+    "PagerCursor",
+    "PortfolioPlan",
+    "RateLimiter",
+    "ReconcileStep",
     "Reservation",
+    "ReservationName",
+    "ReservationServiceAsyncClient",
     "ReservationServiceClient",
+    "ResourceCache",
+    "RetryPolicy",
     "SearchAssignmentsRequest",
     "SearchAssignmentsResponse",
     "SplitCapacityCommitmentRequest",
@@ -122,4 +125,9 @@ __all__ = (
     "UpdateBiReservationRequest",
     "UpdateCapacityCommitmentRequest",
     "UpdateReservationRequest",
+    "WarmupReport",
+    "Watcher",
+    "default_policies",
 )
+
+__getattr__, __dir__ = _lazy.attach(__name__, _EXPORTS)
@@ -16,50 +16,89 @@
 #
 
 
-from .services.reservation_service import ReservationServiceClient
-from .types.reservation import Assignment
-from .types.reservation import BiReservation
-from .types.reservation import CapacityCommitment
-from .types.reservation import CreateAssignmentRequest
-from .types.reservation import CreateCapacityCommitmentRequest
-from .types.reservation import CreateReservationRequest
-from .types.reservation import DeleteAssignmentRequest
-from .types.reservation import DeleteCapacityCommitmentRequest
-from .types.reservation import DeleteReservationRequest
-from .types.reservation import GetBiReservationRequest
-from .types.reservation import GetCapacityCommitmentRequest
-from .types.reservation import GetReservationRequest
-from .types.reservation import ListAssignmentsRequest
-from .types.reservation import ListAssignmentsResponse
-from .types.reservation import ListCapacityCommitmentsRequest
-from .types.reservation import ListCapacityCommitmentsResponse
-from .types.reservation import ListReservationsRequest
-from .types.reservation import ListReservationsResponse
-from .types.reservation import MergeCapacityCommitmentsRequest
-from .types.reservation import MoveAssignmentRequest
-from .types.reservation import Reservation
-from .types.reservation import SearchAssignmentsRequest
-from .types.reservation import SearchAssignmentsResponse
-from .types.reservation import SplitCapacityCommitmentRequest
-from .types.reservation import SplitCapacityCommitmentResponse
-from .types.reservation import UpdateBiReservationRequest
-from .types.reservation import UpdateCapacityCommitmentRequest
-from .types.reservation import UpdateReservationRequest
+from . import _lazy
 
+# Exported names and the modules defining them. The modules are imported
+# on first access; see ``reservation_v1._lazy``.
+_EXPORTS = {
+    "Assignment": ".types.reservation",
+    "AssignmentIndex": ".services.reservation_service",
+    "AssignmentName": ".services.reservation_service",
+    "BatchResult": ".services.reservation_service",
+    "BiReservation": ".types.reservation",
+    "BiReservationName": ".services.reservation_service",
+    "CapacityCommitment": ".types.reservation",
+    "CapacityCommitmentName": ".services.reservation_service",
+    "CapacityModel": ".services.reservation_service",
+    "ChangeEvent": ".services.reservation_service",
+    "ChannelOptions": ".services.reservation_service",
+    "CreateAssignmentRequest": ".types.reservation",
+    "CreateCapacityCommitmentRequest": ".types.reservation",
+    "CreateReservationRequest": ".types.reservation",
+    "DeleteAssignmentRequest": ".types.reservation",
+    "DeleteCapacityCommitmentRequest": ".types.reservation",
+    "DeleteReservationRequest": ".types.reservation",
+    "DesiredAssignment": ".services.reservation_service",
+    "FieldDiff": ".services.reservation_service",
+    "GetBiReservationRequest": ".types.reservation",
+    "GetCapacityCommitmentRequest": ".types.reservation",
+    "GetReservationRequest": ".types.reservation",
+    "HedgePolicy": ".services.reservation_service",
+    "ListAssignmentsRequest": ".types.reservation",
+    "ListAssignmentsResponse": ".types.reservation",
+    "ListCapacityCommitmentsRequest": ".types.reservation",
+    "ListCapacityCommitmentsResponse": ".types.reservation",
+    "ListReservationsRequest": ".types.reservation",
+    "ListReservationsResponse": ".types.reservation",
+    "MergeCapacityCommitmentsRequest": ".types.reservation",
+    "MethodPolicy": ".services.reservation_service",
+    "MoveAssignmentRequest": ".types.reservation",
+    "PagerCursor": ".services.reservation_service",
+    "PortfolioPlan": ".services.reservation_service",
+    "RateLimiter": ".services.reservation_service",
+    "ReconcileStep": ".services.reservation_service",
+    "Reservation": ".types.reservation",
+    "ReservationName": ".services.reservation_service",
+    "ReservationServiceAsyncClient": ".services.reservation_service",
+    "ReservationServiceClient": ".services.reservation_service",
+    "ResourceCache": ".services.reservation_service",
+    "RetryPolicy": ".services.reservation_service",
+    "SearchAssignmentsRequest": ".types.reservation",
+    "SearchAssignmentsResponse": ".types.reservation",
+    "SplitCapacityCommitmentRequest": ".types.reservation",
+    "SplitCapacityCommitmentResponse": ".types.reservation",
+    "UpdateBiReservationRequest": ".types.reservation",
+    "UpdateCapacityCommitmentRequest": ".types.reservation",
+    "UpdateReservationRequest": ".types.reservation",
+    "WarmupReport": ".services.reservation_service",
+    "Watcher": ".services.reservation_service",
+    "default_policies": ".services.reservation_service",
+}
 
 __all__ = (
     "Assignment",
+    "AssignmentIndex",
+    "AssignmentName",
+    "BatchResult",
     "BiReservation",
+    "BiReservationName",
     "CapacityCommitment",
+    "CapacityCommitmentName",
+    "CapacityModel",
+    "ChangeEvent",
+    "ChannelOptions",
     "CreateAssignmentRequest",
     "CreateCapacityCommitmentRequest",
     "CreateReservationRequest",
     "DeleteAssignmentRequest",
     "DeleteCapacityCommitmentRequest",
     "DeleteReservationRequest",
+    "DesiredAssignment",
+    "FieldDiff",
     "GetBiReservationRequest",
     "GetCapacityCommitmentRequest",
     "GetReservationRequest",
+    "HedgePolicy",
     "ListAssignmentsRequest",
     "ListAssignmentsResponse",
     "ListCapacityCommitmentsRequest",
@@ -67,8 +106,18 @@ __all__ = (
     "ListReservationsRequest",
     "ListReservationsResponse",
     "MergeCapacityCommitmentsRequest",
+    "MethodPolicy",
     "MoveAssignmentRequest",
+    "PagerCursor",
+    "PortfolioPlan",
+    "RateLimiter",
+    "ReconcileStep",
     "Reservation",
+    "ReservationName",
+    "ReservationServiceAsyncClient",
+    "ReservationServiceClient",
+    "ResourceCache",
+    "RetryPolicy",
     "SearchAssignmentsRequest",
     "SearchAssignmentsResponse",
     "SplitCapacityCommitmentRequest",
@@ -76,5 +125,9 @@ __all__ = (
     "UpdateBiReservationRequest",
     "UpdateCapacityCommitmentRequest",
     "UpdateReservationRequest",
-    "ReservationServiceClient",
+    "WarmupReport",
+    "Watcher",
+    "default_policies",
 )
+
+__getattr__, __dir__ = _lazy.attach(__name__, _EXPORTS)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Lazy package exports.
+
+The package ``__init__`` modules export the clients and message types
+without importing them, so that ``import google.cloud.bigquery.reservation``
+does not import grpc, google-auth and every message class. An export is
+imported on first access, through the module ``__getattr__`` of PEP 562.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def attach(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Return ``__getattr__`` and ``__dir__`` functions for a package.
+
+    Args:
+        package (str): The ``__name__`` of the package.
+        exports (Dict[str, str]): The exported names, each mapped to the
+            module defining it, absolute or relative to ``package``.
+
+    Returns:
+        Tuple[Callable, Callable]: The package's ``__getattr__`` and
+        ``__dir__``. Python before 3.7 ignores module ``__getattr__``, so
+        there every export is imported immediately instead.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> object:
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(
+                "module %r has no attribute %r" % (package, name)
+            ) from None
+        value = getattr(importlib.import_module(module, package), name)
+        # Later lookups find the name without calling __getattr__.
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    if sys.version_info < (3, 7):
+        for name in exports:
+            __getattr__(name)
+
+    return __getattr__, __dir__
@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Export the reservation inventory to NDJSON or Parquet files.
+
+Installed as the ``bq-reservation-export`` command::
+
+    bq-reservation-export --project my-project --location US --location EU \\
+        --output-dir inventory/2020-09-01T10 --format parquet
+
+The reservations, capacity commitments, assignments and BI reservations
+of every project and location are written under
+``OUTPUT_DIR/<resource>/project=<project>/location=<location>/`` as
+numbered part files of at most about ``--chunk-rows`` rows. The listings
+run concurrently, and each holds at most one chunk in memory.
+
+After writing a part file, an export saves the page token its listing
+continues from in ``OUTPUT_DIR/export-state.json``. Running the same
+command again after an interruption resumes every listing from its saved
+token; the state file is removed once the export completes.
+"""
+
+import argparse
+from concurrent import futures
+import glob
+import json
+import os
+import sys
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from google.protobuf import json_format  # type: ignore
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import arrow
+from google.cloud.bigquery.reservation_v1.services.reservation_service import paths
+from google.cloud.bigquery.reservation_v1.services.reservation_service.client import (
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+
+NDJSON = "ndjson"
+PARQUET = "parquet"
+FORMATS = (NDJSON, PARQUET)
+
+RESERVATIONS = "reservations"
+CAPACITY_COMMITMENTS = "capacity_commitments"
+ASSIGNMENTS = "assignments"
+BI_RESERVATIONS = "bi_reservations"
+RESOURCES = (RESERVATIONS, CAPACITY_COMMITMENTS, ASSIGNMENTS, BI_RESERVATIONS)
+
+STATE_FILE = "export-state.json"
+
+# Resource -> (message type, list method, request type, repeated field).
+_LISTINGS = {
+    RESERVATIONS: (
+        reservation.Reservation,
+        "list_reservations",
+        reservation.ListReservationsRequest,
+        "reservations",
+    ),
+    CAPACITY_COMMITMENTS: (
+        reservation.CapacityCommitment,
+        "list_capacity_commitments",
+        reservation.ListCapacityCommitmentsRequest,
+        "capacity_commitments",
+    ),
+    ASSIGNMENTS: (
+        reservation.Assignment,
+        "list_assignments",
+        reservation.ListAssignmentsRequest,
+        "assignments",
+    ),
+}
+
+
+def _message_type(resource: str):
+    if resource == BI_RESERVATIONS:
+        return reservation.BiReservation
+    return _LISTINGS[resource][0]
+
+
+def _pages(
+    client: ReservationServiceClient,
+    resource: str,
+    project: str,
+    location: str,
+    page_token: str,
+    page_size: int,
+) -> Iterator[Tuple[Sequence[Any], str]]:
+    """Yield the raw messages of each page and the token of the next."""
+    if resource == BI_RESERVATIONS:
+        response = client.get_bi_reservation(
+            name=paths.bi_reservation_path(project, location)
+        )
+        yield [reservation.BiReservation.pb(response)], ""
+        return
+    _, method, request_type, field = _LISTINGS[resource]
+    parent = "projects/%s/locations/%s" % (project, location)
+    if resource == ASSIGNMENTS:
+        # Assignments of every reservation in the location.
+        parent = paths.reservation_path(project, location, "-")
+    request = request_type(parent=parent, page_size=page_size, page_token=page_token)
+    for page in getattr(client, method)(request=request).pages:
+        yield getattr(type(page).pb(page), field), page.next_page_token
+
+
+class _NdjsonWriter:
+    suffix = ".ndjson"
+
+    def __init__(self, message_type) -> None:
+        pass
+
+    def write(self, path: str, chunks: List[Sequence[Any]]) -> None:
+        with open(path, "w", encoding="utf-8") as stream:
+            for messages in chunks:
+                for message in messages:
+                    row = json_format.MessageToDict(
+                        message, preserving_proto_field_name=True
+                    )
+                    stream.write(json.dumps(row, separators=(",", ":")))
+                    stream.write("\n")
+
+
+class _ParquetWriter:
+    suffix = ".parquet"
+
+    def __init__(self, message_type) -> None:
+        try:
+            import pyarrow.parquet  # type: ignore
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet export requires pyarrow. Install it with "
+                "`pip install google-cloud-bigquery-reservation[pandas]`."
+            ) from exc
+
+        self._message_type = message_type
+        self._parquet = pyarrow.parquet
+
+    def write(self, path: str, chunks: List[Sequence[Any]]) -> None:
+        table = arrow.messages_to_arrow(self._message_type, chunks)
+        self._parquet.write_table(table, path)
+
+
+_WRITERS = {NDJSON: _NdjsonWriter, PARQUET: _ParquetWriter}
+
+
+class ExportState:
+    """The progress of an export, saved after every part file.
+
+    Each listing is keyed by ``<resource>/<project>/<location>`` and
+    records the page token it continues from, the part files and rows
+    written, and whether it is done.
+
+    Args:
+        path (str): The state file; loaded if it exists.
+        output_format (str): The format of the export. Resuming an export
+            in another format is refused.
+
+    Raises:
+        ValueError: If the saved export used another format.
+    """
+
+    def __init__(self, path: str, output_format: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._tasks = {}  # type: Dict[str, Dict[str, Any]]
+        self.resumed = os.path.exists(path)
+        if self.resumed:
+            with open(path, encoding="utf-8") as stream:
+                saved = json.load(stream)
+            if saved["format"] != output_format:
+                raise ValueError(
+                    "%s holds an unfinished %s export; finish it or remove the "
+                    "file." % (path, saved["format"])
+                )
+            self._tasks = saved["tasks"]
+        self._format = output_format
+
+    def get(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._tasks.get(key, {}))
+
+    def update(self, key: str, **values: Any) -> None:
+        """Record the progress of a listing and save the state."""
+        with self._lock:
+            self._tasks.setdefault(key, {}).update(values)
+            temporary = self.path + ".tmp"
+            with open(temporary, "w", encoding="utf-8") as stream:
+                json.dump({"format": self._format, "tasks": self._tasks}, stream)
+            os.replace(temporary, self.path)
+
+    def remove(self) -> None:
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+def _export_listing(
+    client: ReservationServiceClient,
+    state: ExportState,
+    output_dir: str,
+    output_format: str,
+    resource: str,
+    project: str,
+    location: str,
+    page_size: int,
+    chunk_rows: int,
+) -> int:
+    """Export one listing; return its total number of rows."""
+    key = "/".join((resource, project, location))
+    progress = state.get(key)
+    if progress.get("done"):
+        return progress["rows"]
+    directory = os.path.join(
+        output_dir, resource, "project=" + project, "location=" + location
+    )
+    os.makedirs(directory, exist_ok=True)
+    writer = _WRITERS[output_format](_message_type(resource))
+    if not progress:
+        # A fresh listing replaces the files of any earlier export.
+        for old in glob.glob(os.path.join(directory, "part-*")):
+            os.remove(old)
+        progress = {"page_token": "", "parts": 0, "rows": 0}
+
+    parts, rows = progress["parts"], progress["rows"]
+    chunks = []  # type: List[Sequence[Any]]
+    buffered = 0
+    pages = _pages(
+        client, resource, project, location, progress["page_token"], page_size
+    )
+    for messages, next_page_token in pages:
+        chunks.append(messages)
+        buffered += len(messages)
+        if buffered < chunk_rows and next_page_token:
+            continue
+        if buffered or not parts:
+            path = os.path.join(directory, "part-%05d%s" % (parts, writer.suffix))
+            writer.write(path + ".tmp", chunks)
+            os.replace(path + ".tmp", path)
+            parts += 1
+            rows += buffered
+        chunks, buffered = [], 0
+        state.update(
+            key,
+            page_token=next_page_token,
+            parts=parts,
+            rows=rows,
+            done=not next_page_token,
+        )
+    return rows
+
+
+def export(
+    client: ReservationServiceClient,
+    projects: Iterable[str],
+    locations: Iterable[str],
+    output_dir: str,
+    *,
+    output_format: str = NDJSON,
+    resources: Iterable[str] = RESOURCES,
+    concurrency: int = 8,
+    page_size: int = 1000,
+    chunk_rows: int = 10000
+) -> Dict[str, int]:
+    """Export the inventory of ``projects`` in ``locations``.
+
+    Resumes an interrupted export found in ``output_dir``. See the module
+    documentation for the layout of the files.
+
+    Args:
+        client (~.ReservationServiceClient): The client to list with.
+        projects (Iterable[str]): The project IDs.
+        locations (Iterable[str]): The locations, e.g. ``"US"``.
+        output_dir (str): The directory to write to.
+        output_format (str): ``"ndjson"`` or ``"parquet"``.
+        resources (Iterable[str]): The resources to export, among
+            :data:`RESOURCES`.
+        concurrency (int): The number of listings run at once.
+        page_size (int): The page size of the list requests.
+        chunk_rows (int): The rows after which a part file is written.
+
+    Returns:
+        Dict[str, int]: The number of rows exported per resource.
+
+    Raises:
+        ValueError: If an argument is invalid, or an unfinished export in
+            another format is in ``output_dir``.
+        google.api_core.exceptions.GoogleAPICallError: If a listing
+            failed; the others still run to completion, and the next run
+            resumes the failed one.
+    """
+    resources = tuple(resources)
+    projects = list(projects)
+    locations = list(locations)
+    if output_format not in FORMATS:
+        raise ValueError("Unknown format %r." % output_format)
+    unknown = set(resources) - set(RESOURCES)
+    if unknown:
+        raise ValueError("Unknown resources: %s" % ", ".join(sorted(unknown)))
+    if concurrency < 1 or page_size < 1 or chunk_rows < 1:
+        raise ValueError("concurrency, page_size and chunk_rows must be positive.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    state = ExportState(os.path.join(output_dir, STATE_FILE), output_format)
+    listings = [
+        (resource, project, location)
+        for resource in resources
+        for project in projects
+        for location in locations
+    ]
+    totals = {resource: 0 for resource in resources}
+    errors = []
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        running = {
+            executor.submit(
+                _export_listing,
+                client,
+                state,
+                output_dir,
+                output_format,
+                resource,
+                project,
+                location,
+                page_size,
+                chunk_rows,
+            ): resource
+            for resource, project, location in listings
+        }
+        for future in futures.as_completed(running):
+            try:
+                totals[running[future]] += future.result()
+            except Exception as exc:
+                errors.append(exc)
+    if errors:
+        raise errors[0]
+    state.remove()
+    return totals
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bq-reservation-export", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--project", action="append", required=True, help="Repeat for more."
+    )
+    parser.add_argument(
+        "--location", action="append", required=True, help="Repeat for more."
+    )
+    parser.add_argument("--output-dir", required=True)
+    parser.add_argument("--format", choices=FORMATS, default=NDJSON)
+    parser.add_argument(
+        "--resource",
+        action="append",
+        choices=RESOURCES,
+        help="Repeat for more; all resources by default.",
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--chunk-rows", type=int, default=10000)
+    parser.add_argument("--api-endpoint", help="Override the service endpoint.")
+    return parser
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Run the ``bq-reservation-export`` command; return its exit status."""
+    args = _parser().parse_args(argv)
+    client_options = None
+    if args.api_endpoint:
+        client_options = {"api_endpoint": args.api_endpoint}
+    client = ReservationServiceClient(client_options=client_options)
+    try:
+        totals = export(
+            client,
+            args.project,
+            args.location,
+            args.output_dir,
+            output_format=args.format,
+            resources=args.resource or RESOURCES,
+            concurrency=args.concurrency,
+            page_size=args.page_size,
+            chunk_rows=args.chunk_rows,
+        )
+    except (ImportError, ValueError) as exc:
+        print("bq-reservation-export: %s" % exc, file=sys.stderr)
+        return 2
+    except Exception as exc:
+        print("Export failed: %s" % exc, file=sys.stderr)
+        print("Run the same command again to resume it.", file=sys.stderr)
+        return 1
+    for resource, rows in totals.items():
+        print("%s: %d rows" % (resource, rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,62 @@
 # limitations under the License.
 #
 
-from .client import ReservationServiceClient
+from google.cloud.bigquery.reservation_v1 import _lazy
 
-__all__ = ("ReservationServiceClient",)
+# Exported names and the modules defining them. The modules are imported
+# on first access; see ``reservation_v1._lazy``.
+_EXPORTS = {
+    "ReservationServiceClient": ".client",
+    "ReservationServiceAsyncClient": ".async_client",
+    "AssignmentIndex": ".assignment_index",
+    "BatchResult": ".batch",
+    "ResourceCache": ".cache",
+    "AssignmentName": ".paths",
+    "BiReservationName": ".paths",
+    "CapacityCommitmentName": ".paths",
+    "ReservationName": ".paths",
+    "WarmupReport": ".transports.base",
+    "ChannelOptions": ".transports.channel_options",
+    "MethodPolicy": ".transports.policy",
+    "RetryPolicy": ".transports.policy",
+    "HedgePolicy": ".transports.policy",
+    "default_policies": ".transports.policy",
+    "RateLimiter": ".transports.ratelimit",
+    "PagerCursor": ".pagers",
+    "ChangeEvent": ".watch",
+    "Watcher": ".watch",
+    "DesiredAssignment": ".reconcile",
+    "ReconcileStep": ".reconcile",
+    "FieldDiff": ".masks",
+    "PortfolioPlan": ".portfolio",
+    "CapacityModel": ".capacity",
+}
+
+__all__ = (
+    "ReservationServiceClient",
+    "ReservationServiceAsyncClient",
+    "BatchResult",
+    "ResourceCache",
+    "AssignmentIndex",
+    "AssignmentName",
+    "BiReservationName",
+    "CapacityCommitmentName",
+    "ReservationName",
+    "ChannelOptions",
+    "WarmupReport",
+    "MethodPolicy",
+    "RetryPolicy",
+    "HedgePolicy",
+    "default_policies",
+    "RateLimiter",
+    "PagerCursor",
+    "ChangeEvent",
+    "Watcher",
+    "DesiredAssignment",
+    "ReconcileStep",
+    "FieldDiff",
+    "PortfolioPlan",
+    "CapacityModel",
+)
+
+__getattr__, __dir__ = _lazy.attach(__name__, _EXPORTS)
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Columnar export of list results.
+
+The pagers' ``to_arrow`` and ``to_dataframe`` build one Arrow record
+batch per page, reading the columns straight from the page's protobuf
+messages rather than through proto-plus wrappers. Enums are dictionary
+encoded with their names, and timestamps become ``timestamp[us, UTC]``.
+
+``pyarrow``, and ``pandas`` for ``to_dataframe``, are optional; install
+them with the ``pandas`` extra.
+"""
+
+import enum
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple, Type
+
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+
+_INSTALL_HINT = (
+    "Install it with `pip install google-cloud-bigquery-reservation[pandas]`."
+)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow  # type: ignore
+    except ImportError as exc:
+        raise ImportError("to_arrow() requires pyarrow. " + _INSTALL_HINT) from exc
+    return pyarrow
+
+
+def _import_pandas():
+    try:
+        import pandas  # type: ignore
+    except ImportError as exc:
+        raise ImportError("to_dataframe() requires pandas. " + _INSTALL_HINT) from exc
+    return pandas
+
+
+def _timestamp_micros(field: str) -> Callable[[Sequence[Any]], List[Any]]:
+    def values(messages):
+        result = []
+        for message in messages:
+            if message.HasField(field):
+                value = getattr(message, field)
+                result.append(value.seconds * 1000000 + value.nanos // 1000)
+            else:
+                result.append(None)
+        return result
+
+    return values
+
+
+def _nested(field: str, subfield: str) -> Callable[[Sequence[Any]], List[Any]]:
+    def values(messages):
+        return [
+            getattr(getattr(message, field), subfield)
+            if message.HasField(field)
+            else None
+            for message in messages
+        ]
+
+    return values
+
+
+def _scalar(field: str) -> Callable[[Sequence[Any]], List[Any]]:
+    def values(messages):
+        return [getattr(message, field) for message in messages]
+
+    return values
+
+
+# The column kinds, each mapped to its Arrow type when pyarrow is imported.
+_STRING = "string"
+_INT32 = "int32"
+_INT64 = "int64"
+_BOOL = "bool"
+_TIMESTAMP = "timestamp"
+
+# Message type -> columns of (name, kind or enum class, values of a page).
+_COLUMNS = {
+    reservation.Reservation: (
+        ("name", _STRING, _scalar("name")),
+        ("slot_capacity", _INT64, _scalar("slot_capacity")),
+        ("ignore_idle_slots", _BOOL, _scalar("ignore_idle_slots")),
+    ),
+    reservation.CapacityCommitment: (
+        ("name", _STRING, _scalar("name")),
+        ("slot_count", _INT64, _scalar("slot_count")),
+        ("plan", reservation.CapacityCommitment.CommitmentPlan, _scalar("plan")),
+        ("state", reservation.CapacityCommitment.State, _scalar("state")),
+        ("commitment_end_time", _TIMESTAMP, _timestamp_micros("commitment_end_time")),
+        ("failure_status_code", _INT32, _nested("failure_status", "code")),
+        ("failure_status_message", _STRING, _nested("failure_status", "message")),
+        (
+            "renewal_plan",
+            reservation.CapacityCommitment.CommitmentPlan,
+            _scalar("renewal_plan"),
+        ),
+    ),
+    reservation.Assignment: (
+        ("name", _STRING, _scalar("name")),
+        ("assignee", _STRING, _scalar("assignee")),
+        ("job_type", reservation.Assignment.JobType, _scalar("job_type")),
+        ("state", reservation.Assignment.State, _scalar("state")),
+    ),
+    reservation.BiReservation: (
+        ("name", _STRING, _scalar("name")),
+        ("update_time", _TIMESTAMP, _timestamp_micros("update_time")),
+        ("size", _INT64, _scalar("size")),
+    ),
+}  # type: Dict[Type, Tuple[Tuple[str, Any, Callable], ...]]
+
+
+class _Converter:
+    """Converts pages of one message type to Arrow record batches."""
+
+    def __init__(self, message_type: Type) -> None:
+        pa = self.pyarrow = _import_pyarrow()
+        scalar_types = {
+            _STRING: pa.string(),
+            _INT32: pa.int32(),
+            _INT64: pa.int64(),
+            _BOOL: pa.bool_(),
+            _TIMESTAMP: pa.timestamp("us", tz="UTC"),
+        }
+        self._columns = []
+        fields = []
+        for name, kind, values in _COLUMNS[message_type]:
+            if isinstance(kind, type) and issubclass(kind, enum.Enum):
+                # Unknown enum values, e.g. from a newer server, are null.
+                positions = {member.value: i for i, member in enumerate(kind)}
+                dictionary = pa.array([member.name for member in kind])
+                arrow_type = pa.dictionary(pa.int32(), pa.string())
+                self._columns.append((values, None, (positions, dictionary)))
+            else:
+                arrow_type = scalar_types[kind]
+                self._columns.append((values, arrow_type, None))
+            fields.append(pa.field(name, arrow_type))
+        self.schema = pa.schema(fields)
+
+    def record_batch(self, messages: Sequence[Any]) -> Any:
+        """Return the record batch of a page's raw protobuf messages."""
+        pa = self.pyarrow
+        arrays = []
+        for values, arrow_type, enum_encoding in self._columns:
+            if enum_encoding is None:
+                arrays.append(pa.array(values(messages), type=arrow_type))
+                continue
+            positions, dictionary = enum_encoding
+            indices = pa.array(
+                [positions.get(value) for value in values(messages)], type=pa.int32()
+            )
+            arrays.append(pa.DictionaryArray.from_arrays(indices, dictionary))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+def messages_to_arrow(message_type: Type, chunks: Iterable[Sequence[Any]]) -> Any:
+    """Return chunks of raw protobuf messages as a ``pyarrow.Table``.
+
+    Args:
+        message_type (Type): The proto-plus class wrapping the messages.
+        chunks (Iterable[Sequence]): The messages, one record batch per
+            chunk.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    converter = _Converter(message_type)
+    batches = [converter.record_batch(messages) for messages in chunks]
+    return converter.pyarrow.Table.from_batches(batches, schema=converter.schema)
+
+
+def to_arrow(message_type: Type, field: str, pages: Iterable[Any]) -> Any:
+    """Return the items of ``pages`` as a ``pyarrow.Table``.
+
+    Args:
+        message_type (Type): The proto-plus class of the items.
+        field (str): The repeated field of each page holding the items.
+        pages (Iterable): The list responses.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    return messages_to_arrow(
+        message_type, (getattr(type(page).pb(page), field) for page in pages)
+    )
+
+
+async def to_arrow_async(message_type: Type, field: str, pages: Any) -> Any:
+    """The AsyncIO counterpart of :func:`to_arrow`, for an async iterable
+    of pages."""
+    converter = _Converter(message_type)
+    batches = []
+    async for page in pages:
+        batches.append(converter.record_batch(getattr(type(page).pb(page), field)))
+    return converter.pyarrow.Table.from_batches(batches, schema=converter.schema)
+
+
+def to_dataframe(table: Any) -> Any:
+    """Return ``table`` as a ``pandas.DataFrame``; enums become categoricals.
+
+    Raises:
+        ImportError: If pandas is not installed.
+    """
+    _import_pandas()
+    return table.to_pandas()
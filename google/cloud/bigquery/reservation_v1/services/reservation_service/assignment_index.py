@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+
+# (location, assignee, job type)
+_Key = Tuple[str, str, int]
+
+
+class AssignmentIndex:
+    """An in-memory index resolving which assignment applies to a resource.
+
+    The index is loaded with ``list_assignments`` over one or more
+    ``projects/{project}/locations/{location}/reservations/-`` parents and
+    then answers lookups locally, applying the same rules as
+    ``search_assignments``: for a given job type, the assignment of the
+    resource itself wins, otherwise that of its closest ancestor folder
+    or organization. A lookup costs one dictionary probe per level of the
+    resource hierarchy.
+
+    The resource hierarchy comes from ``get_parent``, a callable mapping a
+    resource name to the name of its parent, or ``None`` at the top. A
+    plain ``dict``'s ``get`` method works for a static hierarchy; a
+    callable backed by the Resource Manager API works too, since the
+    ancestors of each resource are memoized until the next full refresh.
+
+    Args:
+        client (~.ReservationServiceClient): The client used to list
+            assignments.
+        parents (Iterable[str]): The ``.../reservations/-`` parents to
+            index, e.g. ``projects/admin/locations/US/reservations/-``.
+        get_parent (Callable[[str], Optional[str]]): Returns the parent of
+            a project or folder, e.g. ``folders/123`` for ``projects/p``.
+        max_concurrency (int): The maximum number of parents listed
+            concurrently during a refresh.
+    """
+
+    def __init__(
+        self,
+        client,
+        parents: Iterable[str],
+        get_parent: Callable[[str], Optional[str]],
+        *,
+        max_concurrency: int = 8
+    ) -> None:
+        self._client = client
+        self._parents = list(parents)
+        self._get_parent = get_parent
+        self._max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._entries = {}  # type: Dict[_Key, reservation.Assignment]
+        self._keys_by_parent = {}  # type: Dict[str, Set[_Key]]
+        self._ancestors = {}  # type: Dict[str, Tuple[str, ...]]
+
+    def refresh(self, parents: Iterable[str] = None) -> None:
+        """Reload the assignments listed under ``parents``.
+
+        Only the given parents are re-listed; entries loaded from other
+        parents are kept. Refreshing every parent also forgets the
+        memoized resource hierarchy. The index is updated atomically, and
+        left unchanged if listing any parent fails.
+
+        Args:
+            parents (Optional[Iterable[str]]): The parents to reload; all
+                indexed parents if omitted. New parents are added to the
+                index.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If listing a
+                parent failed.
+        """
+        full = parents is None
+        parents = self._parents if full else list(parents)
+        listed = {parent: [] for parent in parents}  # type: Dict[str, List]
+        for result in self._client.batch_list_assignments(
+            parents, max_concurrency=self._max_concurrency
+        ):
+            if not result.ok:
+                raise result.error
+            listed[result.item].append(result.response)
+
+        with self._lock:
+            entries = dict(self._entries)
+            keys_by_parent = dict(self._keys_by_parent)
+            for parent, assignments in listed.items():
+                for key in keys_by_parent.pop(parent, ()):
+                    entries.pop(key, None)
+                keys = keys_by_parent[parent] = set()
+                for assignment in assignments:
+                    key = _key(assignment)
+                    entries[key] = assignment
+                    keys.add(key)
+                if parent not in self._parents:
+                    self._parents.append(parent)
+            self._entries = entries
+            self._keys_by_parent = keys_by_parent
+            if full:
+                self._ancestors = {}
+
+    def add(self, assignment: reservation.Assignment) -> None:
+        """Index an assignment, e.g. one just returned by ``create_assignment``.
+
+        Args:
+            assignment (~.reservation.Assignment): The assignment; its
+                ``name`` must be set.
+        """
+        key = _key(assignment)
+        parent = _indexed_parent(assignment.name)
+        with self._lock:
+            entries = dict(self._entries)
+            entries[key] = assignment
+            self._keys_by_parent.setdefault(parent, set()).add(key)
+            self._entries = entries
+
+    def remove(self, name: str) -> None:
+        """Drop an assignment, e.g. after ``delete_assignment``.
+
+        Args:
+            name (str): The resource name of the assignment.
+        """
+        with self._lock:
+            entries = {
+                key: assignment
+                for key, assignment in self._entries.items()
+                if assignment.name != name
+            }
+            for key in self._entries.keys() - entries.keys():
+                for keys in self._keys_by_parent.values():
+                    keys.discard(key)
+            self._entries = entries
+
+    def lookup(
+        self, assignee: str, job_type: reservation.Assignment.JobType, location: str
+    ) -> Optional[reservation.Assignment]:
+        """Return the assignment that applies to ``assignee``.
+
+        Args:
+            assignee (str): A project, folder or organization, e.g.
+                ``projects/myproject``.
+            job_type (~.reservation.Assignment.JobType): The job type.
+            location (str): The location, e.g. ``US``.
+
+        Returns:
+            Optional[~.reservation.Assignment]: The assignment of the
+            closest resource, starting with ``assignee`` itself, that has
+            one for ``job_type``; ``None`` if there is none. The returned
+            message is shared with the index and must not be modified.
+        """
+        entries = self._entries
+        for resource in self._ancestors_of(assignee):
+            assignment = entries.get((location, resource, job_type))
+            if assignment is not None:
+                return assignment
+        return None
+
+    def reservation_for(
+        self, assignee: str, job_type: reservation.Assignment.JobType, location: str
+    ) -> Optional[str]:
+        """Return the name of the reservation ``assignee`` uses, if any.
+
+        Takes the same arguments as :meth:`lookup`.
+
+        Returns:
+            Optional[str]: The reservation name, e.g.
+            ``projects/admin/locations/US/reservations/prod``, or ``None``
+            if jobs of this type run on on-demand capacity.
+        """
+        assignment = self.lookup(assignee, job_type, location)
+        if assignment is None:
+            return None
+        return assignment.name.rsplit("/assignments/", 1)[0]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _ancestors_of(self, resource: str) -> Tuple[str, ...]:
+        ancestors = self._ancestors.get(resource)
+        if ancestors is None:
+            chain = []  # type: List[str]
+            node = resource  # type: Optional[str]
+            while node and node not in chain:
+                chain.append(node)
+                node = self._get_parent(node)
+            ancestors = self._ancestors[resource] = tuple(chain)
+        return ancestors
+
+
+def _key(assignment: reservation.Assignment) -> _Key:
+    # projects/{project}/locations/{location}/reservations/{r}/assignments/{a}
+    location = assignment.name.split("/")[3]
+    return (location, assignment.assignee, assignment.job_type)
+
+
+def _indexed_parent(name: str) -> str:
+    return name.split("/reservations/", 1)[0] + "/reservations/-"
+
+
+__all__ = ("AssignmentIndex",)
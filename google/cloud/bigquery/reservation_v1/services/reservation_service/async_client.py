@@ -0,0 +1,1968 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import functools
+from typing import Mapping, Sequence, Tuple, Type, Union
+
+import google.api_core.client_options as ClientOptions  # type: ignore
+from google.api_core import exceptions  # type: ignore
+from google.api_core import gapic_v1  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+from google.auth import credentials  # type: ignore
+from google.oauth2 import service_account  # type: ignore
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import pagers
+from google.cloud.bigquery.reservation_v1.types import reservation
+from google.cloud.bigquery.reservation_v1.types import reservation as gcbr_reservation
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
+from google.rpc import status_pb2 as status  # type: ignore
+
+from . import masks
+from .transports.base import ReservationServiceTransport, WarmupReport
+from .transports.channel_options import ChannelOptions
+from .transports.policy import MethodPolicy
+from .transports.ratelimit import RateLimiter
+from .client import ReservationServiceClient
+
+
+class ReservationServiceAsyncClient:
+    """This API allows users to manage their flat-rate BigQuery
+    reservations.
+
+    A reservation provides computational resource guarantees, in the
+    form of `slots <https://cloud.google.com/bigquery/docs/slots>`__, to
+    users. A slot is a unit of computational power in BigQuery, and
+    serves as the basic unit of parallelism. In a scan of a
+    multi-partitioned table, a single slot operates on a single
+    partition of the table. A reservation resource exists as a child
+    resource of the admin project and location, e.g.:
+    ``projects/myproject/locations/US/reservations/reservationName``.
+
+    A capacity commitment is a way to purchase compute capacity for
+    BigQuery jobs (in the form of slots) with some committed period of
+    usage. A capacity commitment resource exists as a child resource of
+    the admin project and location, e.g.:
+    ``projects/myproject/locations/US/capacityCommitments/id``.
+    """
+
+    _client: ReservationServiceClient
+
+    DEFAULT_ENDPOINT = ReservationServiceClient.DEFAULT_ENDPOINT
+    DEFAULT_MTLS_ENDPOINT = ReservationServiceClient.DEFAULT_MTLS_ENDPOINT
+
+    assignment_path = staticmethod(ReservationServiceClient.assignment_path)
+    parse_assignment_path = staticmethod(ReservationServiceClient.parse_assignment_path)
+    reservation_path = staticmethod(ReservationServiceClient.reservation_path)
+    parse_reservation_path = staticmethod(
+        ReservationServiceClient.parse_reservation_path
+    )
+    capacity_commitment_path = staticmethod(
+        ReservationServiceClient.capacity_commitment_path
+    )
+    parse_capacity_commitment_path = staticmethod(
+        ReservationServiceClient.parse_capacity_commitment_path
+    )
+    bi_reservation_path = staticmethod(ReservationServiceClient.bi_reservation_path)
+    parse_bi_reservation_path = staticmethod(
+        ReservationServiceClient.parse_bi_reservation_path
+    )
+
+    from_service_account_file = classmethod(
+        ReservationServiceClient.from_service_account_file.__func__  # type: ignore
+    )
+    from_service_account_json = from_service_account_file
+
+    get_transport_class = functools.partial(
+        type(ReservationServiceClient).get_transport_class,
+        type(ReservationServiceClient),
+    )
+
+    def __init__(
+        self,
+        *,
+        credentials: credentials.Credentials = None,
+        transport: Union[str, ReservationServiceTransport] = "grpc_asyncio",
+        client_options: ClientOptions = None,
+        channel_options: Union[ChannelOptions, dict] = None,
+        method_policies: Mapping[str, MethodPolicy] = None,
+        rate_limiter: RateLimiter = None,
+    ) -> None:
+        """Instantiate the reservation service client.
+
+        Args:
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. These
+                credentials identify the application to the service; if none
+                are specified, the client will attempt to ascertain the
+                credentials from the environment.
+            transport (Union[str, ~.ReservationServiceTransport]): The
+                transport to use. Defaults to the ``grpc_asyncio`` transport,
+                also if None; an instance must be an AsyncIO transport.
+            client_options (ClientOptions): Custom options for the client.
+                (1) The ``api_endpoint`` property can be used to override the
+                default endpoint provided by the client.
+                (2) If ``transport`` argument is None, ``client_options`` can be
+                used to create a mutual TLS transport. If ``client_cert_source``
+                is provided, mutual TLS transport will be created with the given
+                ``api_endpoint`` or the default mTLS endpoint, and the client
+                SSL credentials obtained from ``client_cert_source``.
+            channel_options (Union[~.ChannelOptions, dict]): Keepalive,
+                compression, message size and flow-control options for the
+                channel of the transport. They can also be set as the
+                ``channel_options`` key or attribute of ``client_options``.
+            method_policies (Optional[Mapping[str, ~.MethodPolicy]]): The
+                default deadline and retry of methods, keyed by method
+                name, e.g. ``"get_reservation"``. Hedging is not supported
+                by the AsyncIO transport.
+            rate_limiter (Optional[~.RateLimiter]): Paces the calls of every
+                method to stay within per-project and per-method quotas,
+                adapting to ``RESOURCE_EXHAUSTED`` errors. Calls are not
+                paced if not set.
+
+        Raises:
+            google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
+                creation failed for any reason.
+        """
+
+        self._client = ReservationServiceClient(
+            credentials=credentials,
+            transport="grpc_asyncio" if transport is None else transport,
+            client_options=client_options,
+            channel_options=channel_options,
+            method_policies=method_policies,
+            rate_limiter=rate_limiter,
+        )
+
+    async def warmup(self, *, timeout: float = None) -> WarmupReport:
+        """Prepare the client so the first call pays no setup cost.
+
+        Creates the stub of every method, fetches an access token and
+        connects the channel. Call it once at worker start-up, off the
+        request path; calls work without it.
+
+        Args:
+            timeout (Optional[float]): How long to wait for the channel to
+                connect, in seconds; forever if not set.
+
+        Returns:
+            ~.WarmupReport: How long each step, and the whole warm-up,
+            took.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel did
+                not connect within ``timeout``.
+            google.auth.exceptions.RefreshError: If fetching the access
+                token failed.
+        """
+        return await self._client._transport.warmup(timeout=timeout)
+
+    async def create_reservation(
+        self,
+        request: gcbr_reservation.CreateReservationRequest = None,
+        *,
+        parent: str = None,
+        reservation: gcbr_reservation.Reservation = None,
+        reservation_id: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> gcbr_reservation.Reservation:
+        r"""Creates a new reservation resource.
+
+        Args:
+            request (:class:`~.gcbr_reservation.CreateReservationRequest`):
+                The request object. The request for
+                [ReservationService.CreateReservation][google.cloud.bigquery.reservation.v1.ReservationService.CreateReservation].
+            parent (:class:`str`):
+                Required. Project, location. E.g.,
+                ``projects/myproject/locations/US``
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            reservation (:class:`~.gcbr_reservation.Reservation`):
+                Definition of the new reservation to
+                create.
+                This corresponds to the ``reservation`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            reservation_id (:class:`str`):
+                The reservation ID. This field must
+                only contain lower case alphanumeric
+                characters or dash. Max length is 64
+                characters.
+                This corresponds to the ``reservation_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.gcbr_reservation.Reservation:
+                A reservation is a mechanism used to
+                guarantee slots to users.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, reservation, reservation_id]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = gcbr_reservation.CreateReservationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if reservation is not None:
+            request.reservation = reservation
+        if reservation_id is not None:
+            request.reservation_id = reservation_id
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.create_reservation
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def list_reservations(
+        self,
+        request: reservation.ListReservationsRequest = None,
+        *,
+        parent: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        cursor: pagers.PagerCursor = None,
+    ) -> pagers.ListReservationsAsyncPager:
+        r"""Lists all the reservations for the project in the
+        specified location.
+
+        Args:
+            request (:class:`~.reservation.ListReservationsRequest`):
+                The request object. The request for
+                [ReservationService.ListReservations][google.cloud.bigquery.reservation.v1.ReservationService.ListReservations].
+            parent (:class:`str`):
+                Required. The parent resource name
+                containing project and location, e.g.:
+                "projects/myproject/locations/US".
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager fetches
+                ahead in the background while the current page is consumed.
+                Defaults to ``0``, which fetches pages on demand.
+            cursor (~.pagers.PagerCursor): The ``cursor`` of an earlier
+                pager of this method, to resume its listing from the next
+                page. If set, neither ``request`` nor the individual field
+                arguments should be set.
+
+        Returns:
+            ~.pagers.ListReservationsAsyncPager:
+                The response for
+                [ReservationService.ListReservations][google.cloud.bigquery.reservation.v1.ReservationService.ListReservations].
+
+                Iterating over this object will yield results and
+                resolve additional pages automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        if cursor is not None:
+            if request is not None or any([parent]):
+                raise ValueError(
+                    "If the `cursor` argument is set, then neither the "
+                    "`request` argument nor any of the individual field "
+                    "arguments should be set."
+                )
+            request = cursor.to_request(
+                "list_reservations", reservation.ListReservationsRequest
+            )
+
+        request = reservation.ListReservationsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_reservations
+        ]
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+        )
+
+        # Send the request, unless resuming a listing that has no more pages.
+        if cursor is not None and cursor.exhausted:
+            response = reservation.ListReservationsResponse()
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata
+            )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListReservationsAsyncPager(
+            method=rpc, request=request, response=response, prefetch=prefetch
+        )
+
+        # Done; return the response.
+        return response
+
+    async def get_reservation(
+        self,
+        request: reservation.GetReservationRequest = None,
+        *,
+        name: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.Reservation:
+        r"""Returns information about the reservation.
+
+        Args:
+            request (:class:`~.reservation.GetReservationRequest`):
+                The request object. The request for
+                [ReservationService.GetReservation][google.cloud.bigquery.reservation.v1.ReservationService.GetReservation].
+            name (:class:`str`):
+                Required. Resource name of the reservation to retrieve.
+                E.g.,
+                ``projects/myproject/locations/US/reservations/team1-prod``
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.Reservation:
+                A reservation is a mechanism used to
+                guarantee slots to users.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.GetReservationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.get_reservation
+        ]
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+        )
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def delete_reservation(
+        self,
+        request: reservation.DeleteReservationRequest = None,
+        *,
+        name: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> None:
+        r"""Deletes a reservation. Returns
+        ``google.rpc.Code.FAILED_PRECONDITION`` when reservation has
+        assignments.
+
+        Args:
+            request (:class:`~.reservation.DeleteReservationRequest`):
+                The request object. The request for
+                [ReservationService.DeleteReservation][google.cloud.bigquery.reservation.v1.ReservationService.DeleteReservation].
+            name (:class:`str`):
+                Required. Resource name of the reservation to retrieve.
+                E.g.,
+                ``projects/myproject/locations/US/reservations/team1-prod``
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.DeleteReservationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.delete_reservation
+        ]
+
+        # Send the request.
+        await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+    async def update_reservation(
+        self,
+        request: gcbr_reservation.UpdateReservationRequest = None,
+        *,
+        reservation: gcbr_reservation.Reservation = None,
+        update_mask: field_mask.FieldMask = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> gcbr_reservation.Reservation:
+        r"""Updates an existing reservation resource.
+
+        Args:
+            request (:class:`~.gcbr_reservation.UpdateReservationRequest`):
+                The request object. The request for
+                [ReservationService.UpdateReservation][google.cloud.bigquery.reservation.v1.ReservationService.UpdateReservation].
+            reservation (:class:`~.gcbr_reservation.Reservation`):
+                Content of the reservation to update.
+                This corresponds to the ``reservation`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            update_mask (:class:`~.field_mask.FieldMask`):
+                Standard field mask for the set of
+                fields to be updated.
+                This corresponds to the ``update_mask`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.gcbr_reservation.Reservation:
+                A reservation is a mechanism used to
+                guarantee slots to users.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([reservation, update_mask]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = gcbr_reservation.UpdateReservationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if reservation is not None:
+            request.reservation = reservation
+        if update_mask is not None:
+            request.update_mask = update_mask
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.update_reservation
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def create_capacity_commitment(
+        self,
+        request: reservation.CreateCapacityCommitmentRequest = None,
+        *,
+        parent: str = None,
+        capacity_commitment: reservation.CapacityCommitment = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.CapacityCommitment:
+        r"""Creates a new capacity commitment resource.
+
+        Args:
+            request (:class:`~.reservation.CreateCapacityCommitmentRequest`):
+                The request object. The request for
+                [ReservationService.CreateCapacityCommitment][google.cloud.bigquery.reservation.v1.ReservationService.CreateCapacityCommitment].
+            parent (:class:`str`):
+                Required. Resource name of the parent
+                reservation. E.g.,
+                projects/myproject/locations/US
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            capacity_commitment (:class:`~.reservation.CapacityCommitment`):
+                Content of the capacity commitment to
+                create.
+                This corresponds to the ``capacity_commitment`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.CapacityCommitment:
+                Capacity commitment is a way to
+                purchase compute capacity for BigQuery
+                jobs (in the form of slots) with some
+                committed period of usage. Annual
+                commitments renew by default.
+                Commitments can be removed after their
+                commitment end time passes.
+
+                In order to remove annual commitment,
+                its plan needs to be changed to monthly
+                or flex first.
+
+                A capacity commitment resource exists as
+                a child resource of the admin project.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, capacity_commitment]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.CreateCapacityCommitmentRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if capacity_commitment is not None:
+            request.capacity_commitment = capacity_commitment
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.create_capacity_commitment
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def list_capacity_commitments(
+        self,
+        request: reservation.ListCapacityCommitmentsRequest = None,
+        *,
+        parent: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        cursor: pagers.PagerCursor = None,
+    ) -> pagers.ListCapacityCommitmentsAsyncPager:
+        r"""Lists all the capacity commitments for the admin
+        project.
+
+        Args:
+            request (:class:`~.reservation.ListCapacityCommitmentsRequest`):
+                The request object. The request for
+                [ReservationService.ListCapacityCommitments][google.cloud.bigquery.reservation.v1.ReservationService.ListCapacityCommitments].
+            parent (:class:`str`):
+                Required. Resource name of the parent
+                reservation. E.g.,
+                projects/myproject/locations/US
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager fetches
+                ahead in the background while the current page is consumed.
+                Defaults to ``0``, which fetches pages on demand.
+            cursor (~.pagers.PagerCursor): The ``cursor`` of an earlier
+                pager of this method, to resume its listing from the next
+                page. If set, neither ``request`` nor the individual field
+                arguments should be set.
+
+        Returns:
+            ~.pagers.ListCapacityCommitmentsAsyncPager:
+                The response for
+                [ReservationService.ListCapacityCommitments][google.cloud.bigquery.reservation.v1.ReservationService.ListCapacityCommitments].
+
+                Iterating over this object will yield results and
+                resolve additional pages automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        if cursor is not None:
+            if request is not None or any([parent]):
+                raise ValueError(
+                    "If the `cursor` argument is set, then neither the "
+                    "`request` argument nor any of the individual field "
+                    "arguments should be set."
+                )
+            request = cursor.to_request(
+                "list_capacity_commitments", reservation.ListCapacityCommitmentsRequest
+            )
+
+        request = reservation.ListCapacityCommitmentsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_capacity_commitments
+        ]
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+        )
+
+        # Send the request, unless resuming a listing that has no more pages.
+        if cursor is not None and cursor.exhausted:
+            response = reservation.ListCapacityCommitmentsResponse()
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata
+            )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListCapacityCommitmentsAsyncPager(
+            method=rpc, request=request, response=response, prefetch=prefetch
+        )
+
+        # Done; return the response.
+        return response
+
+    async def get_capacity_commitment(
+        self,
+        request: reservation.GetCapacityCommitmentRequest = None,
+        *,
+        name: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.CapacityCommitment:
+        r"""Returns information about the capacity commitment.
+
+        Args:
+            request (:class:`~.reservation.GetCapacityCommitmentRequest`):
+                The request object. The request for
+                [ReservationService.GetCapacityCommitment][google.cloud.bigquery.reservation.v1.ReservationService.GetCapacityCommitment].
+            name (:class:`str`):
+                Required. Resource name of the
+                capacity commitment to retrieve. E.g.,
+                projects/myproject/locations/US/capacityCommitments/123
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.CapacityCommitment:
+                Capacity commitment is a way to
+                purchase compute capacity for BigQuery
+                jobs (in the form of slots) with some
+                committed period of usage. Annual
+                commitments renew by default.
+                Commitments can be removed after their
+                commitment end time passes.
+
+                In order to remove annual commitment,
+                its plan needs to be changed to monthly
+                or flex first.
+
+                A capacity commitment resource exists as
+                a child resource of the admin project.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.GetCapacityCommitmentRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.get_capacity_commitment
+        ]
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+        )
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def delete_capacity_commitment(
+        self,
+        request: reservation.DeleteCapacityCommitmentRequest = None,
+        *,
+        name: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> None:
+        r"""Deletes a capacity commitment. Attempting to delete capacity
+        commitment before its commitment_end_time will fail with the
+        error code ``google.rpc.Code.FAILED_PRECONDITION``.
+
+        Args:
+            request (:class:`~.reservation.DeleteCapacityCommitmentRequest`):
+                The request object. The request for
+                [ReservationService.DeleteCapacityCommitment][google.cloud.bigquery.reservation.v1.ReservationService.DeleteCapacityCommitment].
+            name (:class:`str`):
+                Required. Resource name of the
+                capacity commitment to delete. E.g.,
+                projects/myproject/locations/US/capacityCommitments/123
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.DeleteCapacityCommitmentRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.delete_capacity_commitment
+        ]
+
+        # Send the request.
+        await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+    async def update_capacity_commitment(
+        self,
+        request: reservation.UpdateCapacityCommitmentRequest = None,
+        *,
+        capacity_commitment: reservation.CapacityCommitment = None,
+        update_mask: field_mask.FieldMask = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.CapacityCommitment:
+        r"""Updates an existing capacity commitment.
+
+        Only ``plan`` and ``renewal_plan`` fields can be updated.
+
+        Plan can only be changed to a plan of a longer commitment
+        period. Attempting to change to a plan with shorter commitment
+        period will fail with the error code
+        ``google.rpc.Code.FAILED_PRECONDITION``.
+
+        Args:
+            request (:class:`~.reservation.UpdateCapacityCommitmentRequest`):
+                The request object. The request for
+                [ReservationService.UpdateCapacityCommitment][google.cloud.bigquery.reservation.v1.ReservationService.UpdateCapacityCommitment].
+            capacity_commitment (:class:`~.reservation.CapacityCommitment`):
+                Content of the capacity commitment to
+                update.
+                This corresponds to the ``capacity_commitment`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            update_mask (:class:`~.field_mask.FieldMask`):
+                Standard field mask for the set of
+                fields to be updated.
+                This corresponds to the ``update_mask`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.CapacityCommitment:
+                Capacity commitment is a way to
+                purchase compute capacity for BigQuery
+                jobs (in the form of slots) with some
+                committed period of usage. Annual
+                commitments renew by default.
+                Commitments can be removed after their
+                commitment end time passes.
+
+                In order to remove annual commitment,
+                its plan needs to be changed to monthly
+                or flex first.
+
+                A capacity commitment resource exists as
+                a child resource of the admin project.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([capacity_commitment, update_mask]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.UpdateCapacityCommitmentRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if capacity_commitment is not None:
+            request.capacity_commitment = capacity_commitment
+        if update_mask is not None:
+            request.update_mask = update_mask
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.update_capacity_commitment
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def split_capacity_commitment(
+        self,
+        request: reservation.SplitCapacityCommitmentRequest = None,
+        *,
+        name: str = None,
+        slot_count: int = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.SplitCapacityCommitmentResponse:
+        r"""Splits capacity commitment to two commitments of the same plan
+        and ``commitment_end_time``.
+
+        A common use case is to enable downgrading commitments.
+
+        For example, in order to downgrade from 10000 slots to 8000, you
+        might split a 10000 capacity commitment into commitments of 2000
+        and 8000. Then, you would change the plan of the first one to
+        ``FLEX`` and then delete it.
+
+        Args:
+            request (:class:`~.reservation.SplitCapacityCommitmentRequest`):
+                The request object. The request for
+                [ReservationService.SplitCapacityCommitment][google.cloud.bigquery.reservation.v1.ReservationService.SplitCapacityCommitment].
+            name (:class:`str`):
+                Required. The resource name e.g.,:
+                projects/myproject/locations/US/capacityCommitments/123
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            slot_count (:class:`int`):
+                Number of slots in the capacity
+                commitment after the split.
+                This corresponds to the ``slot_count`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.SplitCapacityCommitmentResponse:
+                The response for
+                [ReservationService.SplitCapacityCommitment][google.cloud.bigquery.reservation.v1.ReservationService.SplitCapacityCommitment].
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name, slot_count]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.SplitCapacityCommitmentRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+        if slot_count is not None:
+            request.slot_count = slot_count
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.split_capacity_commitment
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def merge_capacity_commitments(
+        self,
+        request: reservation.MergeCapacityCommitmentsRequest = None,
+        *,
+        parent: str = None,
+        capacity_commitment_ids: Sequence[str] = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.CapacityCommitment:
+        r"""Merges capacity commitments of the same plan into a single
+        commitment.
+
+        The resulting capacity commitment has the greater
+        commitment_end_time out of the to-be-merged capacity
+        commitments.
+
+        Attempting to merge capacity commitments of different plan will
+        fail with the error code
+        ``google.rpc.Code.FAILED_PRECONDITION``.
+
+        Args:
+            request (:class:`~.reservation.MergeCapacityCommitmentsRequest`):
+                The request object. The request for
+                [ReservationService.MergeCapacityCommitments][google.cloud.bigquery.reservation.v1.ReservationService.MergeCapacityCommitments].
+            parent (:class:`str`):
+                Parent resource that identifies admin
+                project and location e.g.,
+                projects/myproject/locations/us
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            capacity_commitment_ids (:class:`Sequence[str]`):
+                Ids of capacity commitments to merge.
+                These capacity commitments must exist
+                under admin project and location
+                specified in the parent.
+                This corresponds to the ``capacity_commitment_ids`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.CapacityCommitment:
+                Capacity commitment is a way to
+                purchase compute capacity for BigQuery
+                jobs (in the form of slots) with some
+                committed period of usage. Annual
+                commitments renew by default.
+                Commitments can be removed after their
+                commitment end time passes.
+
+                In order to remove annual commitment,
+                its plan needs to be changed to monthly
+                or flex first.
+
+                A capacity commitment resource exists as
+                a child resource of the admin project.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, capacity_commitment_ids]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.MergeCapacityCommitmentsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if capacity_commitment_ids is not None:
+            request.capacity_commitment_ids = capacity_commitment_ids
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.merge_capacity_commitments
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def create_assignment(
+        self,
+        request: reservation.CreateAssignmentRequest = None,
+        *,
+        parent: str = None,
+        assignment: reservation.Assignment = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.Assignment:
+        r"""Creates an assignment object which allows the given project to
+        submit jobs of a certain type using slots from the specified
+        reservation.
+
+        Currently a resource (project, folder, organization) can only
+        have one assignment per each (job_type, location) combination,
+        and that reservation will be used for all jobs of the matching
+        type.
+
+        Different assignments can be created on different levels of the
+        projects, folders or organization hierarchy. During query
+        execution, the assignment is looked up at the project, folder
+        and organization levels in that order. The first assignment
+        found is applied to the query.
+
+        When creating assignments, it does not matter if other
+        assignments exist at higher levels.
+
+        Example:
+
+        -  The organization ``organizationA`` contains two projects,
+           ``project1`` and ``project2``.
+        -  Assignments for all three entities (``organizationA``,
+           ``project1``, and ``project2``) could all be created and
+           mapped to the same or different reservations.
+
+        Returns ``google.rpc.Code.PERMISSION_DENIED`` if user does not
+        have 'bigquery.admin' permissions on the project using the
+        reservation and the project that owns this reservation.
+
+        Returns ``google.rpc.Code.INVALID_ARGUMENT`` when location of
+        the assignment does not match location of the reservation.
+
+        Args:
+            request (:class:`~.reservation.CreateAssignmentRequest`):
+                The request object. The request for
+                [ReservationService.CreateAssignment][google.cloud.bigquery.reservation.v1.ReservationService.CreateAssignment].
+                Note: "bigquery.reservationAssignments.create"
+                permission is required on the related assignee.
+            parent (:class:`str`):
+                Required. The parent resource name of the assignment
+                E.g.
+                ``projects/myproject/locations/US/reservations/team1-prod``
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            assignment (:class:`~.reservation.Assignment`):
+                Assignment resource to create.
+                This corresponds to the ``assignment`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.Assignment:
+                A Assignment allows a project to
+                submit jobs of a certain type using
+                slots from the specified reservation.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, assignment]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.CreateAssignmentRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if assignment is not None:
+            request.assignment = assignment
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.create_assignment
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def list_assignments(
+        self,
+        request: reservation.ListAssignmentsRequest = None,
+        *,
+        parent: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        cursor: pagers.PagerCursor = None,
+    ) -> pagers.ListAssignmentsAsyncPager:
+        r"""Lists assignments.
+
+        Only explicitly created assignments will be returned.
+
+        Example:
+
+        -  Organization ``organizationA`` contains two projects,
+           ``project1`` and ``project2``.
+        -  Reservation ``res1`` exists and was created previously.
+        -  CreateAssignment was used previously to define the following
+           associations between entities and reservations:
+           ``<organizationA, res1>`` and ``<project1, res1>``
+
+        In this example, ListAssignments will just return the above two
+        assignments for reservation ``res1``, and no expansion/merge
+        will happen.
+
+        The wildcard "-" can be used for reservations in the request. In
+        that case all assignments belongs to the specified project and
+        location will be listed.
+
+        **Note** "-" cannot be used for projects nor locations.
+
+        Args:
+            request (:class:`~.reservation.ListAssignmentsRequest`):
+                The request object. The request for
+                [ReservationService.ListAssignments][google.cloud.bigquery.reservation.v1.ReservationService.ListAssignments].
+            parent (:class:`str`):
+                Required. The parent resource name e.g.:
+
+                ``projects/myproject/locations/US/reservations/team1-prod``
+
+                Or:
+
+                ``projects/myproject/locations/US/reservations/-``
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager fetches
+                ahead in the background while the current page is consumed.
+                Defaults to ``0``, which fetches pages on demand.
+            cursor (~.pagers.PagerCursor): The ``cursor`` of an earlier
+                pager of this method, to resume its listing from the next
+                page. If set, neither ``request`` nor the individual field
+                arguments should be set.
+
+        Returns:
+            ~.pagers.ListAssignmentsAsyncPager:
+                The response for
+                [ReservationService.ListAssignments][google.cloud.bigquery.reservation.v1.ReservationService.ListAssignments].
+
+                Iterating over this object will yield results and
+                resolve additional pages automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        if cursor is not None:
+            if request is not None or any([parent]):
+                raise ValueError(
+                    "If the `cursor` argument is set, then neither the "
+                    "`request` argument nor any of the individual field "
+                    "arguments should be set."
+                )
+            request = cursor.to_request(
+                "list_assignments", reservation.ListAssignmentsRequest
+            )
+
+        request = reservation.ListAssignmentsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.list_assignments
+        ]
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+        )
+
+        # Send the request, unless resuming a listing that has no more pages.
+        if cursor is not None and cursor.exhausted:
+            response = reservation.ListAssignmentsResponse()
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata
+            )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListAssignmentsAsyncPager(
+            method=rpc, request=request, response=response, prefetch=prefetch
+        )
+
+        # Done; return the response.
+        return response
+
+    async def delete_assignment(
+        self,
+        request: reservation.DeleteAssignmentRequest = None,
+        *,
+        name: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> None:
+        r"""Deletes a assignment. No expansion will happen.
+
+        Example:
+
+        -  Organization ``organizationA`` contains two projects,
+           ``project1`` and ``project2``.
+        -  Reservation ``res1`` exists and was created previously.
+        -  CreateAssignment was used previously to define the following
+           associations between entities and reservations:
+           ``<organizationA, res1>`` and ``<project1, res1>``
+
+        In this example, deletion of the ``<organizationA, res1>``
+        assignment won't affect the other assignment
+        ``<project1, res1>``. After said deletion, queries from
+        ``project1`` will still use ``res1`` while queries from
+        ``project2`` will switch to use on-demand mode.
+
+        Args:
+            request (:class:`~.reservation.DeleteAssignmentRequest`):
+                The request object. The request for
+                [ReservationService.DeleteAssignment][google.cloud.bigquery.reservation.v1.ReservationService.DeleteAssignment].
+                Note: "bigquery.reservationAssignments.delete"
+                permission is required on the related assignee.
+            name (:class:`str`):
+                Required. Name of the resource, e.g.
+                ``projects/myproject/locations/US/reservations/team1-prod/assignments/123``
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.DeleteAssignmentRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.delete_assignment
+        ]
+
+        # Send the request.
+        await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+    async def search_assignments(
+        self,
+        request: reservation.SearchAssignmentsRequest = None,
+        *,
+        parent: str = None,
+        query: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        cursor: pagers.PagerCursor = None,
+    ) -> pagers.SearchAssignmentsAsyncPager:
+        r"""Looks up assignments for a specified resource for a particular
+        region. If the request is about a project:
+
+        1. Assignments created on the project will be returned if they
+           exist.
+        2. Otherwise assignments created on the closest ancestor will be
+           returned.
+        3. Assignments for different JobTypes will all be returned.
+
+        The same logic applies if the request is about a folder.
+
+        If the request is about an organization, then assignments
+        created on the organization will be returned (organization
+        doesn't have ancestors).
+
+        Comparing to ListAssignments, there are some behavior
+        differences:
+
+        1. permission on the assignee will be verified in this API.
+        2. Hierarchy lookup (project->folder->organization) happens in
+           this API.
+        3. Parent here is ``projects/*/locations/*``, instead of
+           ``projects/*/locations/*reservations/*``.
+
+        **Note** "-" cannot be used for projects nor locations.
+
+        Args:
+            request (:class:`~.reservation.SearchAssignmentsRequest`):
+                The request object. The request for
+                [ReservationService.SearchAssignments][google.cloud.bigquery.reservation.v1.ReservationService.SearchAssignments].
+                Note: "bigquery.reservationAssignments.search"
+                permission is required on the related assignee.
+            parent (:class:`str`):
+                Required. The resource name of the
+                admin project(containing project and
+                location), e.g.:
+                "projects/myproject/locations/US".
+                This corresponds to the ``parent`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            query (:class:`str`):
+                Please specify resource name as assignee in the query.
+
+                Examples:
+
+                -  ``assignee=projects/myproject``
+                -  ``assignee=folders/123``
+                -  ``assignee=organizations/456``
+
+                This corresponds to the ``query`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager fetches
+                ahead in the background while the current page is consumed.
+                Defaults to ``0``, which fetches pages on demand.
+            cursor (~.pagers.PagerCursor): The ``cursor`` of an earlier
+                pager of this method, to resume its listing from the next
+                page. If set, neither ``request`` nor the individual field
+                arguments should be set.
+
+        Returns:
+            ~.pagers.SearchAssignmentsAsyncPager:
+                The response for
+                [ReservationService.SearchAssignments][google.cloud.bigquery.reservation.v1.ReservationService.SearchAssignments].
+
+                Iterating over this object will yield results and
+                resolve additional pages automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([parent, query]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        if cursor is not None:
+            if request is not None or any([parent, query]):
+                raise ValueError(
+                    "If the `cursor` argument is set, then neither the "
+                    "`request` argument nor any of the individual field "
+                    "arguments should be set."
+                )
+            request = cursor.to_request(
+                "search_assignments", reservation.SearchAssignmentsRequest
+            )
+
+        request = reservation.SearchAssignmentsRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if parent is not None:
+            request.parent = parent
+        if query is not None:
+            request.query = query
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.search_assignments
+        ]
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
+        )
+
+        # Send the request, unless resuming a listing that has no more pages.
+        if cursor is not None and cursor.exhausted:
+            response = reservation.SearchAssignmentsResponse()
+        else:
+            response = await rpc(
+                request, retry=retry, timeout=timeout, metadata=metadata
+            )
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.SearchAssignmentsAsyncPager(
+            method=rpc, request=request, response=response, prefetch=prefetch
+        )
+
+        # Done; return the response.
+        return response
+
+    async def move_assignment(
+        self,
+        request: reservation.MoveAssignmentRequest = None,
+        *,
+        name: str = None,
+        destination_id: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.Assignment:
+        r"""Moves an assignment under a new reservation.
+        This differs from removing an existing assignment and
+        recreating a new one by providing a transactional change
+        that ensures an assignee always has an associated
+        reservation.
+
+        Args:
+            request (:class:`~.reservation.MoveAssignmentRequest`):
+                The request object. The request for
+                [ReservationService.MoveAssignment][google.cloud.bigquery.reservation.v1.ReservationService.MoveAssignment].
+                **Note**: "bigquery.reservationAssignments.create"
+                permission is required on the destination_id.
+
+                **Note**: "bigquery.reservationAssignments.create" and
+                "bigquery.reservationAssignments.delete" permission are
+                required on the related assignee.
+            name (:class:`str`):
+                Required. The resource name of the assignment, e.g.
+                ``projects/myproject/locations/US/reservations/team1-prod/assignments/123``
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            destination_id (:class:`str`):
+                The new reservation ID, e.g.:
+                ``projects/myotherproject/locations/US/reservations/team2-prod``
+                This corresponds to the ``destination_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.Assignment:
+                A Assignment allows a project to
+                submit jobs of a certain type using
+                slots from the specified reservation.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name, destination_id]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.MoveAssignmentRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+        if destination_id is not None:
+            request.destination_id = destination_id
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.move_assignment
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def get_bi_reservation(
+        self,
+        request: reservation.GetBiReservationRequest = None,
+        *,
+        name: str = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.BiReservation:
+        r"""Retrieves a BI reservation.
+
+        Args:
+            request (:class:`~.reservation.GetBiReservationRequest`):
+                The request object. A request to get a singleton BI
+                reservation.
+            name (:class:`str`):
+                Required. Name of the requested reservation, for
+                example:
+                ``projects/{project_id}/locations/{location_id}/bireservation``
+                This corresponds to the ``name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.BiReservation:
+                Represents a BI Reservation.
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([name]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.GetBiReservationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if name is not None:
+            request.name = name
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.get_bi_reservation
+        ]
+
+        # Certain fields should be provided within the metadata header;
+        # add these here.
+        metadata = tuple(metadata) + (
+            gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
+        )
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def update_bi_reservation(
+        self,
+        request: reservation.UpdateBiReservationRequest = None,
+        *,
+        bi_reservation: reservation.BiReservation = None,
+        update_mask: field_mask.FieldMask = None,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.BiReservation:
+        r"""Updates a BI reservation.
+
+        Only fields specified in the ``field_mask`` are updated.
+
+        A singleton BI reservation always exists with default size 0. In
+        order to reserve BI capacity it needs to be updated to an amount
+        greater than 0. In order to release BI capacity reservation size
+        must be set to 0.
+
+        Args:
+            request (:class:`~.reservation.UpdateBiReservationRequest`):
+                The request object. A request to update a BI
+                reservation.
+            bi_reservation (:class:`~.reservation.BiReservation`):
+                A reservation to update.
+                This corresponds to the ``bi_reservation`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            update_mask (:class:`~.field_mask.FieldMask`):
+                A list of fields to be updated in
+                this request.
+                This corresponds to the ``update_mask`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.BiReservation:
+                Represents a BI Reservation.
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        if request is not None and any([bi_reservation, update_mask]):
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        request = reservation.UpdateBiReservationRequest(request)
+
+        # If we have keyword arguments corresponding to fields on the
+        # request, apply these.
+
+        if bi_reservation is not None:
+            request.bi_reservation = bi_reservation
+        if update_mask is not None:
+            request.update_mask = update_mask
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.update_bi_reservation
+        ]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+
+        # Done; return the response.
+        return response
+
+    async def patch_reservation(
+        self,
+        original: gcbr_reservation.Reservation,
+        modified: gcbr_reservation.Reservation,
+        *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> gcbr_reservation.Reservation:
+        r"""Updates a reservation with only the fields that changed.
+
+        Compares ``modified`` with ``original`` and sends
+        ``update_reservation`` just the changed updatable fields, with
+        the matching ``update_mask``. No RPC is made if nothing changed.
+
+        Args:
+            original (:class:`~.gcbr_reservation.Reservation`):
+                The reservation as it is, e.g. as last fetched.
+            modified (:class:`~.gcbr_reservation.Reservation`):
+                The reservation as it should be.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.gcbr_reservation.Reservation:
+                The updated reservation, or ``original`` if nothing
+                changed.
+
+        """
+        change = masks.diff(original, modified)
+        if not change.changed:
+            return original
+        return await self.update_reservation(
+            reservation=change.message,
+            update_mask=change.update_mask,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    async def patch_capacity_commitment(
+        self,
+        original: reservation.CapacityCommitment,
+        modified: reservation.CapacityCommitment,
+        *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.CapacityCommitment:
+        r"""Updates a capacity commitment with only the fields that changed.
+
+        Compares ``modified`` with ``original`` and sends
+        ``update_capacity_commitment`` just the changed updatable fields, with
+        the matching ``update_mask``. No RPC is made if nothing changed.
+
+        Args:
+            original (:class:`~.reservation.CapacityCommitment`):
+                The capacity commitment as it is, e.g. as last fetched.
+            modified (:class:`~.reservation.CapacityCommitment`):
+                The capacity commitment as it should be.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.CapacityCommitment:
+                The updated capacity commitment, or ``original`` if nothing
+                changed.
+
+        """
+        change = masks.diff(original, modified)
+        if not change.changed:
+            return original
+        return await self.update_capacity_commitment(
+            capacity_commitment=change.message,
+            update_mask=change.update_mask,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    async def patch_bi_reservation(
+        self,
+        original: reservation.BiReservation,
+        modified: reservation.BiReservation,
+        *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.BiReservation:
+        r"""Updates a BI reservation with only the fields that changed.
+
+        Compares ``modified`` with ``original`` and sends
+        ``update_bi_reservation`` just the changed updatable fields, with
+        the matching ``update_mask``. No RPC is made if nothing changed.
+
+        Args:
+            original (:class:`~.reservation.BiReservation`):
+                The BI reservation as it is, e.g. as last fetched.
+            modified (:class:`~.reservation.BiReservation`):
+                The BI reservation as it should be.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.BiReservation:
+                The updated BI reservation, or ``original`` if nothing
+                changed.
+
+        """
+        change = masks.diff(original, modified)
+        if not change.changed:
+            return original
+        return await self.update_bi_reservation(
+            bi_reservation=change.message,
+            update_mask=change.update_mask,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+
+__all__ = ("ReservationServiceAsyncClient",)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+
+# The number of listed resources buffered between the paging threads and
+# the consumer of :func:`run_paged`.
+_PAGED_BUFFER_SIZE = 1024
+
+
+class BatchResult(NamedTuple):
+    """The outcome of one item of a batch call.
+
+    Attributes:
+        index (int): The position of the item in the input.
+        item (Any): The input item, e.g. the assignment to create or the
+            name of the assignment to delete.
+        response (Any): The RPC response, or ``None`` if the call failed
+            or the RPC returns nothing.
+        error (Optional[Exception]): The exception raised by the call, if
+            it failed.
+    """
+
+    index: int
+    item: Any
+    response: Any
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call for this item succeeded."""
+        return self.error is None
+
+
+def run(
+    call: Callable[[Any], Any], items: Iterable[Any], max_concurrency: int
+) -> Iterator[BatchResult]:
+    """Call ``call`` once per item, with at most ``max_concurrency`` in flight.
+
+    Items are drawn from ``items`` lazily, so the input may be a generator
+    of any length. Results are yielded in completion order as soon as they
+    are available; a failing item is reported through
+    :attr:`BatchResult.error` and does not stop the rest of the batch.
+
+    Args:
+        call (Callable[[Any], Any]): Issues the RPC for a single item.
+        items (Iterable[Any]): The items to process.
+        max_concurrency (int): The maximum number of concurrent calls.
+
+    Returns:
+        Iterator[~.BatchResult]: One result per input item.
+
+    Raises:
+        ValueError: If ``max_concurrency`` is less than 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+
+    return _run(call, items, max_concurrency)
+
+
+def _run(
+    call: Callable[[Any], Any], items: Iterable[Any], max_concurrency: int
+) -> Iterator[BatchResult]:
+    pending = {}
+    items = iter(enumerate(items))
+    with futures.ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="reservation-batch"
+    ) as executor:
+
+        def submit():
+            for index, item in items:
+                pending[executor.submit(call, item)] = (index, item)
+                return
+
+        for _ in range(max_concurrency):
+            submit()
+
+        while pending:
+            done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                submit()
+                try:
+                    result = BatchResult(index, item, future.result(), None)
+                except Exception as exc:
+                    result = BatchResult(index, item, None, exc)
+                yield result
+
+
+def run_paged(
+    list_call: Callable[[Any], Iterable[Any]],
+    parents: Iterable[Any],
+    max_concurrency: int,
+) -> Iterator[BatchResult]:
+    """Iterate ``list_call(parent)`` for many parents concurrently.
+
+    Each parent's pager runs on its own worker thread, with at most
+    ``max_concurrency`` parents being listed at any time; since a pager
+    fetches one page at a time, this also caps the RPCs in flight.
+    Parents are drawn from ``parents`` lazily. Resources are yielded as
+    soon as any pager produces them, so results from different parents
+    interleave. Workers block once a bounded buffer fills up, so a slow
+    consumer slows the paging down rather than growing memory.
+
+    Args:
+        list_call (Callable[[Any], Iterable[Any]]): Returns the pager for
+            a single parent.
+        parents (Iterable[Any]): The parents to list.
+        max_concurrency (int): The maximum number of parents listed
+            concurrently.
+
+    Returns:
+        Iterator[~.BatchResult]: One result per listed resource, with
+        ``item`` set to the parent and ``response`` to the resource. If
+        listing a parent fails, one result carrying the error is yielded
+        for it after the resources listed before the failure.
+
+    Raises:
+        ValueError: If ``max_concurrency`` is less than 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+
+    return _run_paged(list_call, parents, max_concurrency)
+
+
+def _run_paged(
+    list_call: Callable[[Any], Iterable[Any]],
+    parents: Iterable[Any],
+    max_concurrency: int,
+) -> Iterator[BatchResult]:
+    results = queue.Queue(maxsize=_PAGED_BUFFER_SIZE)  # type: queue.Queue
+    stop = threading.Event()
+    finished = object()
+
+    def put(item):
+        # Block while the buffer is full, but give up once the consumer
+        # has gone away.
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(index, parent):
+        try:
+            for resource in list_call(parent):
+                if not put(BatchResult(index, parent, resource, None)):
+                    return
+        except Exception as exc:
+            put(BatchResult(index, parent, None, exc))
+        finally:
+            put(finished)
+
+    parents = iter(enumerate(parents))
+    with futures.ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="reservation-fanout"
+    ) as executor:
+
+        def submit():
+            for index, parent in parents:
+                executor.submit(drain, index, parent)
+                return 1
+            return 0
+
+        try:
+            active = sum(submit() for _ in range(max_concurrency))
+            while active:
+                result = results.get()
+                if result is finished:
+                    active += submit() - 1
+                    continue
+                yield result
+        finally:
+            stop.set()
+
+
+__all__ = ("BatchResult",)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+
+RESERVATION = "reservation"
+CAPACITY_COMMITMENT = "capacity_commitment"
+BI_RESERVATION = "bi_reservation"
+
+
+class _Flight:
+    """A load in progress for a single cache key."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None  # type: Any
+        self.error = None  # type: BaseException
+        self.stale = False
+
+
+class ResourceCache:
+    """A read-through cache for ``get_*`` lookups on the reservation client.
+
+    Entries are kept in a bounded LRU and expire after a time-to-live that
+    is configured per resource type. Concurrent misses for the same
+    resource are coalesced: the first caller issues the RPC and the others
+    wait for its result. Failed lookups are never cached.
+
+    Pass an instance as the ``cache`` argument of
+    :class:`~.ReservationServiceClient`; the client then invalidates the
+    affected entries whenever it updates, deletes, splits or merges a
+    resource. Changes made through other clients are only picked up once
+    the entry expires.
+
+    Cached messages are copied on the way out, so callers may mutate the
+    returned objects freely.
+
+    Args:
+        max_size (int): The maximum number of entries held across all
+            resource types.
+        reservation_ttl (float): Seconds a reservation stays cached.
+        capacity_commitment_ttl (float): Seconds a capacity commitment
+            stays cached.
+        bi_reservation_ttl (float): Seconds a BI reservation stays cached.
+        clock (Callable[[], float]): Monotonic time source, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 1024,
+        reservation_ttl: float = 60.0,
+        capacity_commitment_ttl: float = 60.0,
+        bi_reservation_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        self._max_size = max_size
+        self._ttls = {
+            RESERVATION: reservation_ttl,
+            CAPACITY_COMMITMENT: capacity_commitment_ttl,
+            BI_RESERVATION: bi_reservation_ttl,
+        }  # type: Dict[str, float]
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = (
+            OrderedDict()
+        )  # type: OrderedDict[Tuple[str, str], Tuple[float, Any]]
+        self._flights = {}  # type: Dict[Tuple[str, str], _Flight]
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: str, name: str, load: Callable[[], Any]) -> Any:
+        """Return the cached resource, calling ``load`` on a miss.
+
+        Args:
+            kind (str): The resource type, e.g. ``"reservation"``.
+            name (str): The resource name.
+            load (Callable[[], Any]): Fetches the resource from the API.
+
+        Returns:
+            A copy of the cached or freshly loaded resource.
+        """
+        key = (kind, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return _copy(value)
+                del self._entries[key]
+            self.misses += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _copy(flight.value)
+
+        try:
+            flight.value = load()
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                if flight.error is None and not flight.stale:
+                    self._store(key, flight.value)
+            flight.done.set()
+        return _copy(flight.value)
+
+    def invalidate(self, kind: str, *names: str) -> None:
+        """Drop the given resources from the cache.
+
+        A lookup already in flight for one of the resources still returns
+        its result to its callers, but that result is not cached.
+
+        Args:
+            kind (str): The resource type, e.g. ``"reservation"``.
+            names (str): The resource names to drop.
+        """
+        with self._lock:
+            for name in names:
+                key = (kind, name)
+                self._entries.pop(key, None)
+                flight = self._flights.pop(key, None)
+                if flight is not None:
+                    flight.stale = True
+
+    def clear(self) -> None:
+        """Drop every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+            for flight in self._flights.values():
+                flight.stale = True
+            self._flights.clear()
+
+    def _store(self, key: Tuple[str, str], value: Any) -> None:
+        ttl = self._ttls.get(key[0], 0.0)
+        if ttl <= 0:
+            return
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
+def _copy(value: Any) -> Any:
+    # proto-plus messages copy their underlying protobuf when passed to
+    # their own constructor.
+    return type(value)(value)
+
+
+__all__ = ("ResourceCache",)
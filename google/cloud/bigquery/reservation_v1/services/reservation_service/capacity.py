@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Any, Dict, Iterable, List
+
+from google.api_core import exceptions  # type: ignore
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+from . import batch
+
+
+def _parent(name: str, collection: str) -> str:
+    return name.split("/%s/" % collection)[0]
+
+
+class CapacityModel:
+    """The committed and reserved slots of admin projects and locations.
+
+    The service rejects a reservation create or update with
+    ``RESOURCE_EXHAUSTED`` when the ``slot_capacity`` of the reservations
+    of an admin project and location would exceed the slots of its active
+    capacity commitments. The model applies the same rule locally, so a
+    batch of changes can be checked before any RPC is sent.
+
+    Args:
+        parents (Iterable[str]): The admin projects and locations, e.g.
+            ``projects/admin/locations/US``.
+        reservations (Iterable[~.reservation.Reservation]): The
+            reservations of ``parents``.
+        commitments (Iterable[~.reservation.CapacityCommitment]): The
+            capacity commitments of ``parents``; only ``ACTIVE`` ones
+            count.
+
+    Raises:
+        ValueError: If a reservation or commitment is outside ``parents``.
+    """
+
+    def __init__(
+        self,
+        parents: Iterable[str],
+        reservations: Iterable[reservation.Reservation] = (),
+        commitments: Iterable[reservation.CapacityCommitment] = (),
+    ) -> None:
+        self._committed = dict.fromkeys(parents, 0)  # type: Dict[str, int]
+        self._reserved = dict.fromkeys(self._committed, 0)  # type: Dict[str, int]
+        self._reservations = {}  # type: Dict[str, int]
+        for commitment in commitments:
+            parent = self._require(_parent(commitment.name, "capacityCommitments"))
+            if commitment.state == reservation.CapacityCommitment.State.ACTIVE:
+                self._committed[parent] += commitment.slot_count
+        for listed in reservations:
+            parent = self._require(_parent(listed.name, "reservations"))
+            self._reservations[listed.name] = listed.slot_capacity
+            self._reserved[parent] += listed.slot_capacity
+
+    @classmethod
+    def load(
+        cls, client, parents: Iterable[str], *, max_concurrency: int = 8
+    ) -> "CapacityModel":
+        """Build the model from the reservations and commitments of
+        ``parents``, listed concurrently.
+
+        Args:
+            client (~.ReservationServiceClient): The client to list with.
+            parents (Iterable[str]): The admin projects and locations.
+            max_concurrency (int): The maximum number of listings in
+                flight.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If listing failed.
+        """
+        parents = list(parents)
+        listed = {
+            "list_reservations": [],
+            "list_capacity_commitments": [],
+        }  # type: Dict[str, List[Any]]
+        for result in batch.run_paged(
+            lambda listing: getattr(client, listing[0])(parent=listing[1]),
+            [(method, parent) for method in listed for parent in parents],
+            max_concurrency,
+        ):
+            if not result.ok:
+                raise result.error
+            listed[result.item[0]].append(result.response)
+        return cls(
+            parents, listed["list_reservations"], listed["list_capacity_commitments"]
+        )
+
+    def committed(self, parent: str) -> int:
+        """The slots of the active commitments of ``parent``."""
+        return self._committed[self._require(parent)]
+
+    def reserved(self, parent: str) -> int:
+        """The total ``slot_capacity`` of the reservations of ``parent``."""
+        return self._reserved[self._require(parent)]
+
+    def available(self, parent: str) -> int:
+        """The committed slots of ``parent`` left for reservations."""
+        return self.committed(parent) - self.reserved(parent)
+
+    def validate(self, requests: Iterable[Any]) -> List[batch.BatchResult]:
+        """Check a batch of changes, as if sent in order.
+
+        Each request is checked against the capacity left by the valid
+        requests before it; a rejected request does not count towards
+        the following ones. The model itself is not changed.
+
+        Args:
+            requests (Iterable[Any]): ``CreateReservationRequest``,
+                ``UpdateReservationRequest`` and
+                ``DeleteReservationRequest`` messages; other requests,
+                such as the assignment ones of a
+                :func:`~.reconcile.plan`, are accepted as they are.
+
+        Returns:
+            List[~.batch.BatchResult]: One result per request, with
+            ``item`` set to the request and ``response`` to ``None``. The
+            error of a rejected request is the one the service would
+            raise: ``ResourceExhausted`` if committed slots would be
+            exceeded, ``AlreadyExists`` or ``NotFound`` if the
+            reservation would already exist or not exist.
+
+        Raises:
+            ValueError: If a request is outside the modeled parents.
+        """
+        reservations = dict(self._reservations)
+        reserved = dict(self._reserved)
+        results = []
+        for index, request in enumerate(requests):
+            try:
+                self._check(index, request, reservations, reserved)
+            except exceptions.GoogleAPICallError as exc:
+                results.append(batch.BatchResult(index, request, None, exc))
+            else:
+                results.append(batch.BatchResult(index, request, None, None))
+        return results
+
+    def _check(
+        self,
+        index: int,
+        request: Any,
+        reservations: Dict[str, int],
+        reserved: Dict[str, int],
+    ) -> None:
+        if isinstance(request, reservation.CreateReservationRequest):
+            parent = self._require(request.parent)
+            # The service names reservations created without an ID.
+            name = "%s/reservations/%s" % (
+                parent,
+                request.reservation_id or "#%d" % index,
+            )
+            if name in reservations:
+                raise exceptions.AlreadyExists("%s exists." % name)
+            old, new = None, request.reservation.slot_capacity
+        elif isinstance(request, reservation.UpdateReservationRequest):
+            name = request.reservation.name
+            parent = self._require(_parent(name, "reservations"))
+            if name not in reservations:
+                raise exceptions.NotFound("%s not found." % name)
+            paths = request.update_mask.paths
+            old = reservations[name]
+            new = (
+                request.reservation.slot_capacity
+                if not paths or "slot_capacity" in paths
+                else old
+            )
+        elif isinstance(request, reservation.DeleteReservationRequest):
+            name = request.name
+            parent = self._require(_parent(name, "reservations"))
+            if name not in reservations:
+                raise exceptions.NotFound("%s not found." % name)
+            reserved[parent] -= reservations.pop(name)
+            return
+        else:
+            return
+
+        if new == old:
+            return
+        needed = reserved[parent] - (old or 0) + new
+        if needed > self._committed[parent]:
+            raise exceptions.ResourceExhausted(
+                "Reservations in %s would need %d slots but only %d are committed."
+                % (parent, needed, self._committed[parent])
+            )
+        reservations[name] = new
+        reserved[parent] = needed
+
+    def _require(self, parent: str) -> str:
+        if parent not in self._committed:
+            raise ValueError("%s is not modeled." % parent)
+        return parent
@@ -17,8 +17,17 @@
 
 from collections import OrderedDict
 import re
-from typing import Callable, Dict, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import google.api_core.client_options as ClientOptions  # type: ignore
 from google.api_core import exceptions  # type: ignore
@@ -34,8 +43,17 @@ from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
 from google.protobuf import timestamp_pb2 as timestamp  # type: ignore
 from google.rpc import status_pb2 as status  # type: ignore
 
-from .transports.base import ReservationServiceTransport
+from . import batch
+from . import masks
+from . import paths
+from . import waiter
+from .cache import BI_RESERVATION, CAPACITY_COMMITMENT, RESERVATION, ResourceCache
+from .transports.base import ReservationServiceTransport, WarmupReport
+from .transports.channel_options import ChannelOptions
+from .transports.policy import MethodPolicy
+from .transports.ratelimit import RateLimiter
 from .transports.grpc import ReservationServiceGrpcTransport
+from .transports.grpc_asyncio import ReservationServiceGrpcAsyncIOTransport
 
 
 class ReservationServiceClientMeta(type):
@@ -50,6 +68,7 @@ class ReservationServiceClientMeta(type):
         OrderedDict()
     )  # type: Dict[str, Type[ReservationServiceTransport]]
     _transport_registry["grpc"] = ReservationServiceGrpcTransport
+    _transport_registry["grpc_asyncio"] = ReservationServiceGrpcAsyncIOTransport
 
     def get_transport_class(
         cls, label: str = None
@@ -151,71 +170,44 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         project: str, location: str, reservation: str, assignment: str
     ) -> str:
         """Return a fully-qualified assignment string."""
-        return "projects/{project}/locations/{location}/reservations/{reservation}/assignments/{assignment}".format(
-            project=project,
-            location=location,
-            reservation=reservation,
-            assignment=assignment,
-        )
+        return paths.assignment_path(project, location, reservation, assignment)
 
     @staticmethod
     def parse_assignment_path(path: str) -> Dict[str, str]:
         """Parse a assignment path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/reservations/(?P<reservation>.+?)/assignments/(?P<assignment>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return paths.parse_assignment_path(path)
 
     @staticmethod
     def reservation_path(project: str, location: str, reservation: str) -> str:
         """Return a fully-qualified reservation string."""
-        return "projects/{project}/locations/{location}/reservations/{reservation}".format(
-            project=project, location=location, reservation=reservation
-        )
+        return paths.reservation_path(project, location, reservation)
 
     @staticmethod
     def parse_reservation_path(path: str) -> Dict[str, str]:
         """Parse a reservation path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/reservations/(?P<reservation>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return paths.parse_reservation_path(path)
 
     @staticmethod
     def capacity_commitment_path(
         project: str, location: str, capacity_commitment: str
     ) -> str:
         """Return a fully-qualified capacity_commitment string."""
-        return "projects/{project}/locations/{location}/capacityCommitments/{capacity_commitment}".format(
-            project=project, location=location, capacity_commitment=capacity_commitment
-        )
+        return paths.capacity_commitment_path(project, location, capacity_commitment)
 
     @staticmethod
     def parse_capacity_commitment_path(path: str) -> Dict[str, str]:
         """Parse a capacity_commitment path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/capacityCommitments/(?P<capacity_commitment>.+?)$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return paths.parse_capacity_commitment_path(path)
 
     @staticmethod
     def bi_reservation_path(project: str, location: str) -> str:
         """Return a fully-qualified bi_reservation string."""
-        return "projects/{project}/locations/{location}/bireservation".format(
-            project=project, location=location
-        )
+        return paths.bi_reservation_path(project, location)
 
     @staticmethod
     def parse_bi_reservation_path(path: str) -> Dict[str, str]:
         """Parse a bi_reservation path into its component segments."""
-        m = re.match(
-            r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/bireservation$",
-            path,
-        )
-        return m.groupdict() if m else {}
+        return paths.parse_bi_reservation_path(path)
 
     def __init__(
         self,
@@ -223,6 +215,10 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         credentials: credentials.Credentials = None,
         transport: Union[str, ReservationServiceTransport] = None,
         client_options: ClientOptions = None,
+        cache: ResourceCache = None,
+        channel_options: Union[ChannelOptions, dict] = None,
+        method_policies: Mapping[str, MethodPolicy] = None,
+        rate_limiter: RateLimiter = None,
     ) -> None:
         """Instantiate the reservation service client.
 
@@ -243,13 +239,59 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
                 is provided, mutual TLS transport will be created with the given
                 ``api_endpoint`` or the default mTLS endpoint, and the client
                 SSL credentials obtained from ``client_cert_source``.
+            cache (Optional[~.ResourceCache]): A read-through cache for
+                ``get_reservation``, ``get_capacity_commitment`` and
+                ``get_bi_reservation``. Writes made through this client
+                invalidate the affected entries. Caching is disabled if
+                not set.
+            channel_options (Union[~.ChannelOptions, dict]): Keepalive,
+                compression, message size and flow-control options for the
+                channels of the transport. They can also be set as the
+                ``channel_options`` key or attribute of ``client_options``.
+            method_policies (Optional[Mapping[str, ~.MethodPolicy]]): The
+                default deadline, retry and hedging of methods, keyed by
+                method name, e.g. ``"get_reservation"``; see
+                :func:`~.default_policies`. Methods without a policy have no
+                default deadline or retry.
+            rate_limiter (Optional[~.RateLimiter]): Paces the calls of every
+                method to stay within per-project and per-method quotas,
+                adapting to ``RESOURCE_EXHAUSTED`` errors. Calls are not
+                paced if not set.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
                 creation failed for any reason.
+            ValueError: If ``channel_options`` are invalid, given twice, or
+                given with a transport instance, or if ``method_policies``
+                are invalid, or if ``method_policies`` or ``rate_limiter``
+                are given with a transport instance.
         """
         if isinstance(client_options, dict):
+            client_options = dict(client_options)
+            option = client_options.pop("channel_options", None)
             client_options = ClientOptions.from_dict(client_options)
+        else:
+            option = getattr(client_options, "channel_options", None)
+        if option is not None:
+            if channel_options is not None:
+                raise ValueError(
+                    "channel_options were provided both directly and in "
+                    "client_options."
+                )
+            channel_options = option
+        if isinstance(channel_options, dict):
+            channel_options = ChannelOptions.from_dict(channel_options)
+        # Only pass the argument when set, so transports that predate it
+        # keep working.
+        transport_kwargs = {}
+        if channel_options is not None:
+            transport_kwargs["channel_options"] = channel_options
+        if method_policies is not None:
+            transport_kwargs["method_policies"] = method_policies
+        if rate_limiter is not None:
+            transport_kwargs["rate_limiter"] = rate_limiter
+
+        self._cache = cache
 
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
@@ -261,6 +303,12 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
                     "When providing a transport instance, "
                     "provide its credentials directly."
                 )
+            if transport_kwargs:
+                raise ValueError(
+                    "When providing a transport instance, "
+                    "configure its channel, method policies and rate limiter "
+                    "directly."
+                )
             self._transport = transport
         elif client_options is None or (
             client_options.api_endpoint is None
@@ -269,7 +317,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             # Don't trigger mTLS if we get an empty ClientOptions.
             Transport = type(self).get_transport_class(transport)
             self._transport = Transport(
-                credentials=credentials, host=self.DEFAULT_ENDPOINT
+                credentials=credentials, host=self.DEFAULT_ENDPOINT, **transport_kwargs
             )
         else:
             # We have a non-empty ClientOptions. If client_cert_source is
@@ -290,13 +338,38 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
                 else self.DEFAULT_ENDPOINT
             )
 
-            self._transport = ReservationServiceGrpcTransport(
+            Transport = type(self).get_transport_class(transport)
+            self._transport = Transport(
                 credentials=credentials,
                 host=api_endpoint,
                 api_mtls_endpoint=api_mtls_endpoint,
                 client_cert_source=client_options.client_cert_source,
+                **transport_kwargs,
             )
 
+    def warmup(self, *, timeout: float = None) -> WarmupReport:
+        """Prepare the client so the first call pays no setup cost.
+
+        Creates the stub of every method, fetches an access token and
+        connects the channel. Call it once at worker start-up, off the
+        request path; calls work without it.
+
+        Args:
+            timeout (Optional[float]): How long to wait for the channel to
+                connect, in seconds; forever if not set.
+
+        Returns:
+            ~.WarmupReport: How long each step, and the whole warm-up,
+            took.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel did
+                not connect within ``timeout``.
+            google.auth.exceptions.RefreshError: If fetching the access
+                token failed.
+        """
+        return self._transport.warmup(timeout=timeout)
+
     def create_reservation(
         self,
         request: gcbr_reservation.CreateReservationRequest = None,
@@ -305,7 +378,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         reservation: gcbr_reservation.Reservation = None,
         reservation_id: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gcbr_reservation.Reservation:
         r"""Creates a new reservation resource.
@@ -370,11 +443,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_reservation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.create_reservation]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
@@ -388,8 +457,10 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         parent: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        cursor: pagers.PagerCursor = None,
     ) -> pagers.ListReservationsPager:
         r"""Lists all the reservations for the project in the
         specified location.
@@ -411,6 +482,13 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager fetches
+                ahead in the background while the current page is consumed.
+                Defaults to ``0``, which fetches pages on demand.
+            cursor (~.pagers.PagerCursor): The ``cursor`` of an earlier
+                pager of this method, to resume its listing from the next
+                page. If set, neither ``request`` nor the individual field
+                arguments should be set.
 
         Returns:
             ~.pagers.ListReservationsPager:
@@ -430,6 +508,17 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
                 "the individual field arguments should be set."
             )
 
+        if cursor is not None:
+            if request is not None or any([parent]):
+                raise ValueError(
+                    "If the `cursor` argument is set, then neither the "
+                    "`request` argument nor any of the individual field "
+                    "arguments should be set."
+                )
+            request = cursor.to_request(
+                "list_reservations", reservation.ListReservationsRequest
+            )
+
         request = reservation.ListReservationsRequest(request)
 
         # If we have keyword arguments corresponding to fields on the
@@ -440,11 +529,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_reservations,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.list_reservations]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -452,13 +537,16 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request, unless resuming a listing that has no more pages.
+        if cursor is not None and cursor.exhausted:
+            response = reservation.ListReservationsResponse()
+        else:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListReservationsPager(
-            method=rpc, request=request, response=response
+            method=rpc, request=request, response=response, prefetch=prefetch
         )
 
         # Done; return the response.
@@ -470,7 +558,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.Reservation:
         r"""Returns information about the reservation.
@@ -518,11 +606,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_reservation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.get_reservation]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -530,8 +614,15 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request, unless the resource is cached.
+        if self._cache is not None:
+            response = self._cache.get(
+                RESERVATION,
+                request.name,
+                lambda: rpc(request, retry=retry, timeout=timeout, metadata=metadata),
+            )
+        else:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
 
         # Done; return the response.
         return response
@@ -542,7 +633,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> None:
         r"""Deletes a reservation. Returns
@@ -586,14 +677,15 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.delete_reservation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.delete_reservation]
 
-        # Send the request.
-        rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request. Cached copies of the resource are dropped even
+        # if the call fails, since the write may still have been applied.
+        try:
+            rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(RESERVATION, request.name)
 
     def update_reservation(
         self,
@@ -602,7 +694,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         reservation: gcbr_reservation.Reservation = None,
         update_mask: field_mask.FieldMask = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> gcbr_reservation.Reservation:
         r"""Updates an existing reservation resource.
@@ -656,14 +748,15 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_reservation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.update_reservation]
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request. Cached copies of the resource are dropped even
+        # if the call fails, since the write may still have been applied.
+        try:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(RESERVATION, request.reservation.name)
 
         # Done; return the response.
         return response
@@ -675,7 +768,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         parent: str = None,
         capacity_commitment: reservation.CapacityCommitment = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.CapacityCommitment:
         r"""Creates a new capacity commitment resource.
@@ -743,11 +836,9 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_capacity_commitment,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[
+            self._transport.create_capacity_commitment
+        ]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
@@ -761,8 +852,10 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         parent: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        cursor: pagers.PagerCursor = None,
     ) -> pagers.ListCapacityCommitmentsPager:
         r"""Lists all the capacity commitments for the admin
         project.
@@ -784,6 +877,13 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager fetches
+                ahead in the background while the current page is consumed.
+                Defaults to ``0``, which fetches pages on demand.
+            cursor (~.pagers.PagerCursor): The ``cursor`` of an earlier
+                pager of this method, to resume its listing from the next
+                page. If set, neither ``request`` nor the individual field
+                arguments should be set.
 
         Returns:
             ~.pagers.ListCapacityCommitmentsPager:
@@ -803,6 +903,17 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
                 "the individual field arguments should be set."
             )
 
+        if cursor is not None:
+            if request is not None or any([parent]):
+                raise ValueError(
+                    "If the `cursor` argument is set, then neither the "
+                    "`request` argument nor any of the individual field "
+                    "arguments should be set."
+                )
+            request = cursor.to_request(
+                "list_capacity_commitments", reservation.ListCapacityCommitmentsRequest
+            )
+
         request = reservation.ListCapacityCommitmentsRequest(request)
 
         # If we have keyword arguments corresponding to fields on the
@@ -813,11 +924,9 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_capacity_commitments,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[
+            self._transport.list_capacity_commitments
+        ]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -825,13 +934,16 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request, unless resuming a listing that has no more pages.
+        if cursor is not None and cursor.exhausted:
+            response = reservation.ListCapacityCommitmentsResponse()
+        else:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListCapacityCommitmentsPager(
-            method=rpc, request=request, response=response
+            method=rpc, request=request, response=response, prefetch=prefetch
         )
 
         # Done; return the response.
@@ -843,7 +955,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.CapacityCommitment:
         r"""Returns information about the capacity commitment.
@@ -903,11 +1015,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_capacity_commitment,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.get_capacity_commitment]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -915,8 +1023,15 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request, unless the resource is cached.
+        if self._cache is not None:
+            response = self._cache.get(
+                CAPACITY_COMMITMENT,
+                request.name,
+                lambda: rpc(request, retry=retry, timeout=timeout, metadata=metadata),
+            )
+        else:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
 
         # Done; return the response.
         return response
@@ -927,7 +1042,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> None:
         r"""Deletes a capacity commitment. Attempting to delete capacity
@@ -971,14 +1086,17 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.delete_capacity_commitment,
-            default_timeout=None,
-            client_info=_client_info,
-        )
-
-        # Send the request.
-        rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        rpc = self._transport._wrapped_methods[
+            self._transport.delete_capacity_commitment
+        ]
+
+        # Send the request. Cached copies of the resource are dropped even
+        # if the call fails, since the write may still have been applied.
+        try:
+            rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(CAPACITY_COMMITMENT, request.name)
 
     def update_capacity_commitment(
         self,
@@ -987,7 +1105,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         capacity_commitment: reservation.CapacityCommitment = None,
         update_mask: field_mask.FieldMask = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.CapacityCommitment:
         r"""Updates an existing capacity commitment.
@@ -1061,14 +1179,19 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_capacity_commitment,
-            default_timeout=None,
-            client_info=_client_info,
-        )
-
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        rpc = self._transport._wrapped_methods[
+            self._transport.update_capacity_commitment
+        ]
+
+        # Send the request. Cached copies of the resource are dropped even
+        # if the call fails, since the write may still have been applied.
+        try:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(
+                    CAPACITY_COMMITMENT, request.capacity_commitment.name
+                )
 
         # Done; return the response.
         return response
@@ -1080,7 +1203,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         name: str = None,
         slot_count: int = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.SplitCapacityCommitmentResponse:
         r"""Splits capacity commitment to two commitments of the same plan
@@ -1143,14 +1266,17 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.split_capacity_commitment,
-            default_timeout=None,
-            client_info=_client_info,
-        )
-
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        rpc = self._transport._wrapped_methods[
+            self._transport.split_capacity_commitment
+        ]
+
+        # Send the request. Cached copies of the resource are dropped even
+        # if the call fails, since the write may still have been applied.
+        try:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(CAPACITY_COMMITMENT, request.name)
 
         # Done; return the response.
         return response
@@ -1162,7 +1288,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         parent: str = None,
         capacity_commitment_ids: Sequence[str] = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.CapacityCommitment:
         r"""Merges capacity commitments of the same plan into a single
@@ -1241,14 +1367,25 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.merge_capacity_commitments,
-            default_timeout=None,
-            client_info=_client_info,
-        )
-
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        rpc = self._transport._wrapped_methods[
+            self._transport.merge_capacity_commitments
+        ]
+
+        # Send the request. Cached copies of the resource are dropped even
+        # if the call fails, since the write may still have been applied.
+        try:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(
+                    CAPACITY_COMMITMENT,
+                    *(
+                        "{}/capacityCommitments/{}".format(
+                            request.parent, commitment_id
+                        )
+                        for commitment_id in request.capacity_commitment_ids
+                    ),
+                )
 
         # Done; return the response.
         return response
@@ -1260,7 +1397,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         parent: str = None,
         assignment: reservation.Assignment = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.Assignment:
         r"""Creates an assignment object which allows the given project to
@@ -1349,11 +1486,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.create_assignment,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.create_assignment]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
@@ -1367,8 +1500,10 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         parent: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        cursor: pagers.PagerCursor = None,
     ) -> pagers.ListAssignmentsPager:
         r"""Lists assignments.
 
@@ -1414,6 +1549,13 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager fetches
+                ahead in the background while the current page is consumed.
+                Defaults to ``0``, which fetches pages on demand.
+            cursor (~.pagers.PagerCursor): The ``cursor`` of an earlier
+                pager of this method, to resume its listing from the next
+                page. If set, neither ``request`` nor the individual field
+                arguments should be set.
 
         Returns:
             ~.pagers.ListAssignmentsPager:
@@ -1433,6 +1575,17 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
                 "the individual field arguments should be set."
             )
 
+        if cursor is not None:
+            if request is not None or any([parent]):
+                raise ValueError(
+                    "If the `cursor` argument is set, then neither the "
+                    "`request` argument nor any of the individual field "
+                    "arguments should be set."
+                )
+            request = cursor.to_request(
+                "list_assignments", reservation.ListAssignmentsRequest
+            )
+
         request = reservation.ListAssignmentsRequest(request)
 
         # If we have keyword arguments corresponding to fields on the
@@ -1443,11 +1596,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.list_assignments,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.list_assignments]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1455,13 +1604,16 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request, unless resuming a listing that has no more pages.
+        if cursor is not None and cursor.exhausted:
+            response = reservation.ListAssignmentsResponse()
+        else:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListAssignmentsPager(
-            method=rpc, request=request, response=response
+            method=rpc, request=request, response=response, prefetch=prefetch
         )
 
         # Done; return the response.
@@ -1473,7 +1625,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> None:
         r"""Deletes a assignment. No expansion will happen.
@@ -1531,11 +1683,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.delete_assignment,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.delete_assignment]
 
         # Send the request.
         rpc(request, retry=retry, timeout=timeout, metadata=metadata)
@@ -1547,8 +1695,10 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         parent: str = None,
         query: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        cursor: pagers.PagerCursor = None,
     ) -> pagers.SearchAssignmentsPager:
         r"""Looks up assignments for a specified resource for a particular
         region. If the request is about a project:
@@ -1608,6 +1758,13 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The number of pages the returned pager fetches
+                ahead in the background while the current page is consumed.
+                Defaults to ``0``, which fetches pages on demand.
+            cursor (~.pagers.PagerCursor): The ``cursor`` of an earlier
+                pager of this method, to resume its listing from the next
+                page. If set, neither ``request`` nor the individual field
+                arguments should be set.
 
         Returns:
             ~.pagers.SearchAssignmentsPager:
@@ -1627,6 +1784,17 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
                 "the individual field arguments should be set."
             )
 
+        if cursor is not None:
+            if request is not None or any([parent, query]):
+                raise ValueError(
+                    "If the `cursor` argument is set, then neither the "
+                    "`request` argument nor any of the individual field "
+                    "arguments should be set."
+                )
+            request = cursor.to_request(
+                "search_assignments", reservation.SearchAssignmentsRequest
+            )
+
         request = reservation.SearchAssignmentsRequest(request)
 
         # If we have keyword arguments corresponding to fields on the
@@ -1639,11 +1807,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.search_assignments,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.search_assignments]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1651,13 +1815,16 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("parent", request.parent),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request, unless resuming a listing that has no more pages.
+        if cursor is not None and cursor.exhausted:
+            response = reservation.SearchAssignmentsResponse()
+        else:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.SearchAssignmentsPager(
-            method=rpc, request=request, response=response
+            method=rpc, request=request, response=response, prefetch=prefetch
         )
 
         # Done; return the response.
@@ -1670,7 +1837,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         name: str = None,
         destination_id: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.Assignment:
         r"""Moves an assignment under a new reservation.
@@ -1736,11 +1903,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.move_assignment,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.move_assignment]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
@@ -1754,7 +1917,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         *,
         name: str = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.BiReservation:
         r"""Retrieves a BI reservation.
@@ -1800,11 +1963,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.get_bi_reservation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.get_bi_reservation]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1812,8 +1971,15 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request, unless the resource is cached.
+        if self._cache is not None:
+            response = self._cache.get(
+                BI_RESERVATION,
+                request.name,
+                lambda: rpc(request, retry=retry, timeout=timeout, metadata=metadata),
+            )
+        else:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
 
         # Done; return the response.
         return response
@@ -1825,7 +1991,7 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
         bi_reservation: reservation.BiReservation = None,
         update_mask: field_mask.FieldMask = None,
         retry: retries.Retry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: float = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> reservation.BiReservation:
         r"""Updates a BI reservation.
@@ -1884,27 +2050,525 @@ class ReservationServiceClient(metaclass=ReservationServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = gapic_v1.method.wrap_method(
-            self._transport.update_bi_reservation,
-            default_timeout=None,
-            client_info=_client_info,
-        )
+        rpc = self._transport._wrapped_methods[self._transport.update_bi_reservation]
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        # Send the request. Cached copies of the resource are dropped even
+        # if the call fails, since the write may still have been applied.
+        try:
+            response = rpc(request, retry=retry, timeout=timeout, metadata=metadata)
+        finally:
+            if self._cache is not None:
+                self._cache.invalidate(BI_RESERVATION, request.bi_reservation.name)
 
         # Done; return the response.
         return response
 
+    def batch_create_assignments(
+        self,
+        parent: str,
+        assignments: Iterable[reservation.Assignment],
+        *,
+        max_concurrency: int = 8,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[batch.BatchResult]:
+        r"""Creates many assignments under one reservation concurrently.
+
+        Issues one ``create_assignment`` call per assignment, keeping at
+        most ``max_concurrency`` calls in flight. Assignments are drawn
+        from ``assignments`` lazily as earlier calls complete.
 
-try:
-    _client_info = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution(
-            "google-cloud-bigquery-reservation"
-        ).version
-    )
-except pkg_resources.DistributionNotFound:
-    _client_info = gapic_v1.client_info.ClientInfo()
+        Args:
+            parent (str):
+                Required. The parent reservation, e.g.
+                ``projects/myproject/locations/US/reservations/team1-prod``
+            assignments (Iterable[~.reservation.Assignment]):
+                The assignments to create.
+            max_concurrency (int): The maximum number of RPCs in flight at
+                any time.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[~.batch.BatchResult]:
+                One result per input item, yielded in completion order.
+                Each result carries the input index, the response and any
+                error raised for that item; a failed item does not stop
+                the batch.
+
+        """
+        return batch.run(
+            lambda assignment: self.create_assignment(
+                parent=parent,
+                assignment=assignment,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            ),
+            assignments,
+            max_concurrency,
+        )
+
+    def batch_delete_assignments(
+        self,
+        names: Iterable[str],
+        *,
+        max_concurrency: int = 8,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[batch.BatchResult]:
+        r"""Deletes many assignments concurrently.
+
+        Issues one ``delete_assignment`` call per name, keeping at most
+        ``max_concurrency`` calls in flight.
+
+        Args:
+            names (Iterable[str]):
+                Resource names of the assignments to delete, e.g.
+                ``projects/myproject/locations/US/reservations/team1-prod/assignments/123``
+            max_concurrency (int): The maximum number of RPCs in flight at
+                any time.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[~.batch.BatchResult]:
+                One result per input item, yielded in completion order.
+                Each result carries the input index, the response and any
+                error raised for that item; a failed item does not stop
+                the batch.
+
+        """
+        return batch.run(
+            lambda name: self.delete_assignment(
+                name=name, retry=retry, timeout=timeout, metadata=metadata
+            ),
+            names,
+            max_concurrency,
+        )
+
+    def batch_move_assignments(
+        self,
+        names: Iterable[str],
+        destination_id: str,
+        *,
+        max_concurrency: int = 8,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[batch.BatchResult]:
+        r"""Moves many assignments to one reservation concurrently.
+
+        Issues one ``move_assignment`` call per name, keeping at most
+        ``max_concurrency`` calls in flight.
+
+        Args:
+            names (Iterable[str]):
+                Resource names of the assignments to move.
+            destination_id (str):
+                The new reservation ID, e.g.
+                ``projects/myotherproject/locations/US/reservations/team2-prod``
+            max_concurrency (int): The maximum number of RPCs in flight at
+                any time.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[~.batch.BatchResult]:
+                One result per input item, yielded in completion order.
+                Each result carries the input index, the response and any
+                error raised for that item; a failed item does not stop
+                the batch.
+
+        """
+        return batch.run(
+            lambda name: self.move_assignment(
+                name=name,
+                destination_id=destination_id,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            ),
+            names,
+            max_concurrency,
+        )
+
+    def batch_list_reservations(
+        self,
+        parents: Iterable[str],
+        *,
+        max_concurrency: int = 8,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[batch.BatchResult]:
+        r"""Lists reservations under many parents concurrently.
+
+        Runs one ``list_reservations`` pager per parent, with at most
+        ``max_concurrency`` parents being listed at any time. Results
+        are yielded as soon as they arrive, so reservations from
+        different parents interleave.
+
+        Args:
+            parents (Iterable[str]):
+                The parent resources, e.g. ``projects/myproject/locations/US``
+                and ``projects/myproject/locations/EU``
+            max_concurrency (int): The maximum number of parents listed,
+                and so of RPCs in flight, at any time.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[~.batch.BatchResult]:
+                One result per reservation, with ``item`` set to the
+                parent it was listed under and ``response`` to the
+                reservation. If listing a parent fails, a result carrying
+                the error is yielded for it; the other parents are still
+                listed.
+
+        """
+        return batch.run_paged(
+            lambda parent: self.list_reservations(
+                parent=parent, retry=retry, timeout=timeout, metadata=metadata
+            ),
+            parents,
+            max_concurrency,
+        )
+
+    def batch_list_capacity_commitments(
+        self,
+        parents: Iterable[str],
+        *,
+        max_concurrency: int = 8,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[batch.BatchResult]:
+        r"""Lists capacity commitments under many parents concurrently.
+
+        Runs one ``list_capacity_commitments`` pager per parent, with at most
+        ``max_concurrency`` parents being listed at any time. Results
+        are yielded as soon as they arrive, so capacity commitments from
+        different parents interleave.
+
+        Args:
+            parents (Iterable[str]):
+                The parent resources, e.g. ``projects/myproject/locations/US``
+                and ``projects/myproject/locations/EU``
+            max_concurrency (int): The maximum number of parents listed,
+                and so of RPCs in flight, at any time.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[~.batch.BatchResult]:
+                One result per capacity commitment, with ``item`` set to the
+                parent it was listed under and ``response`` to the
+                capacity commitment. If listing a parent fails, a result carrying
+                the error is yielded for it; the other parents are still
+                listed.
+
+        """
+        return batch.run_paged(
+            lambda parent: self.list_capacity_commitments(
+                parent=parent, retry=retry, timeout=timeout, metadata=metadata
+            ),
+            parents,
+            max_concurrency,
+        )
+
+    def batch_list_assignments(
+        self,
+        parents: Iterable[str],
+        *,
+        max_concurrency: int = 8,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[batch.BatchResult]:
+        r"""Lists assignments under many parents concurrently.
+
+        Runs one ``list_assignments`` pager per parent, with at most
+        ``max_concurrency`` parents being listed at any time. Results
+        are yielded as soon as they arrive, so assignments from
+        different parents interleave.
+
+        Args:
+            parents (Iterable[str]):
+                The parent reservations, e.g.
+                ``projects/myproject/locations/US/reservations/team1-prod``.
+                Use ``-`` as the reservation ID to list the assignments of
+                every reservation in a location.
+            max_concurrency (int): The maximum number of parents listed,
+                and so of RPCs in flight, at any time.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[~.batch.BatchResult]:
+                One result per assignment, with ``item`` set to the
+                parent it was listed under and ``response`` to the
+                assignment. If listing a parent fails, a result carrying
+                the error is yielded for it; the other parents are still
+                listed.
+
+        """
+        return batch.run_paged(
+            lambda parent: self.list_assignments(
+                parent=parent, retry=retry, timeout=timeout, metadata=metadata
+            ),
+            parents,
+            max_concurrency,
+        )
+
+    def wait_for_commitments(
+        self,
+        names: Iterable[str],
+        *,
+        timeout: float = None,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> Iterator[reservation.CapacityCommitment]:
+        r"""Waits for many capacity commitments to leave ``PENDING``.
+
+        Polls ``get_capacity_commitment`` for each commitment in one loop,
+        with a per-commitment exponential backoff and jitter, until it is
+        ``ACTIVE`` or ``FAILED``.
+
+        Args:
+            names (Iterable[str]):
+                Resource names of the capacity commitments, e.g.
+                ``projects/myproject/locations/US/capacityCommitments/123``
+            timeout (Optional[float]): How long to wait in total, in
+                seconds; forever if not set.
+            initial_delay (float): The delay before polling a commitment
+                a second time, in seconds; it doubles after each poll.
+            max_delay (float): The longest delay between two polls of a
+                commitment, in seconds.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            Iterator[~.reservation.CapacityCommitment]:
+                Each commitment once ``ACTIVE`` or ``FAILED``, in the order
+                they settle. A failed commitment carries its
+                ``failure_status``.
+
+        Raises:
+            concurrent.futures.TimeoutError: From the iterator, if some
+                commitments are still pending after ``timeout``.
+        """
+
+        def get(name):
+            # Poll the service, not a cached copy; the cache then holds the
+            # latest state.
+            if self._cache is not None:
+                self._cache.invalidate(CAPACITY_COMMITMENT, name)
+            return self.get_capacity_commitment(
+                name=name, retry=retry, metadata=metadata
+            )
+
+        return waiter.wait(
+            get,
+            names,
+            timeout=timeout,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+        )
+
+    def wait_for_commitment(
+        self,
+        name: str,
+        *,
+        timeout: float = None,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.CapacityCommitment:
+        r"""Waits for a capacity commitment to become ``ACTIVE``.
+
+        See :meth:`wait_for_commitments` for the polling and the
+        arguments.
+
+        Returns:
+            ~.reservation.CapacityCommitment:
+                The active commitment.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: Matching the
+                ``failure_status`` of the commitment, if it failed. The
+                commitment is the exception's ``response``.
+            concurrent.futures.TimeoutError: If the commitment is still
+                pending after ``timeout``.
+        """
+        (commitment,) = self.wait_for_commitments(
+            [name],
+            timeout=timeout,
+            initial_delay=initial_delay,
+            max_delay=max_delay,
+            retry=retry,
+            metadata=metadata,
+        )
+        if commitment.state == reservation.CapacityCommitment.State.FAILED:
+            raise waiter.failure_error(commitment)
+        return commitment
+
+    def patch_reservation(
+        self,
+        original: gcbr_reservation.Reservation,
+        modified: gcbr_reservation.Reservation,
+        *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> gcbr_reservation.Reservation:
+        r"""Updates a reservation with only the fields that changed.
+
+        Compares ``modified`` with ``original`` and sends
+        ``update_reservation`` just the changed updatable fields, with
+        the matching ``update_mask``. No RPC is made if nothing changed.
+
+        Args:
+            original (:class:`~.gcbr_reservation.Reservation`):
+                The reservation as it is, e.g. as last fetched.
+            modified (:class:`~.gcbr_reservation.Reservation`):
+                The reservation as it should be.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.gcbr_reservation.Reservation:
+                The updated reservation, or ``original`` if nothing
+                changed.
+
+        """
+        change = masks.diff(original, modified)
+        if not change.changed:
+            return original
+        return self.update_reservation(
+            reservation=change.message,
+            update_mask=change.update_mask,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    def patch_capacity_commitment(
+        self,
+        original: reservation.CapacityCommitment,
+        modified: reservation.CapacityCommitment,
+        *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.CapacityCommitment:
+        r"""Updates a capacity commitment with only the fields that changed.
+
+        Compares ``modified`` with ``original`` and sends
+        ``update_capacity_commitment`` just the changed updatable fields, with
+        the matching ``update_mask``. No RPC is made if nothing changed.
+
+        Args:
+            original (:class:`~.reservation.CapacityCommitment`):
+                The capacity commitment as it is, e.g. as last fetched.
+            modified (:class:`~.reservation.CapacityCommitment`):
+                The capacity commitment as it should be.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.CapacityCommitment:
+                The updated capacity commitment, or ``original`` if nothing
+                changed.
+
+        """
+        change = masks.diff(original, modified)
+        if not change.changed:
+            return original
+        return self.update_capacity_commitment(
+            capacity_commitment=change.message,
+            update_mask=change.update_mask,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+
+    def patch_bi_reservation(
+        self,
+        original: reservation.BiReservation,
+        modified: reservation.BiReservation,
+        *,
+        retry: retries.Retry = gapic_v1.method.DEFAULT,
+        timeout: float = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> reservation.BiReservation:
+        r"""Updates a BI reservation with only the fields that changed.
+
+        Compares ``modified`` with ``original`` and sends
+        ``update_bi_reservation`` just the changed updatable fields, with
+        the matching ``update_mask``. No RPC is made if nothing changed.
+
+        Args:
+            original (:class:`~.reservation.BiReservation`):
+                The BI reservation as it is, e.g. as last fetched.
+            modified (:class:`~.reservation.BiReservation`):
+                The BI reservation as it should be.
+
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            ~.reservation.BiReservation:
+                The updated BI reservation, or ``original`` if nothing
+                changed.
+
+        """
+        change = masks.diff(original, modified)
+        if not change.changed:
+            return original
+        return self.update_bi_reservation(
+            bi_reservation=change.message,
+            update_mask=change.update_mask,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
 
 
 __all__ = ("ReservationServiceClient",)
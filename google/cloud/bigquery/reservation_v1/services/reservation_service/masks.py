@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Any, NamedTuple, Sequence
+
+from google.cloud.bigquery.reservation_v1.types import reservation
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+
+# Message type -> the fields its update RPC can change.
+UPDATABLE_FIELDS = {
+    reservation.Reservation: ("slot_capacity", "ignore_idle_slots"),
+    reservation.CapacityCommitment: ("plan", "renewal_plan"),
+    reservation.BiReservation: ("size",),
+}
+
+
+class FieldDiff(NamedTuple):
+    """The difference between two versions of a resource.
+
+    Attributes:
+        message (Any): The resource trimmed to its name and the changed
+            fields, ready to be sent with ``update_mask``.
+        update_mask (~.field_mask.FieldMask): The changed fields.
+    """
+
+    message: Any
+    update_mask: field_mask.FieldMask
+
+    @property
+    def changed(self) -> bool:
+        """Whether any field changed; if not, the update can be skipped."""
+        return bool(self.update_mask.paths)
+
+
+def diff(original: Any, modified: Any, fields: Sequence[str] = None) -> FieldDiff:
+    """Compare two versions of a resource field by field.
+
+    Args:
+        original (Any): The resource as it is, e.g. as last fetched.
+        modified (Any): The resource as it should be. Its ``name`` may be
+            left empty.
+        fields (Optional[Sequence[str]]): The fields to compare; those the
+            update RPC of the message type can change by default.
+
+    Returns:
+        ~.FieldDiff: The minimal update. Fields outside ``fields``, such
+        as output-only ones, are neither compared nor sent.
+
+    Raises:
+        TypeError: If the resources are of different types.
+        ValueError: If the resources have different names, or ``fields``
+            is omitted for a message type without an update RPC.
+    """
+    message_type = type(original)
+    if type(modified) is not message_type:
+        raise TypeError(
+            "Cannot compare %s with %s."
+            % (message_type.__name__, type(modified).__name__)
+        )
+    if fields is None:
+        if message_type not in UPDATABLE_FIELDS:
+            raise ValueError("No updatable fields known for %s." % message_type)
+        fields = UPDATABLE_FIELDS[message_type]
+    old = message_type.pb(original)
+    new = message_type.pb(modified)
+    if new.name and new.name != old.name:
+        raise ValueError("Cannot compare %s with %s." % (old.name, new.name))
+
+    paths = [field for field in fields if getattr(old, field) != getattr(new, field)]
+    trimmed = type(new)()
+    trimmed.CopyFrom(new)
+    for descriptor, _ in new.ListFields():
+        if descriptor.name not in paths:
+            trimmed.ClearField(descriptor.name)
+    trimmed.name = old.name
+    return FieldDiff(message_type.wrap(trimmed), field_mask.FieldMask(paths=paths))
@@ -15,11 +15,179 @@
 # limitations under the License.
 #
 
-from typing import Any, Callable, Iterable
-
+import asyncio
+import json
+import queue
+import threading
+from typing import (
+    Any,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Tuple,
+)
+
+from google.protobuf import json_format  # type: ignore
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import arrow
 from google.cloud.bigquery.reservation_v1.types import reservation
 
 
+# Sentinel placed on a prefetch queue once the last page has been fetched.
+_DONE = object()
+
+
+class PagerCursor(NamedTuple):
+    """Where a paged listing resumes.
+
+    A pager's ``cursor`` points past the most recently fetched page: take
+    it after processing each page of ``pages`` to checkpoint a long scan,
+    save it with :meth:`to_json`, and pass it back as the ``cursor``
+    argument of the list method, in this process or another, to continue
+    from the next page.
+
+    Attributes:
+        method (str): The list method, e.g. ``"list_assignments"``.
+        request (Dict[str, Any]): The fields of the request for the next
+            page, including its ``page_token``, in the protobuf JSON
+            mapping.
+        exhausted (bool): Whether the listing has no more pages.
+    """
+
+    method: str
+    request: Dict[str, Any]
+    exhausted: bool = False
+
+    def to_json(self) -> str:
+        """Return the cursor as a JSON string."""
+        return json.dumps(self._asdict(), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, data: str) -> "PagerCursor":
+        """Return the cursor saved by :meth:`to_json`."""
+        return cls(**json.loads(data))
+
+    def to_request(self, method: str, request_type: Any) -> Any:
+        """Return the request for the next page of ``method``.
+
+        Raises:
+            ValueError: If the cursor belongs to another method.
+        """
+        if method != self.method:
+            raise ValueError("The cursor resumes %s, not %s." % (self.method, method))
+        return request_type.wrap(
+            json_format.ParseDict(self.request, request_type.pb()())
+        )
+
+
+def _cursor(method: str, request: Any, response: Any) -> PagerCursor:
+    request = type(request)(request)
+    request.page_token = response.next_page_token
+    return PagerCursor(
+        method=method,
+        request=json_format.MessageToDict(
+            type(request).pb(request), preserving_proto_field_name=True
+        ),
+        exhausted=not response.next_page_token,
+    )
+
+
+def _validate_prefetch(prefetch: int) -> int:
+    if prefetch < 0:
+        raise ValueError("prefetch must be a non-negative integer.")
+    return prefetch
+
+
+def _prefetched_pages(
+    method: Callable, request: Any, response: Any, prefetch: int
+) -> Iterable[Tuple[str, Any]]:
+    """Fetch up to ``prefetch`` pages ahead of the consumer on a thread.
+
+    Yields ``(page_token, response)`` pairs in order. The queue between the
+    fetching thread and the consumer holds at most ``prefetch`` pages, so
+    memory stays bounded however slowly the pages are consumed. An
+    exception raised while fetching is re-raised to the consumer once the
+    pages fetched before it have been yielded.
+    """
+    pages = queue.Queue(maxsize=prefetch)  # type: queue.Queue
+    stop = threading.Event()
+    request = type(request)(request)
+
+    def put(item):
+        # Block while the queue is full, but give up once the consumer
+        # has gone away.
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def fetch(response):
+        try:
+            while response.next_page_token and not stop.is_set():
+                request.page_token = response.next_page_token
+                response = method(request)
+                put((request.page_token, response))
+        except Exception as exc:
+            put(exc)
+        put(_DONE)
+
+    worker = threading.Thread(
+        target=fetch, args=(response,), name="pager-prefetch", daemon=True
+    )
+    worker.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+async def _prefetched_pages_async(
+    method: Callable, request: Any, response: Any, prefetch: int
+) -> AsyncIterable[Tuple[str, Any]]:
+    """Fetch up to ``prefetch`` pages ahead of the consumer in a task.
+
+    The AsyncIO counterpart of :func:`_prefetched_pages`; the fetching task
+    is cancelled when the consumer stops iterating.
+    """
+    pages = asyncio.Queue(maxsize=prefetch)  # type: asyncio.Queue
+    request = type(request)(request)
+
+    async def fetch(response):
+        try:
+            while response.next_page_token:
+                request.page_token = response.next_page_token
+                response = await method(request)
+                await pages.put((request.page_token, response))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            await pages.put(exc)
+        await pages.put(_DONE)
+
+    worker = asyncio.ensure_future(fetch(response))
+    try:
+        while True:
+            item = await pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        worker.cancel()
+
+
 class ListReservationsPager:
     """A pager for iterating through ``list_reservations`` requests.
 
@@ -45,6 +213,8 @@ class ListReservationsPager:
         ],
         request: reservation.ListReservationsRequest,
         response: reservation.ListReservationsResponse,
+        *,
+        prefetch: int = 0,
     ):
         """Instantiate the pager.
 
@@ -55,17 +225,34 @@ class ListReservationsPager:
                 The initial request object.
             response (:class:`~.reservation.ListReservationsResponse`):
                 The initial response object.
+            prefetch (int): The number of pages to fetch ahead in the
+                background while the current page is consumed. ``0``
+                fetches each page only once the previous one is exhausted.
         """
         self._method = method
         self._request = reservation.ListReservationsRequest(request)
         self._response = response
+        self._prefetch = _validate_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def cursor(self) -> PagerCursor:
+        """Where to resume the listing after the pages fetched so far."""
+        return _cursor("list_reservations", self._request, self._response)
+
     @property
     def pages(self) -> Iterable[reservation.ListReservationsResponse]:
         yield self._response
+        if self._prefetch:
+            for page_token, response in _prefetched_pages(
+                self._method, self._request, self._response, self._prefetch
+            ):
+                self._request.page_token = page_token
+                self._response = response
+                yield self._response
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request)
@@ -75,6 +262,24 @@ class ListReservationsPager:
         for page in self.pages:
             yield from page.reservations
 
+    def to_arrow(self) -> Any:
+        """Return the reservations as a ``pyarrow.Table``.
+
+        Fetches the pages from the current one on and converts each to a
+        record batch as it arrives, reading the protobuf messages directly.
+        Enums are dictionary encoded and timestamps are
+        ``timestamp[us, UTC]``. Requires ``pyarrow``.
+        """
+        return arrow.to_arrow(reservation.Reservation, "reservations", self.pages)
+
+    def to_dataframe(self) -> Any:
+        """Return the reservations as a ``pandas.DataFrame``.
+
+        Built from :meth:`to_arrow`; enums become categoricals. Requires
+        ``pandas`` and ``pyarrow``.
+        """
+        return arrow.to_dataframe(self.to_arrow())
+
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
@@ -105,6 +310,8 @@ class ListCapacityCommitmentsPager:
         ],
         request: reservation.ListCapacityCommitmentsRequest,
         response: reservation.ListCapacityCommitmentsResponse,
+        *,
+        prefetch: int = 0,
     ):
         """Instantiate the pager.
 
@@ -115,17 +322,34 @@ class ListCapacityCommitmentsPager:
                 The initial request object.
             response (:class:`~.reservation.ListCapacityCommitmentsResponse`):
                 The initial response object.
+            prefetch (int): The number of pages to fetch ahead in the
+                background while the current page is consumed. ``0``
+                fetches each page only once the previous one is exhausted.
         """
         self._method = method
         self._request = reservation.ListCapacityCommitmentsRequest(request)
         self._response = response
+        self._prefetch = _validate_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def cursor(self) -> PagerCursor:
+        """Where to resume the listing after the pages fetched so far."""
+        return _cursor("list_capacity_commitments", self._request, self._response)
+
     @property
     def pages(self) -> Iterable[reservation.ListCapacityCommitmentsResponse]:
         yield self._response
+        if self._prefetch:
+            for page_token, response in _prefetched_pages(
+                self._method, self._request, self._response, self._prefetch
+            ):
+                self._request.page_token = page_token
+                self._response = response
+                yield self._response
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request)
@@ -135,6 +359,26 @@ class ListCapacityCommitmentsPager:
         for page in self.pages:
             yield from page.capacity_commitments
 
+    def to_arrow(self) -> Any:
+        """Return the capacity commitments as a ``pyarrow.Table``.
+
+        Fetches the pages from the current one on and converts each to a
+        record batch as it arrives, reading the protobuf messages directly.
+        Enums are dictionary encoded and timestamps are
+        ``timestamp[us, UTC]``. Requires ``pyarrow``.
+        """
+        return arrow.to_arrow(
+            reservation.CapacityCommitment, "capacity_commitments", self.pages
+        )
+
+    def to_dataframe(self) -> Any:
+        """Return the capacity commitments as a ``pandas.DataFrame``.
+
+        Built from :meth:`to_arrow`; enums become categoricals. Requires
+        ``pandas`` and ``pyarrow``.
+        """
+        return arrow.to_dataframe(self.to_arrow())
+
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
@@ -164,6 +408,8 @@ class ListAssignmentsPager:
         ],
         request: reservation.ListAssignmentsRequest,
         response: reservation.ListAssignmentsResponse,
+        *,
+        prefetch: int = 0,
     ):
         """Instantiate the pager.
 
@@ -174,17 +420,34 @@ class ListAssignmentsPager:
                 The initial request object.
             response (:class:`~.reservation.ListAssignmentsResponse`):
                 The initial response object.
+            prefetch (int): The number of pages to fetch ahead in the
+                background while the current page is consumed. ``0``
+                fetches each page only once the previous one is exhausted.
         """
         self._method = method
         self._request = reservation.ListAssignmentsRequest(request)
         self._response = response
+        self._prefetch = _validate_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def cursor(self) -> PagerCursor:
+        """Where to resume the listing after the pages fetched so far."""
+        return _cursor("list_assignments", self._request, self._response)
+
     @property
     def pages(self) -> Iterable[reservation.ListAssignmentsResponse]:
         yield self._response
+        if self._prefetch:
+            for page_token, response in _prefetched_pages(
+                self._method, self._request, self._response, self._prefetch
+            ):
+                self._request.page_token = page_token
+                self._response = response
+                yield self._response
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request)
@@ -194,6 +457,24 @@ class ListAssignmentsPager:
         for page in self.pages:
             yield from page.assignments
 
+    def to_arrow(self) -> Any:
+        """Return the assignments as a ``pyarrow.Table``.
+
+        Fetches the pages from the current one on and converts each to a
+        record batch as it arrives, reading the protobuf messages directly.
+        Enums are dictionary encoded and timestamps are
+        ``timestamp[us, UTC]``. Requires ``pyarrow``.
+        """
+        return arrow.to_arrow(reservation.Assignment, "assignments", self.pages)
+
+    def to_dataframe(self) -> Any:
+        """Return the assignments as a ``pandas.DataFrame``.
+
+        Built from :meth:`to_arrow`; enums become categoricals. Requires
+        ``pandas`` and ``pyarrow``.
+        """
+        return arrow.to_dataframe(self.to_arrow())
+
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
@@ -224,6 +505,8 @@ class SearchAssignmentsPager:
         ],
         request: reservation.SearchAssignmentsRequest,
         response: reservation.SearchAssignmentsResponse,
+        *,
+        prefetch: int = 0,
     ):
         """Instantiate the pager.
 
@@ -234,17 +517,34 @@ class SearchAssignmentsPager:
                 The initial request object.
             response (:class:`~.reservation.SearchAssignmentsResponse`):
                 The initial response object.
+            prefetch (int): The number of pages to fetch ahead in the
+                background while the current page is consumed. ``0``
+                fetches each page only once the previous one is exhausted.
         """
         self._method = method
         self._request = reservation.SearchAssignmentsRequest(request)
         self._response = response
+        self._prefetch = _validate_prefetch(prefetch)
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    @property
+    def cursor(self) -> PagerCursor:
+        """Where to resume the listing after the pages fetched so far."""
+        return _cursor("search_assignments", self._request, self._response)
+
     @property
     def pages(self) -> Iterable[reservation.SearchAssignmentsResponse]:
         yield self._response
+        if self._prefetch:
+            for page_token, response in _prefetched_pages(
+                self._method, self._request, self._response, self._prefetch
+            ):
+                self._request.page_token = page_token
+                self._response = response
+                yield self._response
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request)
@@ -254,5 +554,427 @@ class SearchAssignmentsPager:
         for page in self.pages:
             yield from page.assignments
 
+    def to_arrow(self) -> Any:
+        """Return the assignments as a ``pyarrow.Table``.
+
+        Fetches the pages from the current one on and converts each to a
+        record batch as it arrives, reading the protobuf messages directly.
+        Enums are dictionary encoded and timestamps are
+        ``timestamp[us, UTC]``. Requires ``pyarrow``.
+        """
+        return arrow.to_arrow(reservation.Assignment, "assignments", self.pages)
+
+    def to_dataframe(self) -> Any:
+        """Return the assignments as a ``pandas.DataFrame``.
+
+        Built from :meth:`to_arrow`; enums become categoricals. Requires
+        ``pandas`` and ``pyarrow``.
+        """
+        return arrow.to_dataframe(self.to_arrow())
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListReservationsAsyncPager:
+    """A pager for iterating through ``list_reservations`` requests.
+
+    This class thinly wraps an initial
+    :class:`~.reservation.ListReservationsResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``reservations`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListReservations`` requests and continue to iterate
+    through the ``reservations`` field on the
+    corresponding responses.
+
+    All the usual :class:`~.reservation.ListReservationsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[
+            [reservation.ListReservationsRequest],
+            Awaitable[reservation.ListReservationsResponse],
+        ],
+        request: reservation.ListReservationsRequest,
+        response: reservation.ListReservationsResponse,
+        *,
+        prefetch: int = 0,
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The coroutine method that was originally
+                called, and which instantiated this pager.
+            request (:class:`~.reservation.ListReservationsRequest`):
+                The initial request object.
+            response (:class:`~.reservation.ListReservationsResponse`):
+                The initial response object.
+            prefetch (int): The number of pages to fetch ahead in the
+                background while the current page is consumed. ``0``
+                fetches each page only once the previous one is exhausted.
+        """
+        self._method = method
+        self._request = reservation.ListReservationsRequest(request)
+        self._response = response
+        self._prefetch = _validate_prefetch(prefetch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def cursor(self) -> PagerCursor:
+        """Where to resume the listing after the pages fetched so far."""
+        return _cursor("list_reservations", self._request, self._response)
+
+    @property
+    async def pages(self) -> AsyncIterable[reservation.ListReservationsResponse]:
+        yield self._response
+        if self._prefetch:
+            async for page_token, response in _prefetched_pages_async(
+                self._method, self._request, self._response, self._prefetch
+            ):
+                self._request.page_token = page_token
+                self._response = response
+                yield self._response
+            return
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(self._request)
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterable[reservation.Reservation]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.reservations:
+                    yield response
+
+        return async_generator()
+
+    async def to_arrow(self) -> Any:
+        """Return the reservations as a ``pyarrow.Table``.
+
+        The asynchronous counterpart of
+        :meth:`ListReservationsPager.to_arrow`.
+        """
+        return await arrow.to_arrow_async(
+            reservation.Reservation, "reservations", self.pages
+        )
+
+    async def to_dataframe(self) -> Any:
+        """Return the reservations as a ``pandas.DataFrame``.
+
+        The asynchronous counterpart of
+        :meth:`ListReservationsPager.to_dataframe`.
+        """
+        return arrow.to_dataframe(await self.to_arrow())
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListCapacityCommitmentsAsyncPager:
+    """A pager for iterating through ``list_capacity_commitments`` requests.
+
+    This class thinly wraps an initial
+    :class:`~.reservation.ListCapacityCommitmentsResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``capacity_commitments`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListCapacityCommitments`` requests and continue to iterate
+    through the ``capacity_commitments`` field on the
+    corresponding responses.
+
+    All the usual :class:`~.reservation.ListCapacityCommitmentsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[
+            [reservation.ListCapacityCommitmentsRequest],
+            Awaitable[reservation.ListCapacityCommitmentsResponse],
+        ],
+        request: reservation.ListCapacityCommitmentsRequest,
+        response: reservation.ListCapacityCommitmentsResponse,
+        *,
+        prefetch: int = 0,
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The coroutine method that was originally
+                called, and which instantiated this pager.
+            request (:class:`~.reservation.ListCapacityCommitmentsRequest`):
+                The initial request object.
+            response (:class:`~.reservation.ListCapacityCommitmentsResponse`):
+                The initial response object.
+            prefetch (int): The number of pages to fetch ahead in the
+                background while the current page is consumed. ``0``
+                fetches each page only once the previous one is exhausted.
+        """
+        self._method = method
+        self._request = reservation.ListCapacityCommitmentsRequest(request)
+        self._response = response
+        self._prefetch = _validate_prefetch(prefetch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def cursor(self) -> PagerCursor:
+        """Where to resume the listing after the pages fetched so far."""
+        return _cursor("list_capacity_commitments", self._request, self._response)
+
+    @property
+    async def pages(self) -> AsyncIterable[reservation.ListCapacityCommitmentsResponse]:
+        yield self._response
+        if self._prefetch:
+            async for page_token, response in _prefetched_pages_async(
+                self._method, self._request, self._response, self._prefetch
+            ):
+                self._request.page_token = page_token
+                self._response = response
+                yield self._response
+            return
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(self._request)
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterable[reservation.CapacityCommitment]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.capacity_commitments:
+                    yield response
+
+        return async_generator()
+
+    async def to_arrow(self) -> Any:
+        """Return the capacity commitments as a ``pyarrow.Table``.
+
+        The asynchronous counterpart of
+        :meth:`ListCapacityCommitmentsPager.to_arrow`.
+        """
+        return await arrow.to_arrow_async(
+            reservation.CapacityCommitment, "capacity_commitments", self.pages
+        )
+
+    async def to_dataframe(self) -> Any:
+        """Return the capacity commitments as a ``pandas.DataFrame``.
+
+        The asynchronous counterpart of
+        :meth:`ListCapacityCommitmentsPager.to_dataframe`.
+        """
+        return arrow.to_dataframe(await self.to_arrow())
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListAssignmentsAsyncPager:
+    """A pager for iterating through ``list_assignments`` requests.
+
+    This class thinly wraps an initial
+    :class:`~.reservation.ListAssignmentsResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``assignments`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``ListAssignments`` requests and continue to iterate
+    through the ``assignments`` field on the
+    corresponding responses.
+
+    All the usual :class:`~.reservation.ListAssignmentsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[
+            [reservation.ListAssignmentsRequest],
+            Awaitable[reservation.ListAssignmentsResponse],
+        ],
+        request: reservation.ListAssignmentsRequest,
+        response: reservation.ListAssignmentsResponse,
+        *,
+        prefetch: int = 0,
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The coroutine method that was originally
+                called, and which instantiated this pager.
+            request (:class:`~.reservation.ListAssignmentsRequest`):
+                The initial request object.
+            response (:class:`~.reservation.ListAssignmentsResponse`):
+                The initial response object.
+            prefetch (int): The number of pages to fetch ahead in the
+                background while the current page is consumed. ``0``
+                fetches each page only once the previous one is exhausted.
+        """
+        self._method = method
+        self._request = reservation.ListAssignmentsRequest(request)
+        self._response = response
+        self._prefetch = _validate_prefetch(prefetch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def cursor(self) -> PagerCursor:
+        """Where to resume the listing after the pages fetched so far."""
+        return _cursor("list_assignments", self._request, self._response)
+
+    @property
+    async def pages(self) -> AsyncIterable[reservation.ListAssignmentsResponse]:
+        yield self._response
+        if self._prefetch:
+            async for page_token, response in _prefetched_pages_async(
+                self._method, self._request, self._response, self._prefetch
+            ):
+                self._request.page_token = page_token
+                self._response = response
+                yield self._response
+            return
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(self._request)
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterable[reservation.Assignment]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.assignments:
+                    yield response
+
+        return async_generator()
+
+    async def to_arrow(self) -> Any:
+        """Return the assignments as a ``pyarrow.Table``.
+
+        The asynchronous counterpart of
+        :meth:`ListAssignmentsPager.to_arrow`.
+        """
+        return await arrow.to_arrow_async(
+            reservation.Assignment, "assignments", self.pages
+        )
+
+    async def to_dataframe(self) -> Any:
+        """Return the assignments as a ``pandas.DataFrame``.
+
+        The asynchronous counterpart of
+        :meth:`ListAssignmentsPager.to_dataframe`.
+        """
+        return arrow.to_dataframe(await self.to_arrow())
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class SearchAssignmentsAsyncPager:
+    """A pager for iterating through ``search_assignments`` requests.
+
+    This class thinly wraps an initial
+    :class:`~.reservation.SearchAssignmentsResponse` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``assignments`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``SearchAssignments`` requests and continue to iterate
+    through the ``assignments`` field on the
+    corresponding responses.
+
+    All the usual :class:`~.reservation.SearchAssignmentsResponse`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[
+            [reservation.SearchAssignmentsRequest],
+            Awaitable[reservation.SearchAssignmentsResponse],
+        ],
+        request: reservation.SearchAssignmentsRequest,
+        response: reservation.SearchAssignmentsResponse,
+        *,
+        prefetch: int = 0,
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The coroutine method that was originally
+                called, and which instantiated this pager.
+            request (:class:`~.reservation.SearchAssignmentsRequest`):
+                The initial request object.
+            response (:class:`~.reservation.SearchAssignmentsResponse`):
+                The initial response object.
+            prefetch (int): The number of pages to fetch ahead in the
+                background while the current page is consumed. ``0``
+                fetches each page only once the previous one is exhausted.
+        """
+        self._method = method
+        self._request = reservation.SearchAssignmentsRequest(request)
+        self._response = response
+        self._prefetch = _validate_prefetch(prefetch)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def cursor(self) -> PagerCursor:
+        """Where to resume the listing after the pages fetched so far."""
+        return _cursor("search_assignments", self._request, self._response)
+
+    @property
+    async def pages(self) -> AsyncIterable[reservation.SearchAssignmentsResponse]:
+        yield self._response
+        if self._prefetch:
+            async for page_token, response in _prefetched_pages_async(
+                self._method, self._request, self._response, self._prefetch
+            ):
+                self._request.page_token = page_token
+                self._response = response
+                yield self._response
+            return
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(self._request)
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterable[reservation.Assignment]:
+        async def async_generator():
+            async for page in self.pages:
+                for response in page.assignments:
+                    yield response
+
+        return async_generator()
+
+    async def to_arrow(self) -> Any:
+        """Return the assignments as a ``pyarrow.Table``.
+
+        The asynchronous counterpart of
+        :meth:`SearchAssignmentsPager.to_arrow`.
+        """
+        return await arrow.to_arrow_async(
+            reservation.Assignment, "assignments", self.pages
+        )
+
+    async def to_dataframe(self) -> Any:
+        """Return the assignments as a ``pandas.DataFrame``.
+
+        The asynchronous counterpart of
+        :meth:`SearchAssignmentsPager.to_dataframe`.
+        """
+        return arrow.to_dataframe(await self.to_arrow())
+
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
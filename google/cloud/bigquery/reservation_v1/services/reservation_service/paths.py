@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Fast parsing and formatting of ReservationService resource names.
+
+The ``parse_*_path`` functions accept exactly the names the client's
+``parse_*_path`` static methods accept, using precompiled patterns and a
+memo of recently parsed names. The ``parse_*_paths`` functions parse a
+whole list of names into columns, which suits joining inventory data.
+
+The ``*Name`` types are immutable named tuples of the name components.
+They hash and compare without reparsing, a name being equal only to a
+name of the same type, and ``str()`` formats them back into the resource
+name.
+"""
+
+import functools
+import operator
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Distinct names memoized per resource type.
+_CACHE_SIZE = 65536
+
+_ASSIGNMENT_PATTERN = re.compile(
+    r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/reservations/(?P<reservation>.+?)/assignments/(?P<assignment>.+?)$"
+)
+_RESERVATION_PATTERN = re.compile(
+    r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/reservations/(?P<reservation>.+?)$"
+)
+_CAPACITY_COMMITMENT_PATTERN = re.compile(
+    r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/capacityCommitments/(?P<capacity_commitment>.+?)$"
+)
+_BI_RESERVATION_PATTERN = re.compile(
+    r"^projects/(?P<project>.+?)/locations/(?P<location>.+?)/bireservation$"
+)
+
+
+def _memoized(pattern):
+    @functools.lru_cache(maxsize=_CACHE_SIZE)
+    def parse(path: str) -> Optional[Tuple[str, ...]]:
+        m = pattern.match(path)
+        return m.groups() if m else None
+
+    return parse
+
+
+# Single-name lookups are memoized; the batch parsers match the patterns
+# directly, since large batches of distinct names would only churn the
+# memo.
+_parse_assignment = _memoized(_ASSIGNMENT_PATTERN)
+_parse_reservation = _memoized(_RESERVATION_PATTERN)
+_parse_capacity_commitment = _memoized(_CAPACITY_COMMITMENT_PATTERN)
+_parse_bi_reservation = _memoized(_BI_RESERVATION_PATTERN)
+
+
+# Equality and hashing of the name types: unlike plain tuples, names of
+# different resource types with the same components differ.
+def _eq(self, other) -> bool:
+    return type(self) is type(other) and tuple.__eq__(self, other)
+
+
+def _ne(self, other) -> bool:
+    return not _eq(self, other)
+
+
+def _hash(self) -> int:
+    return hash((type(self).__name__, tuple.__hash__(self)))
+
+
+class AssignmentName(NamedTuple):
+    """The name of an assignment, e.g.
+    ``projects/myproject/locations/US/reservations/team1-prod/assignments/123``.
+    """
+
+    project: str
+    location: str
+    reservation: str
+    assignment: str
+
+    @classmethod
+    def from_path(cls, path: str) -> "AssignmentName":
+        """Parse a resource name; raises ``ValueError`` if it does not match."""
+        components = _parse_assignment(path)
+        if components is None:
+            raise ValueError("Not an assignment name: %r" % path)
+        return cls(*components)
+
+    @property
+    def parent(self) -> "ReservationName":
+        """The name of the reservation holding the assignment."""
+        return ReservationName(self.project, self.location, self.reservation)
+
+    def __str__(self) -> str:
+        return assignment_path(*self)
+
+    __eq__ = _eq
+    __ne__ = _ne
+    __hash__ = _hash
+
+
+class ReservationName(NamedTuple):
+    """The name of a reservation, e.g.
+    ``projects/myproject/locations/US/reservations/team1-prod``.
+    """
+
+    project: str
+    location: str
+    reservation: str
+
+    @classmethod
+    def from_path(cls, path: str) -> "ReservationName":
+        """Parse a resource name; raises ``ValueError`` if it does not match."""
+        components = _parse_reservation(path)
+        if components is None:
+            raise ValueError("Not a reservation name: %r" % path)
+        return cls(*components)
+
+    def __str__(self) -> str:
+        return reservation_path(*self)
+
+    __eq__ = _eq
+    __ne__ = _ne
+    __hash__ = _hash
+
+
+class CapacityCommitmentName(NamedTuple):
+    """The name of a capacity commitment, e.g.
+    ``projects/myproject/locations/US/capacityCommitments/123``.
+    """
+
+    project: str
+    location: str
+    capacity_commitment: str
+
+    @classmethod
+    def from_path(cls, path: str) -> "CapacityCommitmentName":
+        """Parse a resource name; raises ``ValueError`` if it does not match."""
+        components = _parse_capacity_commitment(path)
+        if components is None:
+            raise ValueError("Not a capacity commitment name: %r" % path)
+        return cls(*components)
+
+    def __str__(self) -> str:
+        return capacity_commitment_path(*self)
+
+    __eq__ = _eq
+    __ne__ = _ne
+    __hash__ = _hash
+
+
+class BiReservationName(NamedTuple):
+    """The name of a BI reservation, e.g.
+    ``projects/myproject/locations/US/bireservation``.
+    """
+
+    project: str
+    location: str
+
+    @classmethod
+    def from_path(cls, path: str) -> "BiReservationName":
+        """Parse a resource name; raises ``ValueError`` if it does not match."""
+        components = _parse_bi_reservation(path)
+        if components is None:
+            raise ValueError("Not a BI reservation name: %r" % path)
+        return cls(*components)
+
+    def __str__(self) -> str:
+        return bi_reservation_path(*self)
+
+    __eq__ = _eq
+    __ne__ = _ne
+    __hash__ = _hash
+
+
+def assignment_path(
+    project: str, location: str, reservation: str, assignment: str
+) -> str:
+    """Return a fully-qualified assignment string."""
+    return "projects/%s/locations/%s/reservations/%s/assignments/%s" % (
+        project,
+        location,
+        reservation,
+        assignment,
+    )
+
+
+def reservation_path(project: str, location: str, reservation: str) -> str:
+    """Return a fully-qualified reservation string."""
+    return "projects/%s/locations/%s/reservations/%s" % (project, location, reservation)
+
+
+def capacity_commitment_path(
+    project: str, location: str, capacity_commitment: str
+) -> str:
+    """Return a fully-qualified capacity_commitment string."""
+    return "projects/%s/locations/%s/capacityCommitments/%s" % (
+        project,
+        location,
+        capacity_commitment,
+    )
+
+
+def bi_reservation_path(project: str, location: str) -> str:
+    """Return a fully-qualified bi_reservation string."""
+    return "projects/%s/locations/%s/bireservation" % (project, location)
+
+
+def _as_dict(fields: Tuple[str, ...], components: Optional[Tuple[str, ...]]):
+    return dict(zip(fields, components)) if components else {}
+
+
+def parse_assignment_path(path: str) -> Dict[str, str]:
+    """Parse a assignment path into its component segments."""
+    return _as_dict(AssignmentName._fields, _parse_assignment(path))
+
+
+def parse_reservation_path(path: str) -> Dict[str, str]:
+    """Parse a reservation path into its component segments."""
+    return _as_dict(ReservationName._fields, _parse_reservation(path))
+
+
+def parse_capacity_commitment_path(path: str) -> Dict[str, str]:
+    """Parse a capacity_commitment path into its component segments."""
+    return _as_dict(CapacityCommitmentName._fields, _parse_capacity_commitment(path))
+
+
+def parse_bi_reservation_path(path: str) -> Dict[str, str]:
+    """Parse a bi_reservation path into its component segments."""
+    return _as_dict(BiReservationName._fields, _parse_bi_reservation(path))
+
+
+def _columns(
+    fields: Tuple[str, ...], pattern, paths: Iterable[str]
+) -> Dict[str, List[Optional[str]]]:
+    missing = (None,) * len(fields)
+    rows = [m.groups() if m else missing for m in map(pattern.match, paths)]
+    return {
+        field: list(map(operator.itemgetter(i), rows)) for i, field in enumerate(fields)
+    }
+
+
+def parse_assignment_paths(paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+    """Parse many assignment paths into columns.
+
+    Args:
+        paths (Iterable[str]): The assignment names.
+
+    Returns:
+        Dict[str, List[Optional[str]]]: One list per component
+        (``project``, ``location``, ``reservation``, ``assignment``), each
+        holding that component of every name in input order; ``None`` for
+        names that do not match.
+    """
+    return _columns(AssignmentName._fields, _ASSIGNMENT_PATTERN, paths)
+
+
+def parse_reservation_paths(paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+    """Parse many reservation paths into columns.
+
+    See :func:`parse_assignment_paths`.
+    """
+    return _columns(ReservationName._fields, _RESERVATION_PATTERN, paths)
+
+
+def parse_capacity_commitment_paths(
+    paths: Iterable[str]
+) -> Dict[str, List[Optional[str]]]:
+    """Parse many capacity_commitment paths into columns.
+
+    See :func:`parse_assignment_paths`.
+    """
+    return _columns(CapacityCommitmentName._fields, _CAPACITY_COMMITMENT_PATTERN, paths)
+
+
+def parse_bi_reservation_paths(paths: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+    """Parse many bi_reservation paths into columns.
+
+    See :func:`parse_assignment_paths`.
+    """
+    return _columns(BiReservationName._fields, _BI_RESERVATION_PATTERN, paths)
+
+
+__all__ = (
+    "AssignmentName",
+    "BiReservationName",
+    "CapacityCommitmentName",
+    "ReservationName",
+)
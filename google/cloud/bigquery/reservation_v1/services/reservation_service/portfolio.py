@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Planning of capacity commitment changes.
+
+:func:`plan` takes the capacity commitments of an admin project and
+location and the slots wanted on each plan, and returns the splits, plan
+conversions, merges and deletes getting there as
+:class:`~.reconcile.ReconcileStep` objects, to run with
+:func:`~.reconcile.apply`::
+
+    portfolio_plan = portfolio.plan(
+        client.list_capacity_commitments(parent=parent),
+        {Plan.ANNUAL: 1000, Plan.FLEX: 200},
+    )
+    for result in reconcile.apply(client, portfolio_plan.steps):
+        ...
+
+A plan can only be changed to a longer one, so slots missing from a plan
+come from the surplus of shorter plans, converting whole commitments
+where they fit and splitting one otherwise. Surplus on ``FLEX`` is
+deleted; surplus on longer plans is stranded until the commitment ends.
+``TRIAL`` commitments are left alone.
+"""
+
+import bisect
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Tuple
+
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+from .reconcile import ReconcileStep
+
+_Plan = reservation.CapacityCommitment.CommitmentPlan
+
+# The plans that can be converted, from the shortest to the longest.
+_PLANS = (_Plan.FLEX, _Plan.MONTHLY, _Plan.ANNUAL)
+
+
+class PortfolioPlan(NamedTuple):
+    """The changes reaching a target slot profile.
+
+    Attributes:
+        steps (List[~.ReconcileStep]): The RPCs, each after the steps it
+            depends on.
+        stranded (Dict[~.reservation.CapacityCommitment.CommitmentPlan, int]):
+            The slots still committed beyond the target on each plan other
+            than ``FLEX``, which cannot be released before the commitments
+            end.
+        complete (bool): Whether the steps reach the target. If not, some
+            changes need the names of commitments that are pending or
+            split off by the steps: apply them, list the commitments again
+            once active, and plan again.
+    """
+
+    steps: List[ReconcileStep]
+    stranded: Dict[Any, int]
+    complete: bool
+
+
+class _Pool:
+    """The named, active commitments of one plan, sorted by slot count."""
+
+    def __init__(self, commitments: Iterable[reservation.CapacityCommitment]) -> None:
+        self.entries = sorted(
+            (c.slot_count, c.name) for c in commitments
+        )  # type: List[Tuple[int, str]]
+        self.slots = sum(entry[0] for entry in self.entries)
+
+    def take(self, amount: int) -> List[Tuple[str, int, int]]:
+        """Remove ``amount`` slots with as few commitments as possible.
+
+        Returns (name, slot count, slots taken) for each commitment used;
+        only the last one may be taken in part, the rest of it staying on
+        the plan under a new name.
+        """
+        taken = []
+        while amount > 0 and self.entries:
+            index = bisect.bisect_left(self.entries, (amount, ""))
+            if index == len(self.entries):
+                # Nothing is big enough: take the largest whole.
+                index -= 1
+            slot_count, name = self.entries.pop(index)
+            used = min(amount, slot_count)
+            taken.append((name, slot_count, used))
+            self.slots -= slot_count
+            amount -= used
+        return taken
+
+
+def plan(
+    commitments: Iterable[reservation.CapacityCommitment],
+    target: Mapping[Any, int],
+    *,
+    parent: str = None,
+    consolidate: bool = False
+) -> PortfolioPlan:
+    """Plan the fewest RPCs turning commitments into a target slot profile.
+
+    Slots missing from a plan are filled, longest plan first, from the
+    surplus of shorter plans, longest first, since surplus there would
+    be stranded: a commitment of exactly the missing size is converted
+    with one ``update_capacity_commitment``; otherwise the largest
+    commitments are converted whole until one larger than what is still
+    missing can be split, the part staying behind under a new name.
+    What no surplus covers is bought with ``create_capacity_commitment``;
+    surplus in pending or split off commitments is left for the next
+    plan rather than bought again.
+    ``FLEX`` surplus is then deleted the same way, and the ``renewal_plan``
+    of ``ANNUAL`` commitments within the surplus of that plan is set to
+    ``FLEX`` so that they can be released once they end.
+
+    Planning takes O(n log n) time for n commitments.
+
+    Args:
+        commitments (Iterable[~.reservation.CapacityCommitment]): The
+            commitments of one admin project and location. Only
+            ``ACTIVE`` ones are split, converted or merged; ``PENDING``
+            ones count towards their plan.
+        target (Mapping[~.reservation.CapacityCommitment.CommitmentPlan, int]):
+            The slots wanted on ``FLEX``, ``MONTHLY`` and ``ANNUAL``; a
+            plan left out wants none.
+        parent (Optional[str]): The admin project and location, e.g.
+            ``projects/admin/locations/US``; taken from the commitments'
+            names if omitted.
+        consolidate (bool): Whether to merge the active commitments of
+            each plan into one at the end.
+
+    Returns:
+        ~.PortfolioPlan: The steps and the stranded slots.
+
+    Raises:
+        ValueError: If the target has another plan or a negative slot
+            count, the commitments have different parents, or a
+            commitment must be created or merged without a parent.
+    """
+    for plan_, slots in target.items():
+        if plan_ not in _PLANS or slots < 0:
+            raise ValueError("Invalid target: %s slots on %r." % (slots, plan_))
+
+    active = {plan_: [] for plan_ in _PLANS}  # type: Dict[Any, List]
+    totals = dict.fromkeys(_PLANS, 0)
+    parents = set()
+    for commitment in commitments:
+        parents.add(commitment.name.split("/capacityCommitments/")[0])
+        if commitment.plan not in totals:
+            continue
+        if commitment.state == reservation.CapacityCommitment.State.ACTIVE:
+            active[commitment.plan].append(commitment)
+        elif commitment.state != reservation.CapacityCommitment.State.PENDING:
+            continue
+        totals[commitment.plan] += commitment.slot_count
+    if parent is not None:
+        parents.add(parent)
+    if len(parents) > 1:
+        raise ValueError("Commitments of several parents: %s" % sorted(parents))
+    parent = parents.pop() if parents else None
+
+    pools = {plan_: _Pool(active[plan_]) for plan_ in _PLANS}
+    surplus = {plan_: max(0, totals[plan_] - target.get(plan_, 0)) for plan_ in _PLANS}
+    renewals = {
+        c.name: c.renewal_plan for c in active[_Plan.ANNUAL]
+    }  # type: Dict[str, Any]
+    # Plan -> (names of its active commitments, steps they wait for).
+    members = {
+        plan_: (dict.fromkeys(c.name for c in active[plan_]), []) for plan_ in _PLANS
+    }  # type: Dict[Any, Tuple[Dict[str, None], List[int]]]
+    steps = []  # type: List[ReconcileStep]
+    complete = True
+
+    def add(method, request, after=()):
+        steps.append(ReconcileStep(method, request, tuple(after)))
+        return len(steps) - 1
+
+    def carve(name, slot_count, used):
+        # Leave ``used`` slots under ``name``; the rest gets a new name.
+        if used == slot_count:
+            return ()
+        split = add(
+            "split_capacity_commitment",
+            reservation.SplitCapacityCommitmentRequest(name=name, slot_count=used),
+        )
+        return (split,)
+
+    def require_parent():
+        if parent is None:
+            raise ValueError("A parent is required to create or merge commitments.")
+        return parent
+
+    for index in reversed(range(len(_PLANS))):
+        plan_ = _PLANS[index]
+        missing = max(0, target.get(plan_, 0) - totals[plan_])
+        for source in reversed(_PLANS[:index]):
+            amount = min(missing, surplus[source], pools[source].slots)
+            if not amount:
+                continue
+            for name, slot_count, used in pools[source].take(amount):
+                del members[source][0][name]
+                conversion = add(
+                    "update_capacity_commitment",
+                    reservation.UpdateCapacityCommitmentRequest(
+                        capacity_commitment=reservation.CapacityCommitment(
+                            name=name, plan=plan_
+                        ),
+                        update_mask={"paths": ["plan"]},
+                    ),
+                    carve(name, slot_count, used),
+                )
+                members[plan_][0][name] = None
+                members[plan_][1].append(conversion)
+            surplus[source] -= amount
+            missing -= amount
+        # Surplus left in commitments that are pending, or split off by
+        # this plan, is converted once they have names.
+        for source in reversed(_PLANS[:index]):
+            amount = min(missing, surplus[source])
+            surplus[source] -= amount
+            missing -= amount
+            complete = complete and not amount
+        if missing:
+            add(
+                "create_capacity_commitment",
+                reservation.CreateCapacityCommitmentRequest(
+                    parent=require_parent(),
+                    capacity_commitment=reservation.CapacityCommitment(
+                        slot_count=missing, plan=plan_
+                    ),
+                ),
+            )
+
+    flex = min(surplus[_Plan.FLEX], pools[_Plan.FLEX].slots)
+    for name, slot_count, used in pools[_Plan.FLEX].take(flex):
+        del members[_Plan.FLEX][0][name]
+        add(
+            "delete_capacity_commitment",
+            reservation.DeleteCapacityCommitmentRequest(name=name),
+            carve(name, slot_count, used),
+        )
+    surplus[_Plan.FLEX] -= flex
+    complete = complete and not surplus[_Plan.FLEX]
+
+    releasable = surplus[_Plan.ANNUAL]
+    for slot_count, name in reversed(pools[_Plan.ANNUAL].entries):
+        if slot_count > releasable or renewals[name] == _Plan.FLEX:
+            continue
+        members[_Plan.ANNUAL][1].append(
+            add(
+                "update_capacity_commitment",
+                reservation.UpdateCapacityCommitmentRequest(
+                    capacity_commitment=reservation.CapacityCommitment(
+                        name=name, renewal_plan=_Plan.FLEX
+                    ),
+                    update_mask={"paths": ["renewal_plan"]},
+                ),
+            )
+        )
+        renewals[name] = _Plan.FLEX
+        releasable -= slot_count
+
+    if consolidate:
+        for plan_ in _PLANS:
+            names, after = members[plan_]
+            # Keep the commitments to be released apart.
+            names = [name for name in names if renewals.get(name) != _Plan.FLEX]
+            if len(names) < 2:
+                continue
+            add(
+                "merge_capacity_commitments",
+                reservation.MergeCapacityCommitmentsRequest(
+                    parent=require_parent(),
+                    capacity_commitment_ids=[name.rsplit("/", 1)[-1] for name in names],
+                ),
+                after,
+            )
+
+    stranded = {
+        plan_: surplus[plan_] for plan_ in _PLANS[1:] if surplus[plan_]
+    }  # type: Dict[Any, int]
+    return PortfolioPlan(steps, stranded, complete)
@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Reconciliation of reservations and assignments with a desired state.
+
+:func:`plan` lists the current reservations and assignments of some
+locations and returns the RPCs turning them into the desired ones, as
+:class:`ReconcileStep` objects; :func:`apply` runs them, concurrently
+where their order does not matter::
+
+    steps = reconcile.plan(
+        client,
+        ["projects/admin/locations/US"],
+        [reservation.Reservation(name=prod, slot_capacity=500)],
+        [reconcile.DesiredAssignment(prod, "projects/etl", QUERY)],
+    )
+    for result in reconcile.apply(client, steps):
+        if not result.ok:
+            print(result.item.method, result.error)
+
+The plan is minimal: updates only carry the fields that differ,
+assignments that change reservation are moved rather than deleted and
+created again, and nothing is deleted unless ``prune`` is set. Capacity
+commitments are left alone.
+"""
+
+import collections
+from concurrent import futures
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+from . import batch
+from . import masks
+from .paths import ReservationName
+
+# (location, assignee, job type): an assignee has at most one assignment
+# per job type in a location.
+_AssignmentKey = Tuple[str, str, int]
+
+
+class DesiredAssignment(NamedTuple):
+    """An assignment that should exist.
+
+    Attributes:
+        reservation (str): The name of the reservation, e.g.
+            ``projects/admin/locations/US/reservations/prod``.
+        assignee (str): The project, folder or organization, e.g.
+            ``projects/etl``.
+        job_type (~.reservation.Assignment.JobType): The job type.
+    """
+
+    reservation: str
+    assignee: str
+    job_type: reservation.Assignment.JobType
+
+
+class ReconcileStep(NamedTuple):
+    """One RPC of a reconciliation plan.
+
+    Attributes:
+        method (str): The client method to call, e.g.
+            ``"update_reservation"``.
+        request (Any): The request message.
+        after (Tuple[int, ...]): The positions in the plan of the steps
+            that must succeed before this one runs.
+    """
+
+    method: str
+    request: Any
+    after: Tuple[int, ...]
+
+    def run(self, client) -> Any:
+        """Issue the RPC; return its response."""
+        return getattr(client, self.method)(request=self.request)
+
+
+def _fetch(
+    client, parents: List[str], max_concurrency: int
+) -> Tuple[Dict[str, reservation.Reservation], Dict[_AssignmentKey, Any]]:
+    listings = [("list_reservations", parent) for parent in parents] + [
+        ("list_assignments", parent + "/reservations/-") for parent in parents
+    ]
+    reservations = {}  # type: Dict[str, reservation.Reservation]
+    assignments = {}  # type: Dict[_AssignmentKey, reservation.Assignment]
+    for result in batch.run_paged(
+        lambda listing: getattr(client, listing[0])(parent=listing[1]),
+        listings,
+        max_concurrency,
+    ):
+        if not result.ok:
+            raise result.error
+        if result.item[0] == "list_reservations":
+            reservations[result.response.name] = result.response
+        else:
+            assignments[_key(result.response)] = result.response
+    return reservations, assignments
+
+
+def _key(assignment: reservation.Assignment) -> _AssignmentKey:
+    return (assignment.name.split("/")[3], assignment.assignee, assignment.job_type)
+
+
+def _reservation_of(assignment_name: str) -> str:
+    return assignment_name.rsplit("/assignments/", 1)[0]
+
+
+def plan(
+    client,
+    parents: Iterable[str],
+    reservations: Iterable[reservation.Reservation],
+    assignments: Iterable[DesiredAssignment] = (),
+    *,
+    prune: bool = False,
+    max_concurrency: int = 8
+) -> List[ReconcileStep]:
+    """Compute the RPCs turning the current state into the desired one.
+
+    The reservations and assignments of ``parents`` are listed
+    concurrently, then compared with the desired ones:
+
+    * a missing reservation is created, and one whose ``slot_capacity``
+      or ``ignore_idle_slots`` differ is updated with a mask of just
+      those fields;
+    * a missing assignment is created, and one in another reservation is
+      moved;
+    * with ``prune``, the reservations and assignments of ``parents``
+      that are not desired are deleted, a reservation after its
+      assignments are moved out or deleted.
+
+    Reservations that grow wait for those that shrink or are deleted under
+    the same admin project and location, so the committed slots are never
+    exceeded midway. A reservation created where slots are freed is
+    created without slots and grown the same way, since assignments may
+    have to move into it before a reservation can be deleted.
+
+    Args:
+        client (~.ReservationServiceClient): The client to list with.
+        parents (Iterable[str]): The locations to reconcile, e.g.
+            ``projects/admin/locations/US``.
+        reservations (Iterable[~.reservation.Reservation]): The desired
+            reservations, with their full names.
+        assignments (Iterable[~.DesiredAssignment]): The desired
+            assignments.
+        prune (bool): Whether to delete what is not desired.
+        max_concurrency (int): The maximum number of listings in flight.
+
+    Returns:
+        List[~.ReconcileStep]: The plan, in an order in which every step
+        comes after the steps it depends on. Empty if nothing differs.
+
+    Raises:
+        ValueError: If a desired reservation is outside ``parents`` or
+            named twice, or a desired assignment is duplicated or names a
+            reservation that is not desired.
+        google.api_core.exceptions.GoogleAPICallError: If listing failed.
+    """
+    parents = list(dict.fromkeys(parents))
+    desired = {}  # type: Dict[str, reservation.Reservation]
+    for wanted in reservations:
+        name = ReservationName.from_path(wanted.name)
+        if "projects/%s/locations/%s" % name[:2] not in parents:
+            raise ValueError("%s is outside the reconciled parents." % wanted.name)
+        if wanted.name in desired:
+            raise ValueError("%s is desired twice." % wanted.name)
+        desired[wanted.name] = wanted
+    desired_assignments = {}  # type: Dict[_AssignmentKey, str]
+    for wanted in assignments:
+        if wanted.reservation not in desired:
+            raise ValueError(
+                "Assignment of %s to undesired reservation %s."
+                % (wanted.assignee, wanted.reservation)
+            )
+        key = (
+            ReservationName.from_path(wanted.reservation).location,
+            wanted.assignee,
+            wanted.job_type,
+        )
+        if key in desired_assignments:
+            raise ValueError(
+                "%s is assigned twice for %s jobs in %s."
+                % (wanted.assignee, reservation.Assignment.JobType(key[2]).name, key[0])
+            )
+        desired_assignments[key] = wanted.reservation
+
+    current, current_assignments = _fetch(client, parents, max_concurrency)
+
+    def parent_of(name):
+        return name.split("/reservations/")[0]
+
+    # The parents where reservations shrink or are deleted.
+    freeing = {
+        parent_of(name)
+        for name, wanted in desired.items()
+        if name in current and wanted.slot_capacity < current[name].slot_capacity
+    }
+    if prune:
+        freeing.update(parent_of(name) for name in set(current) - set(desired))
+
+    steps = []  # type: List[ReconcileStep]
+    created = {}  # type: Dict[str, int]
+    freed = collections.defaultdict(list)  # type: Dict[str, List[int]]
+    # (update, the steps it waits for besides those freeing slots).
+    grown = []  # type: List[Tuple[reservation.UpdateReservationRequest, List[int]]]
+
+    def add(method, request, after=()):
+        steps.append(ReconcileStep(method, request, tuple(after)))
+        return len(steps) - 1
+
+    for name, wanted in sorted(desired.items()):
+        existing = current.get(name)
+        if existing is None:
+            body = reservation.Reservation()
+            for field in masks.UPDATABLE_FIELDS[reservation.Reservation]:
+                setattr(body, field, getattr(wanted, field))
+            deferred = body.slot_capacity > 0 and parent_of(name) in freeing
+            if deferred:
+                body.slot_capacity = 0
+            created[name] = add(
+                "create_reservation",
+                reservation.CreateReservationRequest(
+                    parent=parent_of(name),
+                    reservation_id=ReservationName.from_path(name).reservation,
+                    reservation=body,
+                ),
+            )
+            if deferred:
+                grown.append(
+                    (
+                        reservation.UpdateReservationRequest(
+                            reservation=reservation.Reservation(
+                                name=name, slot_capacity=wanted.slot_capacity
+                            ),
+                            update_mask={"paths": ["slot_capacity"]},
+                        ),
+                        [created[name]],
+                    )
+                )
+            continue
+        change = masks.diff(existing, wanted)
+        if not change.changed:
+            continue
+        request = reservation.UpdateReservationRequest(
+            reservation=change.message, update_mask=change.update_mask
+        )
+        if wanted.slot_capacity > existing.slot_capacity:
+            grown.append((request, []))
+            continue
+        index = add("update_reservation", request)
+        if wanted.slot_capacity < existing.slot_capacity:
+            freed[parent_of(name)].append(index)
+
+    emptied = collections.defaultdict(list)  # type: Dict[str, List[int]]
+    for key, existing in sorted(current_assignments.items()):
+        source = _reservation_of(existing.name)
+        target = desired_assignments.get(key)
+        if target == source:
+            continue
+        if target is not None:
+            index = add(
+                "move_assignment",
+                reservation.MoveAssignmentRequest(
+                    name=existing.name, destination_id=target
+                ),
+                [created[target]] if target in created else (),
+            )
+        elif prune:
+            index = add(
+                "delete_assignment",
+                reservation.DeleteAssignmentRequest(name=existing.name),
+            )
+        else:
+            continue
+        emptied[source].append(index)
+
+    for key, target in sorted(desired_assignments.items()):
+        if key in current_assignments:
+            continue
+        add(
+            "create_assignment",
+            reservation.CreateAssignmentRequest(
+                parent=target,
+                assignment=reservation.Assignment(assignee=key[1], job_type=key[2]),
+            ),
+            [created[target]] if target in created else (),
+        )
+
+    if prune:
+        for name in sorted(set(current) - set(desired)):
+            index = add(
+                "delete_reservation",
+                reservation.DeleteReservationRequest(name=name),
+                emptied[name],
+            )
+            freed[parent_of(name)].append(index)
+
+    for request, after in grown:
+        add(
+            "update_reservation",
+            request,
+            after + freed[parent_of(request.reservation.name)],
+        )
+    return steps
+
+
+def apply(
+    client, steps: List[ReconcileStep], *, max_concurrency: int = 8
+) -> Iterator[batch.BatchResult]:
+    """Run a plan, with at most ``max_concurrency`` RPCs in flight.
+
+    A step starts as soon as the steps it depends on have succeeded. If
+    a step fails, the steps depending on it, directly or not, are
+    skipped; the others still run.
+
+    Args:
+        client (~.ReservationServiceClient): The client to call.
+        steps (List[~.ReconcileStep]): The plan, as returned by
+            :func:`plan`.
+        max_concurrency (int): The maximum number of RPCs in flight.
+
+    Returns:
+        Iterator[~.batch.BatchResult]: One result per step, in completion
+        order, with ``item`` set to the step. A skipped step's error is a
+        ``concurrent.futures.CancelledError``.
+
+    Raises:
+        ValueError: If ``max_concurrency`` is less than 1.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+
+    return _apply(client, steps, max_concurrency)
+
+
+def _apply(
+    client, steps: List[ReconcileStep], max_concurrency: int
+) -> Iterator[batch.BatchResult]:
+    waiting = {index: set(step.after) for index, step in enumerate(steps)}
+    dependents = collections.defaultdict(list)  # type: Dict[int, List[int]]
+    for index, step in enumerate(steps):
+        for dependency in step.after:
+            dependents[dependency].append(index)
+    ready = [index for index, after in waiting.items() if not after]
+    skipped = set()
+
+    with futures.ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="reservation-reconcile"
+    ) as executor:
+        running = {}  # type: Dict[futures.Future, int]
+        while ready or running:
+            for index in ready:
+                running[executor.submit(steps[index].run, client)] = index
+            ready = []
+            done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    yield batch.BatchResult(index, steps[index], future.result(), None)
+                    for dependent in dependents[index]:
+                        waiting[dependent].discard(index)
+                        if not waiting[dependent] and dependent not in skipped:
+                            ready.append(dependent)
+                    continue
+                yield batch.BatchResult(index, steps[index], None, error)
+                failed = [index]
+                while failed:
+                    for dependent in dependents[failed.pop()]:
+                        if dependent in skipped:
+                            continue
+                        skipped.add(dependent)
+                        failed.append(dependent)
+                        yield batch.BatchResult(
+                            dependent,
+                            steps[dependent],
+                            None,
+                            futures.CancelledError("Skipped: step %d failed." % index),
+                        )
@@ -18,8 +18,13 @@
 from collections import OrderedDict
 from typing import Dict, Type
 
-from .base import ReservationServiceTransport
+from .base import ReservationServiceTransport, WarmupReport
+from .channel_options import ChannelOptions
 from .grpc import ReservationServiceGrpcTransport
+from .grpc_asyncio import ReservationServiceGrpcAsyncIOTransport
+from .policy import HedgePolicy, MethodPolicy, RetryPolicy, default_policies
+from .pool import ChannelPool
+from .ratelimit import RateLimiter
 
 
 # Compile a registry of transports.
@@ -27,6 +32,19 @@ _transport_registry = (
     OrderedDict()
 )  # type: Dict[str, Type[ReservationServiceTransport]]
 _transport_registry["grpc"] = ReservationServiceGrpcTransport
+_transport_registry["grpc_asyncio"] = ReservationServiceGrpcAsyncIOTransport
 
 
-__all__ = ("ReservationServiceTransport", "ReservationServiceGrpcTransport")
+__all__ = (
+    "ReservationServiceTransport",
+    "ReservationServiceGrpcTransport",
+    "ReservationServiceGrpcAsyncIOTransport",
+    "ChannelPool",
+    "ChannelOptions",
+    "WarmupReport",
+    "MethodPolicy",
+    "RetryPolicy",
+    "HedgePolicy",
+    "default_policies",
+    "RateLimiter",
+)
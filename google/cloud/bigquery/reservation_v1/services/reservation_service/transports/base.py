@@ -16,19 +16,74 @@
 #
 
 import abc
+import time
 import typing
+import pkg_resources
 
 from google import auth
+from google.api_core import gapic_v1  # type: ignore
 from google.auth import credentials  # type: ignore
+from google.auth.transport import requests as auth_requests  # type: ignore
 
 from google.cloud.bigquery.reservation_v1.types import reservation
 from google.cloud.bigquery.reservation_v1.types import reservation as gcbr_reservation
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
+from . import policy
+from . import ratelimit
+
+
+try:
+    _client_info = gapic_v1.client_info.ClientInfo(
+        gapic_version=pkg_resources.get_distribution(
+            "google-cloud-bigquery-reservation"
+        ).version
+    )
+except pkg_resources.DistributionNotFound:
+    _client_info = gapic_v1.client_info.ClientInfo()
+
+_RPC_NAMES = (
+    "create_reservation",
+    "list_reservations",
+    "get_reservation",
+    "delete_reservation",
+    "update_reservation",
+    "create_capacity_commitment",
+    "list_capacity_commitments",
+    "get_capacity_commitment",
+    "delete_capacity_commitment",
+    "update_capacity_commitment",
+    "split_capacity_commitment",
+    "merge_capacity_commitments",
+    "create_assignment",
+    "list_assignments",
+    "delete_assignment",
+    "search_assignments",
+    "move_assignment",
+    "get_bi_reservation",
+    "update_bi_reservation",
+)
+
+
+class WarmupReport(typing.NamedTuple):
+    """How long a transport's ``warmup`` took, in seconds.
+
+    The credential refresh and the channel connection run concurrently,
+    so ``credentials_s`` and ``channel_s`` overlap.
+    """
+
+    stubs_s: float
+    credentials_s: float
+    channel_s: float
+    total_s: float
+
 
 class ReservationServiceTransport(metaclass=abc.ABCMeta):
     """Abstract transport class for ReservationService."""
 
+    # Whether the stubs return futures, which hedging needs.
+    _SUPPORTS_HEDGING = True
+
     AUTH_SCOPES = (
         "https://www.googleapis.com/auth/bigquery",
         "https://www.googleapis.com/auth/cloud-platform",
@@ -39,6 +94,8 @@ class ReservationServiceTransport(metaclass=abc.ABCMeta):
         *,
         host: str = "bigqueryreservation.googleapis.com",
         credentials: credentials.Credentials = None,
+        method_policies: typing.Mapping[str, policy.MethodPolicy] = None,
+        rate_limiter: ratelimit.RateLimiter = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -49,7 +106,22 @@ class ReservationServiceTransport(metaclass=abc.ABCMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
+            method_policies (Optional[Mapping[str, ~.MethodPolicy]]): The
+                default deadline, retry and hedging of methods, keyed by
+                method name, e.g. ``"get_reservation"``. Methods without a
+                policy have no default deadline or retry.
+            rate_limiter (Optional[~.RateLimiter]): Paces the calls of
+                every method; calls are not paced if not set.
+
+        Raises:
+            ValueError: If a policy names an unknown method or hedges a
+                method that cannot be hedged.
         """
+        self._method_policies = policy.validate(
+            method_policies, hedging=self._SUPPORTS_HEDGING
+        )
+        self._rate_limiter = rate_limiter
+
         # Save the hostname. Default to port 443 (HTTPS) if none is specified.
         if ":" not in host:
             host += ":443"
@@ -60,9 +132,73 @@ class ReservationServiceTransport(metaclass=abc.ABCMeta):
         if credentials is None:
             credentials, _ = auth.default(scopes=self.AUTH_SCOPES)
 
+        # Scope the credentials here rather than letting channel creation
+        # scope a copy, so that refreshing them in ``warmup`` refreshes the
+        # credentials the channel uses.
+        if credentials:
+            credentials = auth.credentials.with_scopes_if_required(
+                credentials, self.AUTH_SCOPES
+            )
+
         # Save the credentials.
         self._credentials = credentials
 
+    def _create_stubs(self) -> float:
+        """Create the stub of every method; return the time taken."""
+        start = time.monotonic()
+        for name in _RPC_NAMES:
+            getattr(self, name)
+        return time.monotonic() - start
+
+    def _refresh_credentials(self) -> float:
+        """Fetch an access token unless a valid one is cached; return the
+        time taken."""
+        start = time.monotonic()
+        if self._credentials and not self._credentials.valid:
+            self._credentials.refresh(auth_requests.Request())
+        return time.monotonic() - start
+
+    def _prep_wrapped_messages(
+        self, wrap_method: typing.Callable = gapic_v1.method.wrap_method
+    ) -> None:
+        """Precompute the wrapped methods.
+
+        Wrapping an RPC adds retry, timeout and client-info handling to the
+        bare transport callable, following the method's policy, and the
+        hedging and rate limiting of the transport. The decorated callables
+        do not depend on the individual request, so they are built once
+        per transport and looked up by the client on every call.
+
+        Args:
+            wrap_method (Callable): ``gapic_v1.method.wrap_method``, or
+                ``gapic_v1.method_async.wrap_method`` for AsyncIO stubs.
+        """
+        self._wrapped_methods = {}
+        for name in _RPC_NAMES:
+            method_policy = self._method_policies.get(name) or policy.MethodPolicy()
+            stub = getattr(self, name)
+            target = stub
+            if method_policy.hedge is not None:
+                target = policy.HedgedCallable(stub, method_policy.hedge)
+            if self._rate_limiter is not None:
+                target = self._limit(name, target)
+            self._wrapped_methods[stub] = wrap_method(
+                target,
+                default_retry=self._retry(method_policy.retry),
+                default_timeout=method_policy.timeout,
+                client_info=_client_info,
+            )
+
+    def _limit(self, name: str, target: typing.Callable) -> typing.Callable:
+        """Pace ``target``, the callable of method ``name``, with the rate
+        limiter."""
+        return self._rate_limiter.wrap(name, target)
+
+    @staticmethod
+    def _retry(retry_policy: typing.Optional[policy.RetryPolicy]):
+        """Return the ``Retry`` of a method's retry policy, if any."""
+        return retry_policy and retry_policy.to_retry()
+
     @property
     def create_reservation(
         self
@@ -205,5 +341,27 @@ class ReservationServiceTransport(metaclass=abc.ABCMeta):
     ]:
         raise NotImplementedError
 
+    def warmup(self, *, timeout: float = None) -> WarmupReport:
+        """Prepare the transport so the first call pays no setup cost.
+
+        Creates every stub, fetches an access token and connects the
+        channel, so that the first call does not wait for a token or a TLS
+        handshake. Warming up is optional; calls work without it.
+
+        Args:
+            timeout (Optional[float]): How long to wait for the channel to
+                connect, in seconds; forever if not set.
+
+        Returns:
+            ~.WarmupReport: How long each step took.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel did
+                not connect within ``timeout``.
+            google.auth.exceptions.RefreshError: If fetching the access
+                token failed.
+        """
+        raise NotImplementedError
+
 
-__all__ = ("ReservationServiceTransport",)
+__all__ = ("ReservationServiceTransport", "WarmupReport")
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Any, List, Mapping, Tuple
+
+import grpc  # type: ignore
+
+
+# The largest HTTP/2 flow-control window (RFC 7540, section 6.9.1).
+_MAX_WINDOW_SIZE = 2 ** 31 - 1
+
+_COMPRESSION = {
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+    "none": grpc.Compression.NoCompression,
+}
+
+# ChannelOptions attribute -> gRPC channel argument.
+_GRPC_ARGUMENTS = (
+    ("keepalive_time_ms", "grpc.keepalive_time_ms"),
+    ("keepalive_timeout_ms", "grpc.keepalive_timeout_ms"),
+    ("keepalive_permit_without_calls", "grpc.keepalive_permit_without_calls"),
+    ("max_receive_message_length", "grpc.max_receive_message_length"),
+    ("max_send_message_length", "grpc.max_send_message_length"),
+    ("initial_window_size", "grpc.http2.lookahead_bytes"),
+    ("bdp_probe", "grpc.http2.bdp_probe"),
+)
+_FIELDS = frozenset([name for name, _ in _GRPC_ARGUMENTS] + ["compression"])
+
+
+class ChannelOptions:
+    """Tuning options for the gRPC channels a transport creates.
+
+    Every option is validated when set; options left as ``None`` keep the
+    gRPC default.
+
+    Args:
+        keepalive_time_ms (Optional[int]): Send a keepalive ping after the
+            connection has been idle this long. Keeps connections through
+            NATs and load balancers that drop idle flows.
+        keepalive_timeout_ms (Optional[int]): Close the connection if a
+            keepalive ping is not acknowledged within this time.
+        keepalive_permit_without_calls (Optional[bool]): Send keepalive
+            pings even when no call is in flight.
+        compression (Optional[str]): ``"gzip"``, ``"deflate"`` or
+            ``"none"``. Compresses requests, and lets the server compress
+            responses, which mostly benefits large list pages.
+        max_receive_message_length (Optional[int]): The largest response
+            accepted, in bytes; ``-1`` for no limit. The gRPC default of
+            4 MiB can be too small for large assignment pages.
+        max_send_message_length (Optional[int]): The largest request sent,
+            in bytes; ``-1`` for no limit.
+        initial_window_size (Optional[int]): The initial HTTP/2 stream
+            flow-control window, in bytes. Larger windows let large
+            responses stream without waiting for window updates on
+            high-latency links.
+        bdp_probe (Optional[bool]): Whether gRPC grows flow-control windows
+            from bandwidth-delay estimates. Disable it to keep the windows
+            at ``initial_window_size``.
+
+    Raises:
+        ValueError: If an option is out of range.
+        TypeError: If an option has the wrong type.
+    """
+
+    def __init__(
+        self,
+        *,
+        keepalive_time_ms: int = None,
+        keepalive_timeout_ms: int = None,
+        keepalive_permit_without_calls: bool = None,
+        compression: str = None,
+        max_receive_message_length: int = None,
+        max_send_message_length: int = None,
+        initial_window_size: int = None,
+        bdp_probe: bool = None
+    ) -> None:
+        self.keepalive_time_ms = _positive("keepalive_time_ms", keepalive_time_ms)
+        self.keepalive_timeout_ms = _positive(
+            "keepalive_timeout_ms", keepalive_timeout_ms
+        )
+        self.keepalive_permit_without_calls = _flag(
+            "keepalive_permit_without_calls", keepalive_permit_without_calls
+        )
+        if compression is not None and compression not in _COMPRESSION:
+            raise ValueError(
+                "compression must be one of %s, not %r"
+                % (", ".join(sorted(_COMPRESSION)), compression)
+            )
+        self.compression = compression
+        self.max_receive_message_length = _message_length(
+            "max_receive_message_length", max_receive_message_length
+        )
+        self.max_send_message_length = _message_length(
+            "max_send_message_length", max_send_message_length
+        )
+        self.initial_window_size = _positive(
+            "initial_window_size", initial_window_size, _MAX_WINDOW_SIZE
+        )
+        self.bdp_probe = _flag("bdp_probe", bdp_probe)
+
+    @classmethod
+    def from_dict(cls, options: Mapping[str, Any]) -> "ChannelOptions":
+        """Construct channel options from a mapping, like ``ClientOptions``.
+
+        Args:
+            options (Mapping[str, Any]): The options, keyed by argument name.
+
+        Raises:
+            ValueError: If a key is not a channel option.
+        """
+        unknown = set(options) - _FIELDS
+        if unknown:
+            raise ValueError(
+                "Unrecognized channel options: %s" % ", ".join(sorted(unknown))
+            )
+        return cls(**options)
+
+    def to_grpc_options(self) -> List[Tuple[str, Any]]:
+        """Return the options as gRPC channel arguments.
+
+        Returns:
+            List[Tuple[str, Any]]: The ``options`` to create a channel with.
+        """
+        grpc_options = [
+            (argument, int(getattr(self, name)))
+            for name, argument in _GRPC_ARGUMENTS
+            if getattr(self, name) is not None
+        ]
+        if self.compression is not None:
+            grpc_options.append(
+                (
+                    "grpc.default_compression_algorithm",
+                    int(_COMPRESSION[self.compression]),
+                )
+            )
+        return grpc_options
+
+    def __eq__(self, other):
+        if not isinstance(other, ChannelOptions):
+            return NotImplemented
+        return vars(self) == vars(other)
+
+    def __repr__(self):
+        return "ChannelOptions: " + repr(
+            {name: value for name, value in vars(self).items() if value is not None}
+        )
+
+
+def _positive(name, value, maximum=None):
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError("%s must be an int, not %r" % (name, value))
+    if value < 1:
+        raise ValueError("%s must be positive, not %d" % (name, value))
+    if maximum is not None and value > maximum:
+        raise ValueError("%s must be at most %d, not %d" % (name, maximum, value))
+    return value
+
+
+def _message_length(name, value):
+    if value == -1:
+        return value
+    return _positive(name, value)
+
+
+def _flag(name, value):
+    if value is None or isinstance(value, bool):
+        return value
+    raise TypeError("%s must be a bool, not %r" % (name, value))
+
+
+__all__ = ("ChannelOptions",)
@@ -15,8 +15,10 @@
 # limitations under the License.
 #
 
-from typing import Callable, Dict, Tuple
+import time
+from typing import Callable, Dict, Mapping, Tuple
 
+from google.api_core import exceptions  # type: ignore
 from google.api_core import grpc_helpers  # type: ignore
 from google.auth import credentials  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
@@ -28,7 +30,11 @@ from google.cloud.bigquery.reservation_v1.types import reservation
 from google.cloud.bigquery.reservation_v1.types import reservation as gcbr_reservation
 from google.protobuf import empty_pb2 as empty  # type: ignore
 
-from .base import ReservationServiceTransport
+from . import policy
+from . import ratelimit
+from . import pool
+from .base import ReservationServiceTransport, WarmupReport
+from .channel_options import ChannelOptions
 
 
 class ReservationServiceGrpcTransport(ReservationServiceTransport):
@@ -67,7 +73,12 @@ class ReservationServiceGrpcTransport(ReservationServiceTransport):
         credentials: credentials.Credentials = None,
         channel: grpc.Channel = None,
         api_mtls_endpoint: str = None,
-        client_cert_source: Callable[[], Tuple[bytes, bytes]] = None
+        client_cert_source: Callable[[], Tuple[bytes, bytes]] = None,
+        channel_pool_size: int = 1,
+        channel_pool_policy: str = pool.ROUND_ROBIN,
+        channel_options: ChannelOptions = None,
+        method_policies: Mapping[str, policy.MethodPolicy] = None,
+        rate_limiter: ratelimit.RateLimiter = None
     ) -> None:
         """Instantiate the transport.
 
@@ -89,11 +100,36 @@ class ReservationServiceGrpcTransport(ReservationServiceTransport):
                 callback to provide client SSL certificate bytes and private key
                 bytes, both in PEM format. It is ignored if ``api_mtls_endpoint``
                 is None.
+            channel_pool_size (int): The number of channels, each with its
+                own connection, to spread calls over. Use more than one
+                when many concurrent calls would otherwise queue on the
+                concurrent-stream limit of a single HTTP/2 connection.
+                This argument is ignored if ``channel`` is provided.
+            channel_pool_policy (str): How a pooled call picks its channel:
+                ``"round_robin"`` or ``"least_loaded"``. The per-channel
+                in-flight counts are available from
+                ``grpc_channel.in_flight()`` when pooling.
+            channel_options (Optional[~.ChannelOptions]): Keepalive,
+                compression, message size and flow-control options for the
+                channels the transport creates. This argument is ignored if
+                ``channel`` is provided.
+            method_policies (Optional[Mapping[str, ~.MethodPolicy]]): The
+                default deadline, retry and hedging of methods, keyed by
+                method name, e.g. ``"get_reservation"``.
+            rate_limiter (Optional[~.RateLimiter]): Paces the calls of
+                every method; calls are not paced if not set.
 
         Raises:
           google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
               creation failed for any reason.
+          ValueError: If a method policy is invalid.
         """
+        if channel_pool_size < 1:
+            raise ValueError("channel_pool_size must be at least 1.")
+        self._channel_pool_size = channel_pool_size
+        self._channel_pool_policy = channel_pool_policy
+        self._channel_options = channel_options
+
         if channel:
             # Sanity check: Ensure that channel and credentials are not both
             # provided.
@@ -119,17 +155,28 @@ class ReservationServiceGrpcTransport(ReservationServiceTransport):
                 ssl_credentials = SslCredentials().ssl_credentials
 
             # create a new channel. The provided one is ignored.
-            self._grpc_channel = grpc_helpers.create_channel(
-                host,
-                credentials=credentials,
-                ssl_credentials=ssl_credentials,
-                scopes=self.AUTH_SCOPES,
+            self._grpc_channel = self._create_pooled_channel(
+                lambda **kwargs: grpc_helpers.create_channel(
+                    host,
+                    credentials=credentials,
+                    ssl_credentials=ssl_credentials,
+                    scopes=self.AUTH_SCOPES,
+                    **kwargs
+                )
             )
 
         # Run the base constructor.
-        super().__init__(host=host, credentials=credentials)
+        super().__init__(
+            host=host,
+            credentials=credentials,
+            method_policies=method_policies,
+            rate_limiter=rate_limiter,
+        )
         self._stubs = {}  # type: Dict[str, Callable]
 
+        # Wrap the stubs once, so that client calls only need a lookup.
+        self._prep_wrapped_messages()
+
     @classmethod
     def create_channel(
         cls,
@@ -164,13 +211,80 @@ class ReservationServiceGrpcTransport(ReservationServiceTransport):
         # Sanity check: Only create a new channel if we do not already
         # have one.
         if not hasattr(self, "_grpc_channel"):
-            self._grpc_channel = self.create_channel(
-                self._host, credentials=self._credentials
+            self._grpc_channel = self._create_pooled_channel(
+                lambda **kwargs: self.create_channel(
+                    self._host, credentials=self._credentials, **kwargs
+                )
             )
 
         # Return the channel from cache.
         return self._grpc_channel
 
+    def _create_pooled_channel(self, create: Callable[..., grpc.Channel]):
+        """Create one channel, or a pool of them if pooling is enabled."""
+        options = (
+            self._channel_options.to_grpc_options() if self._channel_options else []
+        )
+        if self._channel_pool_size == 1:
+            return create(options=options) if options else create()
+        options.append(pool.LOCAL_SUBCHANNEL_POOL_OPTION)
+        return pool.ChannelPool(
+            [create(options=options) for _ in range(self._channel_pool_size)],
+            policy=self._channel_pool_policy,
+        )
+
+    def warmup(self, *, timeout: float = None) -> WarmupReport:
+        """Prepare the transport so the first call pays no setup cost.
+
+        Creates every stub, then fetches an access token while the channel,
+        or every channel of a pool, connects.
+
+        Args:
+            timeout (Optional[float]): How long to wait for the channel to
+                connect, in seconds; forever if not set.
+
+        Returns:
+            ~.WarmupReport: How long each step took.
+
+        Raises:
+            google.api_core.exceptions.DeadlineExceeded: If the channel did
+                not connect within ``timeout``.
+            google.auth.exceptions.RefreshError: If fetching the access
+                token failed.
+        """
+        start = time.monotonic()
+        stubs_s = self._create_stubs()
+
+        channel = self.grpc_channel
+        channels = (
+            channel.channels if isinstance(channel, pool.ChannelPool) else [channel]
+        )
+        connect_start = time.monotonic()
+        ready = [grpc.channel_ready_future(c) for c in channels]
+        try:
+            credentials_s = self._refresh_credentials()
+            for future in ready:
+                remaining = (
+                    None
+                    if timeout is None
+                    else max(0, timeout - (time.monotonic() - connect_start))
+                )
+                future.result(timeout=remaining)
+        except grpc.FutureTimeoutError:
+            raise exceptions.DeadlineExceeded(
+                "The channel did not connect within %s seconds." % timeout
+            )
+        finally:
+            for future in ready:
+                future.cancel()
+        end = time.monotonic()
+        return WarmupReport(
+            stubs_s=stubs_s,
+            credentials_s=credentials_s,
+            channel_s=end - connect_start,
+            total_s=end - start,
+        )
+
     @property
     def create_reservation(
         self
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Per-method deadlines, retries and hedging.
+
+A :class:`MethodPolicy` sets the default deadline, retry and hedging of
+one ReservationService method. Transports apply policies when they wrap
+their methods; per-call ``retry`` and ``timeout`` arguments still take
+precedence.
+"""
+
+import collections
+import queue
+import threading
+import time
+from typing import Deque, Dict, List, Mapping, NamedTuple, Optional
+
+from google.api_core import exceptions  # type: ignore
+from google.api_core import retry as retries  # type: ignore
+from google.api_core import retry_async  # type: ignore
+
+
+# Methods that read without side effects, so sending one twice is safe.
+IDEMPOTENT_METHODS = frozenset(
+    (
+        "get_reservation",
+        "list_reservations",
+        "get_capacity_commitment",
+        "list_capacity_commitments",
+        "list_assignments",
+        "search_assignments",
+        "get_bi_reservation",
+    )
+)
+
+METHODS = IDEMPOTENT_METHODS | frozenset(
+    (
+        "create_reservation",
+        "delete_reservation",
+        "update_reservation",
+        "create_capacity_commitment",
+        "delete_capacity_commitment",
+        "update_capacity_commitment",
+        "split_capacity_commitment",
+        "merge_capacity_commitments",
+        "create_assignment",
+        "delete_assignment",
+        "move_assignment",
+        "update_bi_reservation",
+    )
+)
+
+
+class RetryPolicy(NamedTuple):
+    """Retry with truncated, jittered exponential backoff.
+
+    Each sleep is drawn uniformly between zero and the current delay,
+    which starts at ``initial`` and grows by ``multiplier`` up to
+    ``maximum``.
+
+    Attributes:
+        initial (float): The first delay, in seconds.
+        maximum (float): The largest delay, in seconds.
+        multiplier (float): The delay growth per attempt.
+        deadline (float): Stop retrying this many seconds after the first
+            attempt.
+        retry_deadline_exceeded (bool): Also retry attempts that exceeded
+            their deadline, besides ``UNAVAILABLE`` errors. A timed-out
+            write may have been applied, so enable this for writes only
+            when repeating them is harmless.
+    """
+
+    initial: float = 0.1
+    maximum: float = 60.0
+    multiplier: float = 1.3
+    deadline: float = 600.0
+    retry_deadline_exceeded: bool = True
+
+    def _predicate(self):
+        if self.retry_deadline_exceeded:
+            return retries.if_exception_type(
+                exceptions.ServiceUnavailable, exceptions.DeadlineExceeded
+            )
+        return retries.if_exception_type(exceptions.ServiceUnavailable)
+
+    def to_retry(self) -> retries.Retry:
+        """Return the equivalent ``google.api_core.retry.Retry``."""
+        return retries.Retry(
+            predicate=self._predicate(),
+            initial=self.initial,
+            maximum=self.maximum,
+            multiplier=self.multiplier,
+            deadline=self.deadline,
+        )
+
+    def to_async_retry(self) -> retry_async.AsyncRetry:
+        """Return the equivalent ``google.api_core.retry_async.AsyncRetry``."""
+        return retry_async.AsyncRetry(
+            predicate=self._predicate(),
+            initial=self.initial,
+            maximum=self.maximum,
+            multiplier=self.multiplier,
+            deadline=self.deadline,
+        )
+
+
+class HedgePolicy(NamedTuple):
+    """Send a duplicate request when the first one is slow.
+
+    The duplicate goes out once the call has taken longer than the
+    ``percentile`` of recent successful calls of the method; the first
+    successful response wins and the other attempts are cancelled. Until
+    ``min_samples`` calls have completed, ``initial_delay`` is used.
+
+    Attributes:
+        percentile (float): The latency percentile, between 0 and 100,
+            after which to hedge.
+        initial_delay (float): The hedging delay, in seconds, before
+            enough latencies have been observed.
+        min_samples (int): The number of latencies needed to use the
+            percentile.
+        window (int): The number of recent latencies kept.
+        max_attempts (int): The most requests sent per call, including
+            the first.
+    """
+
+    percentile: float = 95.0
+    initial_delay: float = 1.0
+    min_samples: int = 20
+    window: int = 1000
+    max_attempts: int = 2
+
+
+class MethodPolicy(NamedTuple):
+    """The default deadline, retry and hedging of a method.
+
+    Attributes:
+        timeout (Optional[float]): The default deadline of each attempt,
+            in seconds; no deadline if ``None``.
+        retry (Optional[RetryPolicy]): How to retry ``UNAVAILABLE`` and,
+            optionally, ``DEADLINE_EXCEEDED`` errors; no retry if
+            ``None``.
+        hedge (Optional[HedgePolicy]): How to hedge slow calls; only
+            allowed for the idempotent ``get_*``, ``list_*`` and
+            ``search_assignments`` methods.
+    """
+
+    timeout: Optional[float] = None
+    retry: Optional[RetryPolicy] = None
+    hedge: Optional[HedgePolicy] = None
+
+
+def default_policies(
+    timeout: float = 60.0, hedge: HedgePolicy = None
+) -> Dict[str, MethodPolicy]:
+    """Return policies giving every method a deadline.
+
+    Idempotent methods also retry ``UNAVAILABLE`` and
+    ``DEADLINE_EXCEEDED`` errors, and are hedged if ``hedge`` is given.
+    Other methods only retry ``UNAVAILABLE`` errors, which are returned
+    before the request is processed.
+
+    Args:
+        timeout (float): The deadline of each attempt, in seconds.
+        hedge (Optional[HedgePolicy]): The hedging of idempotent methods.
+
+    Returns:
+        Dict[str, MethodPolicy]: The policy of every method, keyed by
+        method name, e.g. ``"get_reservation"``.
+    """
+    read = MethodPolicy(timeout=timeout, retry=RetryPolicy(), hedge=hedge)
+    write = MethodPolicy(
+        timeout=timeout, retry=RetryPolicy(retry_deadline_exceeded=False)
+    )
+    return {
+        method: read if method in IDEMPOTENT_METHODS else write
+        for method in sorted(METHODS)
+    }
+
+
+def validate(
+    policies: Optional[Mapping[str, MethodPolicy]], hedging: bool = True
+) -> Dict[str, MethodPolicy]:
+    """Check the method names and hedging of ``policies``.
+
+    Raises:
+        ValueError: If a method is unknown, or a non-idempotent method is
+            hedged, or ``hedging`` is False and a method is hedged.
+    """
+    policies = dict(policies or {})
+    unknown = set(policies) - METHODS
+    if unknown:
+        raise ValueError("Unknown methods: %s" % ", ".join(sorted(unknown)))
+    for method, policy in policies.items():
+        if policy.hedge is None:
+            continue
+        if method not in IDEMPOTENT_METHODS:
+            raise ValueError("%s is not idempotent and cannot be hedged." % method)
+        if not hedging:
+            raise ValueError("This transport does not support hedging.")
+        if not 0 < policy.hedge.percentile <= 100:
+            raise ValueError("The hedging percentile must be in (0, 100].")
+        if policy.hedge.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+    return policies
+
+
+class _Latencies:
+    """Recent latencies of a method, and their percentile."""
+
+    # Recompute the percentile after this many new samples.
+    _REFRESH = 32
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._samples = collections.deque(maxlen=policy.window)  # type: Deque[float]
+        self._stale = 0
+        self._delay = policy.initial_delay
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+            self._stale += 1
+            if len(self._samples) >= self._policy.min_samples and (
+                self._stale >= self._REFRESH
+                or len(self._samples) == self._policy.min_samples
+            ):
+                ordered = sorted(self._samples)
+                rank = self._policy.percentile / 100 * (len(ordered) - 1)
+                self._delay = ordered[int(round(rank))]
+                self._stale = 0
+
+    def delay(self) -> float:
+        return self._delay
+
+
+class HedgedCallable:
+    """A unary-unary multi-callable that hedges slow calls.
+
+    Calls ``stub.future``, and sends up to ``max_attempts - 1`` duplicates,
+    each once the previous attempt has been outstanding for the current
+    hedging delay. Returns the first successful response and cancels the
+    other attempts; raises the first error if every attempt fails.
+    Every attempt shares the deadline of the call, and the latency
+    recorded is that of the whole call, from its first attempt.
+
+    Args:
+        stub: A ``grpc.UnaryUnaryMultiCallable``.
+        policy (HedgePolicy): When and how often to hedge.
+    """
+
+    def __init__(self, stub, policy: HedgePolicy) -> None:
+        self._stub = stub
+        self._policy = policy
+        self._latencies = _Latencies(policy)
+
+    def __call__(self, request, timeout=None, **kwargs):
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        completed = queue.Queue()  # type: queue.Queue
+        attempts = []  # type: List
+        errors = []  # type: List[Exception]
+
+        def launch():
+            remaining = (
+                None if deadline is None else max(0, deadline - time.monotonic())
+            )
+            future = self._stub.future(request, timeout=remaining, **kwargs)
+            future.add_done_callback(completed.put)
+            attempts.append(future)
+
+        try:
+            launch()
+            outstanding = 1
+            while outstanding:
+                wait = (
+                    self._latencies.delay()
+                    if len(attempts) < self._policy.max_attempts
+                    else None
+                )
+                try:
+                    future = completed.get(timeout=wait)
+                except queue.Empty:
+                    launch()
+                    outstanding += 1
+                    continue
+                outstanding -= 1
+                error = future.exception()
+                if error is None:
+                    self._latencies.record(time.monotonic() - started)
+                    return future.result()
+                errors.append(error)
+                if not outstanding:
+                    # Slow calls are hedged; failed ones are left to the
+                    # retry policy.
+                    break
+            raise errors[0]
+        finally:
+            for future in attempts:
+                future.cancel()
+
+
+__all__ = ("HedgePolicy", "MethodPolicy", "RetryPolicy", "default_policies")
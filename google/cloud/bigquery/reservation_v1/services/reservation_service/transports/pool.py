@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import itertools
+import threading
+from typing import List, Sequence
+
+import grpc  # type: ignore
+
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+# Channel argument giving each pooled channel its own subchannels, and so
+# its own HTTP/2 connection. Without it, gRPC shares one connection between
+# channels created with identical arguments.
+LOCAL_SUBCHANNEL_POOL_OPTION = ("grpc.use_local_subchannel_pool", 1)
+
+
+class ChannelPool(grpc.Channel):
+    """A ``grpc.Channel`` that spreads calls over several channels.
+
+    Every call is sent on one channel of the pool, picked either in turn
+    (``"round_robin"``) or as the channel with the fewest calls in flight
+    (``"least_loaded"``). Multi-callables created from the pool are stable
+    objects, so they can be created once and cached like the stubs of a
+    single channel.
+
+    Only unary-unary methods are supported, which covers every
+    ReservationService method.
+
+    Args:
+        channels (Sequence[grpc.Channel]): The channels to pool. For the
+            pool to spread calls over several connections, the channels
+            must not share subchannels; see
+            :data:`LOCAL_SUBCHANNEL_POOL_OPTION`.
+        policy (str): ``"round_robin"`` or ``"least_loaded"``.
+    """
+
+    def __init__(
+        self, channels: Sequence[grpc.Channel], policy: str = ROUND_ROBIN
+    ) -> None:
+        if not channels:
+            raise ValueError("A channel pool needs at least one channel.")
+        if policy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError("Unknown channel pool policy: %r" % (policy,))
+        self._channels = list(channels)
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._in_flight = [0] * len(self._channels)
+        self._turns = itertools.count()
+
+    @property
+    def channels(self) -> List[grpc.Channel]:
+        """The pooled channels."""
+        return list(self._channels)
+
+    def in_flight(self) -> List[int]:
+        """Return the number of calls in flight on each channel."""
+        with self._lock:
+            return list(self._in_flight)
+
+    def _acquire(self) -> int:
+        with self._lock:
+            turn = next(self._turns) % len(self._channels)
+            if self._policy == LEAST_LOADED:
+                # Start the scan at the round-robin position, so idle
+                # channels share the load instead of the first one
+                # taking every call.
+                order = itertools.chain(range(turn, len(self._channels)), range(turn))
+                turn = min(order, key=self._in_flight.__getitem__)
+            self._in_flight[turn] += 1
+            return turn
+
+    def _release(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, **kwargs
+    ):
+        return _PooledUnaryUnary(
+            self,
+            [
+                channel.unary_unary(
+                    method,
+                    request_serializer=request_serializer,
+                    response_deserializer=response_deserializer,
+                    **kwargs
+                )
+                for channel in self._channels
+            ],
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        raise NotImplementedError("ChannelPool only supports unary-unary methods.")
+
+    def stream_unary(self, method, *args, **kwargs):
+        raise NotImplementedError("ChannelPool only supports unary-unary methods.")
+
+    def stream_stream(self, method, *args, **kwargs):
+        raise NotImplementedError("ChannelPool only supports unary-unary methods.")
+
+    def subscribe(self, callback, try_to_connect=False):
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+class _PooledUnaryUnary(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, pool: ChannelPool, callables: List) -> None:
+        self._pool = pool
+        self._callables = callables
+
+    def __call__(self, request, *args, **kwargs):
+        index = self._pool._acquire()
+        try:
+            return self._callables[index](request, *args, **kwargs)
+        finally:
+            self._pool._release(index)
+
+    def with_call(self, request, *args, **kwargs):
+        index = self._pool._acquire()
+        try:
+            return self._callables[index].with_call(request, *args, **kwargs)
+        finally:
+            self._pool._release(index)
+
+    def future(self, request, *args, **kwargs):
+        index = self._pool._acquire()
+        try:
+            future = self._callables[index].future(request, *args, **kwargs)
+        except BaseException:
+            self._pool._release(index)
+            raise
+        future.add_done_callback(lambda _: self._pool._release(index))
+        return future
+
+
+__all__ = ("ChannelPool",)
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Client-side rate limiting.
+
+A :class:`RateLimiter` paces the calls of a transport with token buckets,
+one per project and one per project and method, and adapts their rates
+to ``RESOURCE_EXHAUSTED`` errors: each error halves the rate of the
+buckets the call drew from, and each success raises it again by a small
+step, up to the configured rate. Bulk jobs so settle just under the quota
+instead of repeatedly exceeding it.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from google.api_core import exceptions  # type: ignore
+import grpc  # type: ignore
+from grpc import aio  # type: ignore
+
+from . import policy
+
+
+_PROJECT = re.compile(r"^projects/([^/]+)/")
+
+# Request fields holding the resource of update requests.
+_RESOURCE_FIELDS = ("reservation", "capacity_commitment", "bi_reservation")
+
+
+def project_of(request) -> Optional[str]:
+    """Return the project a request is about, or None if unknown."""
+    names = [getattr(request, "parent", None), getattr(request, "name", None)]
+    for field in _RESOURCE_FIELDS:
+        names.append(getattr(getattr(request, field, None), "name", None))
+    for name in names:
+        match = _PROJECT.match(name or "")
+        if match:
+            return match.group(1)
+    return None
+
+
+def _is_exhausted(exc: Exception) -> bool:
+    if isinstance(exc, exceptions.ResourceExhausted):
+        return True
+    return (
+        isinstance(exc, grpc.RpcError)
+        and callable(getattr(exc, "code", None))
+        and exc.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    )
+
+
+class TokenBucket:
+    """A token bucket with an adjustable rate.
+
+    Tokens accrue at ``rate`` per second up to ``burst``. Taking a token
+    never blocks: the bucket goes into debt and returns how long the
+    caller must wait for its turn, so waiting callers are served in the
+    order they arrived.
+
+    Args:
+        rate (float): The largest number of tokens added per second.
+        burst (float): The most tokens the bucket holds.
+        min_rate (float): The smallest rate adaptation may set.
+        clock (Callable[[], float]): Returns the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        min_rate: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+        self._decreased = float("-inf")
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def take(self) -> float:
+        """Take a token; return the seconds to wait before using it."""
+        now = self._clock()
+        self._refill(now)
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def decrease(self, factor: float, cooldown: float) -> None:
+        """Multiply the rate by ``factor``, at most once per ``cooldown``.
+
+        The calls that were in flight when the quota ran out fail together;
+        the cooldown keeps them from collapsing the rate.
+        """
+        now = self._clock()
+        if now - self._decreased < cooldown:
+            return
+        self._refill(now)
+        self._decreased = now
+        self.rate = max(self.min_rate, self.rate * factor)
+        # Forget the burst saved up at the old rate.
+        self._tokens = min(self._tokens, 0.0)
+
+    def increase(self, step: float) -> None:
+        """Add ``step`` times the configured rate, up to that rate."""
+        if self.rate < self.max_rate:
+            self._refill(self._clock())
+            self.rate = min(self.max_rate, self.rate + step * self.max_rate)
+
+
+class RateLimiter:
+    """Paces the calls of a client to stay within its quotas.
+
+    A call takes a token from the bucket of its project and from the
+    bucket of its project and method, and waits until both allow it.
+    Requests whose project is unknown share one bucket. Retries and
+    repeated calls take tokens like any other call; a hedged call takes
+    one. The time spent waiting and on failed attempts counts towards a
+    call's ``timeout``: each attempt is sent with what is left of it.
+
+    Args:
+        project_rate (Optional[float]): The calls per second allowed per
+            project; not limited if None.
+        method_rates (Optional[Mapping[str, float]]): The calls per second
+            allowed per project for some methods, keyed by method name,
+            e.g. ``"create_assignment"``.
+        burst (float): The calls allowed at once after an idle period, in
+            seconds of the rate; at least one call is always allowed.
+        decrease (float): The factor applied to a rate on
+            ``RESOURCE_EXHAUSTED``.
+        increase (float): The fraction of the configured rate added back
+            after each successful call.
+        min_rate_fraction (float): The lowest rate adaptation may set, as
+            a fraction of the configured rate.
+        cooldown (float): The seconds after a decrease during which
+            further ``RESOURCE_EXHAUSTED`` errors do not decrease the rate
+            again.
+        max_attempts (int): The most times a call is sent while it fails
+            with ``RESOURCE_EXHAUSTED``, each attempt waiting for a token
+            at the lowered rate. A call raises ``DeadlineExceeded``
+            instead of waiting past its ``timeout``.
+        clock (Callable[[], float]): Returns the current time in seconds.
+
+    Raises:
+        ValueError: If a rate or factor is out of range or a method is
+            unknown.
+    """
+
+    def __init__(
+        self,
+        *,
+        project_rate: float = None,
+        method_rates: Mapping[str, float] = None,
+        burst: float = 1.0,
+        decrease: float = 0.5,
+        increase: float = 0.02,
+        min_rate_fraction: float = 0.05,
+        cooldown: float = 1.0,
+        max_attempts: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        method_rates = dict(method_rates or {})
+        unknown = set(method_rates) - policy.METHODS
+        if unknown:
+            raise ValueError("Unknown methods: %s" % ", ".join(sorted(unknown)))
+        rates = list(method_rates.values())
+        if project_rate is not None:
+            rates.append(project_rate)
+        if any(rate <= 0 for rate in rates):
+            raise ValueError("Rates must be positive.")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1.")
+        if not 0 < min_rate_fraction <= 1:
+            raise ValueError("min_rate_fraction must be in (0, 1].")
+        if increase < 0 or burst < 0 or cooldown < 0:
+            raise ValueError("increase, burst and cooldown cannot be negative.")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+
+        self._project_rate = project_rate
+        self._method_rates = method_rates
+        self._burst = burst
+        self._decrease = decrease
+        self._increase = increase
+        self._min_rate_fraction = min_rate_fraction
+        self._cooldown = cooldown
+        self.max_attempts = max_attempts
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets = (
+            {}
+        )  # type: Dict[Tuple[Optional[str], Optional[str]], TokenBucket]
+
+    def _bucket(self, project, method, rate):
+        key = (project, method)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(
+                rate,
+                max(1.0, rate * self._burst),
+                rate * self._min_rate_fraction,
+                self._clock,
+            )
+        return bucket
+
+    def _buckets_for(self, method, project):
+        buckets = []
+        if self._project_rate is not None:
+            buckets.append(self._bucket(project, None, self._project_rate))
+        if method in self._method_rates:
+            buckets.append(self._bucket(project, method, self._method_rates[method]))
+        return buckets
+
+    def reserve(self, method: str, project: Optional[str]) -> float:
+        """Take a call's tokens; return the seconds to wait before the call."""
+        with self._lock:
+            return max(
+                [b.take() for b in self._buckets_for(method, project)], default=0.0
+            )
+
+    def _schedule(
+        self, method: str, project: Optional[str], deadline: Optional[float], kwargs
+    ) -> float:
+        """Take an attempt's tokens and set its ``timeout`` to what is left
+        until ``deadline``; return the seconds to wait before sending it."""
+        delay = self.reserve(method, project)
+        if deadline is not None:
+            remaining = deadline - self._clock() - delay
+            if remaining <= 0:
+                raise exceptions.DeadlineExceeded(
+                    "Deadline exceeded waiting to call %s." % method
+                )
+            kwargs["timeout"] = remaining
+        return delay
+
+    def _deadline(self, kwargs) -> Optional[float]:
+        timeout = kwargs.get("timeout")
+        return None if timeout is None else self._clock() + timeout
+
+    def record_success(self, method: str, project: Optional[str]) -> None:
+        """Raise the rates a successful call drew from."""
+        with self._lock:
+            for bucket in self._buckets_for(method, project):
+                bucket.increase(self._increase)
+
+    def record_exhausted(self, method: str, project: Optional[str]) -> None:
+        """Lower the rates a call that ran out of quota drew from."""
+        with self._lock:
+            for bucket in self._buckets_for(method, project):
+                bucket.decrease(self._decrease, self._cooldown)
+
+    def rate(self, method: str, project: Optional[str]) -> Optional[float]:
+        """Return the current calls per second allowed for a method in a
+        project, or None if not limited."""
+        with self._lock:
+            rates = [b.rate for b in self._buckets_for(method, project)]
+        return min(rates) if rates else None
+
+    def wrap(self, method: str, target: Callable) -> Callable:
+        """Return ``target``, a unary-unary callable, paced by this limiter."""
+
+        def limited(request, *args, **kwargs):
+            project = project_of(request)
+            deadline = self._deadline(kwargs)
+            for attempt in range(1, self.max_attempts + 1):
+                delay = self._schedule(method, project, deadline, kwargs)
+                if delay:
+                    time.sleep(delay)
+                try:
+                    response = target(request, *args, **kwargs)
+                except Exception as exc:
+                    if not _is_exhausted(exc):
+                        raise
+                    self.record_exhausted(method, project)
+                    if attempt == self.max_attempts:
+                        raise
+                else:
+                    self.record_success(method, project)
+                    return response
+
+        return limited
+
+    def wrap_async(self, method: str, target: Callable) -> Callable:
+        """Return ``target``, a ``grpc.aio`` unary-unary multi-callable,
+        paced by this limiter."""
+        return _AsyncLimited(self, method, target)
+
+
+class _AsyncLimited(aio.UnaryUnaryMultiCallable):
+    """An AsyncIO multi-callable paced by a :class:`RateLimiter`.
+
+    It subclasses ``UnaryUnaryMultiCallable`` so that
+    ``google.api_core`` wraps its errors as a unary call's. The wrappers
+    copy its ``__dict__``, so attribute names must not clash with theirs.
+    """
+
+    def __init__(self, limiter: RateLimiter, method: str, target) -> None:
+        self._rate_limiter = limiter
+        self._rate_limited_method = method
+        self._rate_limited_stub = target
+
+    def __call__(self, request, *args, **kwargs):
+        return self._call(request, *args, **kwargs)
+
+    async def _call(self, request, *args, **kwargs):
+        limiter, method = self._rate_limiter, self._rate_limited_method
+        project = project_of(request)
+        deadline = limiter._deadline(kwargs)
+        for attempt in range(1, limiter.max_attempts + 1):
+            delay = limiter._schedule(method, project, deadline, kwargs)
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                response = await self._rate_limited_stub(request, *args, **kwargs)
+            except Exception as exc:
+                if not _is_exhausted(exc):
+                    raise
+                limiter.record_exhausted(method, project)
+                if attempt == limiter.max_attempts:
+                    raise
+            else:
+                limiter.record_success(method, project)
+                return response
+
+
+__all__ = ("RateLimiter",)
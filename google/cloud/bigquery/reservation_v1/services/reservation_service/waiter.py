@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import heapq
+import random
+import time
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+import grpc  # type: ignore
+
+from google.api_core import exceptions  # type: ignore
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+_SETTLED = (
+    reservation.CapacityCommitment.State.ACTIVE,
+    reservation.CapacityCommitment.State.FAILED,
+)
+
+
+def failure_error(
+    commitment: reservation.CapacityCommitment,
+) -> exceptions.GoogleAPICallError:
+    """Return the exception matching the ``failure_status`` of a failed
+    commitment; the commitment is its ``response``."""
+    status = commitment.failure_status
+    return exceptions.from_grpc_status(
+        _STATUS_CODES.get(status.code, grpc.StatusCode.UNKNOWN),
+        "Capacity commitment %s failed: %s" % (commitment.name, status.message),
+        response=commitment,
+    )
+
+
+def wait(
+    get: Callable[[str], reservation.CapacityCommitment],
+    names: Iterable[str],
+    *,
+    timeout: float = None,
+    initial_delay: float = 1.0,
+    max_delay: float = 60.0,
+    multiplier: float = 2.0,
+    clock: Callable[[], float] = time.monotonic,
+    sleep: Callable[[float], None] = time.sleep
+) -> Iterator[reservation.CapacityCommitment]:
+    """Poll capacity commitments until each is ``ACTIVE`` or ``FAILED``.
+
+    Every commitment is fetched once right away, then on its own
+    schedule: the delay before its next poll grows by ``multiplier`` up to
+    ``max_delay``, and is jittered down by up to half so that commitments
+    created together are not polled in lockstep. A single loop sleeps
+    until the next commitment is due.
+
+    Args:
+        get (Callable[[str], ~.CapacityCommitment]): Fetches a commitment
+            by name.
+        names (Iterable[str]): The commitments to wait for.
+        timeout (Optional[float]): How long to wait in total, in seconds;
+            forever if not set.
+        initial_delay (float): The delay before the second poll of a
+            commitment, in seconds.
+        max_delay (float): The longest delay between two polls of a
+            commitment, in seconds.
+        multiplier (float): The growth of the delay after each poll.
+        clock (Callable[[], float]): Monotonic time source, in seconds.
+        sleep (Callable[[float], None]): Waits between polls.
+
+    Returns:
+        Iterator[~.CapacityCommitment]: Each commitment once settled, in
+        the order they settle.
+
+    Raises:
+        ValueError: If a delay or the multiplier is invalid.
+        concurrent.futures.TimeoutError: From the iterator, if some
+            commitments are still pending after ``timeout``.
+    """
+    if not 0 < initial_delay <= max_delay or multiplier < 1:
+        raise ValueError("Expected 0 < initial_delay <= max_delay and multiplier >= 1.")
+    deadline = None if timeout is None else clock() + timeout
+    # (due time, name, delay after the next poll)
+    schedule = [
+        (0.0, name, initial_delay) for name in dict.fromkeys(names)
+    ]  # type: List[Tuple[float, str, float]]
+    heapq.heapify(schedule)
+
+    def poll():
+        while schedule:
+            due, name, delay = heapq.heappop(schedule)
+            wait = due - clock()
+            if wait > 0:
+                sleep(wait)
+            commitment = get(name)
+            if commitment.state in _SETTLED:
+                yield commitment
+                continue
+            now = clock()
+            due = now + delay * random.uniform(0.5, 1.0)
+            if deadline is not None and due > deadline:
+                if now >= deadline:
+                    pending = sorted([name] + [entry[1] for entry in schedule])
+                    raise futures.TimeoutError(
+                        "Capacity commitments still pending after %ss: %s"
+                        % (timeout, ", ".join(pending))
+                    )
+                # Poll a last time when the time is up.
+                due = deadline
+            heapq.heappush(schedule, (due, name, min(max_delay, delay * multiplier)))
+
+    return poll()
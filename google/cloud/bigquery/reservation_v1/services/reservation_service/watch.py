@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import hashlib
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+from .cache import CAPACITY_COMMITMENT, RESERVATION
+
+ASSIGNMENT = "assignment"
+
+ADDED = "ADDED"
+MODIFIED = "MODIFIED"
+REMOVED = "REMOVED"
+
+# Kind -> (list method, request type, repeated field, message type).
+_LISTINGS = {
+    RESERVATION: (
+        "list_reservations",
+        reservation.ListReservationsRequest,
+        "reservations",
+        reservation.Reservation,
+    ),
+    CAPACITY_COMMITMENT: (
+        "list_capacity_commitments",
+        reservation.ListCapacityCommitmentsRequest,
+        "capacity_commitments",
+        reservation.CapacityCommitment,
+    ),
+    ASSIGNMENT: (
+        "list_assignments",
+        reservation.ListAssignmentsRequest,
+        "assignments",
+        reservation.Assignment,
+    ),
+}
+
+
+class ChangeEvent(NamedTuple):
+    """A change found by a :class:`Watcher`.
+
+    Attributes:
+        type (str): ``"ADDED"``, ``"MODIFIED"`` or ``"REMOVED"``.
+        kind (str): ``"reservation"``, ``"capacity_commitment"`` or
+            ``"assignment"``.
+        name (str): The resource name.
+        resource (Any): The resource as listed, or ``None`` if removed.
+    """
+
+    type: str
+    kind: str
+    name: str
+    resource: Any
+
+
+def _fingerprint(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class Watcher:
+    """Polls the resources of a location and reports what changed.
+
+    Each poll lists the resources and compares them with the previous
+    poll through fingerprints: a hash of each page, and of each resource's
+    serialized bytes. A page identical to the one previously fetched at
+    the same position costs one hash; only the resources of changed pages
+    are compared one by one. Only the fingerprints are kept between polls.
+
+    The interval between polls adapts: it drops to ``min_interval`` after
+    a poll that found changes, and grows by ``backoff`` after each quiet
+    one, up to ``max_interval``.
+
+    Args:
+        client (~.ReservationServiceClient): The client to list with.
+        parent (str): The location, e.g. ``projects/p/locations/US``.
+        kinds (Iterable[str]): The kinds of resources to watch, among
+            ``"reservation"``, ``"capacity_commitment"`` and
+            ``"assignment"``; all of them by default.
+        min_interval (float): The shortest interval between polls, in
+            seconds.
+        max_interval (float): The longest interval between polls, in
+            seconds.
+        backoff (float): The growth of the interval after a quiet poll.
+        page_size (int): The page size of the list requests; ``0`` uses
+            the server's default.
+        initial_events (bool): Whether the first poll reports every
+            existing resource as added. If False, it only records them.
+        sleep (Callable[[float], None]): Waits between polls.
+
+    Raises:
+        ValueError: If a kind is unknown or an interval is invalid.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        parent: str,
+        *,
+        kinds: Iterable[str] = (RESERVATION, CAPACITY_COMMITMENT, ASSIGNMENT),
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        backoff: float = 2.0,
+        page_size: int = 0,
+        initial_events: bool = True,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        kinds = tuple(kinds)
+        unknown = set(kinds) - set(_LISTINGS)
+        if unknown:
+            raise ValueError("Unknown kinds: %s" % ", ".join(sorted(unknown)))
+        if not 0 < min_interval <= max_interval or backoff < 1:
+            raise ValueError(
+                "Expected 0 < min_interval <= max_interval and backoff >= 1."
+            )
+        self._client = client
+        self._parent = parent
+        self._kinds = kinds
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._page_size = page_size
+        self._initial_events = initial_events
+        self._sleep = sleep
+        self.interval = min_interval
+        self._polled = False
+        # Resource name -> (kind, fingerprint of its serialized bytes).
+        self._resources = {}  # type: Dict[str, Tuple[str, bytes]]
+        # (kind, page index) -> (page fingerprint, names on the page).
+        self._pages = {}  # type: Dict[Tuple[str, int], Tuple[bytes, Tuple[str, ...]]]
+
+    def _poll_kind(
+        self,
+        kind: str,
+        resources: Dict[str, Tuple[str, bytes]],
+        pages: Dict[Tuple[str, int], Tuple[bytes, Tuple[str, ...]]],
+        events: List[ChangeEvent],
+    ) -> None:
+        method, request_type, field, message_type = _LISTINGS[kind]
+        parent = self._parent
+        if kind == ASSIGNMENT:
+            parent += "/reservations/-"
+        request = request_type(parent=parent, page_size=self._page_size)
+        listing = getattr(self._client, method)(request=request)
+        for index, page in enumerate(listing.pages):
+            raw = type(page).pb(page)
+            # Page tokens need not be stable between polls: leave the next
+            # one out of the fingerprint, restoring it for the pager.
+            token = raw.next_page_token
+            raw.ClearField("next_page_token")
+            page_fingerprint = _fingerprint(raw.SerializeToString(deterministic=True))
+            raw.next_page_token = token
+            key = (kind, index)
+            previous = self._pages.get(key)
+            if previous is not None and previous[0] == page_fingerprint:
+                pages[key] = previous
+                for name in previous[1]:
+                    resources[name] = self._resources[name]
+                continue
+
+            names = []
+            for item in getattr(raw, field):
+                names.append(item.name)
+                fingerprint = _fingerprint(item.SerializeToString(deterministic=True))
+                old = self._resources.get(item.name, (kind, None))[1]
+                resources[item.name] = (kind, fingerprint)
+                if old != fingerprint:
+                    change = ADDED if old is None else MODIFIED
+                    events.append(
+                        ChangeEvent(change, kind, item.name, message_type.wrap(item))
+                    )
+            pages[key] = (page_fingerprint, tuple(names))
+
+    def poll(self) -> List[ChangeEvent]:
+        """List the resources once; return the changes since the last poll.
+
+        Also adapts :attr:`interval`. If listing fails, the error is
+        raised and the next poll reports the changes since the last
+        successful one.
+        """
+        resources = {}  # type: Dict[str, Tuple[str, bytes]]
+        pages = {}  # type: Dict[Tuple[str, int], Tuple[bytes, Tuple[str, ...]]]
+        events = []  # type: List[ChangeEvent]
+        for kind in self._kinds:
+            self._poll_kind(kind, resources, pages, events)
+        for name, (kind, _) in self._resources.items():
+            if name not in resources:
+                events.append(ChangeEvent(REMOVED, kind, name, None))
+        self._resources = resources
+        self._pages = pages
+
+        if not self._polled:
+            self._polled = True
+            if not self._initial_events:
+                events = []
+        if events:
+            self.interval = self._min_interval
+        else:
+            self.interval = min(self._max_interval, self.interval * self._backoff)
+        return events
+
+    def watch(self, stop: threading.Event = None) -> Iterator[ChangeEvent]:
+        """Poll until ``stop`` is set, yielding each change.
+
+        Args:
+            stop (Optional[threading.Event]): Ends the watch when set; the
+                watch runs until the iterator is closed if omitted.
+        """
+        while stop is None or not stop.is_set():
+            yield from self.poll()
+            if stop is None:
+                self._sleep(self.interval)
+            elif stop.wait(self.interval):
+                return
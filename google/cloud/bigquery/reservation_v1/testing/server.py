@@ -0,0 +1,421 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import threading
+from typing import Callable, Mapping, Sequence, Tuple
+
+import grpc  # type: ignore
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service.transports import (
+    MethodPolicy,
+    RateLimiter,
+    ReservationServiceGrpcTransport,
+)
+
+from .servicer import FakeReservationService
+
+
+class FakeReservationServer:
+    """Serve a :class:`~.FakeReservationService` on a local port.
+
+    The server listens on an insecure localhost port, so clients connect
+    through a real gRPC channel. It can be used as a context manager::
+
+        with FakeReservationServer() as server:
+            client = server.client()
+            client.create_reservation(...)
+
+    Args:
+        servicer (Optional[~.FakeReservationService]): The servicer to
+            serve. A new, empty one is created if omitted.
+        host (str): The interface to listen on.
+        port (int): The port to listen on; ``0`` picks a free port.
+        max_workers (int): The number of threads handling requests.
+    """
+
+    def __init__(
+        self,
+        servicer: FakeReservationService = None,
+        *,
+        host: str = "localhost",
+        port: int = 0,
+        max_workers: int = 10
+    ) -> None:
+        self.servicer = servicer or FakeReservationService()
+        self._host = host
+        self._port = port
+        self._max_workers = max_workers
+        self._server = None
+
+    @property
+    def address(self) -> str:
+        """The ``host:port`` the server listens on, once started."""
+        return "%s:%d" % (self._host, self._port)
+
+    def start(self) -> "FakeReservationServer":
+        """Start serving in background threads."""
+        if self._server is None:
+            self._server = grpc.server(
+                futures.ThreadPoolExecutor(max_workers=self._max_workers)
+            )
+            self._server.add_generic_rpc_handlers((self.servicer.handler(),))
+            self._port = self._server.add_insecure_port(self.address)
+            self._server.start()
+        return self
+
+    def stop(self, grace: float = None) -> None:
+        """Stop the server, optionally letting in-flight calls finish."""
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+
+    def channel(self) -> grpc.Channel:
+        """Return a new insecure channel connected to the server."""
+        return grpc.insecure_channel(self.address)
+
+    def client(self) -> ReservationServiceClient:
+        """Return a new client connected to the server."""
+        return ReservationServiceClient(
+            transport=ReservationServiceGrpcTransport(channel=self.channel())
+        )
+
+    def __enter__(self) -> "FakeReservationServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+def in_process_channel(servicer: FakeReservationService) -> grpc.Channel:
+    """Return a channel that calls ``servicer`` directly, without sockets.
+
+    Requests and responses are still serialized and deserialized with the
+    serializers the transport registers, and failures surface as
+    ``grpc.RpcError`` exceptions carrying a status code, so the client
+    code path matches a real channel apart from the network. Calls made
+    with ``future()``, as hedged methods make them, run on their own
+    thread.
+
+    Args:
+        servicer (~.FakeReservationService): The servicer to call.
+
+    Returns:
+        grpc.Channel: A channel supporting unary-unary calls.
+    """
+    return _InProcessChannel(servicer.handler())
+
+
+def in_process_client(
+    servicer: FakeReservationService = None,
+    *,
+    method_policies: Mapping[str, MethodPolicy] = None,
+    rate_limiter: RateLimiter = None,
+    **kwargs
+) -> ReservationServiceClient:
+    """Return a client calling ``servicer`` through :func:`in_process_channel`.
+
+    Args:
+        servicer (Optional[~.FakeReservationService]): The servicer to
+            call. A new, empty one is created if omitted.
+        method_policies (Optional[Mapping[str, ~.MethodPolicy]]): The
+            method policies of the transport.
+        rate_limiter (Optional[~.RateLimiter]): The rate limiter of the
+            transport.
+        kwargs: Further arguments of the client, e.g. ``cache``.
+
+    Returns:
+        ~.ReservationServiceClient: The client.
+    """
+    return ReservationServiceClient(
+        transport=ReservationServiceGrpcTransport(
+            channel=in_process_channel(servicer or FakeReservationService()),
+            method_policies=method_policies,
+            rate_limiter=rate_limiter,
+        ),
+        **kwargs
+    )
+
+
+class _RpcError(grpc.RpcError, grpc.Call):
+    """A failed in-process call."""
+
+    def __init__(self, code: grpc.StatusCode, details: str) -> None:
+        super().__init__(details)
+        self._code = code
+        self._details = details
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def details(self) -> str:
+        return self._details
+
+    def initial_metadata(self) -> Sequence[Tuple[str, str]]:
+        return ()
+
+    def trailing_metadata(self) -> Sequence[Tuple[str, str]]:
+        return ()
+
+    def is_active(self) -> bool:
+        return False
+
+    def time_remaining(self) -> float:
+        return None
+
+    def cancel(self) -> bool:
+        return False
+
+    def add_callback(self, callback: Callable[[], None]) -> bool:
+        return False
+
+
+class _Call(_RpcError):
+    """A successful in-process call, as returned by ``with_call``."""
+
+    def __init__(self) -> None:
+        super().__init__(grpc.StatusCode.OK, "")
+
+
+class _Abort(Exception):
+    def __init__(self, code: grpc.StatusCode, details: str) -> None:
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class _HandlerCallDetails(grpc.HandlerCallDetails):
+    def __init__(self, method: str, invocation_metadata) -> None:
+        self.method = method
+        self.invocation_metadata = invocation_metadata
+
+
+class _ServicerContext(grpc.ServicerContext):
+    def __init__(self, metadata: Sequence[Tuple[str, str]], timeout: float) -> None:
+        self._metadata = tuple(metadata or ())
+        self._timeout = timeout
+        self.code = grpc.StatusCode.OK
+        self.details = ""
+
+    def abort(self, code, details):
+        raise _Abort(code, details)
+
+    def abort_with_status(self, status):
+        raise _Abort(status.code, status.details)
+
+    def set_code(self, code):
+        self.code = code
+
+    def set_details(self, details):
+        self.details = details
+
+    def invocation_metadata(self):
+        return self._metadata
+
+    def peer(self):
+        return "in-process"
+
+    def peer_identities(self):
+        return None
+
+    def peer_identity_key(self):
+        return None
+
+    def auth_context(self):
+        return {}
+
+    def send_initial_metadata(self, initial_metadata):
+        pass
+
+    def set_trailing_metadata(self, trailing_metadata):
+        pass
+
+    def is_active(self):
+        return True
+
+    def time_remaining(self):
+        return self._timeout
+
+    def cancel(self):
+        pass
+
+    def add_callback(self, callback):
+        return False
+
+
+class _UnaryUnary(grpc.UnaryUnaryMultiCallable):
+    def __init__(self, handler, method, request_serializer, response_deserializer):
+        self._handler = handler
+        self._method = method
+        self._request_serializer = request_serializer or (lambda x: x)
+        self._response_deserializer = response_deserializer or (lambda x: x)
+
+    def __call__(
+        self,
+        request,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        response, _ = self.with_call(request, timeout=timeout, metadata=metadata)
+        return response
+
+    def with_call(
+        self,
+        request,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        method_handler = self._handler.service(
+            _HandlerCallDetails(self._method, metadata)
+        )
+        if method_handler is None:
+            raise _RpcError(grpc.StatusCode.UNIMPLEMENTED, "Method not found!")
+
+        context = _ServicerContext(metadata, timeout)
+        try:
+            response = method_handler.unary_unary(
+                method_handler.request_deserializer(self._request_serializer(request)),
+                context,
+            )
+        except _Abort as exc:
+            raise _RpcError(exc.code, exc.details) from None
+        except Exception as exc:
+            raise _RpcError(
+                grpc.StatusCode.UNKNOWN, "Exception calling application: %s" % exc
+            ) from exc
+        if context.code != grpc.StatusCode.OK:
+            raise _RpcError(context.code, context.details)
+
+        return (
+            self._response_deserializer(method_handler.response_serializer(response)),
+            _Call(),
+        )
+
+    def future(
+        self,
+        request,
+        timeout=None,
+        metadata=None,
+        credentials=None,
+        wait_for_ready=None,
+        compression=None,
+    ):
+        return _Future(lambda: self(request, timeout=timeout, metadata=metadata))
+
+
+class _Future(grpc.Future):
+    """An in-process call running on its own thread.
+
+    The servicer cannot be interrupted, so the call cannot be cancelled.
+    """
+
+    def __init__(self, call: Callable) -> None:
+        self._future = futures.Future()  # type: futures.Future
+        self._future.set_running_or_notify_cancel()
+        threading.Thread(target=self._run, args=(call,), daemon=True).start()
+
+    def _run(self, call: Callable) -> None:
+        try:
+            response = call()
+        except Exception as exc:
+            self._future.set_exception(exc)
+        else:
+            self._future.set_result(response)
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+    def running(self):
+        return not self._future.done()
+
+    def done(self):
+        return self._future.done()
+
+    def result(self, timeout=None):
+        try:
+            return self._future.result(timeout)
+        except futures.TimeoutError:
+            raise grpc.FutureTimeoutError() from None
+
+    def exception(self, timeout=None):
+        try:
+            return self._future.exception(timeout)
+        except futures.TimeoutError:
+            raise grpc.FutureTimeoutError() from None
+
+    def traceback(self, timeout=None):
+        exception = self.exception(timeout)
+        return None if exception is None else exception.__traceback__
+
+    def add_done_callback(self, fn):
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+class _InProcessChannel(grpc.Channel):
+    def __init__(self, handler: grpc.GenericRpcHandler) -> None:
+        self._handler = handler
+
+    def unary_unary(
+        self,
+        method,
+        request_serializer=None,
+        response_deserializer=None,
+        _registered_method=False,
+    ):
+        return _UnaryUnary(
+            self._handler, method, request_serializer, response_deserializer
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        raise NotImplementedError("ReservationService has no streaming methods.")
+
+    def stream_unary(self, method, *args, **kwargs):
+        raise NotImplementedError("ReservationService has no streaming methods.")
+
+    def stream_stream(self, method, *args, **kwargs):
+        raise NotImplementedError("ReservationService has no streaming methods.")
+
+    def subscribe(self, callback, try_to_connect=False):
+        callback(grpc.ChannelConnectivity.READY)
+
+    def unsubscribe(self, callback):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+__all__ = ("FakeReservationServer", "in_process_channel", "in_process_client")
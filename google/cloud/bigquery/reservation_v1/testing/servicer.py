@@ -0,0 +1,689 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import datetime
+import itertools
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import grpc  # type: ignore
+
+from google.cloud.bigquery.reservation_v1.types import reservation
+from google.protobuf import empty_pb2 as empty  # type: ignore
+
+
+SERVICE_NAME = "google.cloud.bigquery.reservation.v1.ReservationService"
+
+_ID_PATTERN = re.compile(r"^[a-z0-9]([a-z0-9-]{0,62}[a-z0-9])?$")
+_LOCATION_PATTERN = re.compile(r"^projects/[^/]+/locations/[^/]+$")
+_RESERVATION_PATTERN = re.compile(
+    r"^(?P<parent>projects/[^/]+/locations/[^/]+)/reservations/[^/]+$"
+)
+_DEFAULT_PAGE_SIZE = 100
+_MAX_PAGE_SIZE = 1000
+
+_Plan = reservation.CapacityCommitment.CommitmentPlan
+_PLAN_DURATIONS = {
+    _Plan.FLEX: datetime.timedelta(seconds=60),
+    _Plan.MONTHLY: datetime.timedelta(days=30),
+    _Plan.TRIAL: datetime.timedelta(days=182),
+    _Plan.ANNUAL: datetime.timedelta(days=365),
+}
+
+
+class FakeReservationService:
+    """An in-memory implementation of the ``ReservationService`` API.
+
+    The servicer keeps every resource in process memory and speaks the
+    same protocol buffer messages as the production service, so a client
+    connected to it goes through the real serialization and channel code.
+    Use :class:`~.FakeReservationServer` or :func:`~.in_process_channel`
+    to connect a client.
+
+    The behavior follows the documented service semantics closely enough
+    for tests and load tests:
+
+    * Capacity commitments are created ``ACTIVE`` (or ``PENDING`` if
+      ``commitments_start_pending`` is set; see :meth:`activate_commitment`
+      and :meth:`fail_commitment`). They cannot be deleted before their
+      ``commitment_end_time``, and their plan can only be changed to a
+      longer one.
+    * ``SplitCapacityCommitment`` keeps ``slot_count`` slots in the
+      original commitment and returns it as ``first``; ``second`` is a new
+      commitment with the remaining slots. Both share the plan and end
+      time of the original.
+    * ``SearchAssignments`` walks from the assignee up the resource
+      hierarchy (project, folder, organization) and, for each job type,
+      returns the assignments of the closest resource that has one.
+    * When ``enforce_capacity`` is set, the total ``slot_capacity`` of the
+      reservations of an admin project may not exceed the slots of its
+      active commitments in that location.
+
+    Args:
+        hierarchy (Optional[Mapping[str, str]]): Maps a resource name, such
+            as ``projects/p``, to the name of its parent, such as
+            ``folders/1`` or ``organizations/2``. More links can be added
+            later with :meth:`set_parent`.
+        enforce_capacity (bool): Reject reservations that exceed the
+            committed slots.
+        commitments_start_pending (bool): Create capacity commitments in
+            the ``PENDING`` state.
+        clock (Callable[[], float]): Wall-clock time source, in seconds
+            since the epoch.
+    """
+
+    def __init__(
+        self,
+        *,
+        hierarchy: Mapping[str, str] = None,
+        enforce_capacity: bool = False,
+        commitments_start_pending: bool = False,
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        self._lock = threading.RLock()
+        self._hierarchy = dict(hierarchy or {})  # type: Dict[str, str]
+        self._enforce_capacity = enforce_capacity
+        self._commitments_start_pending = commitments_start_pending
+        self._clock = clock
+        self._ids = itertools.count(1)
+        self._reservations = {}  # type: Dict[str, reservation.Reservation]
+        self._commitments = {}  # type: Dict[str, reservation.CapacityCommitment]
+        self._assignments = {}  # type: Dict[str, reservation.Assignment]
+        self._bi_reservations = {}  # type: Dict[str, reservation.BiReservation]
+
+    def set_parent(self, child: str, parent: str) -> None:
+        """Record that ``child`` sits under ``parent`` in the hierarchy.
+
+        Args:
+            child (str): A project or folder, e.g. ``projects/p``.
+            parent (str): A folder or organization, e.g. ``folders/1``.
+        """
+        with self._lock:
+            self._hierarchy[child] = parent
+
+    def activate_commitment(self, name: str) -> reservation.CapacityCommitment:
+        """Move a pending capacity commitment to ``ACTIVE``."""
+        with self._lock:
+            commitment = self._commitments[name]
+            commitment.state = reservation.CapacityCommitment.State.ACTIVE
+            commitment.commitment_end_time = self._now() + _PLAN_DURATIONS.get(
+                commitment.plan, datetime.timedelta()
+            )
+            return _copy(commitment)
+
+    def fail_commitment(
+        self, name: str, message: str = "Failed to provision slots."
+    ) -> reservation.CapacityCommitment:
+        """Move a pending capacity commitment to ``FAILED``."""
+        with self._lock:
+            commitment = self._commitments[name]
+            commitment.state = reservation.CapacityCommitment.State.FAILED
+            commitment.failure_status.code = grpc.StatusCode.RESOURCE_EXHAUSTED.value[0]
+            commitment.failure_status.message = message
+            return _copy(commitment)
+
+    def handler(self) -> grpc.GenericRpcHandler:
+        """Return a generic RPC handler that serves this servicer.
+
+        The handler can be registered on any ``grpc.Server`` with
+        ``server.add_generic_rpc_handlers((handler,))``.
+        """
+        methods = {
+            "CreateReservation": (
+                self.CreateReservation,
+                reservation.CreateReservationRequest,
+                reservation.Reservation.serialize,
+            ),
+            "ListReservations": (
+                self.ListReservations,
+                reservation.ListReservationsRequest,
+                reservation.ListReservationsResponse.serialize,
+            ),
+            "GetReservation": (
+                self.GetReservation,
+                reservation.GetReservationRequest,
+                reservation.Reservation.serialize,
+            ),
+            "DeleteReservation": (
+                self.DeleteReservation,
+                reservation.DeleteReservationRequest,
+                empty.Empty.SerializeToString,
+            ),
+            "UpdateReservation": (
+                self.UpdateReservation,
+                reservation.UpdateReservationRequest,
+                reservation.Reservation.serialize,
+            ),
+            "CreateCapacityCommitment": (
+                self.CreateCapacityCommitment,
+                reservation.CreateCapacityCommitmentRequest,
+                reservation.CapacityCommitment.serialize,
+            ),
+            "ListCapacityCommitments": (
+                self.ListCapacityCommitments,
+                reservation.ListCapacityCommitmentsRequest,
+                reservation.ListCapacityCommitmentsResponse.serialize,
+            ),
+            "GetCapacityCommitment": (
+                self.GetCapacityCommitment,
+                reservation.GetCapacityCommitmentRequest,
+                reservation.CapacityCommitment.serialize,
+            ),
+            "DeleteCapacityCommitment": (
+                self.DeleteCapacityCommitment,
+                reservation.DeleteCapacityCommitmentRequest,
+                empty.Empty.SerializeToString,
+            ),
+            "UpdateCapacityCommitment": (
+                self.UpdateCapacityCommitment,
+                reservation.UpdateCapacityCommitmentRequest,
+                reservation.CapacityCommitment.serialize,
+            ),
+            "SplitCapacityCommitment": (
+                self.SplitCapacityCommitment,
+                reservation.SplitCapacityCommitmentRequest,
+                reservation.SplitCapacityCommitmentResponse.serialize,
+            ),
+            "MergeCapacityCommitments": (
+                self.MergeCapacityCommitments,
+                reservation.MergeCapacityCommitmentsRequest,
+                reservation.CapacityCommitment.serialize,
+            ),
+            "CreateAssignment": (
+                self.CreateAssignment,
+                reservation.CreateAssignmentRequest,
+                reservation.Assignment.serialize,
+            ),
+            "ListAssignments": (
+                self.ListAssignments,
+                reservation.ListAssignmentsRequest,
+                reservation.ListAssignmentsResponse.serialize,
+            ),
+            "DeleteAssignment": (
+                self.DeleteAssignment,
+                reservation.DeleteAssignmentRequest,
+                empty.Empty.SerializeToString,
+            ),
+            "SearchAssignments": (
+                self.SearchAssignments,
+                reservation.SearchAssignmentsRequest,
+                reservation.SearchAssignmentsResponse.serialize,
+            ),
+            "MoveAssignment": (
+                self.MoveAssignment,
+                reservation.MoveAssignmentRequest,
+                reservation.Assignment.serialize,
+            ),
+            "GetBiReservation": (
+                self.GetBiReservation,
+                reservation.GetBiReservationRequest,
+                reservation.BiReservation.serialize,
+            ),
+            "UpdateBiReservation": (
+                self.UpdateBiReservation,
+                reservation.UpdateBiReservationRequest,
+                reservation.BiReservation.serialize,
+            ),
+        }
+        return grpc.method_handlers_generic_handler(
+            SERVICE_NAME,
+            {
+                name: grpc.unary_unary_rpc_method_handler(
+                    behavior,
+                    request_deserializer=request_type.deserialize,
+                    response_serializer=serializer,
+                )
+                for name, (behavior, request_type, serializer) in methods.items()
+            },
+        )
+
+    # Reservations.
+
+    def CreateReservation(self, request, context):
+        _check_location(request.parent, context)
+        reservation_id = request.reservation_id or "reservation-%d" % next(self._ids)
+        if not _ID_PATTERN.match(reservation_id):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Invalid reservation id: %s" % reservation_id,
+            )
+        name = "%s/reservations/%s" % (request.parent, reservation_id)
+        with self._lock:
+            if name in self._reservations:
+                context.abort(grpc.StatusCode.ALREADY_EXISTS, "%s exists." % name)
+            created = _copy(request.reservation)
+            created.name = name
+            self._check_capacity(request.parent, context, extra={name: created})
+            self._reservations[name] = created
+            return _copy(created)
+
+    def ListReservations(self, request, context):
+        _check_location(request.parent, context)
+        with self._lock:
+            matches = [
+                r
+                for name, r in self._reservations.items()
+                if name.startswith(request.parent + "/reservations/")
+            ]
+        page, token = _paginate(matches, request.page_size, request.page_token, context)
+        return reservation.ListReservationsResponse(
+            reservations=page, next_page_token=token
+        )
+
+    def GetReservation(self, request, context):
+        with self._lock:
+            return _copy(self._get(self._reservations, request.name, context))
+
+    def DeleteReservation(self, request, context):
+        with self._lock:
+            self._get(self._reservations, request.name, context)
+            if any(
+                name.startswith(request.name + "/assignments/")
+                for name in self._assignments
+            ):
+                context.abort(
+                    grpc.StatusCode.FAILED_PRECONDITION,
+                    "%s has assignments." % request.name,
+                )
+            del self._reservations[request.name]
+        return empty.Empty()
+
+    def UpdateReservation(self, request, context):
+        name = request.reservation.name
+        with self._lock:
+            updated = _copy(self._get(self._reservations, name, context))
+            _apply_mask(
+                updated,
+                request.reservation,
+                request.update_mask.paths,
+                ("slot_capacity", "ignore_idle_slots"),
+                context,
+            )
+            self._check_capacity(
+                _RESERVATION_PATTERN.match(name).group("parent"),
+                context,
+                extra={name: updated},
+            )
+            self._reservations[name] = updated
+            return _copy(updated)
+
+    # Capacity commitments.
+
+    def CreateCapacityCommitment(self, request, context):
+        _check_location(request.parent, context)
+        commitment = request.capacity_commitment
+        if commitment.slot_count <= 0:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "slot_count must be positive."
+            )
+        if commitment.plan not in _PLAN_DURATIONS:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "A plan is required.")
+        with self._lock:
+            created = reservation.CapacityCommitment(
+                name="%s/capacityCommitments/%d" % (request.parent, next(self._ids)),
+                slot_count=commitment.slot_count,
+                plan=commitment.plan,
+                renewal_plan=commitment.renewal_plan,
+                state=reservation.CapacityCommitment.State.PENDING,
+            )
+            self._commitments[created.name] = created
+            if not self._commitments_start_pending:
+                self.activate_commitment(created.name)
+            return _copy(created)
+
+    def ListCapacityCommitments(self, request, context):
+        _check_location(request.parent, context)
+        with self._lock:
+            matches = [
+                c
+                for name, c in self._commitments.items()
+                if name.startswith(request.parent + "/capacityCommitments/")
+            ]
+        page, token = _paginate(matches, request.page_size, request.page_token, context)
+        return reservation.ListCapacityCommitmentsResponse(
+            capacity_commitments=page, next_page_token=token
+        )
+
+    def GetCapacityCommitment(self, request, context):
+        with self._lock:
+            return _copy(self._get(self._commitments, request.name, context))
+
+    def DeleteCapacityCommitment(self, request, context):
+        with self._lock:
+            commitment = self._get(self._commitments, request.name, context)
+            if self._committed(commitment):
+                context.abort(
+                    grpc.StatusCode.FAILED_PRECONDITION,
+                    "%s is within its commitment period." % request.name,
+                )
+            del self._commitments[request.name]
+        return empty.Empty()
+
+    def UpdateCapacityCommitment(self, request, context):
+        name = request.capacity_commitment.name
+        with self._lock:
+            current = self._get(self._commitments, name, context)
+            updated = _copy(current)
+            _apply_mask(
+                updated,
+                request.capacity_commitment,
+                request.update_mask.paths,
+                ("plan", "renewal_plan"),
+                context,
+            )
+            if updated.plan != current.plan:
+                duration = _PLAN_DURATIONS.get(updated.plan)
+                if duration is None or (
+                    self._committed(current)
+                    and duration < _PLAN_DURATIONS[current.plan]
+                ):
+                    context.abort(
+                        grpc.StatusCode.FAILED_PRECONDITION,
+                        "Plan can only be changed to a longer commitment period.",
+                    )
+                if current.state == reservation.CapacityCommitment.State.ACTIVE:
+                    updated.commitment_end_time = self._now() + duration
+            self._commitments[name] = updated
+            return _copy(updated)
+
+    def SplitCapacityCommitment(self, request, context):
+        with self._lock:
+            first = _copy(self._get(self._commitments, request.name, context))
+            if not 0 < request.slot_count < first.slot_count:
+                context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    "slot_count must be between 0 and %d." % first.slot_count,
+                )
+            second = _copy(first)
+            second.name = "%s/capacityCommitments/%d" % (
+                request.name.split("/capacityCommitments/")[0],
+                next(self._ids),
+            )
+            second.slot_count = first.slot_count - request.slot_count
+            first.slot_count = request.slot_count
+            self._commitments[first.name] = first
+            self._commitments[second.name] = second
+            return reservation.SplitCapacityCommitmentResponse(
+                first=first, second=second
+            )
+
+    def MergeCapacityCommitments(self, request, context):
+        _check_location(request.parent, context)
+        ids = list(request.capacity_commitment_ids)
+        if len(ids) < 2 or len(set(ids)) != len(ids):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "At least two distinct capacity commitments are required.",
+            )
+        with self._lock:
+            commitments = [
+                self._get(
+                    self._commitments,
+                    "%s/capacityCommitments/%s" % (request.parent, i),
+                    context,
+                )
+                for i in ids
+            ]
+            if any(
+                c.state != reservation.CapacityCommitment.State.ACTIVE
+                for c in commitments
+            ):
+                context.abort(
+                    grpc.StatusCode.FAILED_PRECONDITION,
+                    "Only active capacity commitments can be merged.",
+                )
+            if len({c.plan for c in commitments}) > 1:
+                context.abort(
+                    grpc.StatusCode.FAILED_PRECONDITION,
+                    "Only capacity commitments of the same plan can be merged.",
+                )
+            merged = _copy(
+                max(commitments, key=lambda c: c.commitment_end_time.timestamp())
+            )
+            merged.slot_count = sum(c.slot_count for c in commitments)
+            for commitment in commitments:
+                del self._commitments[commitment.name]
+            self._commitments[merged.name] = merged
+            return _copy(merged)
+
+    # Assignments.
+
+    def CreateAssignment(self, request, context):
+        with self._lock:
+            self._get(self._reservations, request.parent, context)
+            assignment = request.assignment
+            if not assignment.assignee:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "assignee is required.")
+            location = request.parent.split("/reservations/")[0].split("/")[-1]
+            for existing in self._assignments.values():
+                if (
+                    existing.assignee == assignment.assignee
+                    and existing.job_type == assignment.job_type
+                    and existing.name.split("/")[3] == location
+                ):
+                    context.abort(
+                        grpc.StatusCode.ALREADY_EXISTS,
+                        "%s already has an assignment for this job type in %s."
+                        % (assignment.assignee, location),
+                    )
+            created = reservation.Assignment(
+                name="%s/assignments/%d" % (request.parent, next(self._ids)),
+                assignee=assignment.assignee,
+                job_type=assignment.job_type,
+                state=reservation.Assignment.State.ACTIVE,
+            )
+            self._assignments[created.name] = created
+            return _copy(created)
+
+    def ListAssignments(self, request, context):
+        parent = request.parent
+        if parent.endswith("/reservations/-"):
+            prefix = parent[: -len("-")]
+            _check_location(prefix[: -len("/reservations/")], context)
+        else:
+            prefix = parent + "/assignments/"
+            with self._lock:
+                self._get(self._reservations, parent, context)
+        with self._lock:
+            matches = [
+                a for name, a in self._assignments.items() if name.startswith(prefix)
+            ]
+        page, token = _paginate(matches, request.page_size, request.page_token, context)
+        return reservation.ListAssignmentsResponse(
+            assignments=page, next_page_token=token
+        )
+
+    def DeleteAssignment(self, request, context):
+        with self._lock:
+            self._get(self._assignments, request.name, context)
+            del self._assignments[request.name]
+        return empty.Empty()
+
+    def SearchAssignments(self, request, context):
+        _check_location(request.parent, context)
+        if not request.query.startswith("assignee="):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "Query must have the form assignee=<resource name>.",
+            )
+        assignee = request.query[len("assignee=") :]
+        prefix = request.parent + "/reservations/"
+        with self._lock:
+            candidates = [
+                a for a in self._assignments.values() if a.name.startswith(prefix)
+            ]
+            resolved = {}  # type: Dict[int, List[reservation.Assignment]]
+            for node in self._ancestors(assignee):
+                for job_type in reservation.Assignment.JobType:
+                    if job_type in resolved:
+                        continue
+                    found = [
+                        a
+                        for a in candidates
+                        if a.assignee == node and a.job_type == job_type
+                    ]
+                    if found:
+                        resolved[job_type] = found
+        matches = [a for found in resolved.values() for a in found]
+        page, token = _paginate(matches, request.page_size, request.page_token, context)
+        return reservation.SearchAssignmentsResponse(
+            assignments=page, next_page_token=token
+        )
+
+    def MoveAssignment(self, request, context):
+        with self._lock:
+            assignment = self._get(self._assignments, request.name, context)
+            self._get(self._reservations, request.destination_id, context)
+            moved = _copy(assignment)
+            moved.name = "%s/assignments/%s" % (
+                request.destination_id,
+                request.name.rsplit("/", 1)[-1],
+            )
+            del self._assignments[request.name]
+            self._assignments[moved.name] = moved
+            return _copy(moved)
+
+    # BI reservations.
+
+    def GetBiReservation(self, request, context):
+        _check_bi_reservation(request.name, context)
+        with self._lock:
+            return _copy(self._bi_reservation(request.name))
+
+    def UpdateBiReservation(self, request, context):
+        name = request.bi_reservation.name
+        _check_bi_reservation(name, context)
+        with self._lock:
+            updated = _copy(self._bi_reservation(name))
+            _apply_mask(
+                updated,
+                request.bi_reservation,
+                request.update_mask.paths,
+                ("size",),
+                context,
+            )
+            updated.update_time = self._now()
+            self._bi_reservations[name] = updated
+            return _copy(updated)
+
+    # Helpers; callers must hold the lock.
+
+    def _now(self) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(self._clock(), datetime.timezone.utc)
+
+    def _committed(self, commitment: reservation.CapacityCommitment) -> bool:
+        return (
+            commitment.state == reservation.CapacityCommitment.State.ACTIVE
+            and commitment.commitment_end_time is not None
+            and commitment.commitment_end_time > self._now()
+        )
+
+    def _get(self, resources: Dict[str, object], name: str, context):
+        resource = resources.get(name)
+        if resource is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, "%s not found." % name)
+        return resource
+
+    def _bi_reservation(self, name: str) -> reservation.BiReservation:
+        if name not in self._bi_reservations:
+            self._bi_reservations[name] = reservation.BiReservation(name=name)
+        return self._bi_reservations[name]
+
+    def _ancestors(self, resource: str) -> Iterable[str]:
+        seen = set()
+        while resource and resource not in seen:
+            seen.add(resource)
+            yield resource
+            resource = self._hierarchy.get(resource)
+
+    def _check_capacity(
+        self,
+        parent: str,
+        context,
+        extra: Optional[Mapping[str, reservation.Reservation]] = None,
+    ) -> None:
+        if not self._enforce_capacity:
+            return
+        reservations = dict(self._reservations)
+        reservations.update(extra or {})
+        used = sum(
+            r.slot_capacity
+            for name, r in reservations.items()
+            if name.startswith(parent + "/reservations/")
+        )
+        committed = sum(
+            c.slot_count
+            for name, c in self._commitments.items()
+            if name.startswith(parent + "/capacityCommitments/")
+            and c.state == reservation.CapacityCommitment.State.ACTIVE
+        )
+        if used > committed:
+            context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                "Reservations in %s need %d slots but only %d are committed."
+                % (parent, used, committed),
+            )
+
+
+def _copy(message):
+    return type(message)(message)
+
+
+def _check_location(parent: str, context) -> None:
+    if not _LOCATION_PATTERN.match(parent):
+        context.abort(
+            grpc.StatusCode.INVALID_ARGUMENT,
+            "Expected projects/{project}/locations/{location}, got %r." % parent,
+        )
+
+
+def _check_bi_reservation(name: str, context) -> None:
+    if not name.endswith("/bireservation") or not _LOCATION_PATTERN.match(
+        name[: -len("/bireservation")]
+    ):
+        context.abort(
+            grpc.StatusCode.INVALID_ARGUMENT,
+            "Expected projects/{project}/locations/{location}/bireservation, "
+            "got %r." % name,
+        )
+
+
+def _apply_mask(target, source, paths, allowed: Tuple[str, ...], context) -> None:
+    for path in paths:
+        if path not in allowed:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "Cannot update field %r." % path
+            )
+    for path in paths or allowed:
+        setattr(target, path, getattr(source, path))
+
+
+def _paginate(items: List, page_size: int, page_token: str, context):
+    try:
+        start = int(page_token or 0)
+    except ValueError:
+        context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid page token.")
+    if page_size < 0:
+        context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid page size.")
+    end = start + min(page_size or _DEFAULT_PAGE_SIZE, _MAX_PAGE_SIZE)
+    token = str(end) if end < len(items) else ""
+    return [_copy(item) for item in items[start:end]], token
+
+
+__all__ = ("FakeReservationService",)
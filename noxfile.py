@@ -65,8 +65,8 @@ def lint_setup_py(session):
 
 def default(session):
     # Install all test dependencies, then install this package in-place.
-    session.install("mock", "pytest", "pytest-cov")
-    session.install("-e", ".")
+    session.install("mock", "pytest", "pytest-cov", "pytest-asyncio")
+    session.install("-e", ".[pandas]")
 
     # Run py.test against the unit tests.
     session.run(
@@ -120,6 +120,22 @@ def system(session):
         session.run("py.test", "--quiet", system_test_folder_path, *session.posargs)
 
 
+@nox.session(python="3.7")
+def benchmark(session):
+    """Run the benchmark suites against the in-memory fake service.
+
+    Extra arguments are passed through, e.g. ``nox -s benchmark -- --quick``.
+    """
+    session.install("-e", ".")
+    session.run(
+        "python",
+        os.path.join("benchmarks", "run.py"),
+        "--output",
+        "benchmark-results.json",
+        *session.posargs,
+    )
+
+
 @nox.session(python="3.7")
 def cover(session):
     """Run the final coverage report.
@@ -43,14 +43,20 @@ setuptools.setup(
     include_package_data=True,
     install_requires=(
         "google-auth >= 1.14.0",
-        "google-api-core >= 1.8.0, < 2.0.0dev",
+        "google-api-core[grpc] >= 1.22.0, < 2.0.0dev",
         "googleapis-common-protos >= 1.5.8",
-        "grpcio >= 1.10.0",
+        "grpcio >= 1.32.0",
         "proto-plus >= 0.4.0",
     ),
+    extras_require={"pandas": ["pandas >= 0.23.0", "pyarrow >= 1.0.0"]},
     python_requires=">=3.6",
     setup_requires=["libcst >= 0.2.5"],
     scripts=["scripts/fixup_keywords.py"],
+    entry_points={
+        "console_scripts": [
+            "bq-reservation-export = google.cloud.bigquery.reservation_v1.export:main"
+        ]
+    },
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
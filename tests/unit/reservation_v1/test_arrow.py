@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import datetime
+import sys
+
+import pytest
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import pagers
+from google.cloud.bigquery.reservation_v1.types import reservation
+from google.protobuf import timestamp_pb2
+from google.rpc import status_pb2
+
+pa = pytest.importorskip("pyarrow")
+
+PARENT = "projects/p/locations/US"
+
+
+def paged(responses):
+    """Return a list method serving ``responses`` after the first one."""
+    remaining = iter(responses[1:])
+    return lambda request: next(remaining)
+
+
+def test_reservations_to_arrow():
+    responses = [
+        reservation.ListReservationsResponse(
+            reservations=[
+                reservation.Reservation(name="r1", slot_capacity=100),
+                reservation.Reservation(name="r2", ignore_idle_slots=True),
+            ],
+            next_page_token="t",
+        ),
+        reservation.ListReservationsResponse(
+            reservations=[reservation.Reservation(name="r3", slot_capacity=7)]
+        ),
+    ]
+    pager = pagers.ListReservationsPager(
+        paged(responses), reservation.ListReservationsRequest(), responses[0]
+    )
+
+    table = pager.to_arrow()
+
+    assert table.schema == pa.schema(
+        [
+            ("name", pa.string()),
+            ("slot_capacity", pa.int64()),
+            ("ignore_idle_slots", pa.bool_()),
+        ]
+    )
+    assert table.to_pydict() == {
+        "name": ["r1", "r2", "r3"],
+        "slot_capacity": [100, 0, 7],
+        "ignore_idle_slots": [False, True, False],
+    }
+
+
+def test_capacity_commitments_to_arrow():
+    plan = reservation.CapacityCommitment.CommitmentPlan
+    commitments = [
+        reservation.CapacityCommitment(
+            name="c1",
+            slot_count=500,
+            plan=plan.ANNUAL,
+            state=reservation.CapacityCommitment.State.ACTIVE,
+            commitment_end_time=timestamp_pb2.Timestamp(seconds=10, nanos=5000),
+            renewal_plan=plan.FLEX,
+        ),
+        reservation.CapacityCommitment(
+            name="c2", failure_status=status_pb2.Status(code=8, message="quota")
+        ),
+    ]
+    response = reservation.ListCapacityCommitmentsResponse(
+        capacity_commitments=commitments
+    )
+    pager = pagers.ListCapacityCommitmentsPager(
+        paged([response]), reservation.ListCapacityCommitmentsRequest(), response
+    )
+
+    table = pager.to_arrow()
+
+    assert table.schema.field("plan").type == pa.dictionary(pa.int32(), pa.string())
+    assert table.schema.field("commitment_end_time").type == pa.timestamp(
+        "us", tz="UTC"
+    )
+    columns = table.to_pydict()
+    assert columns["plan"] == ["ANNUAL", "COMMITMENT_PLAN_UNSPECIFIED"]
+    assert columns["renewal_plan"] == ["FLEX", "COMMITMENT_PLAN_UNSPECIFIED"]
+    assert columns["state"] == ["ACTIVE", "STATE_UNSPECIFIED"]
+    assert columns["commitment_end_time"] == [
+        datetime.datetime(1970, 1, 1, 0, 0, 10, 5, tzinfo=datetime.timezone.utc),
+        None,
+    ]
+    assert columns["failure_status_code"] == [None, 8]
+    assert columns["failure_status_message"] == [None, "quota"]
+
+
+def test_unknown_enum_value_is_null():
+    response = reservation.ListAssignmentsResponse()
+    reservation.ListAssignmentsResponse.pb(response).assignments.add(
+        name="a", job_type=99
+    )
+    pager = pagers.ListAssignmentsPager(
+        paged([response]), reservation.ListAssignmentsRequest(), response
+    )
+
+    assert pager.to_arrow().to_pydict()["job_type"] == [None]
+
+
+def test_empty_result_keeps_schema():
+    response = reservation.SearchAssignmentsResponse()
+    pager = pagers.SearchAssignmentsPager(
+        paged([response]), reservation.SearchAssignmentsRequest(), response
+    )
+
+    table = pager.to_arrow()
+
+    assert table.num_rows == 0
+    assert table.schema.names == ["name", "assignee", "job_type", "state"]
+
+
+def test_assignments_to_dataframe():
+    pd = pytest.importorskip("pandas")
+    response = reservation.ListAssignmentsResponse(
+        assignments=[
+            reservation.Assignment(
+                name="a1",
+                assignee="projects/x",
+                job_type=reservation.Assignment.JobType.QUERY,
+            ),
+            reservation.Assignment(
+                name="a2",
+                assignee="projects/y",
+                job_type=reservation.Assignment.JobType.PIPELINE,
+            ),
+        ]
+    )
+    pager = pagers.ListAssignmentsPager(
+        paged([response]), reservation.ListAssignmentsRequest(), response
+    )
+
+    frame = pager.to_dataframe()
+
+    assert list(frame["name"]) == ["a1", "a2"]
+    assert isinstance(frame["job_type"].dtype, pd.CategoricalDtype)
+    assert list(frame["job_type"]) == ["QUERY", "PIPELINE"]
+
+
+def test_async_pager_to_arrow():
+    responses = [
+        reservation.ListReservationsResponse(
+            reservations=[reservation.Reservation(name="r1")], next_page_token="t"
+        ),
+        reservation.ListReservationsResponse(
+            reservations=[reservation.Reservation(name="r2")]
+        ),
+    ]
+
+    async def method(request):
+        return responses[1]
+
+    pager = pagers.ListReservationsAsyncPager(
+        method, reservation.ListReservationsRequest(), responses[0]
+    )
+    loop = asyncio.new_event_loop()
+    try:
+        table = loop.run_until_complete(pager.to_arrow())
+    finally:
+        loop.close()
+
+    assert table.column("name").to_pylist() == ["r1", "r2"]
+
+
+def test_missing_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    response = reservation.ListReservationsResponse()
+    pager = pagers.ListReservationsPager(
+        paged([response]), reservation.ListReservationsRequest(), response
+    )
+
+    with pytest.raises(ImportError, match=r"\[pandas\]"):
+        pager.to_arrow()
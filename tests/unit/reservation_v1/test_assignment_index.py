@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from unittest import mock
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    AssignmentIndex,
+)
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+QUERY = reservation.Assignment.JobType.QUERY
+PIPELINE = reservation.Assignment.JobType.PIPELINE
+HIERARCHY = {
+    "projects/p": "folders/1",
+    "projects/q": "folders/2",
+    "folders/1": "organizations/9",
+    "folders/2": "folders/1",
+}
+US = "projects/admin/locations/US"
+EU = "projects/admin/locations/EU"
+
+
+@pytest.fixture
+def servicer():
+    return FakeReservationService(hierarchy=HIERARCHY)
+
+
+@pytest.fixture
+def client(servicer):
+    return in_process_client(servicer)
+
+
+def assign(client, parent, reservation_id, assignee, job_type):
+    name = parent + "/reservations/" + reservation_id
+    try:
+        client.get_reservation(name=name)
+    except exceptions.NotFound:
+        client.create_reservation(
+            parent=parent,
+            reservation_id=reservation_id,
+            reservation=reservation.Reservation(),
+        )
+    return client.create_assignment(
+        parent=name,
+        assignment=reservation.Assignment(assignee=assignee, job_type=job_type),
+    )
+
+
+def test_lookup_matches_search_assignments(client):
+    assign(client, US, "org", "organizations/9", QUERY)
+    assign(client, US, "org", "organizations/9", PIPELINE)
+    assign(client, US, "team", "folders/2", QUERY)
+    assign(client, EU, "eu", "projects/p", QUERY)
+
+    index = AssignmentIndex(
+        client, [US + "/reservations/-", EU + "/reservations/-"], HIERARCHY.get
+    )
+    index.refresh()
+    assert len(index) == 4
+
+    for assignee in ("projects/p", "projects/q", "folders/1", "projects/other"):
+        for job_type in (QUERY, PIPELINE):
+            expected = [
+                a.name
+                for a in client.search_assignments(
+                    parent=US, query="assignee=" + assignee
+                )
+                if a.job_type == job_type
+            ]
+            found = index.lookup(assignee, job_type, "US")
+            assert ([found.name] if found else []) == expected
+
+    assert index.reservation_for("projects/q", QUERY, "US") == US + "/reservations/team"
+    assert index.reservation_for("projects/p", QUERY, "US") == US + "/reservations/org"
+    assert index.reservation_for("projects/p", QUERY, "EU") == EU + "/reservations/eu"
+    assert index.reservation_for("projects/other", QUERY, "EU") is None
+
+
+def test_ancestors_are_memoized():
+    get_parent = mock.Mock(side_effect=HIERARCHY.get)
+    index = AssignmentIndex(mock.Mock(), [], get_parent)
+
+    index.lookup("projects/q", QUERY, "US")
+    calls = get_parent.call_count
+    index.lookup("projects/q", PIPELINE, "US")
+
+    assert calls == 4
+    assert get_parent.call_count == calls
+
+
+def test_partial_refresh(client):
+    assign(client, US, "r", "projects/p", QUERY)
+    assign(client, EU, "r", "projects/p", QUERY)
+    index = AssignmentIndex(
+        client, [US + "/reservations/-", EU + "/reservations/-"], HIERARCHY.get
+    )
+    index.refresh()
+
+    eu_assignment = assign(client, EU, "r", "folders/1", PIPELINE)
+    us_assignment = assign(client, US, "r", "folders/1", PIPELINE)
+    index.refresh([EU + "/reservations/-"])
+
+    assert index.lookup("projects/p", PIPELINE, "EU").name == eu_assignment.name
+    assert index.lookup("projects/p", PIPELINE, "US") is None
+
+    index.add(us_assignment)
+    assert index.lookup("projects/p", PIPELINE, "US").name == us_assignment.name
+
+    index.remove(us_assignment.name)
+    assert index.lookup("projects/p", PIPELINE, "US") is None
+    assert len(index) == 3
+
+
+def test_refresh_failure_leaves_index_unchanged(client):
+    assign(client, US, "r", "projects/p", QUERY)
+    index = AssignmentIndex(client, [US + "/reservations/-"], HIERARCHY.get)
+    index.refresh()
+
+    with pytest.raises(exceptions.InvalidArgument):
+        index.refresh([US + "/reservations/-", "bogus/reservations/-"])
+
+    assert index.lookup("projects/p", QUERY, "US") is not None
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from unittest import mock
+
+import threading
+import time
+
+import pytest
+
+from google.api_core import exceptions
+from google.auth import credentials
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import batch
+from google.cloud.bigquery.reservation_v1.testing import in_process_client
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+
+def test_run_bounded_concurrency():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def call(item):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01)
+        with lock:
+            state["active"] -= 1
+        return item * 2
+
+    results = list(batch.run(call, range(20), max_concurrency=3))
+
+    assert sorted(r.index for r in results) == list(range(20))
+    assert all(r.ok and r.response == r.item * 2 for r in results)
+    assert state["peak"] <= 3
+
+
+def test_run_reports_errors_per_item():
+    def call(item):
+        if item % 2:
+            raise exceptions.NotFound("missing")
+        return item
+
+    results = sorted(batch.run(call, range(4), max_concurrency=2))
+
+    assert [r.ok for r in results] == [True, False, True, False]
+    assert isinstance(results[1].error, exceptions.NotFound)
+    assert results[1].response is None
+
+
+def test_run_consumes_input_lazily():
+    drawn = []
+
+    def items():
+        for i in range(100):
+            drawn.append(i)
+            yield i
+
+    results = batch.run(lambda item: item, items(), max_concurrency=2)
+    next(results)
+    assert len(drawn) <= 3
+    results.close()
+
+
+def test_run_invalid_concurrency():
+    with pytest.raises(ValueError):
+        # Raised on the call, not on the first iteration.
+        batch.run(lambda item: item, [1], max_concurrency=0)
+
+
+def test_batch_create_assignments():
+    client = ReservationServiceClient(credentials=credentials.AnonymousCredentials())
+    parent = "projects/p/locations/US/reservations/r"
+    assignments = [
+        reservation.Assignment(
+            assignee="projects/{}".format(i),
+            job_type=reservation.Assignment.JobType.QUERY,
+        )
+        for i in range(5)
+    ]
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._transport.create_assignment), "__call__"
+    ) as call:
+
+        def create(request, **kwargs):
+            if request.assignment.assignee == "projects/3":
+                raise exceptions.AlreadyExists("exists")
+            return reservation.Assignment(
+                name=request.parent + "/assignments/1",
+                assignee=request.assignment.assignee,
+            )
+
+        call.side_effect = create
+        results = sorted(
+            client.batch_create_assignments(parent, assignments, max_concurrency=2)
+        )
+
+    assert len(call.mock_calls) == 5
+    assert [r.ok for r in results] == [True, True, True, False, True]
+    assert results[0].response.assignee == "projects/0"
+    assert results[0].item is assignments[0]
+    assert isinstance(results[3].error, exceptions.AlreadyExists)
+    _, args, _ = call.mock_calls[0]
+    assert args[0].parent == parent
+
+
+def test_batch_delete_assignments():
+    client = ReservationServiceClient(credentials=credentials.AnonymousCredentials())
+    names = [
+        "projects/p/locations/US/reservations/r/assignments/%d" % i for i in range(3)
+    ]
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._transport.delete_assignment), "__call__"
+    ) as call:
+        call.return_value = None
+        results = list(client.batch_delete_assignments(names))
+
+    assert sorted(r.item for r in results) == names
+    assert all(r.ok for r in results)
+    assert sorted(args[0].name for _, args, _ in call.mock_calls) == names
+
+
+def test_batch_move_assignments():
+    client = ReservationServiceClient(credentials=credentials.AnonymousCredentials())
+    names = [
+        "projects/p/locations/US/reservations/r/assignments/%d" % i for i in range(3)
+    ]
+    destination = "projects/p/locations/US/reservations/other"
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client._transport.move_assignment), "__call__") as call:
+        call.return_value = reservation.Assignment()
+        results = list(client.batch_move_assignments(names, destination))
+
+    assert all(r.ok for r in results)
+    assert {args[0].destination_id for _, args, _ in call.mock_calls} == {destination}
+
+
+def test_run_paged_bounded_concurrency():
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def list_call(parent):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        try:
+            for i in range(3):
+                time.sleep(0.005)
+                yield "%s/%d" % (parent, i)
+        finally:
+            with lock:
+                state["active"] -= 1
+
+    results = list(batch.run_paged(list_call, ["a", "b", "c", "d"], 2))
+
+    assert len(results) == 12
+    assert all(r.ok and r.response.startswith(r.item + "/") for r in results)
+    assert {r.index for r in results if r.item == "c"} == {2}
+    assert state["peak"] <= 2
+
+
+def test_run_paged_reports_errors_per_parent():
+    def list_call(parent):
+        yield parent + "/1"
+        if parent == "bad":
+            raise exceptions.NotFound("missing")
+        yield parent + "/2"
+
+    results = list(batch.run_paged(list_call, ["good", "bad"], 2))
+
+    failed = [r for r in results if not r.ok]
+    assert len(failed) == 1
+    assert failed[0].item == "bad"
+    assert isinstance(failed[0].error, exceptions.NotFound)
+    assert sorted(r.response for r in results if r.ok) == ["bad/1", "good/1", "good/2"]
+
+
+def test_run_paged_stops_workers_when_abandoned():
+    produced = []
+
+    def list_call(parent):
+        for i in range(10000):
+            produced.append(i)
+            yield i
+
+    results = batch.run_paged(list_call, ["a"], 1)
+    next(results)
+    results.close()
+    count = len(produced)
+    time.sleep(0.2)
+
+    assert len(produced) == count
+    assert count <= batch._PAGED_BUFFER_SIZE + 2
+
+
+def test_run_paged_invalid_concurrency():
+    with pytest.raises(ValueError):
+        batch.run_paged(lambda parent: [], ["a"], 0)
+
+
+def test_batch_list_reservations():
+    client = in_process_client()
+    parents = [
+        "projects/%s/locations/%s" % (project, location)
+        for project in ("a", "b")
+        for location in ("US", "EU", "asia-northeast1")
+    ]
+    for parent in parents:
+        for i in range(3):
+            client.create_reservation(
+                parent=parent,
+                reservation_id="r%d" % i,
+                reservation=reservation.Reservation(),
+            )
+
+    results = list(client.batch_list_reservations(parents, max_concurrency=4))
+
+    assert len(results) == 18
+    assert all(r.response.name.startswith(r.item + "/") for r in results)
+    assert {r.item for r in results} == set(parents)
+
+
+def test_batch_list_assignments_reports_missing_parent():
+    client = in_process_client()
+    missing = "projects/p/locations/US/reservations/missing"
+
+    results = list(
+        client.batch_list_assignments(
+            ["projects/p/locations/US/reservations/-", missing]
+        )
+    )
+
+    assert [(r.item, type(r.error)) for r in results] == [
+        (missing, exceptions.NotFound)
+    ]
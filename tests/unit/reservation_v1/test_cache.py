@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from unittest import mock
+
+import threading
+
+import pytest
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ResourceCache,
+)
+from google.cloud.bigquery.reservation_v1.testing import in_process_client
+from google.cloud.bigquery.reservation_v1.types import reservation
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hit_returns_copy():
+    cache = ResourceCache()
+    load = mock.Mock(return_value=reservation.Reservation(name="a", slot_capacity=5))
+
+    first = cache.get("reservation", "a", load)
+    first.slot_capacity = 100
+    second = cache.get("reservation", "a", load)
+
+    load.assert_called_once_with()
+    assert second.slot_capacity == 5
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_ttl_per_resource_type():
+    clock = FakeClock()
+    cache = ResourceCache(reservation_ttl=10, bi_reservation_ttl=0, clock=clock)
+    load = mock.Mock(return_value=reservation.Reservation(name="a"))
+    load_bi = mock.Mock(return_value=reservation.BiReservation(name="b"))
+
+    cache.get("reservation", "a", load)
+    cache.get("bi_reservation", "b", load_bi)
+    cache.get("bi_reservation", "b", load_bi)
+    clock.now = 9.9
+    cache.get("reservation", "a", load)
+    assert load.call_count == 1
+
+    # A zero TTL disables caching for that resource type.
+    assert load_bi.call_count == 2
+
+    clock.now = 10.0
+    cache.get("reservation", "a", load)
+    assert load.call_count == 2
+
+
+def test_cache_lru_bound():
+    cache = ResourceCache(max_size=2)
+    load = mock.Mock(return_value=reservation.Reservation())
+
+    cache.get("reservation", "a", load)
+    cache.get("reservation", "b", load)
+    cache.get("reservation", "a", load)
+    cache.get("reservation", "c", load)
+
+    assert len(cache) == 2
+    assert cache.hits == 1
+    cache.get("reservation", "a", load)
+    assert cache.hits == 2
+    cache.get("reservation", "b", load)
+    assert cache.hits == 2
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError):
+        ResourceCache(max_size=0)
+
+
+def test_cache_coalesces_concurrent_misses():
+    cache = ResourceCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return reservation.Reservation(name="a", slot_capacity=7)
+
+    results = []
+
+    def worker():
+        results.append(cache.get("reservation", "a", load))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(r.slot_capacity == 7 for r in results)
+
+
+def test_cache_errors_are_not_cached():
+    cache = ResourceCache()
+    load = mock.Mock(side_effect=[RuntimeError("boom"), reservation.Reservation()])
+
+    with pytest.raises(RuntimeError):
+        cache.get("reservation", "a", load)
+    cache.get("reservation", "a", load)
+    assert load.call_count == 2
+    assert len(cache) == 1
+
+
+def test_cache_invalidate_during_load():
+    cache = ResourceCache()
+
+    def load():
+        # A write lands while the lookup is in flight.
+        cache.invalidate("reservation", "a")
+        return reservation.Reservation(name="a")
+
+    assert cache.get("reservation", "a", load).name == "a"
+    assert len(cache) == 0
+
+
+def test_client_get_reservation_cached():
+    client = in_process_client(cache=ResourceCache())
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client._transport.get_reservation), "__call__") as call:
+        call.return_value = reservation.Reservation(name="a", slot_capacity=10)
+        assert client.get_reservation(name="a").slot_capacity == 10
+        assert client.get_reservation(name="a").slot_capacity == 10
+        assert client.get_reservation(name="b").slot_capacity == 10
+
+    assert len(call.mock_calls) == 2
+
+
+def fake_rpcs(responses):
+    """Dispatch stub calls on the request type; every stub shares one class."""
+
+    def call(request, **kwargs):
+        response = responses[type(request).__name__]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return call
+
+
+def request_types(call):
+    return [type(args[0]).__name__ for _, args, _ in call.mock_calls]
+
+
+def test_client_update_reservation_invalidates():
+    client = in_process_client(cache=ResourceCache())
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client._transport.get_reservation), "__call__") as call:
+        call.side_effect = fake_rpcs(
+            {
+                "GetReservationRequest": reservation.Reservation(name="a"),
+                "UpdateReservationRequest": RuntimeError("unavailable"),
+            }
+        )
+        client.get_reservation(name="a")
+
+        # Even a failed write drops the cached copy.
+        with pytest.raises(RuntimeError):
+            client.update_reservation(
+                reservation=reservation.Reservation(name="a", slot_capacity=1),
+                update_mask=field_mask.FieldMask(paths=["slot_capacity"]),
+            )
+        client.get_reservation(name="a")
+
+    assert request_types(call).count("GetReservationRequest") == 2
+
+
+def test_client_merge_capacity_commitments_invalidates():
+    client = in_process_client(cache=ResourceCache())
+    parent = "projects/p/locations/US"
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._transport.get_capacity_commitment), "__call__"
+    ) as call:
+        call.side_effect = fake_rpcs(
+            {
+                "GetCapacityCommitmentRequest": reservation.CapacityCommitment(),
+                "MergeCapacityCommitmentsRequest": reservation.CapacityCommitment(),
+            }
+        )
+        client.get_capacity_commitment(name=parent + "/capacityCommitments/1")
+        client.get_capacity_commitment(name=parent + "/capacityCommitments/3")
+        client.merge_capacity_commitments(
+            parent=parent, capacity_commitment_ids=["1", "2"]
+        )
+        client.get_capacity_commitment(name=parent + "/capacityCommitments/1")
+        client.get_capacity_commitment(name=parent + "/capacityCommitments/3")
+
+    assert request_types(call).count("GetCapacityCommitmentRequest") == 3
+
+
+def test_client_update_bi_reservation_invalidates():
+    client = in_process_client(cache=ResourceCache())
+    name = "projects/p/locations/US/bireservation"
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._transport.get_bi_reservation), "__call__"
+    ) as call:
+        call.side_effect = fake_rpcs(
+            {
+                "GetBiReservationRequest": reservation.BiReservation(name=name),
+                "UpdateBiReservationRequest": reservation.BiReservation(name=name),
+            }
+        )
+        client.get_bi_reservation(name=name)
+        client.get_bi_reservation(name=name)
+        client.update_bi_reservation(
+            bi_reservation=reservation.BiReservation(name=name, size=1)
+        )
+        client.get_bi_reservation(name=name)
+
+    assert request_types(call).count("GetBiReservationRequest") == 2
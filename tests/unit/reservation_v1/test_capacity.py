@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    CapacityModel,
+)
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+PARENT = "projects/admin/locations/US"
+OTHER = "projects/admin/locations/EU"
+State = reservation.CapacityCommitment.State
+
+
+def name(reservation_id, parent=PARENT):
+    return parent + "/reservations/" + reservation_id
+
+
+def create(reservation_id, slots, parent=PARENT):
+    return reservation.CreateReservationRequest(
+        parent=parent,
+        reservation_id=reservation_id,
+        reservation=reservation.Reservation(slot_capacity=slots),
+    )
+
+
+def update(reservation_id, slots, paths=("slot_capacity",)):
+    return reservation.UpdateReservationRequest(
+        reservation=reservation.Reservation(
+            name=name(reservation_id), slot_capacity=slots, ignore_idle_slots=True
+        ),
+        update_mask={"paths": list(paths)},
+    )
+
+
+def make_model():
+    return CapacityModel(
+        [PARENT, OTHER],
+        [
+            reservation.Reservation(name=name("a"), slot_capacity=600),
+            reservation.Reservation(name=name("a", OTHER), slot_capacity=50),
+        ],
+        [
+            reservation.CapacityCommitment(
+                name=PARENT + "/capacityCommitments/1",
+                slot_count=1000,
+                state=State.ACTIVE,
+            ),
+            reservation.CapacityCommitment(
+                name=PARENT + "/capacityCommitments/2",
+                slot_count=500,
+                state=State.PENDING,
+            ),
+            reservation.CapacityCommitment(
+                name=OTHER + "/capacityCommitments/3",
+                slot_count=100,
+                state=State.ACTIVE,
+            ),
+        ],
+    )
+
+
+def test_model():
+    model = make_model()
+
+    assert model.committed(PARENT) == 1000
+    assert model.reserved(PARENT) == 600
+    assert model.available(PARENT) == 400
+    assert model.available(OTHER) == 50
+    with pytest.raises(ValueError):
+        model.available("projects/other/locations/US")
+    with pytest.raises(ValueError):
+        CapacityModel([PARENT], [reservation.Reservation(name=name("a", OTHER))])
+
+
+def test_validate():
+    model = make_model()
+    requests = [
+        create("b", 300),
+        create("c", 200),
+        update("a", 700),
+        update("b", 0, paths=["ignore_idle_slots"]),
+        reservation.DeleteReservationRequest(name=name("b")),
+        create("c", 300),
+        create("c", 0),
+        update("missing", 0),
+        create("d", 60, parent=OTHER),
+        reservation.DeleteAssignmentRequest(name=name("a") + "/assignments/1"),
+    ]
+
+    results = model.validate(requests)
+
+    assert [result.index for result in results] == list(range(len(requests)))
+    assert [type(result.error) for result in results] == [
+        type(None),
+        exceptions.ResourceExhausted,
+        type(None),
+        type(None),
+        type(None),
+        type(None),
+        exceptions.AlreadyExists,
+        exceptions.NotFound,
+        exceptions.ResourceExhausted,
+        type(None),
+    ]
+    assert "1100 slots" in str(results[1].error)
+    assert model.reserved(PARENT) == 600
+    with pytest.raises(ValueError):
+        model.validate([create("a", 0, parent="projects/other/locations/US")])
+
+
+def test_predictions_match_the_service():
+    client = in_process_client(FakeReservationService(enforce_capacity=True))
+    client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=500, plan=reservation.CapacityCommitment.CommitmentPlan.FLEX
+        ),
+    )
+    client.create_reservation(create("a", 300))
+    requests = [create("b", 300), create("b", 200), update("a", 250), create("c", 50)]
+
+    predicted = CapacityModel.load(client, [PARENT]).validate(requests)
+
+    assert [result.ok for result in predicted] == [False, True, True, True]
+    for request, prediction in zip(requests, predicted):
+        method = {
+            reservation.CreateReservationRequest: client.create_reservation,
+            reservation.UpdateReservationRequest: client.update_reservation,
+        }[type(request)]
+        try:
+            method(request)
+        except exceptions.GoogleAPICallError as exc:
+            error = exc
+        else:
+            error = None
+        assert type(error) is type(prediction.error)
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from unittest import mock
+
+import grpc
+import pytest
+
+from google.api_core import client_options
+from google.api_core import exceptions
+from google.auth import credentials
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ChannelOptions,
+    ReservationServiceAsyncClient,
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import transports
+from google.cloud.bigquery.reservation_v1.testing import FakeReservationServer
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+TRANSPORTS = (
+    "google.cloud.bigquery.reservation_v1.services.reservation_service.transports."
+)
+
+
+def test_to_grpc_options():
+    options = ChannelOptions(
+        keepalive_time_ms=30000,
+        keepalive_timeout_ms=10000,
+        keepalive_permit_without_calls=True,
+        compression="gzip",
+        max_receive_message_length=64 << 20,
+        max_send_message_length=-1,
+        initial_window_size=1 << 20,
+        bdp_probe=False,
+    )
+
+    assert dict(options.to_grpc_options()) == {
+        "grpc.keepalive_time_ms": 30000,
+        "grpc.keepalive_timeout_ms": 10000,
+        "grpc.keepalive_permit_without_calls": 1,
+        "grpc.default_compression_algorithm": int(grpc.Compression.Gzip),
+        "grpc.max_receive_message_length": 64 << 20,
+        "grpc.max_send_message_length": -1,
+        "grpc.http2.lookahead_bytes": 1 << 20,
+        "grpc.http2.bdp_probe": 0,
+    }
+    assert ChannelOptions().to_grpc_options() == []
+
+
+@pytest.mark.parametrize(
+    "kwargs,error",
+    [
+        ({"keepalive_time_ms": 0}, ValueError),
+        ({"keepalive_timeout_ms": 1.5}, TypeError),
+        ({"keepalive_permit_without_calls": 1}, TypeError),
+        ({"compression": "brotli"}, ValueError),
+        ({"max_receive_message_length": -2}, ValueError),
+        ({"max_send_message_length": True}, TypeError),
+        ({"initial_window_size": 2 ** 31}, ValueError),
+        ({"bdp_probe": "no"}, TypeError),
+    ],
+)
+def test_validation(kwargs, error):
+    with pytest.raises(error):
+        ChannelOptions(**kwargs)
+
+
+def test_from_dict():
+    assert ChannelOptions.from_dict({"compression": "gzip"}) == ChannelOptions(
+        compression="gzip"
+    )
+    with pytest.raises(ValueError, match="keepalive_ms"):
+        ChannelOptions.from_dict({"keepalive_ms": 1})
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"channel_options": ChannelOptions(compression="gzip")},
+        {"channel_options": {"compression": "gzip"}},
+        {"client_options": {"channel_options": {"compression": "gzip"}}},
+    ],
+)
+def test_client_passes_options_to_transport(kwargs):
+    with mock.patch(TRANSPORTS + "ReservationServiceGrpcTransport.__init__") as init:
+        init.return_value = None
+        ReservationServiceClient(**kwargs)
+
+    assert init.call_args[1]["channel_options"] == ChannelOptions(compression="gzip")
+
+
+def test_client_options_attribute():
+    options = client_options.ClientOptions(api_endpoint="squid.clam.whelk")
+    options.channel_options = ChannelOptions(keepalive_time_ms=1000)
+    with mock.patch(TRANSPORTS + "ReservationServiceGrpcTransport.__init__") as init:
+        init.return_value = None
+        ReservationServiceClient(client_options=options)
+
+    init.assert_called_once_with(
+        api_mtls_endpoint=None,
+        client_cert_source=None,
+        credentials=None,
+        host="squid.clam.whelk",
+        channel_options=ChannelOptions(keepalive_time_ms=1000),
+    )
+
+
+def test_async_client_passes_options_to_transport():
+    with mock.patch(
+        TRANSPORTS + "ReservationServiceGrpcAsyncIOTransport.__init__"
+    ) as init:
+        init.return_value = None
+        ReservationServiceAsyncClient(channel_options={"compression": "gzip"})
+
+    assert init.call_args[1]["channel_options"] == ChannelOptions(compression="gzip")
+
+
+def test_async_client_defaults_to_asyncio_transport():
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(), transport=None
+    )
+
+    assert isinstance(
+        client._client._transport, transports.ReservationServiceGrpcAsyncIOTransport
+    )
+
+
+def test_client_rejects_conflicting_options():
+    with pytest.raises(ValueError):
+        ReservationServiceClient(
+            channel_options=ChannelOptions(),
+            client_options={"channel_options": ChannelOptions()},
+        )
+    transport = transports.ReservationServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials()
+    )
+    with pytest.raises(ValueError):
+        ReservationServiceClient(transport=transport, channel_options=ChannelOptions())
+
+
+@pytest.mark.parametrize("channel_pool_size", [1, 2])
+def test_transport_creates_channels_with_options(channel_pool_size):
+    options = ChannelOptions(max_receive_message_length=-1)
+    with mock.patch.object(
+        transports.ReservationServiceGrpcTransport, "create_channel", autospec=True
+    ) as create_channel:
+        transports.ReservationServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            channel_options=options,
+            channel_pool_size=channel_pool_size,
+        )
+
+    for call in create_channel.call_args_list:
+        grpc_options = call[1]["options"]
+        assert ("grpc.max_receive_message_length", -1) in grpc_options
+        assert (transports.pool.LOCAL_SUBCHANNEL_POOL_OPTION in grpc_options) == (
+            channel_pool_size > 1
+        )
+
+
+def test_async_transport_creates_channel_with_options():
+    with mock.patch.object(
+        transports.ReservationServiceGrpcAsyncIOTransport,
+        "create_channel",
+        autospec=True,
+    ) as create_channel:
+        transports.ReservationServiceGrpcAsyncIOTransport(
+            credentials=credentials.AnonymousCredentials(),
+            channel_options=ChannelOptions(compression="gzip"),
+        ).grpc_channel
+
+    assert create_channel.call_args[1]["options"] == [
+        ("grpc.default_compression_algorithm", int(grpc.Compression.Gzip))
+    ]
+
+
+def test_options_apply_to_real_channel():
+    options = ChannelOptions(
+        keepalive_time_ms=60000, compression="gzip", max_receive_message_length=100
+    ).to_grpc_options()
+    with FakeReservationServer() as server:
+        channel = grpc.insecure_channel(server.address, options=options)
+        client = ReservationServiceClient(
+            transport=transports.ReservationServiceGrpcTransport(channel=channel)
+        )
+        for reservation_id in "abc":
+            client.create_reservation(
+                parent="projects/p/locations/US",
+                reservation_id=reservation_id,
+                reservation=reservation.Reservation(),
+            )
+        # The page of three reservations exceeds the 100 byte receive limit.
+        with pytest.raises(exceptions.ResourceExhausted):
+            list(client.list_reservations(parent="projects/p/locations/US"))
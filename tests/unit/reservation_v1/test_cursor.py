@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from google.api_core import grpc_helpers_async
+from google.auth import credentials
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    PagerCursor,
+    ReservationServiceAsyncClient,
+)
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+PARENT = "projects/p/locations/US"
+
+
+@pytest.fixture
+def client():
+    servicer = FakeReservationService()
+    client = in_process_client(servicer)
+    for i in range(5):
+        client.create_reservation(
+            parent=PARENT,
+            reservation_id="r%d" % i,
+            reservation=reservation.Reservation(),
+        )
+    return client
+
+
+def names(items):
+    return [item.name.rsplit("/", 1)[-1] for item in items]
+
+
+def test_resume_from_cursor(client):
+    pager = client.list_reservations(
+        request=reservation.ListReservationsRequest(parent=PARENT, page_size=2)
+    )
+    first = next(iter(pager.pages))
+    assert names(first.reservations) == ["r0", "r1"]
+    saved = pager.cursor.to_json()
+
+    cursor = PagerCursor.from_json(saved)
+    assert cursor.method == "list_reservations"
+    assert cursor.request == {"parent": PARENT, "page_size": 2, "page_token": "2"}
+    assert not cursor.exhausted
+
+    resumed = client.list_reservations(cursor=cursor)
+    assert names(resumed) == ["r2", "r3", "r4"]
+    assert resumed.cursor.exhausted
+
+
+def test_cursor_follows_the_pages(client):
+    pager = client.list_reservations(
+        request=reservation.ListReservationsRequest(parent=PARENT, page_size=2)
+    )
+    tokens = [pager.cursor.request.get("page_token") for _ in pager.pages]
+
+    assert tokens == ["2", "4", None]
+
+
+def test_exhausted_cursor_sends_no_request(client):
+    cursor = client.list_reservations(parent=PARENT).cursor
+    assert cursor.exhausted
+
+    with mock.patch.object(
+        type(client._transport.list_reservations), "__call__"
+    ) as call:
+        assert list(client.list_reservations(cursor=cursor)) == []
+    call.assert_not_called()
+
+
+def test_invalid_cursor_arguments(client):
+    cursor = client.list_reservations(parent=PARENT).cursor
+
+    with pytest.raises(ValueError):
+        client.list_assignments(cursor=cursor)
+    with pytest.raises(ValueError):
+        client.list_reservations(parent=PARENT, cursor=cursor)
+
+
+def test_async_resume_from_cursor():
+    cursor = PagerCursor(
+        "search_assignments",
+        {"parent": PARENT, "query": "assignee=projects/x", "page_token": "t"},
+    )
+
+    async def search():
+        client = ReservationServiceAsyncClient(
+            credentials=credentials.AnonymousCredentials()
+        )
+        with mock.patch.object(
+            type(client._client._transport.search_assignments), "__call__"
+        ) as call:
+            call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+                reservation.SearchAssignmentsResponse(
+                    assignments=[reservation.Assignment(name="a")]
+                )
+            )
+            pager = await client.search_assignments(cursor=cursor)
+            request = call.call_args[0][0]
+        return pager, request
+
+    loop = asyncio.new_event_loop()
+    try:
+        pager, request = loop.run_until_complete(search())
+    finally:
+        loop.close()
+
+    assert request.query == "assignee=projects/x"
+    assert request.page_token == "t"
+    assert pager.cursor.exhausted
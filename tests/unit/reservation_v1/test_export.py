@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import glob
+import json
+import os
+from unittest import mock
+
+import grpc
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.bigquery.reservation_v1 import export
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+
+def populate(servicer, project="p", location="US", reservations=5):
+    client = in_process_client(servicer)
+    parent = "projects/%s/locations/%s" % (project, location)
+    for i in range(reservations):
+        created = client.create_reservation(
+            parent=parent,
+            reservation_id="r%d" % i,
+            reservation=reservation.Reservation(slot_capacity=100 * i),
+        )
+        client.create_assignment(
+            parent=created.name,
+            assignment=reservation.Assignment(
+                assignee="projects/a%d" % i,
+                job_type=reservation.Assignment.JobType.QUERY,
+            ),
+        )
+    client.create_capacity_commitment(
+        parent=parent,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=500, plan=reservation.CapacityCommitment.CommitmentPlan.FLEX
+        ),
+    )
+
+
+def read_ndjson(directory):
+    rows = []
+    for path in sorted(glob.glob(os.path.join(directory, "part-*.ndjson"))):
+        with open(path) as stream:
+            rows.extend(json.loads(line) for line in stream)
+    return rows
+
+
+def test_export_ndjson(tmpdir):
+    servicer = FakeReservationService()
+    populate(servicer, location="US")
+    populate(servicer, location="EU", reservations=2)
+
+    totals = export.export(
+        in_process_client(servicer),
+        ["p"],
+        ["US", "EU"],
+        str(tmpdir),
+        page_size=2,
+        chunk_rows=2,
+    )
+
+    assert totals == {
+        "reservations": 7,
+        "capacity_commitments": 2,
+        "assignments": 7,
+        "bi_reservations": 2,
+    }
+    directory = str(tmpdir.join("reservations", "project=p", "location=US"))
+    assert len(glob.glob(os.path.join(directory, "part-*.ndjson"))) == 3
+    rows = read_ndjson(directory)
+    assert [row["name"] for row in rows] == [
+        "projects/p/locations/US/reservations/r%d" % i for i in range(5)
+    ]
+    assert rows[1]["slot_capacity"] == "100"
+    assignments = read_ndjson(
+        str(tmpdir.join("assignments", "project=p", "location=EU"))
+    )
+    assert [row["job_type"] for row in assignments] == ["QUERY", "QUERY"]
+    assert not tmpdir.join(export.STATE_FILE).exists()
+
+
+def test_export_accepts_iterators(tmpdir):
+    servicer = FakeReservationService()
+    populate(servicer, project="p", location="US", reservations=2)
+    populate(servicer, project="q", location="EU", reservations=1)
+
+    totals = export.export(
+        in_process_client(servicer),
+        (project for project in ["p", "q"]),
+        iter(["US", "EU"]),
+        str(tmpdir),
+    )
+
+    assert totals == {
+        "reservations": 3,
+        "capacity_commitments": 2,
+        "assignments": 3,
+        "bi_reservations": 4,
+    }
+
+
+def test_export_parquet(tmpdir):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    servicer = FakeReservationService()
+    populate(servicer)
+
+    export.export(
+        in_process_client(servicer),
+        ["p"],
+        ["US"],
+        str(tmpdir),
+        output_format=export.PARQUET,
+        resources=[export.RESERVATIONS, export.CAPACITY_COMMITMENTS],
+        page_size=2,
+        chunk_rows=3,
+    )
+
+    directory = tmpdir.join("reservations", "project=p", "location=US")
+    table = parquet.read_table(str(directory))
+    assert table.num_rows == 5
+    assert sorted(table.column("slot_capacity").to_pylist()) == [0, 100, 200, 300, 400]
+    commitments = parquet.read_table(
+        str(tmpdir.join("capacity_commitments", "project=p", "location=US"))
+    )
+    assert commitments.column("plan").to_pylist() == ["FLEX"]
+    assert not tmpdir.join("assignments").exists()
+
+
+class FlakyService(FakeReservationService):
+    """Fails the first request for a second page of assignments."""
+
+    failed = False
+
+    def ListAssignments(self, request, context):
+        if request.page_token and not self.failed:
+            self.failed = True
+            context.abort(grpc.StatusCode.UNAVAILABLE, "try again")
+        return super().ListAssignments(request, context)
+
+
+def test_interrupted_export_resumes(tmpdir):
+    servicer = FlakyService()
+    populate(servicer)
+    client = in_process_client(servicer)
+
+    with pytest.raises(exceptions.ServiceUnavailable):
+        export.export(client, ["p"], ["US"], str(tmpdir), page_size=2, chunk_rows=1)
+
+    with open(str(tmpdir.join(export.STATE_FILE))) as stream:
+        state = json.load(stream)["tasks"]
+    assert state["assignments/p/US"] == {
+        "page_token": "2",
+        "parts": 1,
+        "rows": 2,
+        "done": False,
+    }
+    assert state["reservations/p/US"]["done"]
+
+    with mock.patch.object(client, "list_reservations") as list_reservations:
+        totals = export.export(
+            client, ["p"], ["US"], str(tmpdir), page_size=2, chunk_rows=1
+        )
+    list_reservations.assert_not_called()
+
+    assert totals["assignments"] == 5
+    assert totals["reservations"] == 5
+    rows = read_ndjson(str(tmpdir.join("assignments", "project=p", "location=US")))
+    assert sorted(row["assignee"] for row in rows) == [
+        "projects/a%d" % i for i in range(5)
+    ]
+    assert not tmpdir.join(export.STATE_FILE).exists()
+
+
+def test_fresh_export_replaces_old_parts(tmpdir):
+    servicer = FakeReservationService()
+    populate(servicer)
+    client = in_process_client(servicer)
+    export.export(client, ["p"], ["US"], str(tmpdir), page_size=1, chunk_rows=1)
+
+    name = "projects/p/locations/US/reservations/r4"
+    for assignment in client.list_assignments(parent=name):
+        client.delete_assignment(name=assignment.name)
+    client.delete_reservation(name=name)
+    export.export(client, ["p"], ["US"], str(tmpdir), page_size=1, chunk_rows=1)
+
+    directory = str(tmpdir.join("reservations", "project=p", "location=US"))
+    assert len(read_ndjson(directory)) == 4
+
+
+def test_resuming_in_another_format_is_refused(tmpdir):
+    tmpdir.join(export.STATE_FILE).write(json.dumps({"format": "ndjson", "tasks": {}}))
+
+    with pytest.raises(ValueError):
+        export.export(None, ["p"], ["US"], str(tmpdir), output_format=export.PARQUET)
+
+
+def test_main(tmpdir, capsys):
+    servicer = FakeReservationService()
+    populate(servicer)
+
+    with mock.patch.object(
+        export, "ReservationServiceClient", return_value=in_process_client(servicer)
+    ):
+        status = export.main(
+            [
+                "--project",
+                "p",
+                "--location",
+                "US",
+                "--output-dir",
+                str(tmpdir),
+                "--resource",
+                "reservations",
+            ]
+        )
+
+    assert status == 0
+    assert capsys.readouterr().out == "reservations: 5 rows\n"
+
+    with mock.patch.object(export, "ReservationServiceClient"):
+        status = export.main(
+            [
+                "--project",
+                "p",
+                "--location",
+                "US",
+                "--output-dir",
+                str(tmpdir),
+                "--chunk-rows",
+                "0",
+            ]
+        )
+    assert status == 2
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import datetime
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationServer,
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+from google.protobuf import field_mask_pb2 as field_mask  # type: ignore
+
+PARENT = "projects/admin/locations/US"
+Plan = reservation.CapacityCommitment.CommitmentPlan
+JobType = reservation.Assignment.JobType
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1600000000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["in_process", "localhost"])
+def client(request):
+    servicer = FakeReservationService(
+        hierarchy={"projects/p": "folders/1", "folders/1": "organizations/9"}
+    )
+    if request.param == "in_process":
+        yield in_process_client(servicer)
+    else:
+        with FakeReservationServer(servicer) as server:
+            yield server.client()
+
+
+def test_reservation_lifecycle(client):
+    created = client.create_reservation(
+        parent=PARENT,
+        reservation_id="prod",
+        reservation=reservation.Reservation(slot_capacity=100),
+    )
+    assert created.name == PARENT + "/reservations/prod"
+    assert created.slot_capacity == 100
+
+    with pytest.raises(exceptions.AlreadyExists):
+        client.create_reservation(
+            parent=PARENT, reservation_id="prod", reservation=reservation.Reservation()
+        )
+    with pytest.raises(exceptions.InvalidArgument):
+        client.create_reservation(
+            parent=PARENT,
+            reservation_id="Bad_Id",
+            reservation=reservation.Reservation(),
+        )
+
+    updated = client.update_reservation(
+        reservation=reservation.Reservation(name=created.name, slot_capacity=50),
+        update_mask=field_mask.FieldMask(paths=["slot_capacity"]),
+    )
+    assert updated.slot_capacity == 50
+    assert client.get_reservation(name=created.name).slot_capacity == 50
+
+    client.delete_reservation(name=created.name)
+    with pytest.raises(exceptions.NotFound):
+        client.get_reservation(name=created.name)
+
+
+def test_list_reservations_pages(client):
+    for i in range(5):
+        client.create_reservation(
+            parent=PARENT,
+            reservation_id="r%d" % i,
+            reservation=reservation.Reservation(),
+        )
+    client.create_reservation(
+        parent="projects/admin/locations/EU",
+        reservation_id="other",
+        reservation=reservation.Reservation(),
+    )
+
+    pager = client.list_reservations(
+        request=reservation.ListReservationsRequest(parent=PARENT, page_size=2)
+    )
+    assert [r.name.rsplit("/", 1)[-1] for r in pager] == ["r0", "r1", "r2", "r3", "r4"]
+    pages = list(
+        client.list_reservations(
+            request=reservation.ListReservationsRequest(parent=PARENT, page_size=2)
+        ).pages
+    )
+    assert len(pages) == 3
+
+
+def test_split_and_merge_commitments(client):
+    commitment = client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=1000, plan=Plan.MONTHLY
+        ),
+    )
+    assert commitment.state == reservation.CapacityCommitment.State.ACTIVE
+
+    split = client.split_capacity_commitment(name=commitment.name, slot_count=300)
+    # The named commitment keeps slot_count slots; the new one gets the rest.
+    assert split.first.name == commitment.name
+    assert (split.first.slot_count, split.second.slot_count) == (300, 700)
+    assert split.second.commitment_end_time == commitment.commitment_end_time
+    assert client.get_capacity_commitment(name=commitment.name).slot_count == 300
+    assert client.get_capacity_commitment(name=split.second.name).slot_count == 700
+
+    with pytest.raises(exceptions.InvalidArgument):
+        client.split_capacity_commitment(name=commitment.name, slot_count=300)
+
+    merged = client.merge_capacity_commitments(
+        parent=PARENT,
+        capacity_commitment_ids=[
+            split.first.name.rsplit("/", 1)[-1],
+            split.second.name.rsplit("/", 1)[-1],
+        ],
+    )
+    assert merged.slot_count == 1000
+    assert len(list(client.list_capacity_commitments(parent=PARENT))) == 1
+
+
+def test_merge_requires_same_plan(client):
+    names = [
+        client.create_capacity_commitment(
+            parent=PARENT,
+            capacity_commitment=reservation.CapacityCommitment(
+                slot_count=100, plan=plan
+            ),
+        ).name
+        for plan in (Plan.FLEX, Plan.ANNUAL)
+    ]
+
+    with pytest.raises(exceptions.FailedPrecondition):
+        client.merge_capacity_commitments(
+            parent=PARENT, capacity_commitment_ids=[n.rsplit("/", 1)[-1] for n in names]
+        )
+
+
+def test_commitment_plan_and_deletion_rules():
+    clock = FakeClock()
+    client = in_process_client(FakeReservationService(clock=clock))
+    commitment = client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=100, plan=Plan.MONTHLY
+        ),
+    )
+
+    with pytest.raises(exceptions.FailedPrecondition):
+        client.delete_capacity_commitment(name=commitment.name)
+    with pytest.raises(exceptions.FailedPrecondition):
+        client.update_capacity_commitment(
+            capacity_commitment=reservation.CapacityCommitment(
+                name=commitment.name, plan=Plan.FLEX
+            ),
+            update_mask=field_mask.FieldMask(paths=["plan"]),
+        )
+
+    clock.now += datetime.timedelta(days=31).total_seconds()
+    client.delete_capacity_commitment(name=commitment.name)
+
+
+def test_enforce_capacity():
+    client = in_process_client(FakeReservationService(enforce_capacity=True))
+
+    with pytest.raises(exceptions.ResourceExhausted):
+        client.create_reservation(
+            parent=PARENT,
+            reservation_id="r",
+            reservation=reservation.Reservation(slot_capacity=100),
+        )
+    client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=100, plan=Plan.FLEX
+        ),
+    )
+    client.create_reservation(
+        parent=PARENT,
+        reservation_id="r",
+        reservation=reservation.Reservation(slot_capacity=100),
+    )
+
+
+def test_pending_commitments():
+    servicer = FakeReservationService(commitments_start_pending=True)
+    client = in_process_client(servicer)
+    commitment = client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=100, plan=Plan.FLEX
+        ),
+    )
+    assert commitment.state == reservation.CapacityCommitment.State.PENDING
+
+    servicer.fail_commitment(commitment.name)
+    failed = client.get_capacity_commitment(name=commitment.name)
+    assert failed.state == reservation.CapacityCommitment.State.FAILED
+    assert failed.failure_status.message
+
+
+def test_assignments(client):
+    first = client.create_reservation(
+        parent=PARENT, reservation_id="first", reservation=reservation.Reservation()
+    ).name
+    second = client.create_reservation(
+        parent=PARENT, reservation_id="second", reservation=reservation.Reservation()
+    ).name
+
+    assignment = client.create_assignment(
+        parent=first,
+        assignment=reservation.Assignment(
+            assignee="projects/p", job_type=JobType.QUERY
+        ),
+    )
+    assert assignment.state == reservation.Assignment.State.ACTIVE
+    with pytest.raises(exceptions.AlreadyExists):
+        client.create_assignment(
+            parent=second,
+            assignment=reservation.Assignment(
+                assignee="projects/p", job_type=JobType.QUERY
+            ),
+        )
+    with pytest.raises(exceptions.FailedPrecondition):
+        client.delete_reservation(name=first)
+
+    moved = client.move_assignment(name=assignment.name, destination_id=second)
+    assert moved.name.startswith(second + "/assignments/")
+    assert moved.name.rsplit("/", 1)[-1] == assignment.name.rsplit("/", 1)[-1]
+    assert list(client.list_assignments(parent=first)) == []
+    assert [
+        a.name for a in client.list_assignments(parent=PARENT + "/reservations/-")
+    ] == [moved.name]
+
+    client.delete_assignment(name=moved.name)
+    assert list(client.list_assignments(parent=second)) == []
+
+
+def test_search_assignments_closest_ancestor(client):
+    name = client.create_reservation(
+        parent=PARENT, reservation_id="r", reservation=reservation.Reservation()
+    ).name
+    for assignee, job_type in [
+        ("organizations/9", JobType.QUERY),
+        ("organizations/9", JobType.PIPELINE),
+        ("folders/1", JobType.QUERY),
+        ("projects/other", JobType.QUERY),
+    ]:
+        client.create_assignment(
+            parent=name,
+            assignment=reservation.Assignment(assignee=assignee, job_type=job_type),
+        )
+
+    found = client.search_assignments(parent=PARENT, query="assignee=projects/p")
+    assert sorted((a.assignee, a.job_type) for a in found) == [
+        ("folders/1", JobType.QUERY),
+        ("organizations/9", JobType.PIPELINE),
+    ]
+
+
+def test_bi_reservation(client):
+    name = PARENT + "/bireservation"
+    assert client.get_bi_reservation(name=name).size == 0
+
+    updated = client.update_bi_reservation(
+        bi_reservation=reservation.BiReservation(name=name, size=1 << 30),
+        update_mask=field_mask.FieldMask(paths=["size"]),
+    )
+    assert updated.size == 1 << 30
+    assert updated.update_time is not None
+    assert client.get_bi_reservation(name=name).size == 1 << 30
+
+    with pytest.raises(exceptions.InvalidArgument):
+        client.get_bi_reservation(name=PARENT)
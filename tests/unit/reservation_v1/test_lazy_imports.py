@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+PACKAGES = (
+    "google.cloud.bigquery.reservation",
+    "google.cloud.bigquery.reservation_v1",
+    "google.cloud.bigquery.reservation_v1.services.reservation_service",
+)
+
+
+def imported_modules(statement):
+    """Return the modules loaded by ``statement`` in a fresh interpreter."""
+    output = subprocess.check_output(
+        [sys.executable, "-c", statement + "\nimport sys\nprint(sorted(sys.modules))"]
+    )
+    return set(eval(output))
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_package_import_is_cheap(package):
+    modules = imported_modules("import " + package)
+
+    assert "grpc" not in modules
+    assert "google.auth" not in modules
+    assert "proto" not in modules
+
+
+def test_path_helpers_do_not_import_grpc():
+    modules = imported_modules(
+        "from google.cloud.bigquery.reservation import ReservationName"
+    )
+
+    assert "grpc" not in modules
+    assert "proto" not in modules
+
+
+@pytest.mark.parametrize("package", PACKAGES)
+def test_exports_resolve(package):
+    module = importlib.import_module(package)
+
+    for name in module.__all__:
+        assert getattr(module, name).__name__ == name
+        assert name in dir(module)
+    with pytest.raises(AttributeError):
+        module.NoSuchName
+
+
+def test_exports_are_shared():
+    from google.cloud.bigquery import reservation
+    from google.cloud.bigquery import reservation_v1
+    from google.cloud.bigquery.reservation_v1.services.reservation_service import client
+
+    assert reservation.ReservationServiceClient is client.ReservationServiceClient
+    assert reservation_v1.ReservationServiceClient is client.ReservationServiceClient
+    assert reservation.Reservation is reservation_v1.Reservation
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from google.api_core import grpc_helpers_async
+from google.auth import credentials
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceAsyncClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import masks
+from google.cloud.bigquery.reservation_v1.testing import in_process_client
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+NAME = "projects/p/locations/US/reservations/r"
+Plan = reservation.CapacityCommitment.CommitmentPlan
+
+
+def test_diff():
+    original = reservation.Reservation(name=NAME, slot_capacity=100)
+    modified = reservation.Reservation(original)
+    modified.ignore_idle_slots = True
+
+    change = masks.diff(original, modified)
+
+    assert change.changed
+    assert change.update_mask.paths == ["ignore_idle_slots"]
+    assert change.message == reservation.Reservation(name=NAME, ignore_idle_slots=True)
+
+
+def test_diff_ignores_output_only_fields():
+    original = reservation.CapacityCommitment(
+        name="projects/p/locations/US/capacityCommitments/1",
+        slot_count=100,
+        plan=Plan.FLEX,
+        state=reservation.CapacityCommitment.State.ACTIVE,
+    )
+    modified = reservation.CapacityCommitment(
+        slot_count=500, plan=Plan.ANNUAL, renewal_plan=Plan.ANNUAL
+    )
+
+    change = masks.diff(original, modified)
+
+    assert change.update_mask.paths == ["plan", "renewal_plan"]
+    assert change.message == reservation.CapacityCommitment(
+        name=original.name, plan=Plan.ANNUAL, renewal_plan=Plan.ANNUAL
+    )
+    assert not masks.diff(original, original).changed
+    assert masks.diff(original, modified, ["slot_count"]).update_mask.paths == [
+        "slot_count"
+    ]
+
+
+def test_invalid_diff():
+    with pytest.raises(TypeError):
+        masks.diff(reservation.Reservation(), reservation.BiReservation())
+    with pytest.raises(ValueError):
+        masks.diff(
+            reservation.Reservation(name=NAME), reservation.Reservation(name=NAME + "2")
+        )
+    with pytest.raises(ValueError):
+        masks.diff(reservation.Assignment(), reservation.Assignment())
+
+
+def test_patch_reservation():
+    client = in_process_client()
+    original = reservation.Reservation(name=NAME, slot_capacity=100)
+    with mock.patch.object(
+        type(client._transport.update_reservation), "__call__"
+    ) as call:
+        assert client.patch_reservation(original, original) is original
+        call.assert_not_called()
+
+        call.return_value = reservation.Reservation(name=NAME, slot_capacity=50)
+        response = client.patch_reservation(
+            original, reservation.Reservation(name=NAME, slot_capacity=50)
+        )
+
+    assert response.slot_capacity == 50
+    _, args, _ = call.mock_calls[0]
+    assert args[0].update_mask.paths == ["slot_capacity"]
+    assert args[0].reservation == reservation.Reservation(name=NAME, slot_capacity=50)
+
+
+def test_patch_bi_reservation():
+    client = in_process_client()
+    original = reservation.BiReservation(
+        name="projects/p/locations/US/bireservation", size=10
+    )
+    with mock.patch.object(
+        type(client._transport.update_bi_reservation), "__call__"
+    ) as call:
+        call.return_value = reservation.BiReservation(name=original.name, size=20)
+        client.patch_bi_reservation(original, reservation.BiReservation(size=20))
+
+    _, args, _ = call.mock_calls[0]
+    assert args[0].update_mask.paths == ["size"]
+    assert args[0].bi_reservation.name == original.name
+
+
+def test_async_patch_capacity_commitment():
+    # Run on a private loop: closing the loop pytest-asyncio installs
+    # leaves none for later tests that create AsyncIO channels.
+    original = reservation.CapacityCommitment(
+        name="projects/p/locations/US/capacityCommitments/1", plan=Plan.FLEX
+    )
+
+    async def patch():
+        client = ReservationServiceAsyncClient(
+            credentials=credentials.AnonymousCredentials()
+        )
+        with mock.patch.object(
+            type(client._client._transport.update_capacity_commitment), "__call__"
+        ) as call:
+            unchanged = await client.patch_capacity_commitment(original, original)
+            assert unchanged is original
+            call.assert_not_called()
+
+            call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+                reservation.CapacityCommitment(name=original.name, plan=Plan.ANNUAL)
+            )
+            response = await client.patch_capacity_commitment(
+                original, reservation.CapacityCommitment(plan=Plan.ANNUAL)
+            )
+        _, args, _ = call.mock_calls[0]
+        assert args[0].update_mask.paths == ["plan"]
+        return response
+
+    loop = asyncio.new_event_loop()
+    try:
+        response = loop.run_until_complete(patch())
+    finally:
+        loop.close()
+
+    assert response.plan == Plan.ANNUAL
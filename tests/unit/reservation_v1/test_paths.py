@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import pytest
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    AssignmentName,
+    BiReservationName,
+    CapacityCommitmentName,
+    ReservationName,
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import paths
+
+
+ASSIGNMENT = "projects/p/locations/US/reservations/r/assignments/1"
+
+
+def test_path_formatting_accepts_non_strings():
+    assert (
+        ReservationServiceClient.capacity_commitment_path("p", "US", 123)
+        == "projects/p/locations/US/capacityCommitments/123"
+    )
+
+
+def test_parse_matches_client_semantics():
+    # The patterns are non-greedy, so a reservation "name" may contain
+    # slashes; the parsers keep that behaviour.
+    assert paths.parse_reservation_path(ASSIGNMENT) == {
+        "project": "p",
+        "location": "US",
+        "reservation": "r/assignments/1",
+    }
+    assert paths.parse_assignment_path("projects/p/locations/US") == {}
+    assert paths.parse_bi_reservation_path("projects/p/locations/US/bireservation") == {
+        "project": "p",
+        "location": "US",
+    }
+
+
+def test_parse_returns_fresh_dicts():
+    first = paths.parse_assignment_path(ASSIGNMENT)
+    first["project"] = "changed"
+    assert paths.parse_assignment_path(ASSIGNMENT)["project"] == "p"
+
+
+def test_batch_parse_columns():
+    columns = paths.parse_assignment_paths(
+        [ASSIGNMENT, "bogus", "projects/q/locations/EU/reservations/s/assignments/2"]
+    )
+
+    assert columns == {
+        "project": ["p", None, "q"],
+        "location": ["US", None, "EU"],
+        "reservation": ["r", None, "s"],
+        "assignment": ["1", None, "2"],
+    }
+    assert paths.parse_capacity_commitment_paths([]) == {
+        "project": [],
+        "location": [],
+        "capacity_commitment": [],
+    }
+
+
+def test_batch_parse_accepts_iterators():
+    names = (
+        ReservationServiceClient.reservation_path("p", "US", "r%d" % i)
+        for i in range(3)
+    )
+    assert paths.parse_reservation_paths(names)["reservation"] == ["r0", "r1", "r2"]
+
+
+def test_resource_names():
+    name = AssignmentName.from_path(ASSIGNMENT)
+
+    assert name == AssignmentName("p", "US", "r", "1")
+    assert str(name) == ASSIGNMENT
+    assert name.parent == ReservationName("p", "US", "r")
+    assert str(name.parent) == "projects/p/locations/US/reservations/r"
+    assert {name: 1}[AssignmentName("p", "US", "r", "1")] == 1
+    assert str(CapacityCommitmentName("p", "US", "7")) == (
+        "projects/p/locations/US/capacityCommitments/7"
+    )
+    assert BiReservationName.from_path(
+        "projects/p/locations/US/bireservation"
+    ) == BiReservationName("p", "US")
+
+    with pytest.raises(ValueError):
+        ReservationName.from_path("projects/p")
+
+
+def test_resource_names_of_different_types_differ():
+    reservation_name = ReservationName("p", "US", "x")
+    commitment_name = CapacityCommitmentName("p", "US", "x")
+
+    assert reservation_name != commitment_name
+    assert not reservation_name == commitment_name
+    assert reservation_name != ("p", "US", "x")
+    assert ("p", "US", "x") != reservation_name
+    assert reservation_name == ReservationName("p", "US", "x")
+    assert not reservation_name != ReservationName("p", "US", "x")
+    assert len({reservation_name, commitment_name, ("p", "US", "x")}) == 3
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from google.api_core import exceptions
+from google.auth import credentials
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    HedgePolicy,
+    MethodPolicy,
+    ReservationServiceClient,
+    RetryPolicy,
+    default_policies,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import transports
+from google.cloud.bigquery.reservation_v1.services.reservation_service.transports import (
+    policy,
+)
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationServer,
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+NAME = "projects/p/locations/US/reservations/r"
+FAST_RETRY = RetryPolicy(initial=0.001, maximum=0.001, deadline=5)
+
+
+def test_default_deadline():
+    client = in_process_client(
+        method_policies={"get_reservation": MethodPolicy(timeout=5)}
+    )
+    with mock.patch.object(type(client._transport.get_reservation), "__call__") as call:
+        call.return_value = reservation.Reservation(name=NAME)
+        client.get_reservation(name=NAME)
+        assert 4 < call.call_args[1]["timeout"] <= 5
+
+        client.get_reservation(name=NAME, timeout=1)
+        assert call.call_args[1]["timeout"] <= 1
+
+
+def test_no_policy_keeps_no_deadline():
+    client = in_process_client(method_policies=None)
+    with mock.patch.object(type(client._transport.get_reservation), "__call__") as call:
+        call.return_value = reservation.Reservation(name=NAME)
+        client.get_reservation(name=NAME)
+        assert "timeout" not in call.call_args[1]
+
+
+def test_retry_unavailable():
+    client = in_process_client(
+        method_policies={"get_reservation": MethodPolicy(retry=FAST_RETRY)}
+    )
+    with mock.patch.object(type(client._transport.get_reservation), "__call__") as call:
+        call.side_effect = [
+            exceptions.ServiceUnavailable("down"),
+            exceptions.DeadlineExceeded("slow"),
+            reservation.Reservation(name=NAME),
+        ]
+        assert client.get_reservation(name=NAME).name == NAME
+        assert call.call_count == 3
+
+
+def test_retry_skips_other_errors():
+    client = in_process_client(
+        method_policies={
+            "get_reservation": MethodPolicy(retry=FAST_RETRY),
+            "create_reservation": MethodPolicy(
+                retry=FAST_RETRY._replace(retry_deadline_exceeded=False)
+            ),
+        }
+    )
+    with mock.patch.object(type(client._transport.get_reservation), "__call__") as call:
+        call.side_effect = exceptions.InvalidArgument("bad")
+        with pytest.raises(exceptions.InvalidArgument):
+            client.get_reservation(name=NAME)
+        assert call.call_count == 1
+
+        call.reset_mock()
+        call.side_effect = exceptions.DeadlineExceeded("slow")
+        with pytest.raises(exceptions.DeadlineExceeded):
+            client.create_reservation(
+                parent="projects/p/locations/US", reservation=reservation.Reservation()
+            )
+        assert call.call_count == 1
+
+
+def test_invalid_policies():
+    with pytest.raises(ValueError):
+        in_process_client(method_policies={"get_reservations": MethodPolicy()})
+    with pytest.raises(ValueError):
+        in_process_client(
+            method_policies={"create_reservation": MethodPolicy(hedge=HedgePolicy())}
+        )
+    with pytest.raises(ValueError):
+        transports.ReservationServiceGrpcAsyncIOTransport(
+            credentials=credentials.AnonymousCredentials(),
+            method_policies={"get_reservation": MethodPolicy(hedge=HedgePolicy())},
+        )
+    with pytest.raises(ValueError):
+        ReservationServiceClient(
+            transport=transports.ReservationServiceGrpcTransport(
+                credentials=credentials.AnonymousCredentials()
+            ),
+            method_policies={},
+        )
+
+
+def test_default_policies():
+    policies = default_policies(timeout=30, hedge=HedgePolicy())
+
+    assert set(policies) == policy.METHODS
+    assert all(p.timeout == 30 for p in policies.values())
+    assert policies["search_assignments"].hedge == HedgePolicy()
+    assert policies["search_assignments"].retry.retry_deadline_exceeded
+    assert policies["create_assignment"].hedge is None
+    assert not policies["create_assignment"].retry.retry_deadline_exceeded
+    in_process_client(method_policies=policies)
+
+
+class FakeStub:
+    """Hands out futures that the test completes by hand."""
+
+    def __init__(self):
+        self.futures = []
+        self.started = threading.Semaphore(0)
+
+    def future(self, request, timeout=None, **kwargs):
+        future = futures.Future()
+        future.timeout = timeout
+        self.futures.append(future)
+        self.started.release()
+        return future
+
+
+def call_in_thread(hedged):
+    result = {}
+
+    def target():
+        try:
+            result["value"] = hedged("request", timeout=10)
+        except Exception as exc:
+            result["error"] = exc
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    return thread, result
+
+
+def test_hedge_takes_first_response():
+    stub = FakeStub()
+    hedged = policy.HedgedCallable(stub, HedgePolicy(initial_delay=0.01))
+    thread, result = call_in_thread(hedged)
+
+    stub.started.acquire()
+    stub.started.acquire()
+    stub.futures[1].set_result("second")
+    thread.join()
+
+    assert result == {"value": "second"}
+    assert stub.futures[0].cancelled()
+    assert stub.futures[1].timeout <= 10
+
+
+def test_hedge_waits_for_the_other_attempt_after_an_error():
+    stub = FakeStub()
+    hedged = policy.HedgedCallable(stub, HedgePolicy(initial_delay=0.01))
+    thread, result = call_in_thread(hedged)
+
+    stub.started.acquire()
+    stub.started.acquire()
+    error = RuntimeError("first")
+    stub.futures[0].set_exception(error)
+    stub.futures[1].set_result("second")
+    thread.join()
+
+    assert result == {"value": "second"}
+
+
+def test_hedge_raises_when_every_attempt_fails():
+    stub = FakeStub()
+    hedged = policy.HedgedCallable(stub, HedgePolicy(initial_delay=0.01))
+    thread, result = call_in_thread(hedged)
+
+    stub.started.acquire()
+    stub.started.acquire()
+    error = RuntimeError("first")
+    stub.futures[1].set_exception(error)
+    stub.futures[0].set_exception(RuntimeError("second"))
+    thread.join()
+
+    assert result == {"error": error}
+    assert len(stub.futures) == 2
+
+
+def test_fast_failure_is_not_hedged():
+    stub = FakeStub()
+    hedged = policy.HedgedCallable(stub, HedgePolicy(initial_delay=10))
+    thread, result = call_in_thread(hedged)
+
+    stub.started.acquire()
+    error = RuntimeError("down")
+    stub.futures[0].set_exception(error)
+    thread.join()
+
+    assert result == {"error": error}
+    assert len(stub.futures) == 1
+
+
+def test_hedge_records_the_latency_of_the_whole_call():
+    stub = FakeStub()
+    hedged = policy.HedgedCallable(stub, HedgePolicy(initial_delay=0.05, min_samples=1))
+    thread, result = call_in_thread(hedged)
+
+    stub.started.acquire()
+    stub.started.acquire()
+    stub.futures[1].set_result("second")
+    thread.join()
+
+    # Timed from the first attempt, so at least the hedging delay.
+    assert result == {"value": "second"}
+    assert hedged._latencies.delay() >= 0.05
+
+
+def test_hedge_delay_follows_latency_percentile():
+    latencies = policy._Latencies(
+        HedgePolicy(percentile=90, initial_delay=5, min_samples=10)
+    )
+    for latency in range(9):
+        latencies.record(latency / 100)
+    assert latencies.delay() == 5
+
+    latencies.record(0.09)
+    assert latencies.delay() == pytest.approx(0.08)
+
+
+class SlowFirstService(FakeReservationService):
+    """Holds the first get for up to a second, or until ``release`` is
+    set."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.release = threading.Event()
+
+    def GetReservation(self, request, context):
+        self.calls += 1
+        if self.calls == 1:
+            self.release.wait(1)
+        return super().GetReservation(request, context)
+
+
+def test_hedging_end_to_end():
+    servicer = SlowFirstService()
+    with FakeReservationServer(servicer) as server:
+        client = ReservationServiceClient(
+            transport=transports.ReservationServiceGrpcTransport(
+                channel=server.channel(),
+                method_policies={
+                    "get_reservation": MethodPolicy(
+                        timeout=10, hedge=HedgePolicy(initial_delay=0.05)
+                    )
+                },
+            )
+        )
+        created = client.create_reservation(
+            parent="projects/p/locations/US",
+            reservation_id="r",
+            reservation=reservation.Reservation(),
+        )
+
+        start = time.monotonic()
+        assert client.get_reservation(name=created.name).name == created.name
+        assert time.monotonic() - start < 0.9
+        assert servicer.calls == 2
+
+
+def test_hedging_in_process():
+    servicer = SlowFirstService()
+    client = in_process_client(
+        servicer,
+        method_policies={
+            "get_reservation": MethodPolicy(
+                timeout=10, hedge=HedgePolicy(initial_delay=0.05)
+            )
+        },
+    )
+    created = client.create_reservation(
+        parent="projects/p/locations/US",
+        reservation_id="r",
+        reservation=reservation.Reservation(),
+    )
+
+    start = time.monotonic()
+    try:
+        assert client.get_reservation(name=created.name).name == created.name
+        assert time.monotonic() - start < 0.9
+        assert servicer.calls == 2
+    finally:
+        servicer.release.set()
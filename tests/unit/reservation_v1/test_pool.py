@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+from unittest import mock
+
+import grpc
+import pytest
+
+from google.auth import credentials
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service.transports import (
+    ChannelPool,
+    ReservationServiceGrpcTransport,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service.transports import (
+    pool,
+)
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_channel,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+
+def mock_channels(count):
+    channels = [mock.Mock(spec=grpc.Channel) for _ in range(count)]
+    for index, channel in enumerate(channels):
+        channel.unary_unary.return_value = mock.Mock(return_value=index)
+    return channels
+
+
+def test_round_robin():
+    channel_pool = ChannelPool(mock_channels(3))
+    rpc = channel_pool.unary_unary("/Service/Method")
+
+    assert [rpc(None) for _ in range(6)] == [0, 1, 2, 0, 1, 2]
+    assert channel_pool.in_flight() == [0, 0, 0]
+
+
+def test_least_loaded_avoids_busy_channels():
+    channels = mock_channels(3)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block(request, **kwargs):
+        started.set()
+        release.wait()
+        return 0
+
+    channels[0].unary_unary.return_value = mock.Mock(side_effect=block)
+    channel_pool = ChannelPool(channels, policy=pool.LEAST_LOADED)
+    rpc = channel_pool.unary_unary("/Service/Method")
+
+    thread = threading.Thread(target=rpc, args=(None,))
+    thread.start()
+    started.wait()
+    try:
+        assert channel_pool.in_flight() == [1, 0, 0]
+        assert 0 not in [rpc(None) for _ in range(4)]
+    finally:
+        release.set()
+        thread.join()
+    assert channel_pool.in_flight() == [0, 0, 0]
+
+
+def test_future_releases_when_done():
+    channels = mock_channels(2)
+    callbacks = []
+    future = mock.Mock()
+    future.add_done_callback.side_effect = callbacks.append
+    channels[0].unary_unary.return_value.future.return_value = future
+    channel_pool = ChannelPool(channels)
+
+    assert channel_pool.unary_unary("/Service/Method").future(None) is future
+    assert channel_pool.in_flight() == [1, 0]
+    callbacks[0](future)
+    assert channel_pool.in_flight() == [0, 0]
+
+
+def test_failed_call_releases():
+    channels = mock_channels(1)
+    channels[0].unary_unary.return_value.side_effect = RuntimeError
+    channel_pool = ChannelPool(channels)
+
+    with pytest.raises(RuntimeError):
+        channel_pool.unary_unary("/Service/Method")(None)
+    assert channel_pool.in_flight() == [0]
+
+
+def test_close_closes_every_channel():
+    channels = mock_channels(2)
+    with ChannelPool(channels):
+        pass
+    for channel in channels:
+        channel.close.assert_called_once_with()
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ChannelPool([])
+    with pytest.raises(ValueError):
+        ChannelPool(mock_channels(1), policy="random")
+    with pytest.raises(ValueError):
+        ReservationServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(), channel_pool_size=0
+        )
+
+
+def test_transport_creates_pool():
+    with mock.patch.object(
+        ReservationServiceGrpcTransport, "create_channel", autospec=True
+    ) as create_channel:
+        transport = ReservationServiceGrpcTransport(
+            credentials=credentials.AnonymousCredentials(),
+            channel_pool_size=3,
+            channel_pool_policy=pool.LEAST_LOADED,
+        )
+
+    assert isinstance(transport.grpc_channel, ChannelPool)
+    assert len(transport.grpc_channel.channels) == 3
+    assert create_channel.call_count == 3
+    for call in create_channel.call_args_list:
+        assert call[1]["options"] == [pool.LOCAL_SUBCHANNEL_POOL_OPTION]
+
+
+def test_transport_defaults_to_single_channel():
+    transport = ReservationServiceGrpcTransport(
+        credentials=credentials.AnonymousCredentials()
+    )
+    assert not isinstance(transport.grpc_channel, ChannelPool)
+
+
+def test_pooled_calls_reach_the_server():
+    servicer = FakeReservationService()
+    channel_pool = ChannelPool([in_process_channel(servicer) for _ in range(2)])
+    client = ReservationServiceClient(
+        transport=ReservationServiceGrpcTransport(channel=channel_pool)
+    )
+    parent = "projects/p/locations/US"
+
+    for reservation_id in ("a", "b", "c"):
+        client.create_reservation(
+            parent=parent,
+            reservation_id=reservation_id,
+            reservation=reservation.Reservation(),
+        )
+
+    assert [r.name for r in client.list_reservations(parent=parent)] == [
+        parent + "/reservations/" + reservation_id for reservation_id in "abc"
+    ]
+    assert channel_pool.in_flight() == [0, 0]
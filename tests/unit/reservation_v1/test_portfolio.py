@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import collections
+import itertools
+
+import pytest
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    portfolio,
+    reconcile,
+)
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+PARENT = "projects/admin/locations/US"
+Plan = reservation.CapacityCommitment.CommitmentPlan
+State = reservation.CapacityCommitment.State
+
+_ids = itertools.count(1)
+
+
+def commitment(plan, slot_count, state=State.ACTIVE, renewal_plan=None):
+    return reservation.CapacityCommitment(
+        name="%s/capacityCommitments/%d" % (PARENT, next(_ids)),
+        plan=plan,
+        slot_count=slot_count,
+        state=state,
+        renewal_plan=renewal_plan,
+    )
+
+
+def summary(steps):
+    return [(step.method, step.after) for step in steps]
+
+
+def test_whole_commitments_are_converted_and_deleted():
+    flex = [commitment(Plan.FLEX, n) for n in (500, 300, 200)]
+    annual = commitment(Plan.ANNUAL, 1000)
+
+    result = portfolio.plan(flex + [annual], {Plan.ANNUAL: 1300, Plan.FLEX: 200})
+
+    assert summary(result.steps) == [
+        ("update_capacity_commitment", ()),
+        ("delete_capacity_commitment", ()),
+    ]
+    conversion = result.steps[0].request
+    assert conversion.capacity_commitment.name == flex[1].name
+    assert conversion.capacity_commitment.plan == Plan.ANNUAL
+    assert conversion.update_mask.paths == ["plan"]
+    assert result.steps[1].request.name == flex[0].name
+    assert result.stranded == {}
+
+
+def test_a_commitment_is_split_when_nothing_fits():
+    flex = commitment(Plan.FLEX, 500)
+
+    result = portfolio.plan([flex], {Plan.ANNUAL: 200, Plan.FLEX: 300})
+
+    assert summary(result.steps) == [
+        ("split_capacity_commitment", ()),
+        ("update_capacity_commitment", (0,)),
+    ]
+    # The named commitment keeps the 200 slots converted.
+    assert result.steps[0].request.name == flex.name
+    assert result.steps[0].request.slot_count == 200
+    assert result.steps[1].request.capacity_commitment.name == flex.name
+
+
+def test_surplus_that_would_be_stranded_is_used_first():
+    monthly = commitment(Plan.MONTHLY, 300)
+    flex = commitment(Plan.FLEX, 300)
+
+    result = portfolio.plan([monthly, flex], {Plan.ANNUAL: 300, Plan.FLEX: 300})
+
+    assert [s.request.capacity_commitment.name for s in result.steps] == [monthly.name]
+    assert result.stranded == {}
+
+
+def test_annual_surplus_is_stranded_and_set_to_renew_as_flex():
+    annual = [commitment(Plan.ANNUAL, n) for n in (500, 300, 200)]
+    annual.append(commitment(Plan.ANNUAL, 100, renewal_plan=Plan.FLEX))
+
+    result = portfolio.plan(annual, {Plan.ANNUAL: 700})
+
+    assert result.stranded == {Plan.ANNUAL: 400}
+    assert [s.request.capacity_commitment.name for s in result.steps] == [
+        annual[1].name
+    ]
+    assert result.steps[0].request.capacity_commitment.renewal_plan == Plan.FLEX
+    assert result.steps[0].request.update_mask.paths == ["renewal_plan"]
+
+
+def test_shortfall_is_bought_and_plans_consolidated():
+    flex = [commitment(Plan.FLEX, 100), commitment(Plan.FLEX, 100)]
+    pending = commitment(Plan.MONTHLY, 100, state=State.PENDING)
+    monthly = commitment(Plan.MONTHLY, 100)
+
+    result = portfolio.plan(
+        flex + [pending, monthly],
+        {Plan.MONTHLY: 400, Plan.ANNUAL: 100},
+        consolidate=True,
+    )
+
+    assert summary(result.steps) == [
+        ("update_capacity_commitment", ()),
+        ("update_capacity_commitment", ()),
+        ("create_capacity_commitment", ()),
+        ("merge_capacity_commitments", (1,)),
+    ]
+    assert result.complete
+    assert result.steps[0].request.capacity_commitment.plan == Plan.ANNUAL
+    assert result.steps[2].request.parent == PARENT
+    assert result.steps[2].request.capacity_commitment.slot_count == 100
+    assert result.steps[2].request.capacity_commitment.plan == Plan.MONTHLY
+    assert result.steps[3].request.capacity_commitment_ids == [
+        monthly.name.rsplit("/", 1)[-1],
+        flex[1].name.rsplit("/", 1)[-1],
+    ]
+
+
+def test_invalid_plan():
+    with pytest.raises(ValueError):
+        portfolio.plan([], {Plan.TRIAL: 100})
+    with pytest.raises(ValueError):
+        portfolio.plan([], {Plan.FLEX: -1})
+    with pytest.raises(ValueError):
+        portfolio.plan([], {Plan.FLEX: 100})
+    with pytest.raises(ValueError):
+        portfolio.plan(
+            [commitment(Plan.FLEX, 100)], {}, parent="projects/other/locations/US"
+        )
+
+
+def test_thousands_of_commitments():
+    commitments = [commitment(Plan.FLEX, 100 * (i % 7 + 1)) for i in range(5000)]
+    total = sum(c.slot_count for c in commitments)
+
+    result = portfolio.plan(commitments, {Plan.ANNUAL: 12345, Plan.FLEX: total - 20000})
+
+    methods = collections.Counter(step.method for step in result.steps)
+    assert methods["split_capacity_commitment"] <= 2
+    assert methods["update_capacity_commitment"] < 20
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1600000000.0
+
+    def __call__(self):
+        return self.now
+
+
+def plan_totals(client):
+    totals = collections.Counter()
+    for c in client.list_capacity_commitments(parent=PARENT):
+        totals[c.plan] += c.slot_count
+    return totals
+
+
+def test_apply_releases_split_surplus():
+    clock = FakeClock()
+    client = in_process_client(FakeReservationService(clock=clock))
+    client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            plan=Plan.FLEX, slot_count=100
+        ),
+    )
+    clock.now += 3600
+
+    result = portfolio.plan(
+        client.list_capacity_commitments(parent=PARENT), {Plan.FLEX: 70}
+    )
+    results = list(reconcile.apply(client, result.steps))
+
+    assert all(r.ok for r in results), [r.error for r in results]
+    assert plan_totals(client) == {Plan.FLEX: 70}
+
+
+def test_apply_reaches_the_target():
+    clock = FakeClock()
+    servicer = FakeReservationService(clock=clock)
+    client = in_process_client(servicer)
+    for plan, slot_count in [(Plan.FLEX, 500), (Plan.FLEX, 400), (Plan.MONTHLY, 100)]:
+        client.create_capacity_commitment(
+            parent=PARENT,
+            capacity_commitment=reservation.CapacityCommitment(
+                plan=plan, slot_count=slot_count
+            ),
+        )
+    clock.now += 3600
+    target = {Plan.ANNUAL: 300, Plan.MONTHLY: 300, Plan.FLEX: 100}
+
+    # The first plan splits both FLEX commitments; deleting the surplus
+    # split off needs a second one.
+    for complete in (False, True):
+        result = portfolio.plan(
+            client.list_capacity_commitments(parent=PARENT), target, consolidate=True
+        )
+        assert result.complete == complete
+        results = list(reconcile.apply(client, result.steps))
+        assert all(r.ok for r in results), [r.error for r in results]
+        clock.now += 3600
+
+    final = portfolio.plan(client.list_capacity_commitments(parent=PARENT), target)
+    assert final == ([], {}, True)
+    totals = collections.Counter()
+    counts = collections.Counter()
+    for c in client.list_capacity_commitments(parent=PARENT):
+        totals[c.plan] += c.slot_count
+        counts[c.plan] += 1
+    assert totals == target
+    assert counts[Plan.MONTHLY] == 1
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from unittest import mock
+
+import grpc
+import pytest
+
+from google.api_core import exceptions
+from google.api_core import grpc_helpers_async
+from google.auth import credentials
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    RateLimiter,
+    ReservationServiceAsyncClient,
+    ReservationServiceClient,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service.transports import (
+    ratelimit,
+)
+from google.cloud.bigquery.reservation_v1.testing import in_process_client
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Exhausted(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.RESOURCE_EXHAUSTED
+
+    def details(self):
+        return "quota exceeded"
+
+    def trailing_metadata(self):
+        return None
+
+
+def test_project_of():
+    assert (
+        ratelimit.project_of(
+            reservation.ListReservationsRequest(parent="projects/a/locations/US")
+        )
+        == "a"
+    )
+    assert (
+        ratelimit.project_of(
+            reservation.GetReservationRequest(
+                name="projects/b/locations/US/reservations/r"
+            )
+        )
+        == "b"
+    )
+    request = reservation.UpdateReservationRequest(
+        reservation=reservation.Reservation(
+            name="projects/c/locations/US/reservations/r"
+        )
+    )
+    assert ratelimit.project_of(request) == "c"
+    assert ratelimit.project_of(reservation.GetReservationRequest()) is None
+
+
+def test_bucket_paces_calls():
+    clock = FakeClock()
+    bucket = ratelimit.TokenBucket(rate=2, burst=2, min_rate=0.1, clock=clock)
+
+    assert [bucket.take() for _ in range(4)] == [0, 0, 0.5, 1.0]
+    clock.now = 10
+    assert bucket.take() == 0
+
+
+def test_bucket_adapts():
+    clock = FakeClock()
+    bucket = ratelimit.TokenBucket(rate=10, burst=1, min_rate=1, clock=clock)
+
+    bucket.decrease(0.5, cooldown=1)
+    bucket.decrease(0.5, cooldown=1)
+    assert bucket.rate == 5
+    clock.now = 1
+    for _ in range(4):
+        bucket.decrease(0.5, cooldown=0)
+    assert bucket.rate == 1
+
+    for _ in range(20):
+        bucket.increase(0.1)
+    assert bucket.rate == 10
+
+
+def test_limiter_combines_project_and_method_buckets():
+    clock = FakeClock()
+    limiter = RateLimiter(
+        project_rate=10, method_rates={"create_assignment": 1}, burst=0, clock=clock
+    )
+
+    assert limiter.reserve("create_assignment", "a") == 0
+    assert limiter.reserve("create_assignment", "a") == pytest.approx(1)
+    assert limiter.reserve("create_assignment", "b") == 0
+    assert limiter.reserve("get_reservation", "a") == pytest.approx(0.2)
+    assert limiter.rate("create_assignment", "a") == 1
+    assert limiter.rate("get_reservation", "a") == 10
+    assert RateLimiter().rate("get_reservation", "a") is None
+
+
+def test_invalid_limiter():
+    with pytest.raises(ValueError):
+        RateLimiter(method_rates={"create_assignments": 1})
+    with pytest.raises(ValueError):
+        RateLimiter(project_rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(decrease=1)
+    with pytest.raises(ValueError):
+        RateLimiter(max_attempts=0)
+
+
+def test_client_calls_are_paced():
+    limiter = RateLimiter(project_rate=5, burst=0)
+    client = in_process_client(rate_limiter=limiter)
+    with mock.patch.object(ratelimit.time, "sleep") as sleep, mock.patch.object(
+        type(client._transport.create_assignment), "__call__"
+    ) as call:
+        call.return_value = reservation.Assignment()
+        for _ in range(3):
+            client.create_assignment(parent="projects/p/locations/US/reservations/r")
+
+    assert call.call_count == 3
+    assert sleep.call_count == 2
+
+
+def test_resource_exhausted_lowers_the_rate_and_is_retried():
+    limiter = RateLimiter(project_rate=100, max_attempts=2)
+    client = in_process_client(rate_limiter=limiter)
+    with mock.patch.object(ratelimit.time, "sleep"), mock.patch.object(
+        type(client._transport.create_assignment), "__call__"
+    ) as call:
+        call.side_effect = [Exhausted(), reservation.Assignment(name="a")]
+        response = client.create_assignment(
+            parent="projects/p/locations/US/reservations/r"
+        )
+        assert response.name == "a"
+        assert limiter.rate("create_assignment", "p") < 100
+
+        call.side_effect = Exhausted()
+        with pytest.raises(exceptions.ResourceExhausted):
+            client.create_assignment(parent="projects/p/locations/US/reservations/r")
+
+
+def test_waiting_and_retries_count_towards_the_timeout():
+    clock = FakeClock()
+    limiter = RateLimiter(project_rate=1, burst=0, cooldown=0, clock=clock)
+    client = in_process_client(rate_limiter=limiter)
+
+    def sleep(seconds):
+        clock.now += seconds
+
+    with mock.patch.object(ratelimit.time, "sleep", sleep), mock.patch.object(
+        type(client._transport.create_assignment), "__call__"
+    ) as call:
+        call.side_effect = [Exhausted(), reservation.Assignment(name="a")]
+        response = client.create_assignment(
+            parent="projects/p/locations/US/reservations/r", timeout=10
+        )
+        assert response.name == "a"
+        # The retry waited 2 s for a token at the halved rate.
+        assert [c[1]["timeout"] for c in call.call_args_list] == [10, 8]
+
+        call.reset_mock()
+        call.side_effect = [Exhausted()]
+        with pytest.raises(exceptions.DeadlineExceeded):
+            client.create_assignment(
+                parent="projects/p/locations/US/reservations/r", timeout=3
+            )
+        # The retry would have waited past the deadline.
+        assert call.call_count == 1
+
+
+def test_limiter_and_transport_instance():
+    with pytest.raises(ValueError):
+        ReservationServiceClient(
+            transport=ReservationServiceClient.get_transport_class()(
+                credentials=credentials.AnonymousCredentials()
+            ),
+            rate_limiter=RateLimiter(),
+        )
+
+
+def test_async_client_calls_are_paced():
+    # Run on a private loop: closing the loop pytest-asyncio installs
+    # leaves none for later tests that create AsyncIO channels.
+    limiter = RateLimiter(project_rate=100, max_attempts=2)
+
+    async def get_reservation():
+        client = ReservationServiceAsyncClient(
+            credentials=credentials.AnonymousCredentials(), rate_limiter=limiter
+        )
+        with mock.patch.object(
+            type(client._client._transport.get_reservation), "__call__"
+        ) as call:
+            call.side_effect = [
+                Exhausted(),
+                grpc_helpers_async.FakeUnaryUnaryCall(
+                    reservation.Reservation(name="r")
+                ),
+            ]
+            response = await client.get_reservation(
+                name="projects/p/locations/US/reservations/r", timeout=30
+            )
+        assert call.call_count == 2
+        timeouts = [c[1]["timeout"] for c in call.call_args_list]
+        assert 30 >= timeouts[0] > timeouts[1] > 0
+        return response
+
+    loop = asyncio.new_event_loop()
+    try:
+        response = loop.run_until_complete(get_reservation())
+    finally:
+        loop.close()
+
+    assert response.name == "r"
+    assert limiter.rate("get_reservation", "p") < 100
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    DesiredAssignment,
+    ReconcileStep,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import reconcile
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+PARENT = "projects/admin/locations/US"
+QUERY = reservation.Assignment.JobType.QUERY
+
+
+def name(reservation_id):
+    return PARENT + "/reservations/" + reservation_id
+
+
+def populate(client):
+    """Create a (200 slots), b (100) and c (0), assigning x to a, y to b and
+    z to c."""
+    client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=300, plan=reservation.CapacityCommitment.CommitmentPlan.FLEX
+        ),
+    )
+    for reservation_id, slots, assignee in [
+        ("a", 200, "x"),
+        ("b", 100, "y"),
+        ("c", 0, "z"),
+    ]:
+        client.create_reservation(
+            parent=PARENT,
+            reservation_id=reservation_id,
+            reservation=reservation.Reservation(slot_capacity=slots),
+        )
+        client.create_assignment(
+            parent=name(reservation_id),
+            assignment=reservation.Assignment(
+                assignee="projects/" + assignee, job_type=QUERY
+            ),
+        )
+
+
+def state(client):
+    reservations = {
+        r.name: r.slot_capacity for r in client.list_reservations(parent=PARENT)
+    }
+    assignments = {
+        a.assignee: a.name.split("/assignments/")[0]
+        for a in client.list_assignments(parent=name("-"))
+    }
+    return reservations, assignments
+
+
+DESIRED_RESERVATIONS = [
+    reservation.Reservation(name=name("a"), slot_capacity=100),
+    reservation.Reservation(name=name("b"), slot_capacity=200),
+    reservation.Reservation(name=name("d"), ignore_idle_slots=True),
+]
+DESIRED_ASSIGNMENTS = [
+    DesiredAssignment(name("a"), "projects/x", QUERY),
+    DesiredAssignment(name("d"), "projects/y", QUERY),
+    DesiredAssignment(name("b"), "projects/w", QUERY),
+]
+
+
+def test_plan():
+    client = in_process_client()
+    populate(client)
+
+    steps = reconcile.plan(
+        client, [PARENT], DESIRED_RESERVATIONS, DESIRED_ASSIGNMENTS, prune=True
+    )
+
+    assert [(step.method, step.after) for step in steps] == [
+        ("update_reservation", ()),
+        ("create_reservation", ()),
+        ("move_assignment", (1,)),
+        ("delete_assignment", ()),
+        ("create_assignment", ()),
+        ("delete_reservation", (3,)),
+        ("update_reservation", (0, 5)),
+    ]
+    assert steps[0].request.reservation.name == name("a")
+    assert steps[0].request.update_mask.paths == ["slot_capacity"]
+    assert steps[1].request.reservation_id == "d"
+    assert steps[1].request.reservation.ignore_idle_slots
+    assert steps[2].request.destination_id == name("d")
+    assert steps[5].request.name == name("c")
+    assert steps[6].request.reservation.slot_capacity == 200
+
+
+def test_plan_without_prune_keeps_the_rest():
+    client = in_process_client()
+    populate(client)
+
+    steps = reconcile.plan(client, [PARENT], DESIRED_RESERVATIONS, DESIRED_ASSIGNMENTS)
+
+    assert "delete_reservation" not in [step.method for step in steps]
+    assert "delete_assignment" not in [step.method for step in steps]
+
+
+def test_apply_reaches_the_desired_state():
+    client = in_process_client(FakeReservationService(enforce_capacity=True))
+    populate(client)
+    steps = reconcile.plan(
+        client, [PARENT], DESIRED_RESERVATIONS, DESIRED_ASSIGNMENTS, prune=True
+    )
+
+    results = list(reconcile.apply(client, steps, max_concurrency=4))
+
+    assert sorted(result.index for result in results) == list(range(len(steps)))
+    assert all(result.ok for result in results)
+    assert state(client) == (
+        {name("a"): 100, name("b"): 200, name("d"): 0},
+        {"projects/x": name("a"), "projects/y": name("d"), "projects/w": name("b")},
+    )
+    assert (
+        reconcile.plan(
+            client, [PARENT], DESIRED_RESERVATIONS, DESIRED_ASSIGNMENTS, prune=True
+        )
+        == []
+    )
+
+
+def make_full(client):
+    """Commit 300 slots, all reserved by a, to which x is assigned."""
+    client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=300, plan=reservation.CapacityCommitment.CommitmentPlan.FLEX
+        ),
+    )
+    client.create_reservation(
+        parent=PARENT,
+        reservation_id="a",
+        reservation=reservation.Reservation(slot_capacity=300),
+    )
+    client.create_assignment(
+        parent=name("a"),
+        assignment=reservation.Assignment(assignee="projects/x", job_type=QUERY),
+    )
+
+
+@pytest.mark.parametrize(
+    "desired,prune,expected",
+    [
+        (
+            [
+                reservation.Reservation(name=name("a")),
+                reservation.Reservation(name=name("b"), slot_capacity=300),
+            ],
+            False,
+            {name("a"): 0, name("b"): 300},
+        ),
+        (
+            [reservation.Reservation(name=name("b"), slot_capacity=300)],
+            True,
+            {name("b"): 300},
+        ),
+    ],
+)
+def test_apply_creates_within_freed_slots(desired, prune, expected):
+    client = in_process_client(FakeReservationService(enforce_capacity=True))
+    make_full(client)
+    assignments = [DesiredAssignment(name("b"), "projects/x", QUERY)]
+    steps = reconcile.plan(client, [PARENT], desired, assignments, prune=prune)
+    # b is created empty, then grown after the create and a's freeing step.
+    (create,) = [step for step in steps if step.method == "create_reservation"]
+    assert create.request.reservation.slot_capacity == 0
+    grow = steps[-1]
+    assert grow.request.reservation.name == name("b")
+    assert grow.request.reservation.slot_capacity == 300
+    assert steps.index(create) in grow.after and len(grow.after) == 2
+
+    results = list(reconcile.apply(client, steps, max_concurrency=4))
+
+    assert [result.error for result in results if not result.ok] == []
+    assert state(client) == (expected, {"projects/x": name("b")})
+    assert reconcile.plan(client, [PARENT], desired, assignments, prune=prune) == []
+
+
+def test_apply_skips_the_dependents_of_a_failed_step():
+    client = in_process_client()
+    populate(client)
+    steps = [
+        ReconcileStep(
+            "delete_reservation",
+            reservation.DeleteReservationRequest(name=name("missing")),
+            (),
+        ),
+        ReconcileStep(
+            "delete_reservation",
+            reservation.DeleteReservationRequest(name=name("a")),
+            (0,),
+        ),
+        ReconcileStep(
+            "get_reservation", reservation.GetReservationRequest(name=name("a")), (1,)
+        ),
+        ReconcileStep(
+            "get_reservation", reservation.GetReservationRequest(name=name("b")), ()
+        ),
+    ]
+
+    results = sorted(reconcile.apply(client, steps), key=lambda result: result.index)
+
+    assert isinstance(results[0].error, exceptions.NotFound)
+    assert isinstance(results[1].error, futures.CancelledError)
+    assert isinstance(results[2].error, futures.CancelledError)
+    assert results[3].response.name == name("b")
+    assert name("a") in state(client)[0]
+
+
+def test_invalid_desired_state():
+    with pytest.raises(ValueError):
+        reconcile.plan(
+            None,
+            [PARENT],
+            [
+                reservation.Reservation(
+                    name="projects/other/locations/US/reservations/a"
+                )
+            ],
+        )
+    with pytest.raises(ValueError):
+        reconcile.plan(
+            None, [PARENT], [], [DesiredAssignment(name("a"), "projects/x", QUERY)]
+        )
+    with pytest.raises(ValueError):
+        reconcile.plan(
+            None,
+            [PARENT],
+            [reservation.Reservation(name=name("a"))],
+            [DesiredAssignment(name("a"), "projects/x", QUERY)] * 2,
+        )
+    with pytest.raises(ValueError):
+        reconcile.apply(None, [], max_concurrency=0)
@@ -18,13 +18,20 @@
 from unittest import mock
 
 import grpc
+from grpc import aio
 import math
 import pytest
+import time
 
 from google import auth
 from google.api_core import client_options
+from google.api_core import gapic_v1
 from google.api_core import grpc_helpers
+from google.api_core import grpc_helpers_async
 from google.auth import credentials
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceAsyncClient,
+)
 from google.cloud.bigquery.reservation_v1.services.reservation_service import (
     ReservationServiceClient,
 )
@@ -1923,6 +1930,25 @@ def test_transport_grpc_default():
     assert isinstance(client._transport, transports.ReservationServiceGrpcTransport)
 
 
+def test_transport_wrapped_methods_precomputed():
+    client = ReservationServiceClient(credentials=credentials.AnonymousCredentials())
+
+    # Every RPC should be wrapped exactly once, when the transport is built.
+    assert len(client._transport._wrapped_methods) == 19
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._transport.get_reservation), "__call__"
+    ) as call, mock.patch.object(gapic_v1.method, "wrap_method") as wrap_method:
+        call.return_value = reservation.Reservation()
+        client.get_reservation(name="name_value")
+        client.get_reservation(name="name_value")
+
+        # Calls reuse the precomputed wrapper instead of wrapping again.
+        wrap_method.assert_not_called()
+        assert len(call.mock_calls) == 2
+
+
 def test_reservation_service_base_transport():
     # Instantiate the base transport.
     transport = transports.ReservationServiceTransport(
@@ -2181,3 +2207,426 @@ def test_parse_bi_reservation_path():
     # Check that the path construction is reversible.
     actual = ReservationServiceClient.parse_bi_reservation_path(path)
     assert expected == actual
+
+
+def test_reservation_service_async_client_from_service_account_file():
+    creds = credentials.AnonymousCredentials()
+    with mock.patch.object(
+        service_account.Credentials, "from_service_account_file"
+    ) as factory:
+        factory.return_value = creds
+        client = ReservationServiceAsyncClient.from_service_account_file(
+            "dummy/file/path.json"
+        )
+        assert isinstance(client, ReservationServiceAsyncClient)
+        assert client._client._transport._credentials == creds
+
+        client = ReservationServiceAsyncClient.from_service_account_json(
+            "dummy/file/path.json"
+        )
+        assert client._client._transport._credentials == creds
+
+
+def test_transport_grpc_asyncio_default():
+    # The AsyncIO client should use the gRPC AsyncIO transport by default.
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials()
+    )
+    assert isinstance(
+        client._client._transport, transports.ReservationServiceGrpcAsyncIOTransport
+    )
+    assert len(client._client._transport._wrapped_methods) == 19
+
+
+def test_reservation_service_async_client_client_options():
+    options = client_options.ClientOptions(api_endpoint="squid.clam.whelk")
+    with mock.patch(
+        "google.cloud.bigquery.reservation_v1.services.reservation_service.transports.ReservationServiceGrpcAsyncIOTransport.__init__"
+    ) as grpc_transport:
+        grpc_transport.return_value = None
+        client = ReservationServiceAsyncClient(client_options=options)
+        grpc_transport.assert_called_once_with(
+            api_mtls_endpoint=None,
+            client_cert_source=None,
+            credentials=None,
+            host="squid.clam.whelk",
+        )
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_async(transport: str = "grpc_asyncio"):
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials(), transport=transport
+    )
+
+    # Everything is optional in proto3 as far as the runtime is concerned,
+    # and we are mocking out the actual API, so just send an empty request.
+    request = gcbr_reservation.CreateReservationRequest()
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._client._transport.create_reservation), "__call__"
+    ) as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            gcbr_reservation.Reservation(
+                name="name_value", slot_capacity=1391, ignore_idle_slots=True
+            )
+        )
+
+        response = await client.create_reservation(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+
+        assert args[0] == request
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, gcbr_reservation.Reservation)
+    assert response.name == "name_value"
+    assert response.slot_capacity == 1391
+    assert response.ignore_idle_slots is True
+
+
+@pytest.mark.asyncio
+async def test_get_reservation_field_headers_async():
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials()
+    )
+
+    # Any value that is part of the HTTP/1.1 URI should be sent as
+    # a field header. Set these to a non-empty value.
+    request = reservation.GetReservationRequest(name="name/value")
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._client._transport.get_reservation), "__call__"
+    ) as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(
+            reservation.Reservation()
+        )
+        await client.get_reservation(request)
+
+        # Establish that the underlying gRPC stub method was called.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0] == request
+
+    # Establish that the field header was sent.
+    _, _, kw = call.mock_calls[0]
+    assert ("x-goog-request-params", "name=name/value") in kw["metadata"]
+
+
+@pytest.mark.asyncio
+async def test_delete_assignment_flattened_async():
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials()
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._client._transport.delete_assignment), "__call__"
+    ) as call:
+        # Designate an appropriate return value for the call.
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(None)
+
+        # Call the method with a truthy value for each flattened field,
+        # using the keyword arguments to the method.
+        response = await client.delete_assignment(name="name_value")
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(call.mock_calls) == 1
+        _, args, _ = call.mock_calls[0]
+        assert args[0].name == "name_value"
+
+    assert response is None
+
+
+@pytest.mark.asyncio
+async def test_update_bi_reservation_flattened_error_async():
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials()
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        await client.update_bi_reservation(
+            reservation.UpdateBiReservationRequest(),
+            bi_reservation=reservation.BiReservation(name="name_value"),
+            update_mask=field_mask.FieldMask(paths=["paths_value"]),
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_assignments_async_pager():
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials()
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._client._transport.list_assignments),
+        "__call__",
+        new_callable=mock.AsyncMock,
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            reservation.ListAssignmentsResponse(
+                assignments=[
+                    reservation.Assignment(),
+                    reservation.Assignment(),
+                    reservation.Assignment(),
+                ],
+                next_page_token="abc",
+            ),
+            reservation.ListAssignmentsResponse(assignments=[], next_page_token="def"),
+            reservation.ListAssignmentsResponse(
+                assignments=[reservation.Assignment()], next_page_token="ghi"
+            ),
+            reservation.ListAssignmentsResponse(
+                assignments=[reservation.Assignment(), reservation.Assignment()]
+            ),
+            RuntimeError,
+        )
+        async_pager = await client.list_assignments(request={})
+        assert isinstance(async_pager, pagers.ListAssignmentsAsyncPager)
+        assert async_pager.next_page_token == "abc"
+        responses = []
+        async for response in async_pager:
+            responses.append(response)
+
+        assert len(responses) == 6
+        assert all(isinstance(i, reservation.Assignment) for i in responses)
+
+
+@pytest.mark.asyncio
+async def test_search_assignments_async_pages():
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials()
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._client._transport.search_assignments),
+        "__call__",
+        new_callable=mock.AsyncMock,
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            reservation.SearchAssignmentsResponse(
+                assignments=[
+                    reservation.Assignment(),
+                    reservation.Assignment(),
+                    reservation.Assignment(),
+                ],
+                next_page_token="abc",
+            ),
+            reservation.SearchAssignmentsResponse(
+                assignments=[], next_page_token="def"
+            ),
+            reservation.SearchAssignmentsResponse(
+                assignments=[reservation.Assignment()], next_page_token="ghi"
+            ),
+            reservation.SearchAssignmentsResponse(
+                assignments=[reservation.Assignment(), reservation.Assignment()]
+            ),
+            RuntimeError,
+        )
+        pages = []
+        async for page in (await client.search_assignments(request={})).pages:
+            pages.append(page)
+        for page, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_reservation_service_grpc_asyncio_transport_channel():
+    channel = aio.insecure_channel("http://localhost/")
+
+    # Check that if channel is provided, mtls endpoint and client_cert_source
+    # won't be used.
+    callback = mock.MagicMock()
+    transport = transports.ReservationServiceGrpcAsyncIOTransport(
+        host="squid.clam.whelk",
+        channel=channel,
+        api_mtls_endpoint="mtls.squid.clam.whelk",
+        client_cert_source=callback,
+    )
+    assert transport.grpc_channel == channel
+    assert transport._host == "squid.clam.whelk:443"
+    assert not callback.called
+
+
+@mock.patch("grpc.ssl_channel_credentials", autospec=True)
+@mock.patch("google.api_core.grpc_helpers_async.create_channel", autospec=True)
+def test_reservation_service_grpc_asyncio_transport_channel_mtls_with_client_cert_source(
+    grpc_create_channel, grpc_ssl_channel_cred
+):
+    # Check that if channel is None, but api_mtls_endpoint and client_cert_source
+    # are provided, then a mTLS channel will be created.
+    mock_cred = mock.Mock()
+
+    mock_ssl_cred = mock.Mock()
+    grpc_ssl_channel_cred.return_value = mock_ssl_cred
+
+    mock_grpc_channel = mock.Mock()
+    grpc_create_channel.return_value = mock_grpc_channel
+
+    transport = transports.ReservationServiceGrpcAsyncIOTransport(
+        host="squid.clam.whelk",
+        credentials=mock_cred,
+        api_mtls_endpoint="mtls.squid.clam.whelk",
+        client_cert_source=client_cert_source_callback,
+    )
+    grpc_ssl_channel_cred.assert_called_once_with(
+        certificate_chain=b"cert bytes", private_key=b"key bytes"
+    )
+    grpc_create_channel.assert_called_once_with(
+        "mtls.squid.clam.whelk:443",
+        credentials=mock_cred,
+        ssl_credentials=mock_ssl_cred,
+        scopes=(
+            "https://www.googleapis.com/auth/bigquery",
+            "https://www.googleapis.com/auth/cloud-platform",
+        ),
+    )
+    assert transport.grpc_channel == mock_grpc_channel
+
+
+def test_list_reservations_pager_prefetch():
+    client = ReservationServiceClient(credentials=credentials.AnonymousCredentials)
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._transport.list_reservations), "__call__"
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            reservation.ListReservationsResponse(
+                reservations=[
+                    reservation.Reservation(),
+                    reservation.Reservation(),
+                    reservation.Reservation(),
+                ],
+                next_page_token="abc",
+            ),
+            reservation.ListReservationsResponse(
+                reservations=[], next_page_token="def"
+            ),
+            reservation.ListReservationsResponse(
+                reservations=[reservation.Reservation()], next_page_token="ghi"
+            ),
+            reservation.ListReservationsResponse(
+                reservations=[reservation.Reservation(), reservation.Reservation()]
+            ),
+            RuntimeError,
+        )
+        pager = client.list_reservations(request={}, prefetch=2)
+        pages = list(pager.pages)
+        for page, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page.raw_page.next_page_token == token
+        assert len(pages) == 4
+
+        # The pager tracks the most recent page, as it does without prefetch.
+        assert pager._request.page_token == "ghi"
+        assert pager.next_page_token == ""
+        assert len(call.mock_calls) == 4
+
+
+def test_list_assignments_pager_prefetch_error():
+    client = ReservationServiceClient(credentials=credentials.AnonymousCredentials)
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._transport.list_assignments), "__call__"
+    ) as call:
+        # The second page fails; the error surfaces after the first page.
+        call.side_effect = (
+            reservation.ListAssignmentsResponse(
+                assignments=[reservation.Assignment(), reservation.Assignment()],
+                next_page_token="abc",
+            ),
+            RuntimeError("boom"),
+        )
+        results = []
+        with pytest.raises(RuntimeError, match="boom"):
+            for assignment in client.list_assignments(request={}, prefetch=3):
+                results.append(assignment)
+        assert len(results) == 2
+
+
+def test_search_assignments_pager_prefetch_abandoned():
+    client = ReservationServiceClient(credentials=credentials.AnonymousCredentials)
+
+    def endless(request, **kwargs):
+        return reservation.SearchAssignmentsResponse(
+            assignments=[reservation.Assignment()], next_page_token="more"
+        )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._transport.search_assignments), "__call__"
+    ) as call:
+        call.side_effect = endless
+        pages = client.search_assignments(request={}, prefetch=2).pages
+        next(pages)
+        next(pages)
+        pages.close()
+
+        # Closing the iterator stops the background fetch; at most the
+        # bounded queue and one in-flight page were fetched ahead.
+        time.sleep(0.3)
+        fetched = len(call.mock_calls)
+        assert fetched <= 1 + 2 + 2
+        time.sleep(0.3)
+        assert len(call.mock_calls) == fetched
+
+
+def test_pager_prefetch_invalid():
+    with pytest.raises(ValueError):
+        pagers.ListCapacityCommitmentsPager(
+            method=mock.Mock(),
+            request=reservation.ListCapacityCommitmentsRequest(),
+            response=reservation.ListCapacityCommitmentsResponse(),
+            prefetch=-1,
+        )
+
+
+@pytest.mark.asyncio
+async def test_list_capacity_commitments_async_pager_prefetch():
+    client = ReservationServiceAsyncClient(
+        credentials=credentials.AnonymousCredentials()
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client._client._transport.list_capacity_commitments),
+        "__call__",
+        new_callable=mock.AsyncMock,
+    ) as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            reservation.ListCapacityCommitmentsResponse(
+                capacity_commitments=[
+                    reservation.CapacityCommitment(),
+                    reservation.CapacityCommitment(),
+                ],
+                next_page_token="abc",
+            ),
+            reservation.ListCapacityCommitmentsResponse(
+                capacity_commitments=[reservation.CapacityCommitment()],
+                next_page_token="def",
+            ),
+            RuntimeError("boom"),
+        )
+        async_pager = await client.list_capacity_commitments(request={}, prefetch=1)
+        responses = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for response in async_pager:
+                responses.append(response)
+
+        assert len(responses) == 3
+        assert async_pager.next_page_token == "def"
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from concurrent import futures
+
+import pytest
+
+from google.api_core import exceptions
+from google.cloud.bigquery.reservation_v1.services.reservation_service import waiter
+from google.cloud.bigquery.reservation_v1.services.reservation_service.cache import (
+    ResourceCache,
+)
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+PARENT = "projects/p/locations/US"
+State = reservation.CapacityCommitment.State
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class SettlingService(FakeReservationService):
+    """Settles each pending commitment after a number of gets; the ones
+    in ``failing`` fail."""
+
+    def __init__(self):
+        super().__init__(commitments_start_pending=True)
+        self.gets = {}
+        self.failing = set()
+        self.calls = {}
+
+    def GetCapacityCommitment(self, request, context):
+        calls = self.calls[request.name] = self.calls.get(request.name, 0) + 1
+        if calls == self.gets.get(request.name):
+            if request.name in self.failing:
+                self.fail_commitment(request.name)
+            else:
+                self.activate_commitment(request.name)
+        return super().GetCapacityCommitment(request, context)
+
+
+def create_commitment(client):
+    return client.create_capacity_commitment(
+        parent=PARENT,
+        capacity_commitment=reservation.CapacityCommitment(
+            slot_count=100, plan=reservation.CapacityCommitment.CommitmentPlan.FLEX
+        ),
+    )
+
+
+def test_wait_backs_off_per_commitment():
+    fake = FakeTime()
+    states = {"a": [State.PENDING] * 4 + [State.ACTIVE], "b": [State.FAILED]}
+    polls = []
+
+    def get(name):
+        polls.append((fake.now, name))
+        return reservation.CapacityCommitment(name=name, state=states[name].pop(0))
+
+    settled = waiter.wait(
+        get,
+        ["a", "b", "a"],
+        initial_delay=1,
+        max_delay=4,
+        clock=fake.clock,
+        sleep=fake.sleep,
+    )
+
+    assert [c.name for c in settled] == ["b", "a"]
+    assert [name for _, name in polls] == ["a", "b", "a", "a", "a", "a"]
+    # Each delay is jittered within [delay / 2, delay], the delay doubling
+    # up to max_delay.
+    for seconds, delay in zip(fake.sleeps, [1, 2, 4, 4]):
+        assert delay / 2 <= seconds <= delay
+
+
+def test_wait_times_out():
+    fake = FakeTime()
+
+    def get(name):
+        return reservation.CapacityCommitment(name=name, state=State.PENDING)
+
+    settled = waiter.wait(
+        get, ["a", "b"], timeout=10, clock=fake.clock, sleep=fake.sleep
+    )
+    with pytest.raises(futures.TimeoutError, match="a, b"):
+        list(settled)
+    assert fake.now == 10
+
+
+def test_invalid_wait():
+    with pytest.raises(ValueError):
+        waiter.wait(None, ["a"], initial_delay=2, max_delay=1)
+
+
+def test_wait_for_commitments():
+    servicer = FakeReservationService(commitments_start_pending=True)
+    client = in_process_client(servicer)
+    names = [create_commitment(client).name for _ in range(3)]
+    servicer.activate_commitment(names[0])
+    servicer.fail_commitment(names[1], "No capacity.")
+    servicer.activate_commitment(names[2])
+
+    settled = list(client.wait_for_commitments(names, initial_delay=0.001))
+
+    assert [c.name for c in settled] == names
+    assert [c.state for c in settled] == [State.ACTIVE, State.FAILED, State.ACTIVE]
+    assert settled[1].failure_status.message == "No capacity."
+
+
+def test_wait_for_commitment():
+    servicer = SettlingService()
+    client = in_process_client(servicer)
+    first = create_commitment(client).name
+    second = create_commitment(client).name
+    servicer.gets = {first: 3, second: 2}
+    servicer.failing.add(second)
+
+    commitment = client.wait_for_commitment(first, initial_delay=0.001)
+    assert commitment.state == State.ACTIVE
+    assert servicer.calls[first] == 3
+
+    with pytest.raises(exceptions.ResourceExhausted) as excinfo:
+        client.wait_for_commitment(second, initial_delay=0.001)
+    assert excinfo.value.response.name == second
+    assert "Failed to provision slots." in str(excinfo.value)
+
+
+def test_wait_for_commitment_bypasses_cache():
+    servicer = SettlingService()
+    cache = ResourceCache()
+    client = in_process_client(servicer, cache=cache)
+    name = create_commitment(client).name
+    servicer.gets = {name: 3}
+    assert client.get_capacity_commitment(name=name).state == State.PENDING
+
+    commitment = client.wait_for_commitment(name, initial_delay=0.001, timeout=5)
+
+    assert commitment.state == State.ACTIVE
+    assert servicer.calls[name] == 3
+    # The cache is left with the settled commitment.
+    assert client.get_capacity_commitment(name=name).state == State.ACTIVE
+    assert servicer.calls[name] == 3
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from unittest import mock
+
+import grpc
+from grpc import aio
+import pytest
+
+from google.api_core import exceptions
+from google.auth import credentials
+from google.oauth2 import service_account
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ReservationServiceAsyncClient,
+    ReservationServiceClient,
+    WarmupReport,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import transports
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationServer,
+    FakeReservationService,
+    in_process_channel,
+)
+
+
+def stale_credentials():
+    creds = mock.Mock(spec=credentials.Credentials)
+    creds.valid = False
+    return creds
+
+
+def transport_with(creds, channel):
+    with mock.patch.object(
+        transports.ReservationServiceGrpcTransport, "create_channel"
+    ) as create_channel:
+        create_channel.return_value = channel
+        return transports.ReservationServiceGrpcTransport(credentials=creds)
+
+
+def test_warmup_refreshes_stale_credentials():
+    creds = stale_credentials()
+    transport = transport_with(creds, in_process_channel(FakeReservationService()))
+
+    report = ReservationServiceClient(transport=transport).warmup()
+
+    assert isinstance(report, WarmupReport)
+    assert creds.refresh.call_count == 1
+    assert 0 <= report.stubs_s <= report.total_s
+    assert 0 <= report.channel_s <= report.total_s
+
+
+def test_warmup_keeps_valid_credentials():
+    creds = stale_credentials()
+    creds.valid = True
+    transport = transport_with(creds, in_process_channel(FakeReservationService()))
+
+    transport.warmup()
+
+    creds.refresh.assert_not_called()
+
+
+def test_channel_uses_the_credentials_warmup_refreshes():
+    creds = mock.create_autospec(service_account.Credentials, instance=True)
+    creds.requires_scopes = True
+    with mock.patch.object(
+        transports.ReservationServiceGrpcTransport, "create_channel"
+    ) as create_channel:
+        transport = transports.ReservationServiceGrpcTransport(credentials=creds)
+
+    scoped = creds.with_scopes.return_value
+    assert transport._credentials is scoped
+    assert create_channel.call_args[1]["credentials"] is scoped
+
+
+@pytest.mark.parametrize("channel_pool_size", [1, 2])
+def test_warmup_connects(channel_pool_size):
+    with FakeReservationServer() as server:
+        with mock.patch.object(
+            transports.ReservationServiceGrpcTransport,
+            "create_channel",
+            side_effect=lambda *args, **kwargs: grpc.insecure_channel(
+                server.address, options=kwargs.get("options")
+            ),
+        ):
+            transport = transports.ReservationServiceGrpcTransport(
+                credentials=credentials.AnonymousCredentials(),
+                channel_pool_size=channel_pool_size,
+            )
+
+        transport.warmup(timeout=5)
+
+        channel = transport.grpc_channel
+        channels = channel.channels if channel_pool_size > 1 else [channel]
+        for c in channels:
+            assert (
+                c._channel.check_connectivity_state(False)
+                == grpc.ChannelConnectivity.READY.value[0]
+            )
+
+
+def test_warmup_times_out():
+    with FakeReservationServer() as server:
+        address = server.address
+    # The server is stopped, so the channel cannot connect.
+    transport = transports.ReservationServiceGrpcTransport(
+        channel=grpc.insecure_channel(address)
+    )
+
+    with pytest.raises(exceptions.DeadlineExceeded):
+        transport.warmup(timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_async_warmup():
+    with FakeReservationServer() as server:
+        client = ReservationServiceAsyncClient(
+            transport=transports.ReservationServiceGrpcAsyncIOTransport(
+                channel=aio.insecure_channel(server.address)
+            )
+        )
+
+        report = await client.warmup(timeout=5)
+
+        assert report.channel_s <= report.total_s
+        assert (
+            client._client._transport.grpc_channel.get_state()
+            == grpc.ChannelConnectivity.READY
+        )
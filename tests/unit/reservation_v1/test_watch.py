@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+from unittest import mock
+
+import pytest
+
+from google.cloud.bigquery.reservation_v1.services.reservation_service import (
+    ChangeEvent,
+    Watcher,
+)
+from google.cloud.bigquery.reservation_v1.services.reservation_service import watch
+from google.api_core import exceptions
+from google.cloud.bigquery.reservation_v1.testing import (
+    FakeReservationService,
+    in_process_client,
+)
+from google.cloud.bigquery.reservation_v1.types import reservation
+
+PARENT = "projects/p/locations/US"
+
+
+def create_reservations(client, count, start=0):
+    return [
+        client.create_reservation(
+            parent=PARENT,
+            reservation_id="r%d" % i,
+            reservation=reservation.Reservation(slot_capacity=100),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def summary(events):
+    return sorted((event.type, event.kind, event.name) for event in events)
+
+
+def test_changes_are_reported():
+    client = in_process_client()
+    created = create_reservations(client, 3)
+    assignment = client.create_assignment(
+        parent=created[0].name,
+        assignment=reservation.Assignment(
+            assignee="projects/a", job_type=reservation.Assignment.JobType.QUERY
+        ),
+    )
+    watcher = Watcher(client, PARENT, page_size=2, min_interval=1, max_interval=8)
+
+    events = watcher.poll()
+    assert summary(events) == sorted(
+        [(watch.ADDED, "reservation", r.name) for r in created]
+        + [(watch.ADDED, "assignment", assignment.name)]
+    )
+    assert watcher.interval == 1
+    assert events[0].resource == created[0]
+
+    assert watcher.poll() == []
+    assert watcher.poll() == []
+    assert watcher.interval == 4
+
+    client.update_reservation(
+        reservation=reservation.Reservation(name=created[2].name, slot_capacity=50),
+        update_mask={"paths": ["slot_capacity"]},
+    )
+    events = watcher.poll()
+    assert summary(events) == [(watch.MODIFIED, "reservation", created[2].name)]
+    assert events[0].resource.slot_capacity == 50
+    assert watcher.interval == 1
+
+    client.delete_assignment(name=assignment.name)
+    client.delete_reservation(name=created[0].name)
+    assert summary(watcher.poll()) == [
+        (watch.REMOVED, "assignment", assignment.name),
+        (watch.REMOVED, "reservation", created[0].name),
+    ]
+
+
+def test_unchanged_pages_are_skipped():
+    client = in_process_client()
+    create_reservations(client, 4)
+    watcher = Watcher(client, PARENT, kinds=["reservation"], page_size=2)
+    watcher.poll()
+
+    with mock.patch.object(
+        watch, "_fingerprint", side_effect=watch._fingerprint
+    ) as fingerprint:
+        assert watcher.poll() == []
+    # One hash per page, none per reservation.
+    assert fingerprint.call_count == 2
+
+
+class ChangingTokens(FakeReservationService):
+    """Issues different page tokens for the same pages on every listing."""
+
+    def __init__(self):
+        super().__init__()
+        self.listings = 0
+
+    def ListReservations(self, request, context):
+        if not request.page_token:
+            self.listings += 1
+        request.page_token = request.page_token.partition(":")[2]
+        response = super().ListReservations(request, context)
+        if response.next_page_token:
+            response.next_page_token = "%d:%s" % (
+                self.listings,
+                response.next_page_token,
+            )
+        return response
+
+
+def test_pages_are_matched_by_position():
+    client = in_process_client(ChangingTokens())
+    create_reservations(client, 6)
+    watcher = Watcher(client, PARENT, kinds=["reservation"], page_size=2)
+    watcher.poll()
+
+    with mock.patch.object(
+        watch, "_fingerprint", side_effect=watch._fingerprint
+    ) as fingerprint:
+        assert watcher.poll() == []
+    assert fingerprint.call_count == 3
+
+    client.delete_reservation(name=PARENT + "/reservations/r0")
+    assert summary(watcher.poll()) == [
+        (watch.REMOVED, "reservation", PARENT + "/reservations/r0")
+    ]
+
+
+def test_failed_poll_keeps_the_changes():
+    client = in_process_client()
+    created = create_reservations(client, 3)
+    watcher = Watcher(client, PARENT, page_size=2)
+    watcher.poll()
+
+    client.update_reservation(
+        reservation=reservation.Reservation(name=created[0].name, slot_capacity=50),
+        update_mask={"paths": ["slot_capacity"]},
+    )
+    client.delete_reservation(name=created[2].name)
+    with mock.patch.object(
+        client, "list_assignments", side_effect=exceptions.ServiceUnavailable("")
+    ):
+        with pytest.raises(exceptions.ServiceUnavailable):
+            watcher.poll()
+
+    assert summary(watcher.poll()) == [
+        (watch.MODIFIED, "reservation", created[0].name),
+        (watch.REMOVED, "reservation", created[2].name),
+    ]
+
+
+def test_initial_events_can_be_suppressed():
+    client = in_process_client()
+    create_reservations(client, 2)
+    watcher = Watcher(client, PARENT, initial_events=False)
+
+    assert watcher.poll() == []
+    create_reservations(client, 1, start=2)
+    assert summary(watcher.poll()) == [
+        (watch.ADDED, "reservation", PARENT + "/reservations/r2")
+    ]
+
+
+def test_watch_sleeps_between_polls():
+    client = in_process_client()
+    create_reservations(client, 1)
+    sleep = mock.Mock()
+    watcher = Watcher(client, PARENT, min_interval=2, sleep=sleep)
+
+    events = watcher.watch()
+    assert isinstance(next(events), ChangeEvent)
+    create_reservations(client, 1, start=1)
+    assert next(events).name == PARENT + "/reservations/r1"
+    sleep.assert_called_once_with(2)
+
+
+def test_watch_stops():
+    client = in_process_client()
+    stop = threading.Event()
+    stop.set()
+
+    assert list(Watcher(client, PARENT).watch(stop)) == []
+
+
+def test_invalid_watcher():
+    with pytest.raises(ValueError):
+        Watcher(None, PARENT, kinds=["bi_reservation"])
+    with pytest.raises(ValueError):
+        Watcher(None, PARENT, min_interval=10, max_interval=1)